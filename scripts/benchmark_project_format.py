@@ -0,0 +1,121 @@
+"""
+프로젝트 저장 형식 벤치마크.
+
+형식 1(project.json에 파일마다 JSON 객체)과 형식 2(컬럼형 파일 테이블)의
+저장/로드 시간과 디스크 크기를 파일 수별로 비교합니다.
+
+    python scripts/benchmark_project_format.py [--sizes 10000 100000 1000000]
+
+측정 항목:
+    save        ProjectService.save_project (형식 1은 기존 json.dump 경로).
+                두 형식 모두 메모리의 파일 목록을 만든 뒤부터 측정
+    open        load_project 반환까지 (형식 2는 테이블을 memmap으로 열기만 함)
+    groups      데이터 조회 탭 그룹 목록 생성까지 (경로 디코딩 + (날짜, 시각) 그룹)
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from vibration.core.domain.models import ProjectData  # noqa: E402
+from vibration.core.services.project_file_table import ProjectFileTable  # noqa: E402
+from vibration.core.services.project_service import ProjectService  # noqa: E402
+
+CHANNELS_PER_GROUP = 4
+
+
+def make_table(n_files: int) -> ProjectFileTable:
+    """5분 간격 녹음(그룹당 4채널)의 합성 파일 테이블을 만듭니다."""
+    paths, dates, times, channels = [], [], [], []
+    for i in range(n_files):
+        group, ch = divmod(i, CHANNELS_PER_GROUP)
+        minutes = group * 5
+        day, minute_of_day = divmod(minutes, 24 * 60)
+        date_str = f"2026-{1 + day // 28 % 12:02d}-{1 + day % 28:02d}"
+        time_str = f"{minute_of_day // 60:02d}:{minute_of_day % 60:02d}:00"
+        paths.append(f"{date_str}/{date_str}_{time_str.replace(':', '-')}_1_{ch + 1}.txt")
+        dates.append(date_str)
+        times.append(time_str)
+        channels.append(', '.join(f"CH{c + 1}" for c in range(CHANNELS_PER_GROUP)))
+    return ProjectFileTable.from_columns(
+        paths, dates, times, channels, [25600.0] * n_files,
+        ['100 mV/g'] * n_files, [i % 97 == 0 for i in range(n_files)]
+    )
+
+
+def group_count(project: ProjectData) -> int:
+    """데이터 조회 탭이 프로젝트 로드 시 하는 것처럼 그룹 목록을 만듭니다."""
+    files = project.files
+    if isinstance(files, ProjectFileTable):
+        paths = files.relative_paths()
+        return sum(1 for _, _, rows in files.groups() if [paths[r] for r in rows])
+    groups = {}
+    for fi in files:
+        groups.setdefault((fi.date, fi.time), []).append(fi.relative_path)
+    return len(sorted(groups))
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def folder_size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob('*') if p.is_file())
+
+
+def bench(n_files: int, workdir: Path) -> None:
+    table = make_table(n_files)
+    project = ProjectData(name='bench', description='', created_at='',
+                          parent_folder=str(workdir), files=table)
+    service = ProjectService()
+
+    # 형식 1: 기존 JSON 직렬화 (파일마다 객체)
+    legacy_dir = workdir / f"v1_{n_files}"
+    legacy_dir.mkdir()
+    legacy_json = legacy_dir / 'project.json'
+    legacy = ProjectData(name='bench', description='', created_at='',
+                         parent_folder=str(workdir), files=list(table))
+
+    def save_v1():
+        with open(legacy_json, 'w', encoding='utf-8') as f:
+            json.dump(legacy.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def open_v1():
+        with open(legacy_json, 'r', encoding='utf-8') as f:
+            return ProjectData.from_dict(json.load(f))
+
+    v1_save, _ = timed(save_v1)
+    v1_open, loaded = timed(open_v1)
+    v1_groups, _ = timed(lambda: group_count(loaded))
+
+    # 형식 2: 컬럼형 파일 테이블
+    v2_save, json_path = timed(lambda: service.save_project(project, str(workdir / f"v2_{n_files}")))
+    v2_open, loaded = timed(lambda: service.load_project(json_path))
+    v2_groups, _ = timed(lambda: group_count(loaded))
+
+    v1_size = folder_size(legacy_dir) / 1e6
+    v2_size = folder_size(Path(json_path).parent) / 1e6
+    print(f"{n_files:>9,} | v1 {v1_save:7.2f} {v1_open:7.2f} {v1_open + v1_groups:7.2f} {v1_size:8.1f} | "
+          f"v2 {v2_save:7.2f} {v2_open:7.3f} {v2_open + v2_groups:7.2f} {v2_size:8.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    columns = f"{'save s':>7} {'open s':>7} {'group s':>7} {'MB':>8}"
+    print(f"{'files':>9} | v1 {columns} | v2 {columns}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_files in args.sizes:
+            bench(n_files, Path(tmp))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""Unit tests for the Trend/Peak shared analysis result store."""
+import pytest
+import numpy as np
+from pathlib import Path
+
+from vibration.core.services import AnalysisResultStore, PeakService, TrendService
+
+
+def create_trend_file(filepath: Path, frequency: float, amplitude: float = 1.0,
+                      sampling_rate: float = 10240.0, duration: float = 0.5) -> str:
+    """Create a synthetic vibration data file."""
+    t = np.arange(int(sampling_rate * duration)) / sampling_rate
+    signal = amplitude * np.sin(2 * np.pi * frequency * t)
+    lines = [
+        f"#D.Sampling Freq.: {sampling_rate} Hz",
+        "#b.Sensitivity: 100.0 mV/g",
+        "#Sensitivity: 100.0 mV/g",
+        f"#Record Length: {duration} sec",
+        "#",
+    ] + [f"{v:.8f}" for v in signal]
+    filepath.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return str(filepath)
+
+
+@pytest.fixture
+def trend_files(tmp_path):
+    """Create three files with different peak frequencies."""
+    return [
+        create_trend_file(tmp_path / f"test_20260206_10{i:02d}00_CH1.txt",
+                          frequency=100.0 * (i + 1), amplitude=1.0 + i)
+        for i in range(3)
+    ]
+
+
+def fail_if_called(*args, **kwargs):
+    raise AssertionError("processor must not run when the store has the batch")
+
+
+class TestAnalysisResultStore:
+    """Tests for AnalysisResultStore."""
+
+    def test_key_normalizes_paths(self):
+        """Test os.path.join and Path-style paths produce the same key."""
+        a = AnalysisResultStore.make_key(['/data/./x.txt'], 1, 50, 'Hanning', 1, 0, 100)
+        b = AnalysisResultStore.make_key(['/data/x.txt'], 1.0, 50.0, 'hanning', 1, 0.0, 100.0)
+
+        assert a == b
+
+    def test_lru_eviction(self):
+        """Test the least recently used batch is evicted first."""
+        store = AnalysisResultStore(max_entries=2)
+        store.put('a', [1])
+        store.put('b', [2])
+        store.get('a')
+        store.put('c', [3])
+
+        assert 'a' in store
+        assert 'b' not in store
+        assert len(store) == 2
+
+    def test_get_counts_hits_and_misses(self):
+        """Test hit/miss counters."""
+        store = AnalysisResultStore()
+        store.put('a', [1])
+
+        assert store.get('a') == [1]
+        assert store.get('b') is None
+        assert (store.hits, store.misses) == (1, 1)
+
+
+class TestSharedTrendPeakComputation:
+    """Tests for Trend and Peak services sharing one store."""
+
+    def test_peak_renders_from_trend_batch(self, trend_files, monkeypatch):
+        """Test a Peak request after Trend reuses the stored per-file results."""
+        store = AnalysisResultStore()
+        trend = TrendService(max_workers=1, result_store=store)
+        peak = PeakService(max_workers=1, result_store=store)
+
+        trend_result = trend.compute_trend(trend_files, view_type='VEL')
+        monkeypatch.setattr(peak._processor, 'process_batch', fail_if_called)
+        peak_result = peak.compute_peak_trend(trend_files, view_type='VEL')
+
+        expected = PeakService(max_workers=1).compute_peak_trend(trend_files, view_type='VEL')
+        np.testing.assert_allclose(peak_result.rms_values, expected.rms_values)
+        np.testing.assert_allclose(peak_result.peak_frequencies, expected.peak_frequencies)
+        np.testing.assert_allclose(peak_result.metadata['original_rms_values'],
+                                   trend_result.rms_values)
+
+    def test_trend_renders_from_peak_batch(self, trend_files, monkeypatch):
+        """Test a Trend request after Peak reuses the stored per-file results."""
+        store = AnalysisResultStore()
+        trend = TrendService(max_workers=1, result_store=store)
+        peak = PeakService(max_workers=1, result_store=store)
+
+        peak.compute_peak_trend(trend_files, view_type='ACC')
+        monkeypatch.setattr(trend._processor, 'process_batch', fail_if_called)
+        calls = []
+        result = trend.compute_trend(
+            trend_files, view_type='ACC',
+            progress_callback=lambda cur, total: calls.append((cur, total))
+        )
+
+        assert result.num_files == len(trend_files)
+        assert calls == [(len(trend_files), len(trend_files))]
+
+    def test_different_parameters_recompute(self, trend_files):
+        """Test a changed view type is not served from the store."""
+        store = AnalysisResultStore()
+        trend = TrendService(max_workers=1, result_store=store)
+
+        trend.compute_trend(trend_files, view_type='ACC')
+        trend.compute_trend(trend_files, view_type='VEL')
+
+        assert len(store) == 2
+        assert store.hits == 0
@@ -0,0 +1,79 @@
+"""Unit tests for band trend extraction from a spectrum matrix."""
+import numpy as np
+import pytest
+
+from vibration.core.services.band_trend import BandLookup, BandSpec, extract_band_trends
+
+
+@pytest.fixture
+def matrix():
+    """Create 50 spectra on a 0.5 Hz grid; row i has a tone of amplitude i at 100 Hz."""
+    frequency = np.arange(2001) * 0.5
+    spectra = np.full((50, len(frequency)), 0.01, dtype=np.float32)
+    spectra[:, 200] = np.arange(50)
+    spectra[:, 400] = 3.0
+    spectra[:, 600] = 4.0
+    return frequency, spectra
+
+
+def reference(frequency, row, band):
+    """Per-row reference computed like the trend tab band filter."""
+    if band.method == 'nearest':
+        return row[np.argmin(np.abs(frequency - band.low))]
+    if band.method == 'harmonics':
+        cols = [np.argmin(np.abs(frequency - band.low * k)) for k in range(1, band.harmonics + 1)]
+        return np.sqrt(np.sum(row[cols].astype(np.float64) ** 2))
+    values = row[(frequency >= band.low) & (frequency <= band.high)].astype(np.float64)
+    return np.sqrt(np.sum(values ** 2)) if band.method == 'rms' else values.max()
+
+
+class TestExtractBandTrends:
+    """Tests for extract_band_trends."""
+
+    def test_methods_match_per_row_reference(self, matrix):
+        """Test every band method equals a per-row loop."""
+        frequency, spectra = matrix
+        bands = [BandSpec('nearest', 100.2), BandSpec('rms', 90.0, 210.0),
+                 BandSpec('peak', 150.0, 250.0), BandSpec('harmonics', 100.0, harmonics=3)]
+
+        values = extract_band_trends(frequency, spectra, bands)
+
+        assert values.shape == (50, 4)
+        for i in range(50):
+            expected = [reference(frequency, spectra[i], band) for band in bands]
+            np.testing.assert_allclose(values[i], expected, rtol=1e-6)
+
+    def test_row_chunks_match_single_pass(self, matrix):
+        """Test small read chunks give the same result."""
+        frequency, spectra = matrix
+        bands = [BandSpec('rms', 0.0, 1000.0), BandSpec('nearest', 300.0)]
+
+        np.testing.assert_array_equal(
+            extract_band_trends(frequency, spectra, bands, chunk_bytes=4096),
+            extract_band_trends(frequency, spectra, bands)
+        )
+
+    def test_short_rows_and_empty_bands_are_nan(self, matrix):
+        """Test bins past a row's valid length and bands with no bins give NaN."""
+        frequency, spectra = matrix
+        spectra[0, 300:] = np.nan
+
+        values = extract_band_trends(frequency, spectra, [
+            BandSpec('rms', 200.0, 300.0), BandSpec('peak', 10.2, 10.4), BandSpec('nearest', 5000.0)
+        ])
+
+        assert np.isnan(values[0, 0]) and values[1, 0] > 0
+        assert np.isnan(values[:, 1:]).all()
+
+    def test_lookup_reads_only_used_columns(self, matrix):
+        """Test the precomputed lookup narrows reads to the bands' column range."""
+        frequency, _ = matrix
+
+        lookup = BandLookup(frequency, [BandSpec('nearest', 100.0), BandSpec('peak', 150.0, 200.0)])
+
+        assert (lookup.start, lookup.stop) == (200, 401)
+
+    def test_unknown_method_rejected(self, matrix):
+        """Test an unknown method raises ValueError."""
+        with pytest.raises(ValueError):
+            extract_band_trends(matrix[0], matrix[1], [BandSpec('mean', 1.0)])
@@ -0,0 +1,89 @@
+"""Unit tests for the headless batch CLI."""
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from vibration import cli
+
+
+def create_trend_file(filepath: Path, frequency: float,
+                      sampling_rate: float = 10240.0, duration: float = 0.5) -> str:
+    """Create a synthetic vibration data file."""
+    t = np.arange(int(sampling_rate * duration)) / sampling_rate
+    signal = np.sin(2 * np.pi * frequency * t)
+    lines = [
+        f"#D.Sampling Freq.: {sampling_rate} Hz",
+        "#b.Sensitivity: 100.0 mV/g",
+        "#Sensitivity: 100.0 mV/g",
+        f"#Record Length: {duration} sec",
+        "#",
+    ] + [f"{v:.8f}" for v in signal]
+    filepath.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return str(filepath)
+
+
+@pytest.fixture
+def parent_dir(tmp_path):
+    """Create date sub-folders with two channels each."""
+    parent = tmp_path / "data"
+    for day in ("2026-02-06", "2026-02-07", "2026-03-01"):
+        folder = parent / day
+        folder.mkdir(parents=True)
+        for ch in (1, 2):
+            create_trend_file(folder / f"{day}_10-00-0{ch}_CH{ch}.txt", 100.0 * ch)
+    return parent
+
+
+class TestBatchCli:
+    """Tests for `python -m vibration batch`."""
+
+    def test_npz_output_with_date_range(self, parent_dir, tmp_path, capsys):
+        """Test the date range limits files and all columns are written."""
+        output = tmp_path / "trend.npz"
+
+        code = cli.main([str(parent_dir), '--from', '2026-02-01', '--to', '2026-02-28',
+                         '--workers', '1', '--view', 'vel', '-q', '-o', str(output)])
+
+        assert code == 0
+        data = np.load(output)
+        assert set(data.files) == {'file_name', 'timestamp', 'channel',
+                                   'rms', 'peak', 'peak_freq'}
+        assert len(data['file_name']) == 4
+        assert data['channel'].tolist() == ['CH1', 'CH2', 'CH1', 'CH2']
+        assert data['peak_freq'].tolist() == pytest.approx([100.0, 200.0, 100.0, 200.0])
+        report = capsys.readouterr().out
+        assert 'startup:' in report
+        assert 'files/s' in report
+
+    def test_csv_output_peak_only(self, parent_dir, tmp_path):
+        """Test --analysis peak writes only peak columns to CSV."""
+        output = tmp_path / "peak.csv"
+
+        code = cli.main([str(parent_dir), '--analysis', 'peak', '--band', '50', '150',
+                         '--workers', '1', '-q', '-o', str(output)])
+
+        assert code == 0
+        lines = output.read_text(encoding='utf-8').splitlines()
+        assert lines[0] == 'file_name,timestamp,channel,peak,peak_freq'
+        assert len(lines) == 7
+
+    def test_no_files_returns_error(self, tmp_path):
+        """Test an empty parent folder exits with status 1."""
+        assert cli.main([str(tmp_path), '-q', '-o', str(tmp_path / "out.npz")]) == 1
+
+    def test_unsupported_output_format(self, parent_dir, tmp_path):
+        """Test an unknown output extension is rejected."""
+        assert cli.main([str(parent_dir), '-o', str(tmp_path / "out.xlsx")]) == 2
+
+
+def test_cli_does_not_import_qt():
+    """Test the CLI module pulls in neither PyQt5 nor matplotlib."""
+    code = (
+        "import sys, vibration.cli; "
+        "bad = [m for m in sys.modules if m.startswith(('PyQt5', 'matplotlib'))]; "
+        "sys.exit(1 if bad else 0)"
+    )
+    assert subprocess.run([sys.executable, '-c', code]).returncode == 0
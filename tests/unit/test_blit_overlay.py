@@ -0,0 +1,96 @@
+"""Unit tests for the blitted hover overlay."""
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from vibration.presentation.views.widgets.blit_overlay import BlitOverlay
+
+
+@pytest.fixture
+def canvas():
+    """Create an Agg canvas with many lines and count full draws."""
+    figure = Figure(figsize=(4, 3), dpi=50)
+    ax = figure.add_subplot(111)
+    for i in range(50):
+        ax.plot(np.arange(100), np.random.default_rng(i).uniform(size=100))
+    canvas = FigureCanvasAgg(figure)
+    canvas.draw_idle = MagicMock()
+    canvas.blit = MagicMock()
+    return canvas
+
+
+class TestBlitOverlay:
+    """Tests for BlitOverlay caching and fallbacks."""
+
+    def test_update_before_first_draw_falls_back(self, canvas):
+        """Test update() schedules a full draw until a background exists."""
+        overlay = BlitOverlay(canvas)
+        overlay.add(canvas.figure.axes[0].plot([], [], 'ko')[0])
+
+        overlay.update()
+
+        canvas.draw_idle.assert_called_once()
+        canvas.blit.assert_not_called()
+
+    def test_update_after_draw_blits_only(self, canvas):
+        """Test hover updates restore the cached background and blit."""
+        overlay = BlitOverlay(canvas)
+        dot = overlay.add(canvas.figure.axes[0].plot([], [], 'ko')[0])
+        canvas.draw()
+
+        dot.set_data([10], [0.5])
+        overlay.update()
+
+        assert dot.get_animated()
+        canvas.draw_idle.assert_not_called()
+        canvas.blit.assert_called_once()
+
+    def test_limit_change_invalidates(self, canvas):
+        """Test zooming after the cached draw forces a full redraw."""
+        overlay = BlitOverlay(canvas)
+        overlay.add(canvas.figure.axes[0].plot([], [], 'ko')[0])
+        canvas.draw()
+
+        canvas.figure.axes[0].set_xlim(0, 10)
+        overlay.update()
+
+        canvas.draw_idle.assert_called_once()
+        canvas.blit.assert_not_called()
+
+    def test_invalidate_drops_background(self, canvas):
+        """Test invalidate() (e.g. on resize) forces a full redraw."""
+        overlay = BlitOverlay(canvas)
+        canvas.draw()
+
+        overlay.invalidate()
+        overlay.update()
+
+        canvas.draw_idle.assert_called_once()
+
+    def test_cleared_artists_are_pruned(self, canvas):
+        """Test artists removed by ax.clear() are dropped on the next add."""
+        overlay = BlitOverlay(canvas)
+        ax = canvas.figure.axes[0]
+        old = overlay.add(ax.plot([], [], 'ko')[0])
+        ax.clear()
+
+        new = overlay.add(ax.plot([], [], 'ko')[0])
+
+        assert overlay._artists == [new]
+        assert old is not new
+
+    def test_canvas_without_blit_uses_draw_idle(self):
+        """Test canvases without blit support keep the draw_idle path."""
+        canvas = MagicMock(supports_blit=False)
+        overlay = BlitOverlay(canvas)
+        dot = MagicMock()
+
+        overlay.add(dot)
+        overlay.update()
+
+        assert not overlay.enabled
+        dot.set_animated.assert_not_called()
+        canvas.draw_idle.assert_called_once()
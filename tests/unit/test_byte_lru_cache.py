@@ -0,0 +1,115 @@
+"""Unit tests for the byte-budgeted LRU cache."""
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from vibration.core.services.byte_lru_cache import ByteBudgetLRUCache, estimate_nbytes
+
+
+@dataclass
+class Holder:
+    """Object holding arrays, like SignalData / FFTResult."""
+    data: np.ndarray
+    spectrum: np.ndarray
+    label: str = "x"
+
+
+class TestEstimateNbytes:
+    """Tests for estimate_nbytes."""
+
+    def test_counts_arrays_in_nested_objects(self):
+        """Test arrays inside tuples and objects are summed by nbytes."""
+        value = (Holder(np.zeros(100), np.zeros(50, dtype=np.float32)), np.zeros(10))
+
+        assert estimate_nbytes(value) == 800 + 200 + 1 + 80
+
+    def test_shared_array_counted_once(self):
+        """Test the same array referenced twice is counted once."""
+        arr = np.zeros(1000)
+
+        assert estimate_nbytes([arr, arr]) == arr.nbytes
+
+
+class TestByteBudgetLRUCache:
+    """Tests for ByteBudgetLRUCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest unused entry is evicted when over budget."""
+        cache = ByteBudgetLRUCache(max_bytes=2000)
+        cache.put('a', np.zeros(100))
+        cache.put('b', np.zeros(100))
+        cache.get('a')
+        cache.put('c', np.zeros(100))
+
+        assert list(cache) == ['a', 'c']
+        assert cache.current_bytes == 1600
+        assert cache.evictions == 1
+
+    def test_counters(self):
+        """Test hit and miss counters."""
+        cache = ByteBudgetLRUCache(max_bytes=1024)
+        cache.put('a', np.zeros(8))
+
+        assert cache.get('a') is not None
+        assert cache.get('missing', 'default') == 'default'
+        assert cache.stats() == {
+            'entries': 1, 'bytes': 64, 'max_bytes': 1024,
+            'hits': 1, 'misses': 1, 'evictions': 0,
+        }
+
+    def test_oversized_item_not_cached(self):
+        """Test a single entry larger than the budget is rejected."""
+        cache = ByteBudgetLRUCache(max_bytes=100)
+        cache.put('small', np.zeros(4))
+
+        assert cache.put('big', np.zeros(100)) is False
+        assert 'big' not in cache
+        assert 'small' in cache
+
+    def test_replace_updates_size(self):
+        """Test re-putting a key replaces its size accounting."""
+        cache = ByteBudgetLRUCache(max_bytes=10_000)
+        cache.put('a', np.zeros(100))
+        cache.put('a', np.zeros(10))
+
+        assert cache.current_bytes == 80
+        assert len(cache) == 1
+
+    def test_memory_stays_flat(self):
+        """Test a long browsing session stays within budget."""
+        cache = ByteBudgetLRUCache(max_bytes=8000 * 5)
+        for i in range(200):
+            cache.put(f"file_{i}", np.zeros(1000))
+
+        assert cache.current_bytes <= cache.max_bytes
+        assert len(cache) == 5
+        assert cache.evictions == 195
+
+    def test_pop_and_clear(self):
+        """Test pop returns the value and clear resets usage."""
+        cache = ByteBudgetLRUCache(max_bytes=10_000)
+        arr = np.ones(3)
+        cache.put('a', arr)
+        cache.put('b', np.ones(3))
+
+        assert cache.pop('a') is arr
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.current_bytes == 0
+
+    def test_custom_sizer(self):
+        """Test a custom sizer is used for accounting."""
+        cache = ByteBudgetLRUCache(max_bytes=10, sizer=lambda v: 4)
+        for key in 'abc':
+            cache.put(key, object())
+
+        assert list(cache) == ['b', 'c']
+
+    @pytest.mark.parametrize("budget", [0, -5])
+    def test_zero_budget_caches_nothing(self, budget):
+        """Test a non-positive budget disables caching."""
+        cache = ByteBudgetLRUCache(max_bytes=budget)
+
+        assert cache.put('a', np.zeros(1)) is False
+        assert len(cache) == 0
@@ -0,0 +1,133 @@
+"""Unit tests for the lazy Dataset API."""
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from vibration.core import Dataset
+from vibration.core.services import AnalysisResultStore, TrendService
+from vibration.core.services import OPTIMIZATION_PATCH_LEVEL5_TREND as trend_module
+
+
+def create_trend_file(filepath: Path, frequency: float, amplitude: float = 1.0,
+                      sampling_rate: float = 10240.0, duration: float = 0.5) -> str:
+    """Create a synthetic vibration data file."""
+    t = np.arange(int(sampling_rate * duration)) / sampling_rate
+    signal = amplitude * np.sin(2 * np.pi * frequency * t)
+    lines = [
+        f"#D.Sampling Freq.: {sampling_rate} Hz",
+        "#b.Sensitivity: 100.0 mV/g",
+        "#Sensitivity: 100.0 mV/g",
+        f"#Record Length: {duration} sec",
+        "#",
+    ] + [f"{v:.8f}" for v in signal]
+    filepath.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return str(filepath)
+
+
+@pytest.fixture
+def parent_dir(tmp_path):
+    """Create three date folders with channels 1-3 (peak at 100 * channel Hz)."""
+    parent = tmp_path / "data"
+    for day in ("2026-02-06", "2026-02-07", "2026-03-01"):
+        folder = parent / day
+        folder.mkdir(parents=True)
+        for ch in (1, 2, 3):
+            create_trend_file(folder / f"{day}_10-00-0{ch}_CH{ch}.txt", 100.0 * ch)
+    return parent
+
+
+class TestDatasetPlan:
+    """Tests for plan building and filter push-down."""
+
+    def test_plan_is_lazy_and_immutable(self, tmp_path):
+        """Test building a plan on a missing folder neither fails nor mutates."""
+        base = Dataset.open(tmp_path / "missing")
+        filtered = base.between("2026-01-01", date(2026, 1, 31)).channels([1])
+
+        assert base.date_from is None
+        assert filtered.date_from == date(2026, 1, 1)
+        assert filtered.channel_ids == ('1',)
+
+    def test_filters_pushed_into_scan(self, parent_dir):
+        """Test date and channel filters select files by folder and name."""
+        files = Dataset.open(parent_dir).between("2026-02-01", "2026-02-28") \
+            .channels([1, 3]).files()
+
+        assert [Path(f).name for f in files] == [
+            "2026-02-06_10-00-01_CH1.txt", "2026-02-06_10-00-03_CH3.txt",
+            "2026-02-07_10-00-01_CH1.txt", "2026-02-07_10-00-03_CH3.txt",
+        ]
+
+    def test_bands_are_merged(self, parent_dir):
+        """Test band_rms and band_peak share one ordered band list."""
+        ds = Dataset.open(parent_dir).band_rms([(10, 1000)]).band_peak([(10, 1000), (0, 50)])
+
+        assert ds.bands == ((10.0, 1000.0), (0.0, 50.0))
+
+    def test_compute_without_reduction_raises(self, parent_dir):
+        """Test compute() requires at least one reduction."""
+        with pytest.raises(ValueError):
+            Dataset.open(parent_dir).compute()
+
+
+class TestDatasetCompute:
+    """Tests for fused execution."""
+
+    def test_matches_trend_service(self, parent_dir):
+        """Test each band column equals a TrendService run for that band."""
+        ds = Dataset.open(parent_dir, max_workers=2).spectrum(view='VEL') \
+            .band_rms([(10, 1000), (150, 5000)])
+
+        result = ds.compute()
+
+        for j, band in enumerate(result.bands):
+            expected = TrendService(max_workers=1).compute_trend(
+                result.file_paths, view_type='VEL', frequency_band=band
+            )
+            np.testing.assert_allclose(result.band_rms[:, j], expected.rms_values)
+            np.testing.assert_allclose(result.band_peak_freq[:, j], expected.peak_frequencies)
+        assert result.channels[:3] == ['CH1', 'CH2', 'CH3']
+        assert result.timestamps[0].isoformat() == '2026-02-06T10:00:01'
+
+    def test_one_fft_per_file_for_all_bands(self, parent_dir, monkeypatch):
+        """Test several bands are reduced from a single spectrum per file."""
+        calls = []
+        original = trend_module._compute_trend_spectrum
+
+        def counting(*args):
+            calls.append(args[1])
+            return original(*args)
+
+        monkeypatch.setattr(trend_module, '_compute_trend_spectrum', counting)
+        result = Dataset.open(parent_dir, max_workers=1).channels([2]) \
+            .band_rms([(0, 100), (100, 1000), (1000, 5000)]).compute()
+
+        assert result.band_rms.shape == (3, 3)
+        assert len(calls) == 3
+
+    def test_reuses_and_populates_result_store(self, parent_dir):
+        """Test cached bands are not recomputed and results are shared with services."""
+        store = AnalysisResultStore()
+        ds = Dataset.open(parent_dir, max_workers=1, result_store=store) \
+            .spectrum(view='ACC').band_rms([(10, 1000)])
+
+        first = ds.compute()
+        second = ds.compute()
+        TrendService(max_workers=1, result_store=store).compute_trend(
+            first.file_paths, view_type='ACC', frequency_band=(10, 1000)
+        )
+
+        assert first.computed_files == 9
+        assert second.computed_files == 0
+        np.testing.assert_array_equal(first.band_rms, second.band_rms)
+        assert store.hits == 2
+
+    def test_missing_band_data_marked_failed(self, parent_dir):
+        """Test a band above Nyquist is reported as unsuccessful."""
+        result = Dataset.open(parent_dir, max_workers=1).channels([1]) \
+            .band_rms([(10, 1000), (9000, 9500)]).compute()
+
+        assert result.success[:, 0].all()
+        assert not result.success[:, 1].any()
@@ -0,0 +1,85 @@
+"""Unit tests for the parsed file name catalogue and the tab file filters."""
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from vibration.core.services import file_catalog
+from vibration.core.services.file_catalog import FileCatalog, catalog_for, lookup_timestamp
+from vibration.core.services.trend_service import TrendService
+from vibration.presentation.presenters.trend_presenter import TrendPresenter
+
+NAMES = [
+    "2026-02-06_10-00-00_3_1.txt",
+    "2026-02-05_23-59-59_3_2.txt",
+    "20260207_101010_CH2.txt",
+    "notes.txt",
+    "2026-02-08_00-00-00_4_1.txt",
+]
+
+
+class TestFileCatalog:
+    """Tests for FileCatalog parsing and masks."""
+
+    def test_parses_timestamps_channels_and_repetitions(self):
+        """Test both the vectorised and the regex timestamp paths."""
+        catalog = FileCatalog(NAMES)
+
+        assert catalog.timestamps.dtype == np.dtype('datetime64[s]')
+        assert catalog.timestamps[0] == np.datetime64('2026-02-06T10:00:00')
+        assert catalog.timestamps[2] == np.datetime64('2026-02-07T10:10:10')
+        assert np.isnat(catalog.timestamps[3])
+        assert catalog.channels.tolist() == ['1', '2', 'CH2', 'notes', '1']
+        assert catalog.channel_numbers.tolist() == [1, 2, 2, -1, 1]
+        assert catalog.repetitions.tolist() == [3, 3, -1, -1, 4]
+
+    def test_invalid_calendar_date_is_nat(self):
+        """Test a well-formed but impossible date does not break the batch."""
+        catalog = FileCatalog(["2026-13-01_00-00-00_1_1.txt", NAMES[0]])
+
+        assert np.isnat(catalog.timestamps[0])
+        assert catalog.timestamps[1] == np.datetime64('2026-02-06T10:00:00')
+
+    def test_date_range_is_inclusive_and_keeps_unparsed(self):
+        """Test whole days are included and names without a timestamp stay visible."""
+        catalog = FileCatalog(NAMES)
+
+        assert catalog.select("2026-02-06", "2026-02-07") == [NAMES[0], NAMES[2], NAMES[3]]
+        assert catalog.select(date_from="2026-02-08") == [NAMES[3], NAMES[4]]
+        assert catalog.select("2026-02-09", "2026-02-01") == [NAMES[3]]
+
+    def test_channel_filter_matches_numbers_and_names(self):
+        """Test '2' matches both '_2' and 'CH2' while 'CH2' matches only itself."""
+        catalog = FileCatalog(NAMES)
+
+        assert catalog.select(channels=['2']) == [NAMES[1], NAMES[2]]
+        assert catalog.select(channels=['CH2']) == [NAMES[2]]
+        assert catalog.select(channels=[]) == NAMES
+        assert catalog.select("2026-02-06", "2026-02-08", ['1']) == [NAMES[0], NAMES[4]]
+
+    def test_shared_catalogue_feeds_service_timestamps(self, monkeypatch):
+        """Test the catalogue is reused for the same list and read by the services."""
+        monkeypatch.setattr(file_catalog, '_shared_catalog', None)
+        catalog = catalog_for(NAMES)
+
+        assert catalog_for(list(NAMES)) is catalog
+        assert catalog_for(NAMES[:2]) is not catalog
+        assert lookup_timestamp("/data/2026-02-06_10-00-00_3_1.txt") == datetime(2026, 2, 6, 10)
+        assert TrendService()._extract_timestamp(NAMES[1]) == datetime(2026, 2, 5, 23, 59, 59)
+
+
+class TestTabChannelFilter:
+    """Tests for the channel checkboxes wired through the presenter."""
+
+    def test_trend_channel_filter_uses_catalogue(self):
+        """Test checking a channel shows only that channel's files."""
+        view = MagicMock()
+        view.get_selected_channels.return_value = []
+        presenter = TrendPresenter(view, MagicMock(), MagicMock())
+        presenter._on_files_loaded(NAMES)
+        view.show_files.assert_not_called()
+
+        view.get_selected_channels.return_value = ['1']
+        presenter._apply_file_filter()
+
+        view.show_files.assert_called_with([NAMES[0], NAMES[4]])
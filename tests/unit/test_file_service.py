@@ -352,6 +352,44 @@ class TestCacheManagement:
         file_service.clear_file_cache()
         
         assert len(file_service._file_cache) == 0
+    
+    def test_load_file_reuses_cached_parser(self, file_service, temp_data_file):
+        """Test an unchanged file is served from the cache."""
+        first = file_service.load_file(str(temp_data_file))
+        second = file_service.load_file(str(temp_data_file))
+        
+        assert second['data'] is first['data']
+        assert file_service.get_cache_stats()['hits'] == 1
+    
+    def test_modified_file_is_reparsed(self, file_service, temp_data_file):
+        """Test a changed file is parsed again."""
+        import os
+        file_service.load_file(str(temp_data_file))
+        temp_data_file.write_text(temp_data_file.read_text() + "\n0.6", encoding='utf-8')
+        os.utime(temp_data_file, ns=(1, 1))
+        
+        result = file_service.load_file(str(temp_data_file))
+        
+        assert len(result['data']) == 6
+    
+    def test_cache_respects_byte_budget(self, temp_data_file, tmp_path):
+        """Test old parsers are evicted once the budget is exceeded."""
+        probe = FileService()
+        probe.load_file(str(temp_data_file))
+        entry_bytes = probe.get_cache_stats()['bytes']
+        svc = FileService(cache_budget=int(entry_bytes * 2.5))
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"copy_{i}.txt"
+            path.write_text(temp_data_file.read_text(), encoding='utf-8')
+            paths.append(str(path))
+            svc.load_file(str(path))
+        
+        stats = svc.get_cache_stats()
+        assert stats['bytes'] <= svc.get_cache_stats()['max_bytes']
+        assert stats['evictions'] == 1
+        assert paths[-1] in svc._file_cache
+        assert paths[0] not in svc._file_cache
 
 
 class TestEdgeCases:
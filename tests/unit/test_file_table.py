@@ -0,0 +1,111 @@
+"""Unit tests for the columnar file group table and its Qt model."""
+import numpy as np
+import pytest
+from PyQt5.QtCore import Qt
+
+from vibration.core.services.file_table import FileTable
+from vibration.presentation.models.file_list_model import (
+    COL_CH, COL_COUNT, COL_DATE, COL_FS, COL_SELECT, COL_STATUS, FileListModel
+)
+
+
+def make_records(n=10):
+    """Create n groups over five days; every fourth group is an 'error' anomaly."""
+    return [{
+        'date': f"2026-02-0{1 + i // 2}",
+        'time': f"10:{i:02d}:00",
+        'count': i % 3 + 1,
+        'channel': 'CH1, CH2' if i % 2 else 'CH3',
+        'sampling_rate': 12800.0 if i % 4 == 0 else 25600.0,
+        'sensitivity': '100 mV/g',
+        'files': [f"f{i}_a.txt", f"f{i}_b.txt"],
+        'file_paths': [f"/d/f{i}_a.txt", f"/d/f{i}_b.txt"],
+        'is_anomaly': i % 4 == 0,
+        'anomaly_type': 'error' if i % 4 == 0 else '',
+    } for i in range(n)]
+
+
+class TestFileTable:
+    """Tests for FileTable sort orders and filter masks."""
+
+    def test_record_round_trip(self):
+        """Test a row comes back in the presenter's dict format."""
+        records = make_records()
+
+        assert FileTable.from_records(records).record(3) == records[3]
+
+    def test_descending_sort_is_stable(self):
+        """Test equal keys keep their original order in both directions."""
+        table = FileTable.from_records(make_records())
+
+        ascending = table.sort_order('count')
+        descending = table.sort_order('count', descending=True)
+
+        assert ascending.tolist() == [0, 3, 6, 9, 1, 4, 7, 2, 5, 8]
+        assert descending.tolist() == [2, 5, 8, 1, 4, 7, 0, 3, 6, 9]
+
+    def test_sort_subset_of_rows(self):
+        """Test the order is relative to the given rows."""
+        table = FileTable.from_records(make_records())
+        rows = np.array([9, 4, 0])
+
+        assert rows[table.sort_order('status', rows)].tolist() == [9, 4, 0]
+        assert rows[table.sort_order('date', rows, descending=True)].tolist() == [9, 4, 0]
+
+    def test_filter_masks(self):
+        """Test date, channel, sampling rate and anomaly masks combine."""
+        table = FileTable.from_records(make_records())
+
+        assert np.flatnonzero(table.mask(date_from='2026-02-02', date_to='2026-02-03')).tolist() == [2, 3, 4, 5]
+        assert np.flatnonzero(table.mask(channels=['CH2'])).tolist() == [1, 3, 5, 7, 9]
+        assert np.flatnonzero(table.mask(sampling_rates=[12800.0], anomaly=True)).tolist() == [0, 4, 8]
+        assert table.channel_names() == ['CH1', 'CH2', 'CH3']
+        assert table.date_range() == ('2026-02-01', '2026-02-05')
+
+
+class TestFileListModel:
+    """Tests for the permutation-backed table model."""
+
+    @pytest.fixture
+    def model(self):
+        model = FileListModel()
+        model.set_files(make_records())
+        return model
+
+    def test_display_and_background(self, model):
+        """Test precomputed display strings and anomaly colors."""
+        assert model.data(model.index(1, COL_FS)) == '25600'
+        assert model.data(model.index(0, COL_STATUS)) == 'Anomaly'
+        assert model.data(model.index(0, 0), Qt.BackgroundRole) is not None
+        assert model.data(model.index(1, 0), Qt.BackgroundRole) is None
+
+    def test_sort_and_filter_map_view_rows(self, model):
+        """Test row arguments follow the sorted, filtered view."""
+        model.sort(COL_COUNT, Qt.DescendingOrder)
+        model.set_filter(channels=['CH3'])
+
+        assert model.rowCount() == 5
+        assert model.get_row_data(0)['files'] == ['f2_a.txt', 'f2_b.txt']
+        assert model.data(model.index(0, COL_CH)) == 'CH3'
+
+    def test_checked_files_are_chronological_and_visible(self, model):
+        """Test checked hidden rows are excluded and files come in time order."""
+        model.sort(COL_DATE, Qt.DescendingOrder)
+        model.setData(model.index(0, COL_SELECT), Qt.Checked, Qt.CheckStateRole)
+        model.setData(model.index(9, COL_SELECT), Qt.Checked, Qt.CheckStateRole)
+
+        assert model.get_checked_rows() == [0, 9]
+        assert model.get_checked_files() == ['f0_a.txt', 'f0_b.txt', 'f9_a.txt', 'f9_b.txt']
+        model.set_filter(anomaly=True)
+        assert model.get_checked_files() == ['f0_a.txt', 'f0_b.txt']
+
+    def test_remove_rows_keeps_other_checks(self, model):
+        """Test bulk removal drops rows and keeps remaining checked state."""
+        model.set_all_checked(True)
+        model.setData(model.index(5, COL_SELECT), Qt.Unchecked, Qt.CheckStateRole)
+
+        model.remove_rows([0, 2, 4])
+
+        assert model.rowCount() == 7
+        assert model.get_row_data(0)['time'] == '10:01:00'
+        assert model.get_checked_rows() == [0, 1, 3, 4, 5, 6]
@@ -0,0 +1,154 @@
+"""Unit tests for the nearest-point picking index."""
+from datetime import datetime, timedelta
+
+import matplotlib.dates as mdates
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+
+from vibration.presentation.views.widgets.marker_manager import MarkerManager
+from vibration.presentation.views.widgets.pick_index import PickIndex, PointNavigator, axes_scale
+
+
+def brute_force(groups, x, y, sx, sy):
+    """Return (distance, tag, index) of the nearest point by full scan."""
+    best = (np.inf, None, -1)
+    for tag, (xs, ys) in groups.items():
+        dist = np.hypot((np.asarray(xs) - x) * sx, (np.asarray(ys) - y) * sy)
+        i = int(np.argmin(dist))
+        if dist[i] < best[0]:
+            best = (dist[i], tag, i)
+    return best
+
+
+class TestPickIndex:
+    """Tests for PickIndex lookups."""
+
+    def test_matches_brute_force(self):
+        """Test lookups agree with a full scan over several spectra."""
+        rng = np.random.default_rng(0)
+        frequency = np.arange(20_000) * 0.5
+        groups = {f"f{i}": (frequency, rng.uniform(0, 1, len(frequency))) for i in range(5)}
+        index = PickIndex()
+        for tag, (xs, ys) in groups.items():
+            index.add(xs, ys, tag=tag)
+
+        for x, y in rng.uniform([0, 0], [10_000, 1], size=(50, 2)):
+            pick = index.nearest(x, y, 0.08, 400.0)
+            dist, tag, i = brute_force(groups, x, y, 0.08, 400.0)
+            assert pick.distance == pytest.approx(dist)
+            assert (pick.tag, pick.index) == (tag, i)
+
+    def test_unsorted_input_reports_original_index(self):
+        """Test the index refers to positions in the arrays passed to add()."""
+        index = PickIndex()
+        index.add([3.0, 1.0, 2.0], [30.0, 10.0, 20.0], tag='a')
+
+        pick = index.nearest(1.1, 10.0)
+
+        assert (pick.x, pick.y, pick.index) == (1.0, 10.0, 1)
+
+    def test_datetime_x_and_nan_skipped(self):
+        """Test datetime x is converted once and NaN points are ignored."""
+        start = datetime(2026, 1, 1)
+        times = [start + timedelta(hours=h) for h in range(4)]
+        index = PickIndex()
+        index.add(times, [1.0, np.nan, 3.0, 4.0], tag=1)
+
+        pick = index.nearest(start + timedelta(hours=1), 2.0)
+
+        assert len(index) == 3
+        assert pick.index in (0, 2)
+        assert pick.x == pytest.approx(mdates.date2num(times[pick.index]))
+
+    def test_empty_index(self):
+        """Test an empty index returns None."""
+        assert PickIndex().nearest(0.0, 0.0) is None
+
+
+class TestPointNavigator:
+    """Tests for arrow-key navigation."""
+
+    @pytest.fixture
+    def navigator(self):
+        """Create two spectra on the same bins and one on a shifted grid."""
+        navigator = PointNavigator()
+        navigator.add([0.0, 1.0, 2.0], [1.0, 5.0, 2.0], tag='a')
+        navigator.add([0.0, 1.0, 2.0], [3.0, 4.0, 0.5], tag='b')
+        navigator.add([1.5], [9.0], tag='c')
+        return navigator
+
+    def test_up_down_within_same_x(self, navigator):
+        """Test up/down step through points sharing an x value."""
+        pos = navigator.locate(1.0, 4.0)
+
+        up = navigator.point(navigator.step(pos, 'up'))
+        down = navigator.point(navigator.step(pos, 'down'))
+
+        assert (up.tag, up.y) == ('a', 5.0)
+        assert navigator.step(navigator.step(pos, 'up'), 'up') == navigator.step(pos, 'up')
+        assert navigator.point(pos) == down
+
+    def test_left_right_follow_nearest_y(self, navigator):
+        """Test left/right move to the adjacent x and keep the closest y."""
+        pos = navigator.locate(1.0, 5.0)
+
+        right = navigator.point(navigator.step(pos, 'right'))
+        left = navigator.point(navigator.step(pos, 'left'))
+
+        assert (right.x, right.tag) == (1.5, 'c')
+        assert (left.x, left.y, left.tag) == (0.0, 3.0, 'b')
+
+    def test_edges_stay_put(self, navigator):
+        """Test stepping past either end keeps the current point."""
+        first = navigator.locate(0.0, 1.0)
+        last = navigator.locate(2.0, 2.0)
+
+        assert navigator.step(first, 'left') == first
+        assert navigator.step(last, 'right') == last
+
+    def test_point_reports_line_index(self, navigator):
+        """Test points map back to their position in the added line."""
+        point = navigator.point(navigator.locate(2.0, 0.5))
+
+        assert (point.tag, point.index) == ('b', 2)
+        assert len(navigator) == 7
+
+    def test_datetime_x(self):
+        """Test datetime trend points are navigable."""
+        start = datetime(2026, 1, 1)
+        navigator = PointNavigator()
+        navigator.add([start, start + timedelta(days=1)], [1.0, 2.0], tag=1)
+
+        pos = navigator.step(navigator.locate(start, 1.0), 'right')
+
+        assert navigator.point(pos).x == pytest.approx(mdates.date2num(start + timedelta(days=1)))
+
+
+class TestMarkerManagerPicking:
+    """Tests for MarkerManager using the shared index."""
+
+    def test_rebuilds_when_line_data_changes(self):
+        """Test the cached index follows set_data and skips the hover dot."""
+        ax = Figure().add_subplot(111)
+        line, = ax.plot([0.0, 1.0, 2.0], [0.0, 1.0, 0.0])
+        manager = MarkerManager(ax)
+        manager.init_hover_dot()
+        manager._hover_dot.set_data([5.0], [5.0])
+
+        assert manager.find_closest_point(1.9, 0.1)[:2] == (2.0, 0.0)
+
+        line.set_data([10.0, 11.0], [3.0, 4.0])
+
+        assert manager.find_closest_point(1.9, 0.1)[:2] == (10.0, 3.0)
+
+    def test_axes_scale_uses_pixels(self):
+        """Test axes_scale converts data units to pixels per axis."""
+        ax = Figure(figsize=(4, 2), dpi=100).add_subplot(111)
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 1)
+
+        sx, sy = axes_scale(ax)
+
+        assert sx == pytest.approx(ax.bbox.width / 10)
+        assert sy == pytest.approx(ax.bbox.height / 1)
@@ -0,0 +1,178 @@
+"""Unit tests for plot level-of-detail rendering."""
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+
+from vibration.core.services.waterfall_layout import SpectrumHeatmap
+from vibration.presentation.views.widgets.plot_lod import AxesLOD, ImageLOD, MinMaxPyramid, PeakPyramid
+
+
+@pytest.fixture
+def noise():
+    """Create a one-minute noisy signal at 10240 Hz."""
+    rng = np.random.default_rng(0)
+    return rng.standard_normal(10240 * 60)
+
+
+class TestMinMaxPyramid:
+    """Tests for MinMaxPyramid queries."""
+
+    def test_small_span_returns_raw_samples(self):
+        """Test a span with few samples is drawn without decimation."""
+        y = np.arange(100.0)
+        pyramid = MinMaxPyramid(y, x0=0.0, dx=0.1)
+
+        x, values = pyramid.query(1.0, 2.0, 800)
+
+        np.testing.assert_array_equal(values, y[9:22])
+        np.testing.assert_allclose(x, np.arange(9, 22) * 0.1)
+
+    def test_point_count_bounded_by_pixels(self, noise):
+        """Test the full view draws at most ~4 points per pixel column."""
+        pyramid = MinMaxPyramid(noise, dx=1 / 10240)
+
+        x, y = pyramid.query(*pyramid.x_range, 1000)
+
+        assert 2000 <= len(y) <= 4 * 1000 + 1
+        assert len(x) == len(y)
+
+    def test_envelope_is_exact(self, noise):
+        """Test the decimated line keeps the true min/max of every bucket."""
+        pyramid = MinMaxPyramid(noise, dx=1 / 10240)
+
+        x, y = pyramid.query(*pyramid.x_range, 1000)
+
+        assert y.max() == noise.max()
+        assert y.min() == noise.min()
+        block = int(round((x[2] - x[0]) * 10240))
+        np.testing.assert_array_equal(y[0:-1:2][:10], [noise[i * block:(i + 1) * block].min()
+                                                       for i in range(10)])
+        np.testing.assert_array_equal(y[1:-1:2][:10], [noise[i * block:(i + 1) * block].max()
+                                                       for i in range(10)])
+
+    def test_zoomed_query_covers_view(self, noise):
+        """Test a zoomed query spans the requested range at finer resolution."""
+        pyramid = MinMaxPyramid(noise, dx=1 / 10240)
+
+        full_x, _ = pyramid.query(*pyramid.x_range, 1000)
+        x, _ = pyramid.query(10.0, 12.0, 1000)
+
+        assert x[0] <= 10.0 and x[-1] >= 12.0 - (x[2] - x[0])
+        assert x[2] - x[0] < full_x[2] - full_x[0]
+
+    def test_from_xy_uses_uniform_spacing(self):
+        """Test x0/dx come from an evenly spaced time array."""
+        t = np.linspace(0, 1.0, 11)
+        pyramid = MinMaxPyramid.from_xy(t, np.zeros(11))
+
+        assert pyramid.x_range == pytest.approx((0.0, 1.0))
+
+
+class TestPeakPyramid:
+    """Tests for peak-preserving spectrum decimation."""
+
+    @pytest.fixture
+    def spectrum(self):
+        """Create a 100k-bin noise floor with two single-bin tones."""
+        rng = np.random.default_rng(1)
+        frequency = np.arange(100_000) * 0.1
+        values = rng.uniform(0.0, 0.01, len(frequency))
+        values[12_345] = 5.0
+        values[87_001] = 2.0
+        return frequency, values
+
+    def test_narrow_tones_survive(self, spectrum):
+        """Test single-bin tones are kept at their exact frequencies."""
+        frequency, values = spectrum
+        pyramid = PeakPyramid(frequency, values)
+
+        x, y = pyramid.query(*pyramid.x_range, 800)
+
+        assert len(y) <= 2 * 800 + 2
+        assert 5.0 in y and 2.0 in y
+        assert x[np.argmax(y)] == frequency[12_345]
+        assert x[list(y).index(2.0)] == frequency[87_001]
+
+    def test_bucket_values_are_maxima(self, spectrum):
+        """Test every drawn point is the maximum of its bucket."""
+        frequency, values = spectrum
+        pyramid = PeakPyramid(frequency, values)
+
+        x, y = pyramid.query(*pyramid.x_range, 800)
+
+        block = 64
+        assert len(y) == -(-len(values) // block) + 2
+        np.testing.assert_array_equal(y[1:11], [values[i * block:(i + 1) * block].max()
+                                                for i in range(10)])
+
+    def test_full_range_keeps_endpoints(self, spectrum):
+        """Test the decimated line spans the original x range."""
+        frequency, values = spectrum
+        pyramid = PeakPyramid(frequency, values)
+
+        x, _ = pyramid.query(*pyramid.x_range, 800)
+
+        assert x[0] == frequency[0] and x[-1] == frequency[-1]
+        assert np.all(np.diff(x) > 0)
+
+    def test_zoom_returns_raw_bins(self, spectrum):
+        """Test a narrow zoom draws every bin."""
+        frequency, values = spectrum
+        pyramid = PeakPyramid(frequency, values)
+
+        x, y = pyramid.query(1230.0, 1240.0, 800)
+
+        np.testing.assert_array_equal(y, values[12_299:12_402])
+
+
+class TestAxesLOD:
+    """Tests for re-querying lines on xlim changes."""
+
+    def test_xlim_change_requeries(self, noise):
+        """Test zooming replaces the line data with the new range."""
+        ax = Figure().add_subplot(111)
+        lod = AxesLOD(ax)
+        pyramid = MinMaxPyramid(noise, dx=1 / 10240)
+        line, = ax.plot(*pyramid.query(*pyramid.x_range, lod.pixel_width()))
+        lod.add(line, pyramid.query)
+
+        ax.set_xlim(30.0, 30.01)
+
+        x = line.get_xdata()
+        assert x[0] < 30.0 + 1e-3 and x[-1] > 30.01 - 1e-3
+        assert len(x) < 200
+
+    def test_reset_after_clear(self, noise):
+        """Test lines drawn after ax.clear() + reset() are still refreshed."""
+        ax = Figure().add_subplot(111)
+        lod = AxesLOD(ax)
+        ax.clear()
+        lod.reset()
+        pyramid = MinMaxPyramid(noise, dx=1 / 10240)
+        line, = ax.plot(*pyramid.query(*pyramid.x_range, lod.pixel_width()))
+        lod.add(line, pyramid.query)
+
+        ax.set_xlim(0.0, 0.001)
+
+        assert len(lod) == 1
+        assert line.get_xdata()[-1] < 0.01
+
+
+class TestImageLOD:
+    """Tests for re-pooling images on zoom."""
+
+    def test_zoom_requeries_image(self):
+        """Test zooming replaces the image with finer cells of the visible range."""
+        spectrum = np.random.default_rng(3).uniform(size=(5000, 4000))
+        ax = Figure().add_subplot(111)
+        lod = ImageLOD(ax, SpectrumHeatmap(np.arange(4000.0), spectrum))
+        full = lod.image.get_array().shape
+
+        ax.set_xlim(100.0, 120.0)
+        ax.set_ylim(10.0, 40.0)
+
+        x0, x1, y0, y1 = lod.image.get_extent()
+        assert full[0] < 5000 and full[1] < 4000
+        assert lod.image.get_array().shape == (31, 21)
+        assert (x0, y0) == (99.5, 9.5)
+        assert ax.get_xlim() == (100.0, 120.0)
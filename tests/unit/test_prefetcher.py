@@ -0,0 +1,128 @@
+"""Unit tests for the read-ahead Prefetcher."""
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from vibration.infrastructure.threading import Prefetcher
+
+
+def _array_loader(key: str) -> np.ndarray:
+    """Return a small array tagged with the key length."""
+    return np.full(100, len(key), dtype=np.float64)
+
+
+@pytest.fixture
+def prefetcher():
+    """Create a Prefetcher with a generous budget."""
+    pf = Prefetcher(loader=_array_loader, sizer=lambda a: a.nbytes)
+    yield pf
+    pf.shutdown()
+
+
+class TestPrefetcher:
+    """Tests for scheduling, taking and cancelling prefetches."""
+
+    def test_take_returns_loaded_result(self, prefetcher):
+        """Test a scheduled key can be taken after loading."""
+        prefetcher.schedule(['abc'])
+        result = prefetcher.take('abc')
+        assert result is not None
+        assert np.all(result == 3)
+
+    def test_take_unscheduled_returns_none(self, prefetcher):
+        """Test taking an unknown key is a miss."""
+        assert prefetcher.take('missing') is None
+
+    def test_take_removes_entry(self, prefetcher):
+        """Test a result is only handed out once."""
+        prefetcher.schedule(['abc'])
+        assert prefetcher.take('abc') is not None
+        assert prefetcher.take('abc') is None
+        assert prefetcher.memory_used == 0
+
+    def test_duplicate_schedule_ignored(self, prefetcher):
+        """Test already scheduled keys are not resubmitted."""
+        assert prefetcher.schedule(['a', 'b']) == 2
+        assert prefetcher.schedule(['a', 'b', 'c']) == 1
+
+    def test_cancel_drops_results(self, prefetcher):
+        """Test cancel discards scheduled work and stored results."""
+        prefetcher.schedule(['a', 'b'])
+        prefetcher.take('a')
+        prefetcher.cancel()
+        assert prefetcher.take('b') is None
+        assert prefetcher.memory_used == 0
+
+    def test_cancel_discards_running_result(self):
+        """Test a result finishing after cancel is not stored."""
+        release = threading.Event()
+
+        def slow_loader(key):
+            release.wait(5)
+            return np.zeros(10)
+
+        pf = Prefetcher(loader=slow_loader, sizer=lambda a: a.nbytes)
+        try:
+            pf.schedule(['a'])
+            pf.cancel()
+            release.set()
+            pf.shutdown()
+            assert pf.memory_used == 0
+            assert pf.take('a') is None
+        finally:
+            release.set()
+
+    def test_instant_loader_does_not_block_schedule(self, prefetcher):
+        """Test loads finishing before schedule returns are stored."""
+        assert prefetcher.schedule(['a', 'bb', 'ccc']) == 3
+        assert np.all(prefetcher.take('ccc') == 3)
+        assert np.all(prefetcher.take('a') == 1)
+
+    def test_schedule_stops_at_memory_budget(self):
+        """Test no more work is scheduled once the budget is reached."""
+        pf = Prefetcher(loader=_array_loader, sizer=lambda a: a.nbytes,
+                        max_workers=1, memory_budget=1000)
+        try:
+            pf.schedule(['a'])
+            deadline = time.monotonic() + 5
+            while pf.memory_used == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert pf.memory_used == 800
+
+            # 800 bytes stored + one pending (~800) exceeds the budget
+            assert pf.schedule(['bb', 'ccc']) == 1
+            assert pf.take('ccc') is None
+        finally:
+            pf.shutdown()
+
+    def test_take_timeout_is_a_miss(self):
+        """Test a load still running past the timeout is not waited for."""
+        release = threading.Event()
+
+        def slow_loader(key):
+            release.wait(5)
+            return np.zeros(10)
+
+        pf = Prefetcher(loader=slow_loader, sizer=lambda a: a.nbytes)
+        try:
+            pf.schedule(['a'])
+            assert pf.take('a', timeout=0.01) is None
+            release.set()
+            assert pf.take('a') is None
+        finally:
+            release.set()
+            pf.shutdown()
+
+    def test_failed_loader_is_a_miss(self):
+        """Test loader exceptions surface as a None result."""
+        def failing_loader(key):
+            raise IOError("boom")
+
+        pf = Prefetcher(loader=failing_loader, sizer=lambda a: 0)
+        try:
+            pf.schedule(['a'])
+            assert pf.take('a') is None
+        finally:
+            pf.shutdown()
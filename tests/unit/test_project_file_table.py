@@ -0,0 +1,98 @@
+"""Unit tests for the columnar project file table and project format versions."""
+import json
+
+import numpy as np
+import pytest
+
+from vibration.core.domain.models import ProjectData, ProjectFileInfo
+from vibration.core.services.project_file_table import ProjectFileTable
+from vibration.core.services.project_service import FILE_TABLE_DIR, ProjectService
+
+
+def make_infos():
+    """Create six files in three (date, time) groups, stored out of time order."""
+    return [
+        ProjectFileInfo(f"{date}/{date}_{time.replace(':', '-')}_1_{ch}.txt", date, time,
+                        'CH1, CH2', 25600.0, '100 mV/g', date == '2026-02-02')
+        for date, time in [('2026-02-02', '09:00:00'), ('2026-02-01', '10:00:00'),
+                           ('2026-02-01', '09:30:00')]
+        for ch in (1, 2)
+    ]
+
+
+@pytest.fixture
+def project():
+    infos = make_infos()
+    return ProjectData(name='p', description='d', created_at='now', parent_folder='/data',
+                       measurement_type='ACC', files=ProjectFileTable.from_infos(infos))
+
+
+class TestProjectFileTable:
+    """Tests for ProjectFileTable storage and access."""
+
+    def test_round_trip_is_lazy(self, tmp_path):
+        """Test a saved table reopens as memmaps and yields the same rows."""
+        infos = make_infos()
+        ProjectFileTable.from_infos(infos).save(tmp_path)
+
+        table = ProjectFileTable.open(tmp_path)
+
+        assert isinstance(table.column('date'), np.memmap)
+        assert len(table) == len(infos)
+        assert list(table) == infos
+        assert table[-1] == infos[-1]
+        assert table.relative_paths(2, 4) == [infos[2].relative_path, infos[3].relative_path]
+
+    def test_groups_are_chronological(self):
+        """Test groups come back in (date, time) order with rows in stored order."""
+        groups = [(d, t, rows.tolist())
+                  for d, t, rows in ProjectFileTable.from_infos(make_infos()).groups()]
+
+        assert groups == [('2026-02-01', '09:30:00', [4, 5]),
+                          ('2026-02-01', '10:00:00', [2, 3]),
+                          ('2026-02-02', '09:00:00', [0, 1])]
+
+    def test_incomplete_table_does_not_open(self, tmp_path):
+        """Test a table whose index does not match its columns is rejected."""
+        ProjectFileTable.from_infos(make_infos()).save(tmp_path)
+        np.save(tmp_path / 'is_anomaly.npy', np.zeros(2, dtype=bool))
+
+        assert ProjectFileTable.open(tmp_path) is None
+        assert ProjectFileTable.open(tmp_path / 'missing') is None
+
+
+class TestProjectFormat:
+    """Tests for ProjectService format 2 saving and format 1 compatibility."""
+
+    def test_save_writes_header_json_and_table(self, project, tmp_path):
+        """Test project.json holds no per-file objects in format 2."""
+        json_path = ProjectService().save_project(project, str(tmp_path))
+
+        with open(json_path, encoding='utf-8') as f:
+            data = json.load(f)
+        assert data['format_version'] == 2
+        assert 'files' not in data
+
+        loaded = ProjectService().load_project(json_path)
+        assert isinstance(loaded.files, ProjectFileTable)
+        assert list(loaded.files) == list(project.files)
+        assert loaded.measurement_type == 'ACC'
+
+    def test_reads_format_1_json(self, project, tmp_path):
+        """Test a legacy project.json with a files list still loads."""
+        legacy = ProjectData(name='p', description='d', created_at='now', parent_folder='/data',
+                             files=make_infos())
+        json_path = tmp_path / 'project.json'
+        json_path.write_text(json.dumps(legacy.to_dict()), encoding='utf-8')
+
+        loaded = ProjectService().load_project(str(json_path))
+
+        assert isinstance(loaded.files, ProjectFileTable)
+        assert list(loaded.files) == make_infos()
+
+    def test_missing_table_fails_load(self, project, tmp_path):
+        """Test a format 2 project without its file table is reported as a failure."""
+        json_path = ProjectService().save_project(project, str(tmp_path))
+        (tmp_path / project.project_folder / FILE_TABLE_DIR / 'index.json').unlink()
+
+        assert ProjectService().load_project(json_path) is None
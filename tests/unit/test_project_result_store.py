@@ -0,0 +1,191 @@
+"""Unit tests for the project result store."""
+import os
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from vibration.core.services import (
+    PeakService, ProjectResultStore, SpectraStore, TrendService
+)
+from vibration.presentation.presenters import waterfall_presenter as wf_module
+from vibration.presentation.presenters.trend_presenter import TrendPresenter
+from vibration.presentation.presenters.waterfall_presenter import WaterfallPresenter
+
+
+def create_trend_file(filepath: Path, frequency: float, amplitude: float = 1.0,
+                      sampling_rate: float = 10240.0, duration: float = 0.5) -> str:
+    """Create a synthetic vibration data file."""
+    t = np.arange(int(sampling_rate * duration)) / sampling_rate
+    signal = amplitude * np.sin(2 * np.pi * frequency * t)
+    lines = [
+        f"#D.Sampling Freq.: {sampling_rate} Hz",
+        "#b.Sensitivity: 100.0 mV/g",
+        "#Sensitivity: 100.0 mV/g",
+        f"#Record Length: {duration} sec",
+        "#",
+    ] + [f"{v:.8f}" for v in signal]
+    filepath.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return str(filepath)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Create three files on two channels."""
+    directory = tmp_path / "data"
+    directory.mkdir()
+    for i, channel in enumerate(['CH1', 'CH2', 'CH1']):
+        create_trend_file(directory / f"2026-02-06_10-0{i}-00_{channel}.txt",
+                          frequency=100.0 * (i + 1), amplitude=1.0 + i)
+    return directory
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store in a fresh project folder."""
+    return ProjectResultStore(str(tmp_path / "project"))
+
+
+def file_paths(directory):
+    return sorted(str(p) for p in directory.iterdir())
+
+
+class TestTrendResults:
+    """Tests for Trend/Peak persistence."""
+
+    def test_trend_round_trip(self, store, data_dir):
+        """Test a restored trend result matches the computed one."""
+        result = TrendService(max_workers=1).compute_trend(
+            file_paths(data_dir), frequency_band=(10.0, 1000.0)
+        )
+        params = {'view_type': 'ACC', 'frequency_band': (10.0, 1000.0),
+                  'file_names': ('a.txt', 'b.txt')}
+
+        store.save_trend('trend', result, params)
+        restored = store.load_trend('trend')
+
+        loaded = restored['result']
+        assert restored['params'] == params
+        assert loaded.filenames == result.filenames
+        assert loaded.timestamps == result.timestamps
+        np.testing.assert_array_equal(loaded.rms_values, result.rms_values)
+        np.testing.assert_array_equal(loaded.peak_frequencies, result.peak_frequencies)
+        assert loaded.frequency_band == (10.0, 1000.0)
+        assert loaded.channel_data == result.channel_data
+
+    def test_peak_kept_separately(self, store, data_dir):
+        """Test peak results live in their own folder."""
+        result = PeakService(max_workers=1).compute_peak_trend(file_paths(data_dir))
+
+        store.save_trend('peak', result)
+
+        assert store.has_result('peak')
+        assert not store.has_result('trend')
+        assert (store.project_dir / 'results' / 'peak' / 'index.json').is_file()
+        np.testing.assert_array_equal(
+            store.load_trend('peak')['result'].peak_values, result.peak_values
+        )
+
+    def test_missing_or_interrupted_results(self, store, data_dir):
+        """Test a missing index or column reads as no result."""
+        assert store.load_trend('trend') is None
+
+        store.save_trend('trend', TrendService(max_workers=1).compute_trend(file_paths(data_dir)))
+        (store.result_dir('trend') / 'value.npy').unlink()
+
+        assert store.load_trend('trend') is None
+
+    def test_unknown_kind(self, store):
+        """Test an unknown result kind is rejected."""
+        with pytest.raises(ValueError):
+            store.result_dir('orbit')
+
+
+class TestSpectra:
+    """Tests for waterfall spectrum persistence."""
+
+    @pytest.fixture
+    def spectra(self, tmp_path):
+        """Create a two-row store whose second row is shorter."""
+        spectra = SpectraStore.create(str(tmp_path / "work"), 5, 1.0, ['a.txt', 'b.txt'],
+                                      [datetime(2026, 2, 6, 10), datetime(2026, 2, 6, 11)])
+        spectra.write_row(0, np.linspace(0, 1, 5), 10.0)
+        spectra.write_row(1, np.ones(3), 6.0)
+        spectra.flush()
+        return spectra
+
+    def test_ragged_spectra_round_trip(self, store, spectra):
+        """Test the project copy opens as a memmap with per-row lengths."""
+        store.save_spectra(spectra, {'view_type': 2, 'file_names': ['a.txt', 'b.txt']})
+        restored = store.load_spectra()
+
+        assert restored.params == {'view_type': 2, 'file_names': ('a.txt', 'b.txt')}
+        assert restored.file_names == ['a.txt', 'b.txt']
+        assert isinstance(restored.spectra, np.memmap)
+        np.testing.assert_allclose(restored.row_spectrum(0), np.linspace(0, 1, 5), rtol=1e-6)
+        np.testing.assert_array_equal(restored.row_frequency(1), np.arange(3.0))
+        assert restored.sampling_rates[1] == 6.0
+
+    def test_clear(self, store, spectra):
+        """Test clear removes the index and columns."""
+        store.save_spectra(spectra)
+
+        store.clear('spectrum')
+
+        assert store.load_spectra() is None
+        assert list(store.result_dir('spectrum').iterdir()) == []
+
+
+class TestPresenterRestore:
+    """Tests for restoring plots on project load without raw data."""
+
+    def test_trend_presenter_saves_and_restores(self, tmp_path, data_dir):
+        """Test a computed trend is written on save and replotted on load."""
+        json_path = str(tmp_path / "project" / "project.json")
+        view = MagicMock()
+        presenter = TrendPresenter(view, TrendService(max_workers=1), MagicMock())
+        presenter._trend_cache = {
+            'computed': True,
+            'result': TrendService(max_workers=1).compute_trend(file_paths(data_dir)),
+            'params': {'file_names': ('x',)},
+        }
+        presenter._on_project_saved(json_path)
+
+        fresh = TrendPresenter(MagicMock(), MagicMock(), MagicMock())
+        fresh._on_project_loaded(json_path)
+
+        assert fresh.get_last_result().num_files == 3
+        assert fresh._trend_cache['params'] == {'file_names': ('x',)}
+        fresh.view.plot_trend.assert_called_once()
+        fresh.trend_service.compute_trend.assert_not_called()
+
+    def test_waterfall_restores_after_raw_files_removed(self, tmp_path, monkeypatch):
+        """Test the waterfall is rebuilt from the project when raw data is gone."""
+        monkeypatch.setattr(wf_module, 'ProgressDialog', MagicMock())
+        data = tmp_path / "wf"
+        data.mkdir()
+        names = [Path(create_trend_file(data / f"2026-02-06_10-0{i}-00_CH1.txt",
+                                        100.0 * (i + 1))).name for i in range(2)]
+        json_path = str(tmp_path / "project" / "project.json")
+
+        presenter = WaterfallPresenter(view=MagicMock(), directory_path=str(data))
+        presenter._spectrum_processor.max_workers = 1
+        presenter._compute_waterfall_fft(names, 2.0, 50.0, 'hanning', 1)
+        presenter._waterfall_cache['params'] = {'view_type': 1, 'file_names': tuple(names)}
+        presenter._on_project_saved(json_path)
+        for name in names:
+            os.remove(data / name)
+
+        view = MagicMock()
+        view.get_parameters.return_value = {'angle': 270.0}
+        restored = WaterfallPresenter(view=view)
+        restored._render_waterfall = MagicMock()
+        restored._on_project_loaded(json_path)
+
+        spectra = restored._waterfall_cache['store']
+        assert spectra.file_names == names
+        peak = spectra.row_frequency(1)[np.argmax(spectra.row_spectrum(1))]
+        assert peak == pytest.approx(200.0)
+        restored._render_waterfall.assert_called_once()
@@ -0,0 +1,78 @@
+"""Unit tests for the on-disk waterfall spectra store."""
+import json
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from vibration.core.services.spectra_store import INDEX_FILE, SpectraStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a three-row store; the last row is shorter than the others."""
+    store = SpectraStore.create(
+        str(tmp_path / "a"), 6, 0.5, ['f0.txt', 'f1.txt', 'f2.txt'],
+        [datetime(2026, 2, 6, 10, i) for i in range(3)], {'view_type': 1}
+    )
+    store.write_row(0, np.arange(6.0), 100.0, ('/d/f0.txt', 10, 1))
+    store.write_row(1, np.arange(6.0) * 2, 100.0, ('/d/f1.txt', 10, 2))
+    store.write_row(2, np.ones(4), 50.0)
+    store.flush()
+    return store
+
+
+class TestSpectraStore:
+    """Tests for SpectraStore writing, reopening and copying."""
+
+    def test_open_round_trip(self, store):
+        """Test a flushed store reopens as a read-only memmap."""
+        opened = SpectraStore.open(str(store.directory))
+
+        assert isinstance(opened.spectra, np.memmap) and opened.spectra.dtype == np.float32
+        assert opened.file_names == ['f0.txt', 'f1.txt', 'f2.txt']
+        assert opened.timestamps[2] == np.datetime64('2026-02-06T10:02:00')
+        np.testing.assert_array_equal(opened.frequency, np.arange(6) * 0.5)
+        np.testing.assert_array_equal(opened.row_spectrum(2), np.ones(4))
+        assert np.isnan(opened.spectra[2, 4:]).all()
+        assert opened.params == {'view_type': 1}
+
+    def test_band_reads_one_column(self, store):
+        """Test band() returns the nearest bin of every row, NaN past short rows."""
+        freq, values = store.band(2.4)
+
+        assert freq == 2.5
+        np.testing.assert_array_equal(values, [5.0, 10.0, np.nan])
+
+    def test_source_rows_skip_rows_without_source(self, store):
+        """Test only rows written with source information are reusable."""
+        assert store.source_rows() == {('/d/f0.txt', 10, 1): 0, ('/d/f1.txt', 10, 2): 1}
+
+    def test_copy_rows_between_stores(self, store, tmp_path):
+        """Test rows and their metadata are copied into a new order."""
+        target = SpectraStore.create(str(tmp_path / "b"), 6, 0.5, ['f1.txt', 'f0.txt'],
+                                     [datetime(2026, 2, 6)] * 2)
+
+        target.copy_rows(store, [1, 0], [0, 1])
+
+        np.testing.assert_array_equal(target.row_spectrum(0), np.arange(6.0) * 2)
+        assert target.source_rows() == {('/d/f1.txt', 10, 2): 0, ('/d/f0.txt', 10, 1): 1}
+
+    def test_unflushed_or_other_version_is_not_opened(self, store, tmp_path):
+        """Test a store without a matching index is treated as missing."""
+        unflushed = SpectraStore.create(str(tmp_path / "c"), 4, 1.0, ['x.txt'], [datetime.max])
+        index_path = store.directory / INDEX_FILE
+        index = json.loads(index_path.read_text(encoding='utf-8'))
+        index_path.write_text(json.dumps(dict(index, version=1)), encoding='utf-8')
+
+        assert SpectraStore.open(str(unflushed.directory)) is None
+        assert SpectraStore.open(str(store.directory)) is None
+
+    def test_temporary_store_removed_on_close(self):
+        """Test a store created without a directory owns and deletes it."""
+        store = SpectraStore.create(None, 4, 1.0, ['x.txt'], [datetime(2026, 1, 1)])
+        directory = store.directory
+
+        store.close()
+
+        assert not directory.exists()
@@ -0,0 +1,279 @@
+"""Unit tests for Spectrum presenter file loading and read-ahead."""
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from vibration.core.services.fft_service import FFTService
+from vibration.core.services.file_service import FileService
+from vibration.presentation.presenters import spectrum_presenter as sp_module
+from vibration.presentation.presenters.spectrum_presenter import SpectrumPresenter
+
+
+def create_signal_file(filepath: Path, num_samples: int,
+                       sampling_rate: float = 10240.0) -> str:
+    """Create a sine signal file in the FileParser text format."""
+    signal = np.sin(2 * np.pi * 100 * np.arange(num_samples) / sampling_rate)
+    header = (
+        f"D.Sampling Freq.: {sampling_rate} Hz\n"
+        "Channel: CH1\n"
+        "Sensitivity: 100 mV/g\n"
+        "b.Sensitivity: 100\n"
+        f"Record Length: {num_samples / sampling_rate} sec\n"
+        "\n"
+    )
+    filepath.write_text(header + "\n".join(f"{v:.6f}" for v in signal),
+                        encoding='utf-8')
+    return filepath.name
+
+
+@pytest.fixture
+def presenter(tmp_path, monkeypatch):
+    """Create a SpectrumPresenter with a mocked view (NFFT = 1024)."""
+    monkeypatch.setattr(sp_module, 'ProgressDialog', MagicMock())
+    monkeypatch.setattr(sp_module, 'QApplication', MagicMock())
+
+    p = SpectrumPresenter(
+        view=MagicMock(),
+        fft_service=FFTService(sampling_rate=10240.0, delta_f=10.0, overlap=50.0),
+        file_service=FileService()
+    )
+    p._directory_path = str(tmp_path)
+    yield p
+    p._prefetcher.shutdown()
+
+
+class TestLoadAndComputeFile:
+    """Tests for the per-file load + FFT worker."""
+
+    def test_valid_file_returns_result(self, presenter, tmp_path):
+        """Test a file longer than NFFT yields signal data and spectrum."""
+        name = create_signal_file(tmp_path / "long.txt", 4096)
+
+        signal_data, result, length = presenter._load_and_compute_file(
+            name, 1024, 'ACC'
+        )
+
+        assert signal_data is not None
+        assert result is not None
+        assert length == 4096
+        assert signal_data.channel == name
+
+    def test_short_file_returns_length(self, presenter, tmp_path):
+        """Test a file shorter than NFFT is skipped with its length."""
+        name = create_signal_file(tmp_path / "short.txt", 500)
+
+        assert presenter._load_and_compute_file(name, 1024, 'ACC') == \
+            (None, None, 500)
+
+    def test_missing_file_returns_zero_length(self, presenter):
+        """Test a missing file is reported with zero length."""
+        assert presenter._load_and_compute_file('missing.txt', 1024, 'ACC') == \
+            (None, None, 0)
+
+
+class TestLoadAndPlotFiles:
+    """Tests for the parallel load + plot path."""
+
+    def test_results_follow_selection_order(self, presenter, tmp_path, monkeypatch):
+        """Test plots keep the selection order when workers finish out of order."""
+        names = [create_signal_file(tmp_path / f"f{i}.txt", 2048) for i in range(4)]
+        original = presenter._load_and_compute_file
+
+        def delayed(filename, *args):
+            # 앞쪽 파일일수록 늦게 끝나도록 지연
+            time.sleep(0.05 * (len(names) - names.index(filename)))
+            return original(filename, *args)
+
+        monkeypatch.setattr(presenter, '_load_and_compute_file', delayed)
+        presenter._load_and_plot_files(names)
+
+        labels = [c.kwargs['label'] for c in presenter.view.plot_spectrum.call_args_list]
+        assert labels == names
+        assert [s.channel for s in presenter._signal_data_list] == names
+        assert list(presenter._computed_cache) == names
+
+    def test_only_short_files_are_reported_as_skipped(self, presenter, tmp_path):
+        """Test the warning lists short files but not invalid or missing ones."""
+        good = create_signal_file(tmp_path / "good.txt", 2048)
+        short = create_signal_file(tmp_path / "short.txt", 300)
+        (tmp_path / "empty.txt").write_text("", encoding='utf-8')
+
+        presenter._load_and_plot_files([good, short, "empty.txt", "missing.txt"])
+
+        presenter.view.show_warning.assert_called_once()
+        message = presenter.view.show_warning.call_args.args[1]
+        assert "short.txt (길이: 300)" in message
+        assert "empty.txt" not in message
+        assert "missing.txt" not in message
+        assert [s.channel for s in presenter._signal_data_list] == [good]
+
+    def test_computed_cache_stays_within_budget(self, presenter, tmp_path):
+        """Test the computed cache evicts old files instead of growing."""
+        names = [create_signal_file(tmp_path / f"f{i}.txt", 2048) for i in range(4)]
+        presenter._load_and_plot_files(names[:1])
+        presenter._computed_cache.max_bytes = presenter._computed_cache.current_bytes * 2
+
+        presenter._load_and_plot_files(names[1:])
+
+        assert list(presenter._computed_cache) == names[2:]
+        assert presenter._computed_cache.stats()['evictions'] == 2
+
+
+class TestSensitivityRescale:
+    """Tests for applying custom sensitivity without reloading files."""
+
+    def test_sensitivity_change_rescales_plotted_signals(self, presenter, tmp_path, monkeypatch):
+        """Test a new sensitivity replots every signal as a multiply, with no FFT."""
+        names = [create_signal_file(tmp_path / f"f{i}.txt", 2048) for i in range(3)]
+        presenter._load_and_plot_files(names)
+        unscaled = [np.array(c.kwargs['spectrum'])
+                    for c in presenter.view.plot_spectrum.call_args_list]
+        presenter.view.plot_spectrum.reset_mock()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("files must not be reloaded")
+
+        monkeypatch.setattr(presenter, '_load_and_compute_file', fail)
+        monkeypatch.setattr(presenter.fft_service, 'compute_spectrum', fail)
+        presenter.view.Sensitivity_edit.text.return_value = "50"
+        presenter._on_sensitivity_changed()
+
+        calls = presenter.view.plot_spectrum.call_args_list
+        assert [c.kwargs['label'] for c in calls] == names
+        for call, spectrum in zip(calls, unscaled):
+            np.testing.assert_allclose(call.kwargs['spectrum'], spectrum * 20.0)
+        assert presenter.get_last_results()[0].spectrum == pytest.approx(unscaled[0] * 20.0)
+
+    def test_rescale_matches_scaled_input(self, presenter, tmp_path):
+        """Test multiplying the spectrum equals transforming the scaled signal."""
+        name = create_signal_file(tmp_path / "a.txt", 2048)
+        signal_data, result, _ = presenter._load_and_compute_file(name, 1024, 'VEL')
+
+        direct = presenter.fft_service.compute_spectrum(
+            data=signal_data.data / 0.05, view_type='VEL'
+        )
+
+        np.testing.assert_allclose(result.scaled(20.0).spectrum, direct.spectrum,
+                                   rtol=1e-9, atol=1e-12)
+        assert result.scaled(20.0).rms == pytest.approx(direct.rms)
+
+    def test_span_spectrum_uses_frame_index(self, presenter, tmp_path, monkeypatch):
+        """Test span popups average precomputed frames instead of re-running FFTs."""
+        names = [create_signal_file(tmp_path / f"f{i}.txt", 8192) for i in range(3)]
+        presenter._load_and_plot_files(names)
+        for future in presenter._frame_indexes.values():
+            future.result(timeout=5)
+        window = MagicMock()
+        monkeypatch.setattr(sp_module, 'SpectrumWindow', MagicMock(return_value=window))
+        monkeypatch.setattr(presenter.fft_service, 'compute_spectrum', MagicMock(
+            side_effect=AssertionError("span should use the frame index")))
+
+        presenter._on_time_range_selected(0.05, 0.5)
+
+        assert window.plot_spectrum.call_count == 3
+        spectrum = np.array(window.plot_spectrum.call_args.kwargs['spectrum'])
+        frequencies = np.array(window.plot_spectrum.call_args.kwargs['frequencies'])
+        assert frequencies[np.argmax(spectrum)] == pytest.approx(100.0)
+
+    def test_compute_replaces_frame_indexes(self, presenter, tmp_path, monkeypatch):
+        """Test a new Compute drops frame indexes of the previous plot."""
+        monkeypatch.setattr(presenter, '_schedule_prefetch', MagicMock())
+        names = [create_signal_file(tmp_path / f"f{i}.txt", 2048) for i in range(2)]
+        presenter._load_and_plot_files(names)
+        presenter.view.get_selected_files.return_value = names[1:]
+        presenter.view.get_parameters.return_value = {}
+
+        presenter._on_compute_requested()
+
+        assert list(presenter._frame_indexes) == names[1:]
+
+    def test_invalid_sensitivity_resets_scale(self, presenter):
+        """Test zero or text input falls back to the file scale."""
+        presenter.view.Sensitivity_edit.text.return_value = "0"
+        presenter._on_sensitivity_changed()
+
+        assert presenter._sensitivity_scale() == 1.0
+
+
+def attach_file_list(presenter, names, selected_row):
+    """Attach a fake file list widget with one selected row."""
+    items = []
+    for name in names:
+        item = MagicMock()
+        item.text.return_value = name
+        items.append(item)
+
+    file_list = presenter.view.file_list
+    file_list.count.return_value = len(names)
+    file_list.item.side_effect = lambda row: items[row] if 0 <= row < len(items) else None
+    file_list.row.side_effect = items.index
+    file_list.selectedItems.return_value = [items[selected_row]]
+    return items
+
+
+class TestPrefetchIntegration:
+    """Tests for how the presenter drives the read-ahead prefetcher."""
+
+    def test_view_type_change_rebuilds_loader(self, presenter, tmp_path):
+        """Test prefetches after ACC -> VEL are computed in VEL."""
+        name = create_signal_file(tmp_path / "a.txt", 2048)
+        presenter._prefetcher.schedule([name])
+
+        presenter._on_view_type_changed(2)
+
+        assert presenter._prefetcher.take(name) is None
+        presenter._prefetcher.schedule([name])
+        _, result, _ = presenter._prefetcher.take(name)
+        assert result.view_type == 'VEL'
+
+    def test_sensitivity_change_keeps_prefetched_results(self, presenter, tmp_path):
+        """Test prefetched (unscaled) results survive a sensitivity change."""
+        name = create_signal_file(tmp_path / "a.txt", 2048)
+        raw, _, _ = presenter._load_and_compute_file(name, 1024, 'ACC')
+        presenter._prefetcher.schedule([name])
+
+        presenter.view.Sensitivity_edit.text.return_value = "50"
+        presenter._on_sensitivity_changed()
+
+        signal_data, _, _ = presenter._prefetcher.take(name, timeout=5)
+        np.testing.assert_array_equal(signal_data.data, raw.data)
+
+    def test_file_click_reschedules_read_ahead(self, presenter, tmp_path):
+        """Test clicking a file cancels old work and prefetches the files after it."""
+        names = [create_signal_file(tmp_path / f"f{i}.txt", 2048) for i in range(6)]
+        attach_file_list(presenter, names, selected_row=0)
+        presenter._schedule_prefetch()
+
+        attach_file_list(presenter, names, selected_row=3)
+        presenter._on_file_clicked(names[3])
+
+        assert presenter._prefetcher.take(names[1]) is None
+        assert presenter._prefetcher.take(names[4]) is not None
+
+    def test_date_filter_cancels_read_ahead(self, presenter, tmp_path):
+        """Test changing the date filter drops scheduled prefetches."""
+        name = create_signal_file(tmp_path / "a.txt", 2048)
+        presenter._prefetcher.schedule([name])
+
+        presenter._on_date_filter_changed("2026-01-01", "2026-12-31")
+
+        assert presenter._prefetcher.take(name) is None
+
+    def test_next_uses_prefetched_result(self, presenter, tmp_path, monkeypatch):
+        """Test Next plots a prefetched file without loading it again."""
+        names = [create_signal_file(tmp_path / f"f{i}.txt", 2048) for i in range(3)]
+        attach_file_list(presenter, names, selected_row=0)
+        presenter._prefetcher.schedule([names[1]])
+        deadline = time.monotonic() + 5
+        while presenter._prefetcher.memory_used == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        load = MagicMock()
+        monkeypatch.setattr(presenter, '_load_and_plot_files', load)
+        presenter._on_next_file_requested()
+
+        load.assert_not_called()
+        assert names[1] in presenter._computed_cache
@@ -0,0 +1,134 @@
+"""Unit tests for the shared-memory spectrum transport."""
+import pytest
+import numpy as np
+from pathlib import Path
+
+from vibration.core.services.spectrum_transport import (
+    SharedSpectraBuffer,
+    SpectrumBatchProcessor,
+    apply_spectrum_scale,
+    compute_file_spectrum,
+    max_spectrum_bins,
+)
+
+
+def create_spectrum_file(filepath: Path, frequency: float,
+                         sampling_rate: float = 2048.0, duration: float = 1.0) -> str:
+    """Create a synthetic vibration data file in the FileParser format."""
+    t = np.arange(int(sampling_rate * duration)) / sampling_rate
+    signal = np.sin(2 * np.pi * frequency * t)
+    header = (
+        f"D.Sampling Freq.: {sampling_rate} Hz\n"
+        "Channel: CH1\n"
+        "Sensitivity: 100 mV/g\n"
+        "b.Sensitivity: 100\n"
+        "\n"
+    )
+    filepath.write_text(header + "\n".join(f"{v:.6f}" for v in signal), encoding='utf-8')
+    return str(filepath)
+
+
+@pytest.fixture
+def spectrum_files(tmp_path):
+    """Create five files with peaks at 50, 100, ... 250 Hz."""
+    return [
+        create_spectrum_file(tmp_path / f"2026-02-06_10-0{i}-00_x_1.txt", 50.0 * (i + 1))
+        for i in range(5)
+    ]
+
+
+class TestSharedSpectraBuffer:
+    """Tests for SharedSpectraBuffer."""
+
+    def test_write_row_visible_in_parent(self):
+        """Test a row written through the shared name appears in the matrix."""
+        buffer = SharedSpectraBuffer(3, 4)
+        try:
+            if not buffer.is_shared:
+                pytest.skip("shared memory unavailable")
+            SharedSpectraBuffer.write_row(buffer.name, buffer.shape, 1, np.array([1.0, 2.0]))
+            np.testing.assert_array_equal(buffer.matrix[1], [1.0, 2.0, 0.0, 0.0])
+        finally:
+            buffer.release()
+
+    def test_fallback_uses_plain_array(self):
+        """Test use_shared_memory=False allocates a regular array."""
+        buffer = SharedSpectraBuffer(2, 3, use_shared_memory=False)
+
+        assert not buffer.is_shared
+        assert buffer.name is None
+        assert buffer.matrix.shape == (2, 3)
+
+
+class TestSpectrumBatchProcessor:
+    """Tests for SpectrumBatchProcessor.process_batch."""
+
+    @pytest.mark.parametrize("use_shared_memory", [True, False])
+    def test_rows_match_single_file_spectra(self, spectrum_files, use_shared_memory):
+        """Test each row equals the single-file spectrum in input order."""
+        processor = SpectrumBatchProcessor(max_workers=2, use_shared_memory=use_shared_memory)
+
+        batch = processor.process_batch(spectrum_files, 1.0, 50.0, 'hanning', 1)
+
+        assert batch.success.all()
+        for row, path in enumerate(spectrum_files):
+            frequency, spectrum, sampling_rate = compute_file_spectrum(
+                path, 1.0, 50.0, 'hanning', 1
+            )
+            np.testing.assert_array_equal(batch.spectrum(row), spectrum)
+            np.testing.assert_allclose(batch.frequency(row), frequency)
+            assert batch.sampling_rates[row] == sampling_rate
+            assert batch.frequency(row)[np.argmax(batch.spectrum(row))] == \
+                pytest.approx(50.0 * (row + 1))
+
+    def test_unscaled_rows_rescale_to_scaled(self, spectrum_files):
+        """Test apply_sensitivity=False returns the header scale separately."""
+        path = Path(spectrum_files[0])
+        path.write_text(path.read_text(encoding='utf-8').replace(
+            "b.Sensitivity: 100", "b.Sensitivity: 50"), encoding='utf-8')
+
+        batch = SpectrumBatchProcessor(max_workers=1).process_batch(
+            spectrum_files[:2], 1.0, 50.0, 'hanning', 1, apply_sensitivity=False
+        )
+
+        assert batch.scales.tolist() == [0.5, 1.0]
+        _, expected, _ = compute_file_spectrum(str(path), 1.0, 50.0, 'hanning', 1)
+        np.testing.assert_allclose(
+            apply_spectrum_scale(batch.spectrum(0), batch.scales[0]), expected, atol=1e-4
+        )
+
+    def test_spectrum_is_matrix_view(self, spectrum_files):
+        """Test row spectra are views into the batch matrix (no copy)."""
+        batch = SpectrumBatchProcessor(max_workers=2).process_batch(
+            spectrum_files, 1.0, 50.0, 'hanning', 1
+        )
+
+        assert np.shares_memory(batch.spectrum(0), batch.matrix)
+
+    def test_failed_file_marks_row(self, spectrum_files, tmp_path):
+        """Test unreadable files are reported without shifting other rows."""
+        paths = spectrum_files[:2] + [str(tmp_path / "missing.txt")] + spectrum_files[2:]
+
+        batch = SpectrumBatchProcessor(max_workers=2).process_batch(
+            paths, 1.0, 50.0, 'hanning', 1
+        )
+
+        assert batch.success.tolist() == [True, True, False, True, True, True]
+        assert 2 in batch.errors
+        assert batch.n_valid[2] == 0
+        assert batch.frequency(3)[np.argmax(batch.spectrum(3))] == pytest.approx(150.0)
+
+    def test_progress_callback(self, spectrum_files):
+        """Test progress reaches the total."""
+        calls = []
+        SpectrumBatchProcessor(max_workers=1).process_batch(
+            spectrum_files, 1.0, 50.0, 'hanning', 1,
+            progress_callback=lambda done, total: calls.append((done, total))
+        )
+
+        assert calls[-1] == (5, 5)
+
+
+def test_max_spectrum_bins_uses_header_sampling_rate(spectrum_files):
+    """Test the bin upper bound is fs / delta_f / 2 + 1."""
+    assert max_spectrum_bins(spectrum_files, 1.0) == 1025
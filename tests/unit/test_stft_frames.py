@@ -0,0 +1,68 @@
+"""Unit tests for the STFT frame index used by span spectra."""
+import numpy as np
+import pytest
+
+from vibration.core.services import stft_frames
+from vibration.core.services.fft_service import FFTService
+
+
+@pytest.fixture
+def service():
+    """NFFT = 1024, step = 512."""
+    return FFTService(sampling_rate=10240.0, delta_f=10.0, overlap=50.0)
+
+
+@pytest.fixture
+def signal():
+    rng = np.random.default_rng(0)
+    t = np.arange(40960) / 10240.0
+    return np.sin(2 * np.pi * 120 * t) + 0.1 * rng.standard_normal(len(t))
+
+
+class TestSTFTFrameIndex:
+    """Tests for STFTFrameIndex and FFTService.compute_span_spectrum."""
+
+    @pytest.mark.parametrize("span", [(0, 40960), (1536, 7680), (100, 1124)])
+    @pytest.mark.parametrize("view_type", ['ACC', 'VEL'])
+    def test_aligned_span_matches_welch(self, service, signal, span, view_type):
+        """Test spans on the frame grid (or a single frame) equal a direct FFT."""
+        index = service.build_frame_index(signal)
+
+        span_result = service.compute_span_spectrum(index, *span, view_type=view_type)
+        direct = service.compute_spectrum(signal[span[0]:span[1]], view_type=view_type)
+
+        np.testing.assert_allclose(span_result.frequency, direct.frequency)
+        np.testing.assert_allclose(span_result.spectrum, direct.spectrum,
+                                   rtol=1e-9, atol=1e-12)
+        assert span_result.rms == pytest.approx(direct.rms)
+
+    def test_unaligned_span_transforms_only_edges(self, service, signal, monkeypatch):
+        """Test an unaligned span FFTs at most two edge frames."""
+        index = service.build_frame_index(signal)
+        transformed = []
+        original = stft_frames.frame_powers
+
+        def counting(data, starts, window):
+            transformed.extend(starts.tolist())
+            return original(data, starts, window)
+
+        monkeypatch.setattr(stft_frames, 'frame_powers', counting)
+        result = service.compute_span_spectrum(index, 1000, 30000)
+
+        assert transformed == [1000, 30000 - 1024]
+        assert result.peak_frequency == pytest.approx(120.0)
+
+    def test_short_span_rejected(self, service, signal):
+        """Test a span shorter than NFFT raises like compute_spectrum."""
+        index = service.build_frame_index(signal)
+
+        assert index.span_power(0, 1000) is None
+        with pytest.raises(ValueError):
+            service.compute_span_spectrum(index, 0, 1000)
+
+    def test_parameter_change_invalidates_index(self, signal):
+        """Test an index built with other FFT parameters is refused."""
+        index = FFTService(10240.0, 10.0, 50.0).build_frame_index(signal)
+
+        with pytest.raises(ValueError):
+            FFTService(10240.0, 5.0, 50.0).compute_span_spectrum(index, 0, 40960)
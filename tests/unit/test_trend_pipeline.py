@@ -0,0 +1,143 @@
+"""Unit tests for the reader-thread / compute-process Trend pipeline."""
+import pytest
+import numpy as np
+from pathlib import Path
+
+from vibration.core.services.OPTIMIZATION_PATCH_LEVEL5_TREND import (
+    TrendParallelProcessor,
+    _process_trend_worker,
+)
+from vibration.core.services.trend_pipeline import TrendPipeline, disk_order
+from vibration.core.services.trend_service import TrendService
+
+
+def create_trend_file(filepath: Path, frequency: float, amplitude: float = 1.0,
+                      sampling_rate: float = 10240.0, duration: float = 0.5) -> str:
+    """Create a synthetic vibration data file."""
+    t = np.arange(int(sampling_rate * duration)) / sampling_rate
+    signal = amplitude * np.sin(2 * np.pi * frequency * t)
+    lines = [
+        f"#D.Sampling Freq.: {sampling_rate} Hz",
+        "#b.Sensitivity: 100.0 mV/g",
+        "#Sensitivity: 100.0 mV/g",
+        f"#Record Length: {duration} sec",
+        "#",
+    ] + [f"{v:.8f}" for v in signal]
+    filepath.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return str(filepath)
+
+
+@pytest.fixture
+def trend_files(tmp_path):
+    """Create five files with different peak frequencies."""
+    return [
+        create_trend_file(tmp_path / f"test_20260206_10{i:02d}00_CH1.txt",
+                          frequency=100.0 * (i + 1), amplitude=1.0 + i)
+        for i in range(5)
+    ]
+
+
+BATCH_ARGS = dict(delta_f=1.0, overlap=50.0, window_type='hanning',
+                  view_type=2, band_min=0.0, band_max=5000.0)
+
+
+class TestTrendPipeline:
+    """Tests for TrendPipeline.process_batch."""
+
+    def test_matches_process_pool_results(self, trend_files):
+        """Test pipeline results equal the per-process reader results."""
+        expected = [
+            _process_trend_worker((fp, 1.0, 50.0, 'hanning', 2, 0.0, 5000.0))
+            for fp in trend_files
+        ]
+
+        results = TrendPipeline(max_workers=2).process_batch(trend_files, **BATCH_ARGS)
+
+        assert [r.file_name for r in results] == [r.file_name for r in expected]
+        for got, exp in zip(results, expected):
+            assert got.success
+            assert got.rms_value == pytest.approx(exp.rms_value)
+            assert got.peak_freq == pytest.approx(exp.peak_freq)
+
+    def test_preserves_input_order(self, trend_files):
+        """Test results follow input order, not disk order."""
+        shuffled = list(reversed(trend_files))
+
+        results = TrendPipeline(max_workers=2, queue_depth=1).process_batch(
+            shuffled, **BATCH_ARGS
+        )
+
+        assert [r.file_name for r in results] == [Path(fp).name for fp in shuffled]
+        assert [r.peak_freq for r in results] == \
+            pytest.approx([500.0, 400.0, 300.0, 200.0, 100.0])
+
+    def test_missing_file_reported_as_failure(self, trend_files, tmp_path):
+        """Test unreadable files fail without stopping the batch."""
+        paths = trend_files[:2] + [str(tmp_path / "missing.txt")]
+
+        results = TrendPipeline(max_workers=1).process_batch(paths, **BATCH_ARGS)
+
+        assert [r.success for r in results] == [True, True, False]
+        assert results[2].file_name == "missing.txt"
+
+    def test_records_stage_timings(self, trend_files):
+        """Test stage timings and byte counts are recorded."""
+        pipeline = TrendPipeline(max_workers=2)
+        pipeline.process_batch(trend_files, **BATCH_ARGS)
+
+        stats = pipeline.last_stats
+        assert stats['files'] == len(trend_files)
+        assert stats['bytes_read'] == sum(Path(fp).stat().st_size for fp in trend_files)
+        assert stats['compute_seconds'] > 0
+        assert stats['wall_seconds'] > 0
+
+    def test_progress_callback(self, trend_files):
+        """Test progress is reported once per file."""
+        calls = []
+        TrendPipeline(max_workers=2).process_batch(
+            trend_files, **BATCH_ARGS,
+            progress_callback=lambda cur, total: calls.append((cur, total))
+        )
+
+        assert calls[-1] == (len(trend_files), len(trend_files))
+        assert len(calls) == len(trend_files)
+
+    def test_empty_batch(self):
+        """Test empty input returns no results."""
+        assert TrendPipeline(max_workers=1).process_batch([], **BATCH_ARGS) == []
+
+
+class TestDiskOrder:
+    """Tests for disk_order."""
+
+    def test_missing_files_sorted_last(self, trend_files, tmp_path):
+        """Test files that cannot be stat'ed keep input order at the end."""
+        paths = [str(tmp_path / "a_missing.txt")] + trend_files + [str(tmp_path / "b_missing.txt")]
+
+        order = disk_order(paths)
+
+        assert sorted(order) == list(range(len(paths)))
+        assert order[-2:] == [0, len(paths) - 1]
+
+
+class TestPipelineIntegration:
+    """Tests for enabling the pipeline through the processor and service."""
+
+    def test_processor_delegates_to_pipeline(self, trend_files):
+        """Test io_pipeline=True routes through TrendPipeline and records stats."""
+        processor = TrendParallelProcessor(max_workers=2, io_pipeline=True, queue_depth=2)
+
+        results = processor.process_batch(trend_files, **BATCH_ARGS)
+
+        assert all(r.success for r in results)
+        assert processor.last_stats['files'] == len(trend_files)
+
+    def test_service_exposes_stage_timings(self, trend_files):
+        """Test TrendService reports pipeline settings and timings."""
+        svc = TrendService(max_workers=2, io_pipeline=True, queue_depth=3)
+
+        result = svc.compute_trend(trend_files, view_type='VEL')
+
+        assert result.num_files == len(trend_files)
+        assert svc.get_parameters()['queue_depth'] == 3
+        assert svc.get_stage_timings()['files'] == len(trend_files)
@@ -0,0 +1,139 @@
+"""Unit tests for the persistent per-file trend result cache."""
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from vibration.core.services import PeakService, TrendResultCache, TrendService
+from vibration.core.services.OPTIMIZATION_PATCH_LEVEL5_TREND import TrendParallelProcessor
+
+
+def create_trend_file(filepath: Path, frequency: float, amplitude: float = 1.0,
+                      sampling_rate: float = 10240.0, duration: float = 0.5) -> str:
+    """Create a synthetic vibration data file."""
+    t = np.arange(int(sampling_rate * duration)) / sampling_rate
+    signal = amplitude * np.sin(2 * np.pi * frequency * t)
+    lines = [
+        f"#D.Sampling Freq.: {sampling_rate} Hz",
+        "#b.Sensitivity: 100.0 mV/g",
+        "#Sensitivity: 100.0 mV/g",
+        f"#Record Length: {duration} sec",
+        "#",
+    ] + [f"{v:.8f}" for v in signal]
+    filepath.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    return str(filepath)
+
+
+@pytest.fixture
+def trend_files(tmp_path):
+    """Create four files with different peak frequencies."""
+    return [
+        create_trend_file(tmp_path / f"test_20260206_10{i:02d}00_CH1.txt",
+                          frequency=100.0 * (i + 1), amplitude=1.0 + i)
+        for i in range(4)
+    ]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary database."""
+    return TrendResultCache(tmp_path / "cache" / "trend.sqlite")
+
+
+class CountingProcessor(TrendParallelProcessor):
+    """Processor that records which files were sent to the workers."""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.batches = []
+
+    def process_batch(self, file_paths, **kwargs):
+        self.batches.append([os.path.basename(p) for p in file_paths])
+        return super().process_batch(file_paths, **kwargs)
+
+
+ARGS = (1.0, 50.0, 'hanning', 1, 0.0, 5000.0)
+
+
+class TestTrendResultCache:
+    """Tests for TrendResultCache."""
+
+    def test_only_new_files_are_computed(self, cache, trend_files, tmp_path):
+        """Test extending the selection sends only the added file to the processor."""
+        processor = CountingProcessor()
+        cache.process_batch(processor, trend_files[:3], *ARGS)
+
+        extra = create_trend_file(tmp_path / "test_20260207_100000_CH1.txt", 700.0)
+        results = cache.process_batch(processor, trend_files[:3] + [extra], *ARGS)
+
+        assert processor.batches[-1] == [os.path.basename(extra)]
+        assert [r.peak_freq for r in results] == pytest.approx([100, 200, 300, 700])
+
+    def test_hits_equal_computed_results(self, cache, trend_files):
+        """Test cached values round-trip exactly."""
+        expected = TrendParallelProcessor(max_workers=1).process_batch(
+            trend_files, *ARGS
+        )
+        cache.process_batch(CountingProcessor(), trend_files, *ARGS)
+
+        hits = cache.lookup(trend_files, *ARGS)
+
+        assert sorted(hits) == [0, 1, 2, 3]
+        for i, exp in enumerate(expected):
+            assert hits[i].rms_value == exp.rms_value
+            assert hits[i].peak_freq == exp.peak_freq
+            assert hits[i].metadata == exp.metadata
+
+    def test_modified_file_is_recomputed(self, cache, trend_files):
+        """Test a changed size/mtime invalidates only that file."""
+        cache.process_batch(CountingProcessor(), trend_files, *ARGS)
+        create_trend_file(Path(trend_files[1]), 900.0, duration=0.25)
+        os.utime(trend_files[1], ns=(1, 1))
+
+        processor = CountingProcessor()
+        results = cache.process_batch(processor, trend_files, *ARGS)
+
+        assert processor.batches == [[os.path.basename(trend_files[1])]]
+        assert results[1].peak_freq == pytest.approx(900.0)
+        assert len(cache) == 4
+
+    def test_parameters_are_part_of_key(self, cache, trend_files):
+        """Test a different band or view type misses."""
+        cache.process_batch(CountingProcessor(), trend_files, *ARGS)
+
+        assert cache.lookup(trend_files, 1.0, 50.0, 'hanning', 2, 0.0, 5000.0) == {}
+        assert cache.lookup(trend_files, 1.0, 50.0, 'hanning', 1, 0.0, 1000.0) == {}
+
+    def test_failures_are_not_stored(self, cache, trend_files, tmp_path):
+        """Test failed files are retried on the next batch."""
+        missing = str(tmp_path / "missing.txt")
+        cache.process_batch(CountingProcessor(), [trend_files[0], missing], *ARGS)
+
+        assert len(cache) == 1
+
+    def test_progress_covers_hits_and_misses(self, cache, trend_files):
+        """Test progress counts cached files before computed ones."""
+        cache.process_batch(CountingProcessor(), trend_files[:2], *ARGS)
+        calls = []
+
+        cache.process_batch(CountingProcessor(), trend_files, *ARGS,
+                            progress_callback=lambda cur, total: calls.append((cur, total)))
+
+        assert calls[0] == (2, 4)
+        assert calls[-1] == (4, 4)
+
+
+def test_cache_persists_across_services(cache, trend_files, monkeypatch):
+    """Test a Peak service reuses per-file results saved by a Trend service."""
+    TrendService(max_workers=1, result_cache=cache).compute_trend(trend_files)
+    peak = PeakService(max_workers=1,
+                       result_cache=TrendResultCache(cache.db_path))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("all files should be cache hits")
+
+    monkeypatch.setattr(peak._processor, 'process_batch', fail)
+    result = peak.compute_peak_trend(trend_files)
+
+    assert result.num_files == 4
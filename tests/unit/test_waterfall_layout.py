@@ -0,0 +1,161 @@
+"""Unit tests for the vectorized waterfall layout."""
+import numpy as np
+import pytest
+
+from vibration.core.services.waterfall_layout import (
+    SpectrumHeatmap, frequency_axis, global_extents, layout_waterfall, picking_points,
+    stack_spectra
+)
+
+
+@pytest.fixture
+def matrix():
+    """Create five 1001-bin spectra on a shared 0.5 Hz grid."""
+    rng = np.random.default_rng(0)
+    frequency = np.arange(1001) * 0.5
+    spectra = [rng.uniform(0, 1, len(frequency)) for _ in range(5)]
+    return stack_spectra([frequency] * 5, spectra)
+
+
+def reference_row(f, p, row, x_min, x_max, z_min, z_max, angle, n_files):
+    """Per-file screen coordinates as computed by the former plotting loop."""
+    mask = (f >= x_min) & (f <= x_max)
+    y_norm = (np.clip(p[mask], z_min, z_max) - z_min) / (z_max - z_min)
+    offset = 130 / n_files
+    x = (f[mask] - x_min) / (x_max - x_min) * 530 + row * offset * np.cos(np.deg2rad(angle))
+    y = y_norm * 130 + row * offset * np.sin(np.deg2rad(angle))
+    return x, y
+
+
+class TestStackSpectra:
+    """Tests for stacking per-file spectra."""
+
+    def test_shared_grid_is_not_copied(self, matrix):
+        """Test identical frequency arrays become a broadcast view."""
+        frequency, spectrum = matrix
+
+        assert frequency.shape == spectrum.shape == (5, 1001)
+        assert frequency.strides[0] == 0
+
+    def test_ragged_rows_are_nan_padded(self):
+        """Test spectra of different lengths are padded with NaN."""
+        frequency, spectrum = stack_spectra(
+            [np.arange(3.0), np.arange(5.0)], [np.ones(3), np.ones(5)]
+        )
+
+        assert spectrum.shape == (2, 5)
+        assert np.isnan(spectrum[0, 3:]).all() and np.isnan(frequency[0, 3:]).all()
+        assert global_extents(frequency, spectrum) == (0.0, 4.0, 1.0, 1.0)
+
+
+class TestLayoutWaterfall:
+    """Tests for screen coordinate computation."""
+
+    def test_matches_per_file_loop(self, matrix):
+        """Test the matrix layout equals the former per-file computation."""
+        frequency, spectrum = matrix
+
+        layout = layout_waterfall(frequency, spectrum, 100.0, 300.0, 0.2, 0.8, 300.0)
+
+        for row in range(5):
+            x, y = reference_row(frequency[row], spectrum[row], row, 100.0, 300.0, 0.2, 0.8, 300.0, 5)
+            visible = layout.visible[row]
+            np.testing.assert_allclose(layout.x[row][visible], x)
+            np.testing.assert_allclose(layout.y[row][visible], y)
+        assert layout.x.shape[1] == 401
+
+    def test_rows_without_points_are_skipped(self):
+        """Test files with no bins in the frequency range are not drawn."""
+        frequency, spectrum = stack_spectra(
+            [np.arange(10.0), np.arange(10.0) + 100], [np.ones(10), np.ones(10)]
+        )
+
+        layout = layout_waterfall(frequency, spectrum, 0.0, 20.0, 0.0, 2.0, 270.0)
+
+        np.testing.assert_array_equal(layout.rows, [0])
+        assert layout.segments().shape == (1, 10, 2)
+
+    def test_segments_envelope_keeps_extremes(self, matrix):
+        """Test decimated segments keep each row's min and max."""
+        frequency, spectrum = matrix
+        layout = layout_waterfall(frequency, spectrum, 0.0, 500.0, 0.0, 1.0, 270.0)
+
+        segments = layout.segments(max_points=100)
+
+        assert segments.shape[1] <= 2 * 100 + 2
+        np.testing.assert_allclose(np.nanmax(segments[..., 1], axis=1), np.nanmax(layout.y, axis=1))
+        np.testing.assert_allclose(np.nanmin(segments[..., 1], axis=1), np.nanmin(layout.y, axis=1))
+
+
+class TestPickingPoints:
+    """Tests for picking point arrays."""
+
+    def test_samples_each_row(self, matrix):
+        """Test every row contributes points at a stride of count // 200."""
+        frequency, spectrum = matrix
+        layout = layout_waterfall(frequency, spectrum, 0.0, 500.0, 0.0, 1.0, 270.0)
+        names = [f"file{i}.txt" for i in range(5)]
+
+        points = picking_points(layout, names)
+
+        assert len(points) == 5 * len(range(0, 1001, 5))
+        np.testing.assert_array_equal(points.frequency[:3], [0.0, 2.5, 5.0])
+        x, y, freq, amp, name = points.entry(len(points) - 1)
+        assert (freq, name) == (500.0, "file4.txt")
+        assert amp == spectrum[4, 1000]
+
+
+class TestSpectrumHeatmap:
+    """Tests for max-pooled heatmap queries."""
+
+    @pytest.fixture
+    def heatmap_data(self):
+        """Create 3000 hourly spectra with a one-bin tone in a single file."""
+        rng = np.random.default_rng(2)
+        spectrum = rng.uniform(0, 0.01, (3000, 2049)).astype(np.float32)
+        spectrum[1234, 777] = 1.0
+        return np.arange(2049) * 0.5, spectrum
+
+    def test_full_view_is_pixel_sized_and_keeps_tone(self, heatmap_data):
+        """Test pooling to the pixel grid keeps a single-bin tone."""
+        frequency, spectrum = heatmap_data
+        heatmap = SpectrumHeatmap(frequency, spectrum)
+
+        image, extent = heatmap.query(*heatmap.extent, 400, 300)
+
+        assert image.shape[0] <= 300 and image.shape[1] <= 400
+        assert image.max() == 1.0
+        row, col = np.unravel_index(np.argmax(image), image.shape)
+        rb = -(-3000 // 300)
+        assert row * rb <= 1234 < (row + 1) * rb
+        assert extent[0] == pytest.approx(-0.25) and extent[2] == -0.5
+
+    def test_zoom_returns_raw_cells(self, heatmap_data):
+        """Test a small zoom window returns the original cells."""
+        frequency, spectrum = heatmap_data
+        heatmap = SpectrumHeatmap(frequency, spectrum)
+
+        image, extent = heatmap.query(380.0, 400.0, 1200.0, 1250.0, 400, 300)
+
+        np.testing.assert_array_equal(image, spectrum[1200:1251, 760:801])
+        assert extent == pytest.approx((379.75, 400.25, 1199.5, 1250.5))
+
+    def test_memmap_chunks_match_in_memory(self, heatmap_data, tmp_path):
+        """Test row-chunked reads from a memmap give the same image."""
+        frequency, spectrum = heatmap_data
+        mapped = np.lib.format.open_memmap(tmp_path / "spectra.npy", mode='w+',
+                                           dtype=spectrum.dtype, shape=spectrum.shape)
+        mapped[:] = spectrum
+        mapped.flush()
+
+        expected, _ = SpectrumHeatmap(frequency, spectrum).query(0, 1024, -0.5, 2999.5, 333, 250)
+        image, _ = SpectrumHeatmap(frequency, np.load(tmp_path / "spectra.npy", mmap_mode='r'),
+                                   chunk_bytes=64 * 1024).query(0, 1024, -0.5, 2999.5, 333, 250)
+
+        np.testing.assert_array_equal(image, expected)
+
+    def test_frequency_axis_uses_longest_row(self):
+        """Test ragged rows share the longest frequency grid."""
+        frequency, _ = stack_spectra([np.arange(3.0), np.arange(5.0)], [np.ones(3), np.ones(5)])
+
+        np.testing.assert_array_equal(frequency_axis(frequency), np.arange(5.0))
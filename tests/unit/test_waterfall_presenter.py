@@ -0,0 +1,199 @@
+"""Unit tests for the Waterfall presenter per-file spectrum cache."""
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+from vibration.core.services.band_trend import BandSpec
+from vibration.presentation.presenters import waterfall_presenter as wf_module
+from vibration.presentation.presenters.waterfall_presenter import WaterfallPresenter
+
+
+def create_spectrum_file(filepath: Path, frequency: float,
+                         sampling_rate: float = 2048.0, duration: float = 1.0) -> str:
+    """Create a synthetic vibration data file in the FileParser format."""
+    t = np.arange(int(sampling_rate * duration)) / sampling_rate
+    signal = np.sin(2 * np.pi * frequency * t)
+    header = (
+        f"D.Sampling Freq.: {sampling_rate} Hz\n"
+        "Channel: CH1\n"
+        "Sensitivity: 100 mV/g\n"
+        "b.Sensitivity: 100\n"
+        "\n"
+    )
+    filepath.write_text(header + "\n".join(f"{v:.6f}" for v in signal), encoding='utf-8')
+    return filepath.name
+
+
+@pytest.fixture
+def presenter(tmp_path, monkeypatch):
+    """Create a WaterfallPresenter whose batches run in-process and are recorded."""
+    monkeypatch.setattr(wf_module, 'ProgressDialog', MagicMock())
+    p = WaterfallPresenter(view=MagicMock(), directory_path=str(tmp_path))
+    p._spectrum_processor.max_workers = 1
+
+    p.computed_batches = []
+    original = p._spectrum_processor.process_batch
+
+    def recording(file_paths, *args, **kwargs):
+        p.computed_batches.append([os.path.basename(fp) for fp in file_paths])
+        return original(file_paths, *args, **kwargs)
+
+    monkeypatch.setattr(p._spectrum_processor, 'process_batch', recording)
+    return p
+
+
+@pytest.fixture
+def waterfall_files(tmp_path):
+    """Create four files one minute apart with peaks at 100..400 Hz."""
+    return [
+        create_spectrum_file(tmp_path / f"2026-02-06_10-0{i}-00_x_1.txt", 100.0 * (i + 1))
+        for i in range(4)
+    ]
+
+
+def plotted_names(presenter):
+    return presenter._waterfall_cache['store'].file_names
+
+
+def row_peak(presenter, row):
+    store = presenter._waterfall_cache['store']
+    return store.row_frequency(row)[np.argmax(store.row_spectrum(row))]
+
+
+class TestPerFileWaterfallCache:
+    """Tests for per-file reuse in _compute_waterfall_fft."""
+
+    def test_adding_file_computes_only_new_file(self, presenter, waterfall_files):
+        """Test extending the selection transforms only the added file."""
+        presenter._compute_waterfall_fft(waterfall_files[:3], 1.0, 50.0, 'hanning', 1)
+
+        presenter._compute_waterfall_fft(waterfall_files, 1.0, 50.0, 'hanning', 1)
+
+        assert presenter.computed_batches == [waterfall_files[:3], waterfall_files[3:]]
+        assert plotted_names(presenter) == waterfall_files
+
+    def test_removing_file_reuses_remaining(self, presenter, waterfall_files):
+        """Test shrinking or reordering the selection computes nothing."""
+        presenter._compute_waterfall_fft(waterfall_files, 1.0, 50.0, 'hanning', 1)
+
+        presenter._compute_waterfall_fft(
+            [waterfall_files[3], waterfall_files[0]], 1.0, 50.0, 'hanning', 1
+        )
+
+        assert len(presenter.computed_batches) == 1
+        assert plotted_names(presenter) == [waterfall_files[0], waterfall_files[3]]
+        assert row_peak(presenter, 1) == pytest.approx(400.0)
+
+    def test_parameter_change_recomputes(self, presenter, waterfall_files):
+        """Test entries are keyed by view type."""
+        presenter._compute_waterfall_fft(waterfall_files[:2], 1.0, 50.0, 'hanning', 1)
+
+        presenter._compute_waterfall_fft(waterfall_files[:2], 1.0, 50.0, 'hanning', 2)
+
+        assert presenter.computed_batches == [waterfall_files[:2], waterfall_files[:2]]
+
+    def test_modified_file_recomputed(self, presenter, waterfall_files, tmp_path):
+        """Test a file changed on disk is transformed again."""
+        presenter._compute_waterfall_fft(waterfall_files[:2], 1.0, 50.0, 'hanning', 1)
+        create_spectrum_file(tmp_path / waterfall_files[1], 700.0)
+        os.utime(tmp_path / waterfall_files[1], ns=(1, 1))
+
+        presenter._compute_waterfall_fft(waterfall_files[:2], 1.0, 50.0, 'hanning', 1)
+
+        assert presenter.computed_batches[-1] == [waterfall_files[1]]
+        assert row_peak(presenter, 1) == pytest.approx(700.0)
+
+    def test_spectra_live_in_float32_memmap(self, presenter, waterfall_files):
+        """Test spectra are stored on disk with one shared frequency axis."""
+        presenter._compute_waterfall_fft(waterfall_files, 1.0, 50.0, 'hanning', 1)
+
+        store = presenter._waterfall_cache['store']
+        assert isinstance(store.spectra, np.memmap) and store.spectra.dtype == np.float32
+        assert store.spectra.shape == (4, len(store.frequency))
+
+    def test_clear_cache_removes_temporary_stores(self, presenter, waterfall_files):
+        """Test clear_cache deletes the owned store directories."""
+        presenter._compute_waterfall_fft(waterfall_files, 1.0, 50.0, 'hanning', 1)
+        directory = presenter._waterfall_cache['store'].directory
+
+        presenter.clear_cache()
+
+        assert not directory.exists()
+
+
+class TestRenderWaterfall:
+    """Tests for drawing the cached spectra."""
+
+    def test_single_collection_and_array_picking(self, presenter, waterfall_files):
+        """Test all files are drawn as one LineCollection with array picking data."""
+        presenter._compute_waterfall_fft(waterfall_files, 1.0, 50.0, 'hanning', 1)
+        figure = Figure()
+        presenter.view.get_figure.return_value = figure
+
+        presenter._render_waterfall(None, None, None, None, 270.0, 1)
+
+        ax = figure.axes[0]
+        collections = [c for c in ax.collections if isinstance(c, LineCollection)]
+        assert len(collections) == 1 and len(collections[0].get_segments()) == 4
+        points = presenter.view.set_picking_data.call_args[0][0]
+        for row, file_name in enumerate(waterfall_files):
+            in_row = np.flatnonzero(points.row == row)
+            _, _, freq, _, name = points.entry(in_row[np.argmax(points.amplitude[in_row])])
+            assert name == file_name and freq == pytest.approx(100.0 * (row + 1))
+
+    def test_angle_change_reuses_matrix(self, presenter, waterfall_files):
+        """Test re-rendering keeps the stacked spectrum matrix."""
+        presenter._compute_waterfall_fft(waterfall_files, 1.0, 50.0, 'hanning', 1)
+        presenter.view.get_figure.return_value = Figure()
+        presenter._render_waterfall(None, None, None, None, 270.0, 1)
+        matrix = presenter._waterfall_cache['matrix']
+
+        presenter._render_waterfall(None, None, None, None, 300.0, 1)
+
+        assert presenter._waterfall_cache['matrix'] is matrix
+
+    def test_heatmap_mode_draws_image(self, presenter, waterfall_files):
+        """Test heatmap mode draws one image row per file and no picking data."""
+        presenter._compute_waterfall_fft(waterfall_files, 1.0, 50.0, 'hanning', 1)
+        figure = Figure()
+        presenter.view.get_figure.return_value = figure
+
+        presenter._render_waterfall(None, None, None, None, 270.0, 1,
+                                    display_mode='heatmap', log_color=True)
+
+        image = presenter._heatmap.image
+        assert image.get_array().shape[0] == 4
+        assert image.norm.vmin > 0
+        presenter.view.set_picking_data.assert_called_with(None)
+
+
+class TestBandTrend:
+    """Tests for band trends read from the spectra store."""
+
+    def test_several_bands_in_one_request(self, presenter, waterfall_files):
+        """Test each requested band becomes one series over all files."""
+        presenter._compute_waterfall_fft(waterfall_files, 1.0, 50.0, 'hanning', 1)
+        presenter._show_band_trend_window = MagicMock()
+
+        presenter._on_band_trend_requested([BandSpec('peak', 90.0, 110.0), BandSpec('nearest', 400.0)])
+
+        series = presenter._show_band_trend_window.call_args[0][0]
+        assert [label for label, _, _ in series] == ["Peak 90.0-110.0 Hz", "400.0 Hz"]
+        peak_100 = np.array(series[0][2])
+        assert np.argmax(peak_100) == 0 and len(series[1][1]) == 4
+        assert np.argmax(series[1][2]) == 3
+
+    def test_dragged_span_maps_to_frequency(self, presenter, waterfall_files):
+        """Test a lines-mode drag converts screen x back to frequency."""
+        presenter._band_axis = ('lines', 100.0, 200.0)
+
+        presenter._on_band_span_selected(265.0, 53.0)
+
+        presenter.view.open_band_trend_dialog.assert_called_once_with(
+            pytest.approx(110.0), pytest.approx(150.0)
+        )
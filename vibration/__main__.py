@@ -1,10 +1,22 @@
-"""python -m vibration 진입점."""
+"""python -m vibration 진입점.
+
+    python -m vibration                 GUI 실행
+    python -m vibration batch ...       Qt 없는 배치 분석 (vibration.cli)
+"""
 import multiprocessing
+import sys
+import time
 
 if __name__ == "__main__":
+    started_at = time.perf_counter()
+
     # PyInstaller Windows exe에서 ProcessPoolExecutor 사용 시 필수.
     # 없으면 워커 프로세스마다 메인 모듈을 재실행하여 창이 여러 개 뜸.
     multiprocessing.freeze_support()
 
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        from vibration.cli import main as batch_main
+        sys.exit(batch_main(sys.argv[2:], started_at=started_at))
+
     from vibration.app import main
     main()
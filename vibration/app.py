@@ -6,12 +6,16 @@
 """
 import sys
 import logging
+import sqlite3
 from typing import Dict, Any, Optional
 
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import QTimer
 
-from vibration.core.services import FFTService, TrendService, PeakService, FileService
+from vibration.core.services import (
+    FFTService, TrendService, PeakService, FileService, AnalysisResultStore,
+    TrendResultCache
+)
 from vibration.core.services.project_service import ProjectService
 from vibration.presentation.views import MainWindow
 from vibration.presentation.views.splash_screen import ModernSplashScreen
@@ -51,12 +55,26 @@ class ApplicationFactory:
             window_type=self._config.get('window_type', self.DEFAULT_WINDOW_TYPE)
         )
         
+        # Trend/Peak 탭이 같은 파일별 RMS/Peak 결과를 공유
+        self._services['analysis_store'] = AnalysisResultStore()
+        
+        # 파일 단위 영구 결과 캐시 (선택 변경 시 새 파일만 계산)
+        self._services['result_cache'] = self._create_result_cache()
+        
         self._services['trend'] = TrendService(
-            max_workers=self._config.get('max_workers')
+            max_workers=self._config.get('max_workers'),
+            io_pipeline=self._config.get('io_pipeline', False),
+            queue_depth=self._config.get('queue_depth'),
+            result_store=self._services['analysis_store'],
+            result_cache=self._services['result_cache']
         )
         
         self._services['peak'] = PeakService(
-            max_workers=self._config.get('max_workers')
+            max_workers=self._config.get('max_workers'),
+            io_pipeline=self._config.get('io_pipeline', False),
+            queue_depth=self._config.get('queue_depth'),
+            result_store=self._services['analysis_store'],
+            result_cache=self._services['result_cache']
         )
         
         self._services['project'] = ProjectService()
@@ -64,6 +82,16 @@ class ApplicationFactory:
         logger.info("Created all services")
         return self._services
         
+    def _create_result_cache(self) -> Optional[TrendResultCache]:
+        """config 'result_cache'(기본 True), 'result_cache_path'로 캐시를 생성합니다."""
+        if not self._config.get('result_cache', True):
+            return None
+        try:
+            return TrendResultCache(self._config.get('result_cache_path'))
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Trend result cache disabled: {e}")
+            return None
+        
     def create_main_window(self) -> MainWindow:
         self._main_window = MainWindow()
         logger.info("Created main window")
@@ -0,0 +1,207 @@
+"""
+Qt 없는 헤드리스 배치 CLI.
+
+`python -m vibration batch <상위폴더> ...` 로 실행하며, vibration.core만 임포트합니다
+(PyQt5, matplotlib 미사용). 상위 폴더를 날짜 범위로 스캔하여 Trend(RMS)/Peak
+배치를 수행하고 결과를 컬럼 형식(.npz 또는 .csv)으로 저장합니다. 종료 시
+기동 시간과 처리량을 출력합니다.
+
+예:
+    python -m vibration batch D:/data --from 2026-01-01 --to 2026-01-31 \\
+        --view VEL --band 10 1000 --workers 8 --output trend.npz
+"""
+import argparse
+import csv
+import logging
+import os
+import sys
+import time
+from datetime import date
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from vibration.core.services.analysis_result_store import AnalysisResultStore
+from vibration.core.services.file_service import FileService
+from vibration.core.services.peak_service import PeakService
+from vibration.core.services.trend_result_cache import TrendResultCache
+from vibration.core.services.trend_service import TrendService
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ('.npz', '.csv')
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """batch 서브커맨드 인자 파서를 생성합니다."""
+    parser = argparse.ArgumentParser(
+        prog='python -m vibration batch',
+        description='Headless Trend/Peak batch analysis (no GUI).'
+    )
+    parser.add_argument('parent', help='상위 폴더 (YYYY-MM-DD 하위 폴더 또는 직접 .txt)')
+    parser.add_argument('--from', dest='date_from', type=date.fromisoformat,
+                        help='시작 날짜 YYYY-MM-DD (포함)')
+    parser.add_argument('--to', dest='date_to', type=date.fromisoformat,
+                        help='종료 날짜 YYYY-MM-DD (포함)')
+    parser.add_argument('--pattern', default='*.txt', help='파일 Glob 패턴')
+    parser.add_argument('--analysis', choices=('trend', 'peak', 'both'), default='both',
+                        help='계산할 결과 (both도 파일당 1회만 계산)')
+    parser.add_argument('--view', choices=('ACC', 'VEL', 'DIS'), default='ACC',
+                        type=str.upper, help='신호 유형')
+    parser.add_argument('--band', nargs=2, type=float, metavar=('MIN', 'MAX'),
+                        help='주파수 대역 (Hz)')
+    parser.add_argument('--delta-f', type=float, default=1.0, help='주파수 분해능 (Hz)')
+    parser.add_argument('--overlap', type=float, default=50.0, help='오버랩 비율 (%%)')
+    parser.add_argument('--window', choices=('hanning', 'flattop', 'rectangular'),
+                        default='hanning', type=str.lower, help='윈도우 함수')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='연산 프로세스 수 (기본값: CPU 코어 수 - 1)')
+    parser.add_argument('--io-pipeline', action='store_true',
+                        help='리더 스레드 → 연산 프로세스 파이프라인 사용 (HDD/SMB)')
+    parser.add_argument('--cache', metavar='PATH',
+                        help='파일 단위 결과 캐시(SQLite) 경로 - 재실행 시 새 파일만 계산')
+    parser.add_argument('--output', '-o', required=True,
+                        help='출력 파일 (.npz 또는 .csv)')
+    parser.add_argument('--quiet', '-q', action='store_true', help='진행률 출력 생략')
+    return parser
+
+
+def collect_columns(trend_result, peak_result) -> Dict[str, np.ndarray]:
+    """
+    서비스 결과를 파일 단위 컬럼 딕셔너리로 변환합니다.
+
+    인자:
+        trend_result: TrendService 결과 (None 가능).
+        peak_result: PeakService 결과 (None 가능).
+
+    반환:
+        file_name, timestamp, channel, rms, peak, peak_freq 중 해당 컬럼.
+    """
+    primary = trend_result if trend_result is not None else peak_result
+
+    channel_of: Dict[str, str] = {}
+    for channel, data in (primary.channel_data or {}).items():
+        for label in data['labels']:
+            channel_of[label] = channel
+
+    columns: Dict[str, np.ndarray] = {
+        'file_name': np.array(primary.filenames, dtype=str),
+        'timestamp': np.array(
+            [ts.isoformat() if hasattr(ts, 'isoformat') else str(ts)
+             for ts in primary.timestamps], dtype=str
+        ),
+        'channel': np.array([channel_of.get(n, '') for n in primary.filenames], dtype=str),
+    }
+    if trend_result is not None:
+        columns['rms'] = np.asarray(trend_result.rms_values, dtype=np.float64)
+    if peak_result is not None:
+        columns['peak'] = np.asarray(peak_result.peak_values, dtype=np.float64)
+        columns['peak_freq'] = np.asarray(peak_result.peak_frequencies, dtype=np.float64)
+    return columns
+
+
+def write_columns(path: str, columns: Dict[str, np.ndarray]) -> None:
+    """컬럼 딕셔너리를 .npz(컬럼별 배열) 또는 .csv로 저장합니다."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npz':
+        np.savez(path, **columns)
+        return
+
+    names = list(columns)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(names)
+        writer.writerows(zip(*(columns[n].tolist() for n in names)))
+
+
+def run_batch(args: argparse.Namespace, started_at: Optional[float] = None) -> int:
+    """
+    배치 분석을 실행합니다.
+
+    인자:
+        args: build_parser()로 파싱한 인자.
+        started_at: 프로세스 기동 시각 (time.perf_counter 기준, 기동 시간 보고용).
+
+    반환:
+        종료 코드 (0: 성공, 1: 대상 파일 없음 또는 전체 실패).
+    """
+    if started_at is None:
+        started_at = time.perf_counter()
+    startup_seconds = time.perf_counter() - started_at
+
+    scan_start = time.perf_counter()
+    file_paths = FileService().scan_subdirectories(
+        args.parent, args.date_from, args.date_to, args.pattern
+    )
+    scan_seconds = time.perf_counter() - scan_start
+
+    if not file_paths:
+        print(f"No files found in {args.parent}", file=sys.stderr)
+        return 1
+
+    total_bytes = 0
+    for path in file_paths:
+        try:
+            total_bytes += os.path.getsize(path)
+        except OSError:
+            pass
+
+    def report(current: int, total: int) -> None:
+        if not args.quiet:
+            print(f"\r{current}/{total}", end='', file=sys.stderr, flush=True)
+
+    store = AnalysisResultStore(max_entries=1)
+    service_args = dict(
+        max_workers=args.workers,
+        io_pipeline=args.io_pipeline,
+        result_store=store,
+        result_cache=TrendResultCache(args.cache) if args.cache else None
+    )
+    compute_args = dict(
+        delta_f=args.delta_f,
+        overlap=args.overlap,
+        window_type=args.window,
+        view_type=args.view,
+        frequency_band=tuple(args.band) if args.band else None,
+        progress_callback=report
+    )
+
+    compute_start = time.perf_counter()
+    trend_result = peak_result = None
+    if args.analysis in ('trend', 'both'):
+        trend_result = TrendService(**service_args).compute_trend(file_paths, **compute_args)
+    if args.analysis in ('peak', 'both'):
+        peak_result = PeakService(**service_args).compute_peak_trend(file_paths, **compute_args)
+    compute_seconds = time.perf_counter() - compute_start
+    if not args.quiet:
+        print(file=sys.stderr)
+
+    primary = trend_result if trend_result is not None else peak_result
+    if primary.num_files == 0:
+        print("All files failed", file=sys.stderr)
+        return 1
+
+    write_start = time.perf_counter()
+    write_columns(args.output, collect_columns(trend_result, peak_result))
+    write_seconds = time.perf_counter() - write_start
+
+    failed = primary.metadata.get('failed_count', 0)
+    print(
+        f"files: {primary.num_files} ok, {failed} failed -> {args.output}\n"
+        f"startup: {startup_seconds:.2f}s  scan: {scan_seconds:.2f}s  "
+        f"compute: {compute_seconds:.2f}s  write: {write_seconds:.2f}s\n"
+        f"throughput: {len(file_paths) / compute_seconds if compute_seconds > 0 else 0.0:.1f} files/s, "
+        f"{total_bytes / compute_seconds / 1e6 if compute_seconds > 0 else 0.0:.1f} MB/s"
+    )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None, started_at: Optional[float] = None) -> int:
+    """batch 서브커맨드 진입점."""
+    args = build_parser().parse_args(argv)
+    if os.path.splitext(args.output)[1].lower() not in OUTPUT_FORMATS:
+        print(f"--output must end with one of {', '.join(OUTPUT_FORMATS)}", file=sys.stderr)
+        return 2
+
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s %(name)s: %(message)s')
+    return run_batch(args, started_at)
@@ -1 +1,9 @@
 """Core business logic and domain models."""
+
+
+def __getattr__(name):
+    """서비스 임포트 비용을 피하기 위한 지연 임포트."""
+    if name in ('Dataset', 'DatasetResult'):
+        from . import dataset
+        return getattr(dataset, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
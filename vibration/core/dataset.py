@@ -0,0 +1,335 @@
+"""
+지연 실행(lazy) Dataset API.
+
+스캔 → 로드 → FFT → 축약(reduce) 단계를 프레젠터 코드에서 손으로 조합하면
+소비자마다 파일을 다시 읽게 됩니다. Dataset은 호출마다 실행 계획만 쌓고,
+compute() 시점에 다음과 같이 실행합니다.
+
+    - 날짜/채널 필터를 디렉토리 스캔 단계로 내려 파일을 열기 전에 제외
+    - 파일당 1회의 워커 패스로 읽기 + FFT + 모든 대역 축약을 융합
+    - AnalysisResultStore에 이미 있는 (파일 집합, 파라미터, 대역) 결과는 재사용하고,
+      새로 계산한 결과는 저장소에 기록하여 Trend/Peak 서비스와 공유
+
+예:
+    result = (Dataset.open("D:/data")
+              .between("2026-01-01", "2026-01-31")
+              .channels([1, 3])
+              .spectrum(delta_f=1.0, view='VEL')
+              .band_rms([(10, 1000), (1000, 5000)])
+              .compute())
+    result.band_rms      # (n_files, n_bands)
+
+Qt 의존성 없음 - 순수 Python/NumPy 구현.
+"""
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import multiprocessing as mp
+import numpy as np
+
+from vibration.core.services.analysis_result_store import AnalysisResultStore
+from vibration.core.services.file_catalog import FileCatalog
+from vibration.core.services.file_service import FileService
+from vibration.core.services.OPTIMIZATION_PATCH_LEVEL5_TREND import (
+    TrendResult,
+    _compute_band_results,
+    _failed_trend_result,
+    _parse_trend_text,
+)
+
+logger = logging.getLogger(__name__)
+
+VIEW_TYPE_MAP = {'ACC': 1, 'VEL': 2, 'DIS': 3}
+
+# 이 수 미만의 파일은 프로세스 풀 기동 비용이 더 크므로 현재 프로세스에서 처리
+MIN_PARALLEL_FILES = 4
+
+Band = Tuple[float, float]
+DateLike = Union[date, datetime, str]
+
+
+def _to_date(value: Optional[DateLike]) -> Optional[date]:
+    if value is None or isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(str(value))
+
+
+def _dataset_file_worker(args: Tuple) -> List[TrendResult]:
+    """
+    융합 워커: 파일 1회 읽기 → FFT 1회 → 모든 대역 축약
+
+    Args:
+        args: (file_path, delta_f, window_type, view_type, bands)
+
+    Returns:
+        bands 순서의 TrendResult 리스트
+    """
+    file_path, delta_f, window_type, view_type, bands = args
+    file_name = os.path.basename(file_path)
+    try:
+        with open(file_path, 'rb') as f:
+            text = f.read().decode('utf-8', errors='ignore')
+        data, sampling_rate, metadata = _parse_trend_text(text)
+        return _compute_band_results(
+            file_name, data, sampling_rate, metadata,
+            delta_f, window_type, view_type, bands
+        )
+    except Exception as e:
+        failed = _failed_trend_result(file_name, e)
+        return [failed for _ in bands]
+
+
+@dataclass
+class DatasetResult:
+    """
+    Dataset.compute() 결과 (파일 × 대역 행렬).
+
+    속성:
+        file_paths: 스캔된 파일 경로 (스캔 순서).
+        timestamps: 파일명 기준 측정 시각 (추출 실패 시 None).
+        channels: 파일명 기준 채널 식별자.
+        bands: 대역 목록 (열 순서).
+        band_rms: (n_files, n_bands) Band RMS.
+        band_peak: (n_files, n_bands) Band 최대 진폭.
+        band_peak_freq: (n_files, n_bands) Band 최대 진폭 주파수.
+        success: (n_files, n_bands) 성공 여부.
+        computed_files: 실제로 워커가 처리한 파일 수 (저장소 재사용 시 0).
+    """
+    file_paths: List[str]
+    timestamps: List[Optional[datetime]]
+    channels: List[str]
+    bands: List[Band]
+    band_rms: np.ndarray
+    band_peak: np.ndarray
+    band_peak_freq: np.ndarray
+    success: np.ndarray
+    computed_files: int = 0
+
+    @property
+    def num_files(self) -> int:
+        """파일 수를 반환합니다."""
+        return len(self.file_paths)
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """
+    불변 지연 실행 계획.
+
+    각 메서드는 단계를 추가한 새 Dataset을 반환하며, files()/compute() 호출 전에는
+    디스크에 접근하지 않습니다.
+
+    인자:
+        parent: 상위 폴더 (YYYY-MM-DD 하위 폴더 또는 직접 파일).
+        pattern: 파일 Glob 패턴.
+        date_from: 시작 날짜 (포함).
+        date_to: 종료 날짜 (포함).
+        channel_ids: 채널 필터 (None이면 전체).
+        delta_f: 주파수 분해능 (Hz).
+        overlap: 오버랩 비율 (저장소 키 호환용, Trend FFT는 단일 구간).
+        window_type: 윈도우 함수.
+        view_type: 신호 유형 ('ACC', 'VEL', 'DIS').
+        bands: 축약할 주파수 대역 목록.
+        max_workers: 워커 프로세스 수 (None이면 CPU 코어 수 - 1).
+        result_store: 중간 결과 재사용/공유 저장소.
+    """
+    parent: str
+    pattern: str = '*.txt'
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    channel_ids: Optional[Tuple[str, ...]] = None
+    delta_f: float = 1.0
+    overlap: float = 50.0
+    window_type: str = 'hanning'
+    view_type: str = 'ACC'
+    bands: Tuple[Band, ...] = ()
+    max_workers: Optional[int] = None
+    result_store: Optional[AnalysisResultStore] = field(default=None, compare=False)
+
+    @classmethod
+    def open(
+        cls,
+        parent: str,
+        pattern: str = '*.txt',
+        max_workers: Optional[int] = None,
+        result_store: Optional[AnalysisResultStore] = None
+    ) -> 'Dataset':
+        """상위 폴더에 대한 Dataset을 생성합니다."""
+        return cls(parent=str(parent), pattern=pattern,
+                   max_workers=max_workers, result_store=result_store)
+
+    # ========================================
+    # 계획 단계 (지연)
+    # ========================================
+    def between(self, date_from: Optional[DateLike], date_to: Optional[DateLike]) -> 'Dataset':
+        """날짜 범위 필터 (양 끝 포함, 스캔 단계에서 적용)."""
+        return replace(self, date_from=_to_date(date_from), date_to=_to_date(date_to))
+
+    def channels(self, channel_ids: Iterable[Union[int, str]]) -> 'Dataset':
+        """채널 필터 (예: [1, 3] 또는 ['CH1'], 스캔 단계에서 적용)."""
+        return replace(self, channel_ids=tuple(str(c) for c in channel_ids))
+
+    def spectrum(
+        self,
+        delta_f: float = 1.0,
+        overlap: float = 50.0,
+        window: str = 'hanning',
+        view: str = 'ACC'
+    ) -> 'Dataset':
+        """FFT 파라미터를 지정합니다."""
+        return replace(self, delta_f=float(delta_f), overlap=float(overlap),
+                       window_type=window.lower(), view_type=view.upper())
+
+    def band_rms(self, bands: Sequence[Band]) -> 'Dataset':
+        """Band RMS 축약 대역을 추가합니다."""
+        return self._with_bands(bands)
+
+    def band_peak(self, bands: Sequence[Band]) -> 'Dataset':
+        """Band Peak 축약 대역을 추가합니다 (RMS와 같은 패스에서 계산)."""
+        return self._with_bands(bands)
+
+    def _with_bands(self, bands: Sequence[Band]) -> 'Dataset':
+        merged = list(self.bands)
+        for band_min, band_max in bands:
+            band = (float(band_min), float(band_max))
+            if band not in merged:
+                merged.append(band)
+        return replace(self, bands=tuple(merged))
+
+    def explain(self) -> str:
+        """실행 계획을 사람이 읽을 수 있는 문자열로 반환합니다."""
+        channels = ', '.join(self.channel_ids) if self.channel_ids else 'all'
+        bands = ', '.join(f"{lo:g}-{hi:g} Hz" for lo, hi in self.bands) or '-'
+        return (
+            f"scan {self.parent} [{self.pattern}] "
+            f"dates={self.date_from or '*'}..{self.date_to or '*'} channels={channels}\n"
+            f"  -> fused per-file pass: read + FFT(df={self.delta_f:g}, "
+            f"{self.window_type}, {self.view_type}) + bands [{bands}]"
+        )
+
+    # ========================================
+    # 실행
+    # ========================================
+    def files(self) -> List[str]:
+        """
+        필터를 적용한 파일 경로 목록을 반환합니다.
+
+        날짜 필터는 하위 폴더 단위로, 단일 폴더 모드에서는 파일명 날짜로 적용하고,
+        채널 필터는 파일명으로 적용하므로 제외 파일은 열지 않습니다.
+        """
+        paths = FileService().scan_subdirectories(
+            self.parent, self.date_from, self.date_to, self.pattern
+        )
+        return FileCatalog(paths).select(self.date_from, self.date_to, self.channel_ids)
+
+    def compute(
+        self,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> DatasetResult:
+        """
+        계획을 실행합니다.
+
+        반환:
+            DatasetResult.
+
+        예외:
+            ValueError: 축약 대역이 지정되지 않은 경우.
+        """
+        if not self.bands:
+            raise ValueError("No reduction in plan: call band_rms() or band_peak() first")
+
+        file_paths = self.files()
+        view_type = VIEW_TYPE_MAP.get(self.view_type, 1)
+        bands = list(self.bands)
+
+        columns: Dict[Band, List[TrendResult]] = {}
+        keys = {}
+        if self.result_store is not None:
+            for band in bands:
+                keys[band] = self.result_store.make_key(
+                    file_paths, self.delta_f, self.overlap, self.window_type,
+                    view_type, band[0], band[1]
+                )
+                cached = self.result_store.get(keys[band])
+                if cached is not None:
+                    columns[band] = cached
+
+        missing = [band for band in bands if band not in columns]
+        computed_files = 0
+        if missing and file_paths:
+            per_file = self._execute(file_paths, view_type, missing, progress_callback)
+            computed_files = len(file_paths)
+            for j, band in enumerate(missing):
+                columns[band] = [results[j] for results in per_file]
+                if self.result_store is not None:
+                    self.result_store.put(keys[band], columns[band])
+        elif missing:
+            for band in missing:
+                columns[band] = []
+
+        n_files, n_bands = len(file_paths), len(bands)
+        band_rms = np.zeros((n_files, n_bands))
+        band_peak = np.zeros((n_files, n_bands))
+        band_peak_freq = np.zeros((n_files, n_bands))
+        success = np.zeros((n_files, n_bands), dtype=bool)
+        for j, band in enumerate(bands):
+            for i, r in enumerate(columns[band]):
+                band_rms[i, j] = r.rms_value
+                band_peak[i, j] = r.peak_value
+                band_peak_freq[i, j] = r.peak_freq
+                success[i, j] = r.success
+
+        catalog = FileCatalog(file_paths)
+        return DatasetResult(
+            file_paths=file_paths,
+            timestamps=[catalog.timestamp(p) for p in file_paths],
+            channels=catalog.channels.tolist(),
+            bands=bands,
+            band_rms=band_rms,
+            band_peak=band_peak,
+            band_peak_freq=band_peak_freq,
+            success=success,
+            computed_files=computed_files
+        )
+
+    def _execute(
+        self,
+        file_paths: List[str],
+        view_type: int,
+        bands: List[Band],
+        progress_callback: Optional[Callable[[int, int], None]]
+    ) -> List[List[TrendResult]]:
+        """파일당 1회 융합 워커 패스를 실행합니다 (입력 순서 보장)."""
+        tasks = [
+            (path, self.delta_f, self.window_type, view_type, bands)
+            for path in file_paths
+        ]
+        total = len(tasks)
+        max_workers = self.max_workers or max(mp.cpu_count() - 1, 1)
+
+        if total < MIN_PARALLEL_FILES or max_workers <= 1:
+            results = []
+            for i, task in enumerate(tasks, 1):
+                results.append(_dataset_file_worker(task))
+                if progress_callback:
+                    progress_callback(i, total)
+            return results
+
+        chunksize = max(1, total // (max_workers * 4))
+        results = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for i, result in enumerate(
+                executor.map(_dataset_file_worker, tasks, chunksize=chunksize), 1
+            ):
+                results.append(result)
+                if progress_callback:
+                    progress_callback(i, total)
+        logger.info(f"Dataset: {total} files x {len(bands)} bands in one pass")
+        return results
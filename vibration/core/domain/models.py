@@ -5,8 +5,8 @@
 이 모델들은 프레임워크에 독립적이며 Qt 의존성이 없습니다.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Tuple, Union
+from dataclasses import dataclass, field, replace
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Union
 from datetime import datetime, date
 
 import numpy as np
@@ -85,6 +85,23 @@ class FFTResult:
         """주파수 포인트 수를 반환합니다."""
         return len(self.frequency)
 
+    def scaled(self, factor: float) -> 'FFTResult':
+        """
+        입력 신호에 factor를 곱했을 때의 결과를 FFT 재계산 없이 반환합니다.
+
+        진폭 스펙트럼과 RMS는 factor에, PSD는 factor²에 비례합니다.
+        factor가 1이면 자기 자신을 반환합니다.
+        """
+        if factor == 1.0:
+            return self
+        return replace(
+            self,
+            spectrum=self.spectrum * factor,
+            rms=self.rms * abs(factor),
+            psd=None if self.psd is None else self.psd * (factor * factor),
+            metadata=dict(self.metadata or {})
+        )
+
 
 @dataclass
 class SignalData:
@@ -304,27 +321,34 @@ class ProjectFileInfo:
 
 @dataclass
 class ProjectData:
-    """프로젝트 저장/로드를 위한 데이터 컨테이너."""
+    """
+    프로젝트 저장/로드를 위한 데이터 컨테이너.
+
+    files는 ProjectFileInfo 목록 또는 같은 시퀀스 인터페이스의 컬럼형
+    ProjectFileTable입니다 (load_project는 항상 테이블을 반환).
+    """
     name: str
     description: str
     created_at: str
     parent_folder: str
     measurement_type: str = 'Unknown'
-    files: List[ProjectFileInfo] = field(default_factory=list)
+    files: Sequence[ProjectFileInfo] = field(default_factory=list)
     summary: Dict[str, Any] = field(default_factory=dict)
     project_folder: str = ''
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+    def to_dict(self, include_files: bool = True) -> Dict[str, Any]:
+        data = {
             'name': self.name,
             'description': self.description,
             'created_at': self.created_at,
             'parent_folder': self.parent_folder,
             'measurement_type': self.measurement_type,
-            'files': [f.to_dict() for f in self.files],
             'summary': self.summary,
             'project_folder': self.project_folder,
         }
+        if include_files:
+            data['files'] = [f.to_dict() for f in self.files]
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ProjectData':
@@ -47,186 +47,288 @@ class TrendResult:
 # ========================================
 # 2. 워커 함수 (프로세스에서 실행)
 # ========================================
-def _process_trend_worker(args: Tuple) -> TrendResult:
+def _parse_trend_text(text: str) -> Tuple[np.ndarray, float, Dict[str, Any]]:
     """
-    단일 파일 처리 워커
+    파일 텍스트에서 신호 데이터와 필수 메타데이터를 한 번에 추출
 
     Args:
-        args: (file_path, delta_f, overlap, window_type,
-               view_type, band_min, band_max)
+        text: 디코딩된 파일 전체 텍스트
+
+    Returns:
+        (data(float32), sampling_rate, metadata)
+    """
+    data = []
+    metadata = {}
+    sampling_rate = 10240.0  # 기본값
+
+    for i, line in enumerate(text.splitlines()):
+        line = line.strip()
+
+        # ===== 숫자 데이터 (숫자로 시작하는 줄만) =====
+        if line and (line[0].isdigit() or line[0] == '-'):
+            try:
+                data.append(float(line.split()[0]))
+            except:
+                pass
+
+        # ===== 메타데이터 (상위 25줄만) =====
+        if i >= 25 or ':' not in line:
+            continue
+
+        if 'D.Sampling Freq.' in line:
+            try:
+                sampling_rate = float(line.split(':')[1].replace('Hz', '').strip())
+            except:
+                pass
+        elif 'b.Sensitivity' in line:
+            try:
+                metadata['b_sens'] = float(NUMERIC_PATTERN.search(line.split(':')[1]).group())
+            except:
+                pass
+        elif 'Sensitivity' in line and 'b.' not in line:
+            try:
+                metadata['sens'] = float(NUMERIC_PATTERN.search(line.split(':')[1]).group())
+            except:
+                pass
+        elif 'Starting Time' in line:
+            metadata['start_time'] = line.split(':')[1].strip()
+        elif 'Record Length' in line:
+            metadata['duration'] = line.split(':')[1].strip().split()[0]
+        elif 'Channel' in line:
+            metadata['channel'] = line.split(':')[1].strip()
+
+    return np.array(data, dtype=np.float32), sampling_rate, metadata
+
+
+def _compute_trend_spectrum(
+        data: np.ndarray,
+        sampling_rate: float,
+        metadata: Dict[str, Any],
+        delta_f: float,
+        window_type: str,
+        view_type: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    파싱된 신호에서 Trend용 단측 진폭 스펙트럼 계산
+
+    Returns:
+        (freq, spectrum)
+    """
+    # ===== 1. 민감도 보정 =====
+    if 'b_sens' in metadata and 'sens' in metadata:
+        if metadata['sens'] != 0:
+            data = data * (metadata['b_sens'] / metadata['sens'])
+
+    # ===== 2. FFT 준비 =====
+    N = len(data)
+    MIN_FFT_LENGTH = 1024
+
+    # delta_f 검증
+    delta_f_min = sampling_rate / max(N, MIN_FFT_LENGTH)
+    if delta_f < delta_f_min:
+        delta_f = delta_f_min
+
+    # 제로 패딩
+    N_fft = max(int(sampling_rate / delta_f), MIN_FFT_LENGTH)
+    if N_fft > N:
+        data = np.pad(data, (0, N_fft - N), 'constant')
+        N = N_fft
+
+    # ===== 3. 윈도우 함수 =====
+    from scipy.signal.windows import hann, flattop
+
+    if window_type == 'hanning':
+        window = hann(N, sym=False)
+    elif window_type == 'flattop':
+        window = flattop(N, sym=False)
+    else:  # rectangular
+        window = np.ones(N)
+
+    # ===== 4. FFT 계산 =====
+    from scipy.fft import rfft, rfftfreq
+
+    # 윈도우 적용
+    windowed = data * window
+
+    # FFT
+    spectrum_complex = rfft(windowed)
+    spectrum = np.abs(spectrum_complex) / N
+
+    # 단측 스펙트럼 (DC와 Nyquist 제외하고 2배)
+    spectrum[1:-1] *= 2
+
+    # 주파수 벡터
+    freq = rfftfreq(N, 1 / sampling_rate)
+
+    # ===== 5. ACF (Amplitude Correction Factor) =====
+    ACF = 1 / (np.mean(window) * np.sqrt(2))
+    spectrum = ACF * spectrum
+
+    # ===== 6. 신호 타입 변환 (ACC → VEL/DIS) =====
+    if view_type == 2:  # VEL
+        # ω = 2πf, V = A / (jω)
+        omega = 2 * np.pi * freq
+        omega[0] = 1e-10  # DC 방지
+        spectrum = spectrum / omega * 1000  # mm/s
+    elif view_type == 3:  # DIS
+        # D = A / (jω)^2
+        omega = 2 * np.pi * freq
+        omega[0] = 1e-10
+        spectrum = spectrum / (omega ** 2) * 1000  # μm
+
+    return freq, spectrum
+
+
+def _band_trend_result(
+        file_name: str,
+        freq: np.ndarray,
+        spectrum: np.ndarray,
+        sampling_rate: float,
+        metadata: Dict[str, Any],
+        band_min: float,
+        band_max: float
+) -> TrendResult:
+    """
+    스펙트럼의 한 주파수 대역에서 RMS / Peak 계산
 
     Returns:
         TrendResult
     """
-    (file_path, delta_f, overlap, window_type,
-     view_type, band_min, band_max) = args
+    # ===== 7. Band 필터링 =====
+    mask = (freq >= band_min) & (freq <= band_max)
+    spectrum_band = spectrum[mask]
+    freq_band = freq[mask]
 
-    file_name = os.path.basename(file_path)
+    if len(spectrum_band) == 0:
+        return TrendResult(
+            file_name=file_name,
+            rms_value=0.0, peak_value=0.0, peak_freq=0.0,
+            sampling_rate=sampling_rate, metadata=metadata,
+            success=False, error_msg="Band 범위 내 데이터 없음"
+        )
 
-    try:
-        # ===== 1. 파일 로딩 (NumPy 직접) =====
-        # 숫자 데이터만 추출 (주석 제외)
-        data = []
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                # 숫자로 시작하는 줄만
-                if line and (line[0].isdigit() or line[0] == '-'):
-                    try:
-                        data.append(float(line.split()[0]))
-                    except:
-                        continue
-
-        data = np.array(data, dtype=np.float32)
-
-        if len(data) == 0:
-            return TrendResult(
+    # ===== 8. RMS & Peak 계산 =====
+    # RMS: √(∑P²)
+    rms_value = np.sqrt(np.sum(spectrum_band ** 2))
+
+    # Peak
+    peak_idx = np.argmax(spectrum_band)
+    peak_value = spectrum_band[peak_idx]
+    peak_freq = freq_band[peak_idx]
+
+    # ===== 9. 결과 반환 =====
+    return TrendResult(
+        file_name=file_name,
+        rms_value=float(rms_value),
+        peak_value=float(peak_value),
+        peak_freq=float(peak_freq),
+        sampling_rate=float(sampling_rate),
+        metadata=metadata,
+        success=True
+    )
+
+
+def _compute_band_results(
+        file_name: str,
+        data: np.ndarray,
+        sampling_rate: float,
+        metadata: Dict[str, Any],
+        delta_f: float,
+        window_type: str,
+        view_type: int,
+        bands: List[Tuple[float, float]]
+) -> List[TrendResult]:
+    """
+    FFT 1회로 여러 주파수 대역의 Band RMS / Peak 계산
+
+    Returns:
+        bands 순서의 TrendResult 리스트
+    """
+    if len(data) == 0:
+        return [
+            TrendResult(
                 file_name=file_name,
                 rms_value=0.0, peak_value=0.0, peak_freq=0.0,
                 sampling_rate=0.0, metadata={},
                 success=False, error_msg="데이터 없음"
             )
+            for _ in bands
+        ]
 
-        # ===== 2. 메타데이터 파싱 (상위 25줄만) =====
-        metadata = {}
-        sampling_rate = 10240.0  # 기본값
-
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for i, line in enumerate(f):
-                if i >= 25:  # 헤더는 보통 상위 25줄 내
-                    break
-
-                line = line.strip()
-                if ':' not in line:
-                    continue
-
-                # 필수 메타데이터만 추출
-                if 'D.Sampling Freq.' in line:
-                    try:
-                        sampling_rate = float(line.split(':')[1].replace('Hz', '').strip())
-                    except:
-                        pass
-                elif 'b.Sensitivity' in line:
-                    try:
-                        metadata['b_sens'] = float(NUMERIC_PATTERN.search(line.split(':')[1]).group())
-                    except:
-                        pass
-                elif 'Sensitivity' in line and 'b.' not in line:
-                    try:
-                        metadata['sens'] = float(NUMERIC_PATTERN.search(line.split(':')[1]).group())
-                    except:
-                        pass
-                elif 'Starting Time' in line:
-                    metadata['start_time'] = line.split(':')[1].strip()
-                elif 'Record Length' in line:
-                    metadata['duration'] = line.split(':')[1].strip().split()[0]
-                elif 'Channel' in line:
-                    metadata['channel'] = line.split(':')[1].strip()
-
-        # ===== 3. 민감도 보정 =====
-        if 'b_sens' in metadata and 'sens' in metadata:
-            if metadata['sens'] != 0:
-                data = data * (metadata['b_sens'] / metadata['sens'])
-
-        # ===== 4. FFT 준비 =====
-        N = len(data)
-        MIN_FFT_LENGTH = 1024
-
-        # delta_f 검증
-        delta_f_min = sampling_rate / max(N, MIN_FFT_LENGTH)
-        if delta_f < delta_f_min:
-            delta_f = delta_f_min
-
-        # 제로 패딩
-        N_fft = max(int(sampling_rate / delta_f), MIN_FFT_LENGTH)
-        if N_fft > N:
-            data = np.pad(data, (0, N_fft - N), 'constant')
-            N = N_fft
-
-        # ===== 5. 윈도우 함수 =====
-        from scipy.signal.windows import hann, flattop
-
-        if window_type == 'hanning':
-            window = hann(N, sym=False)
-        elif window_type == 'flattop':
-            window = flattop(N, sym=False)
-        else:  # rectangular
-            window = np.ones(N)
-
-        # ===== 6. FFT 계산 =====
-        from scipy.fft import rfft, rfftfreq
-
-        # 윈도우 적용
-        windowed = data * window
-
-        # FFT
-        spectrum_complex = rfft(windowed)
-        spectrum = np.abs(spectrum_complex) / N
-
-        # 단측 스펙트럼 (DC와 Nyquist 제외하고 2배)
-        spectrum[1:-1] *= 2
-
-        # 주파수 벡터
-        freq = rfftfreq(N, 1 / sampling_rate)
-
-        # ===== 7. ACF (Amplitude Correction Factor) =====
-        ACF = 1 / (np.mean(window) * np.sqrt(2))
-        spectrum = ACF * spectrum
-
-        # ===== 8. 신호 타입 변환 (ACC → VEL/DIS) =====
-        if view_type == 2:  # VEL
-            # ω = 2πf, V = A / (jω)
-            omega = 2 * np.pi * freq
-            omega[0] = 1e-10  # DC 방지
-            spectrum = spectrum / omega * 1000  # mm/s
-        elif view_type == 3:  # DIS
-            # D = A / (jω)^2
-            omega = 2 * np.pi * freq
-            omega[0] = 1e-10
-            spectrum = spectrum / (omega ** 2) * 1000  # μm
-
-        # ===== 9. Band 필터링 =====
-        mask = (freq >= band_min) & (freq <= band_max)
-        spectrum_band = spectrum[mask]
-        freq_band = freq[mask]
-
-        if len(spectrum_band) == 0:
-            return TrendResult(
-                file_name=file_name,
-                rms_value=0.0, peak_value=0.0, peak_freq=0.0,
-                sampling_rate=sampling_rate, metadata=metadata,
-                success=False, error_msg="Band 범위 내 데이터 없음"
-            )
+    freq, spectrum = _compute_trend_spectrum(
+        data, sampling_rate, metadata, delta_f, window_type, view_type
+    )
+    return [
+        _band_trend_result(file_name, freq, spectrum, sampling_rate, metadata,
+                           band_min, band_max)
+        for band_min, band_max in bands
+    ]
+
+
+def _compute_trend_result(
+        file_name: str,
+        data: np.ndarray,
+        sampling_rate: float,
+        metadata: Dict[str, Any],
+        delta_f: float,
+        window_type: str,
+        view_type: int,
+        band_min: float,
+        band_max: float
+) -> TrendResult:
+    """
+    파싱된 신호에서 Band RMS / Peak 계산
 
-        # ===== 10. RMS & Peak 계산 =====
-        # RMS: √(∑P²)
-        rms_value = np.sqrt(np.sum(spectrum_band ** 2))
+    Returns:
+        TrendResult
+    """
+    return _compute_band_results(
+        file_name, data, sampling_rate, metadata,
+        delta_f, window_type, view_type, [(band_min, band_max)]
+    )[0]
 
-        # Peak
-        peak_idx = np.argmax(spectrum_band)
-        peak_value = spectrum_band[peak_idx]
-        peak_freq = freq_band[peak_idx]
 
-        # ===== 11. 결과 반환 =====
-        return TrendResult(
-            file_name=file_name,
-            rms_value=float(rms_value),
-            peak_value=float(peak_value),
-            peak_freq=float(peak_freq),
-            sampling_rate=float(sampling_rate),
-            metadata=metadata,
-            success=True
+def _failed_trend_result(file_name: str, error: Exception) -> TrendResult:
+    """예외를 실패 TrendResult로 변환"""
+    import traceback
+    return TrendResult(
+        file_name=file_name,
+        rms_value=0.0, peak_value=0.0, peak_freq=0.0,
+        sampling_rate=0.0, metadata={},
+        success=False,
+        error_msg=f"{str(error)}\n{traceback.format_exc()}"
+    )
+
+
+def _process_trend_worker(args: Tuple) -> TrendResult:
+    """
+    단일 파일 처리 워커
+
+    Args:
+        args: (file_path, delta_f, overlap, window_type,
+               view_type, band_min, band_max)
+
+    Returns:
+        TrendResult
+    """
+    (file_path, delta_f, overlap, window_type,
+     view_type, band_min, band_max) = args
+
+    file_name = os.path.basename(file_path)
+
+    try:
+        # 파일을 한 번만 읽어 데이터 + 메타데이터 동시 파싱
+        with open(file_path, 'rb') as f:
+            text = f.read().decode('utf-8', errors='ignore')
+
+        data, sampling_rate, metadata = _parse_trend_text(text)
+        return _compute_trend_result(
+            file_name, data, sampling_rate, metadata,
+            delta_f, window_type, view_type, band_min, band_max
         )
 
     except Exception as e:
-        import traceback
-        return TrendResult(
-            file_name=file_name,
-            rms_value=0.0, peak_value=0.0, peak_freq=0.0,
-            sampling_rate=0.0, metadata={},
-            success=False,
-            error_msg=f"{str(e)}\n{traceback.format_exc()}"
-        )
+        return _failed_trend_result(file_name, e)
 
 
 # ========================================
@@ -235,16 +337,27 @@ def _process_trend_worker(args: Tuple) -> TrendResult:
 class TrendParallelProcessor:
     """Trend 전용 병렬 프로세서 (ProcessPoolExecutor)"""
 
-    def __init__(self, max_workers: int = None):
+    def __init__(
+            self,
+            max_workers: int = None,
+            io_pipeline: bool = False,
+            queue_depth: Optional[int] = None
+    ):
         """
         Args:
             max_workers: 프로세스 수 (None이면 CPU 코어 수 - 1)
+            io_pipeline: True면 리더 스레드 → 연산 프로세스 2단계 파이프라인 사용
+                         (HDD/SMB 등 느린 저장소용, trend_pipeline.TrendPipeline)
+            queue_depth: 파이프라인 읽기 버퍼 수 (None이면 max_workers * 2)
         """
         if max_workers is None:
             # CPU 코어 수 - 1 (시스템 여유 확보)
             max_workers = max(mp.cpu_count() - 1, 1)
 
         self.max_workers = max_workers
+        self.io_pipeline = io_pipeline
+        self.queue_depth = queue_depth
+        self.last_stats: Dict[str, float] = {}
 
     def process_batch(
             self,
@@ -273,6 +386,20 @@ class TrendParallelProcessor:
         Returns:
             TrendResult 리스트 (입력 순서 보장)
         """
+        if self.io_pipeline:
+            from .trend_pipeline import TrendPipeline
+
+            pipeline = TrendPipeline(
+                max_workers=self.max_workers,
+                queue_depth=self.queue_depth
+            )
+            results = pipeline.process_batch(
+                file_paths, delta_f, overlap, window_type,
+                view_type, band_min, band_max, progress_callback
+            )
+            self.last_stats = pipeline.last_stats
+            return results
+
         # 인자 리스트 생성
         args_list = [
             (fp, delta_f, overlap, window_type.lower(),
@@ -384,8 +511,18 @@ class PeakParallelProcessor:
     (내부적으로 TrendParallelProcessor 재사용)
     """
 
-    def __init__(self, max_workers: int = None):
-        self.processor = TrendParallelProcessor(max_workers)
+    def __init__(
+            self,
+            max_workers: int = None,
+            io_pipeline: bool = False,
+            queue_depth: Optional[int] = None
+    ):
+        self.processor = TrendParallelProcessor(max_workers, io_pipeline, queue_depth)
+
+    @property
+    def last_stats(self) -> Dict[str, float]:
+        """마지막 파이프라인 배치의 단계별 통계"""
+        return self.processor.last_stats
 
     def process_batch(
             self,
@@ -5,5 +5,10 @@ from .trend_service import TrendService
 from .peak_service import PeakService
 from .file_service import FileService
 from .project_service import ProjectService
+from .project_result_store import ProjectResultStore
+from .spectra_store import SpectraStore
+from .analysis_result_store import AnalysisResultStore
+from .trend_result_cache import TrendResultCache
 
-__all__ = ['FFTService', 'TrendService', 'PeakService', 'FileService', 'ProjectService']
+__all__ = ['FFTService', 'TrendService', 'PeakService', 'FileService', 'ProjectService',
+           'ProjectResultStore', 'SpectraStore', 'AnalysisResultStore', 'TrendResultCache']
@@ -0,0 +1,100 @@
+"""
+Trend/Peak 공용 분석 결과 저장소.
+
+Overall RMS(Trend) 탭과 Band Peak 탭은 동일한 워커(_process_trend_worker)로
+파일별 RMS, Peak, Peak 주파수를 한 번에 계산합니다. 같은 파일 집합과 FFT
+파라미터로 두 탭을 모두 보면 전체 데이터를 두 번 읽게 되므로, 파일별 원시
+결과를 (파일 집합, 파라미터) 키로 보관하여 다른 탭이 디스크 접근 없이
+집계만 수행하도록 합니다.
+
+Qt 의존성 없음 - 순수 Python 구현.
+"""
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from .OPTIMIZATION_PATCH_LEVEL5_TREND import TrendResult
+
+logger = logging.getLogger(__name__)
+
+AnalysisKey = Tuple
+
+DEFAULT_MAX_ENTRIES = 8
+
+
+class AnalysisResultStore:
+    """
+    (파일 집합, FFT 파라미터) → 파일별 TrendResult 목록 LRU 저장소.
+
+    TrendService와 PeakService가 같은 인스턴스를 공유합니다.
+
+    인자:
+        max_entries: 보관할 배치 결과 수 (초과 시 가장 오래 사용하지 않은 항목 제거).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[AnalysisKey, List[TrendResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        file_paths: List[str],
+        delta_f: float,
+        overlap: float,
+        window_type: str,
+        view_type: int,
+        band_min: float,
+        band_max: float
+    ) -> AnalysisKey:
+        """
+        process_batch 인자로부터 저장소 키를 생성합니다.
+
+        탭마다 경로 결합 방식(os.path.join / Path)이 달라도 같은 키가 되도록
+        경로를 정규화합니다.
+        """
+        return (
+            tuple(os.path.normpath(p) for p in file_paths),
+            float(delta_f),
+            float(overlap),
+            window_type.lower(),
+            int(view_type),
+            float(band_min),
+            float(band_max),
+        )
+
+    def get(self, key: AnalysisKey) -> Optional[List[TrendResult]]:
+        """저장된 결과를 반환합니다 (없으면 None)."""
+        with self._lock:
+            results = self._entries.get(key)
+            if results is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(results)
+
+    def put(self, key: AnalysisKey, results: List[TrendResult]) -> None:
+        """배치 결과를 저장합니다."""
+        with self._lock:
+            self._entries[key] = list(results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 결과를 폐기합니다."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: AnalysisKey) -> bool:
+        with self._lock:
+            return key in self._entries
@@ -0,0 +1,169 @@
+"""
+스펙트럼 행렬의 대역 트렌드 추출.
+
+워터폴 저장소의 (n_files, n_bins) 스펙트럼 행렬에서 파일별 대역 값을 한 번에
+계산합니다. 대역마다 주파수 축의 bin 인덱스를 미리 구하고(BandLookup), 행렬을
+행 청크로 읽으며 대역별로 축 방향 축소(RMS/최댓값)를 수행합니다. 여러 대역을
+요청해도 행렬은 한 번만 읽습니다.
+
+대역 종류:
+    nearest    low에 가장 가까운 bin 값
+    rms        low ≤ f ≤ high bin의 √(∑P²) (트렌드 탭 Band RMS와 같은 정의)
+    peak       low ≤ f ≤ high bin의 최댓값
+    harmonics  low의 1..N배에 가장 가까운 bin들의 √(∑P²)
+
+Qt 의존성 없음 - 순수 NumPy 구현.
+"""
+from typing import List, NamedTuple, Sequence, Union
+
+import numpy as np
+
+BAND_METHODS = ('nearest', 'rms', 'peak', 'harmonics')
+
+# 행렬을 읽는 행 청크 크기 (memmap 행렬도 청크 단위로 디스크에서 읽음)
+BAND_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+class BandSpec(NamedTuple):
+    """
+    추출할 대역 하나.
+
+    속성:
+        method: BAND_METHODS 중 하나.
+        low: 기준/하한/기본 주파수 (Hz).
+        high: 상한 주파수 (rms/peak).
+        harmonics: 고조파 개수 (harmonics).
+    """
+    method: str
+    low: float
+    high: float = 0.0
+    harmonics: int = 1
+
+    @property
+    def label(self) -> str:
+        if self.method == 'rms':
+            return f"RMS {self.low:.1f}-{self.high:.1f} Hz"
+        if self.method == 'peak':
+            return f"Peak {self.low:.1f}-{self.high:.1f} Hz"
+        if self.method == 'harmonics':
+            return f"{self.low:.1f} Hz ×1-{self.harmonics} RMS"
+        return f"{self.low:.1f} Hz"
+
+
+class BandLookup:
+    """
+    주파수 축에 대한 대역별 bin 인덱스.
+
+    인자:
+        frequency: 공유 주파수 축 (오름차순).
+        bands: BandSpec 목록.
+
+    속성:
+        start, stop: 모든 대역이 사용하는 열 범위 (행렬은 이 범위만 읽음).
+        columns: 대역별 열 인덱스 (start 기준 상대 위치).
+    """
+
+    def __init__(self, frequency: np.ndarray, bands: Sequence[BandSpec]):
+        frequency = np.asarray(frequency, dtype=np.float64)
+        self.bands = list(bands)
+        columns: List[np.ndarray] = []
+        for band in self.bands:
+            if band.method not in BAND_METHODS:
+                raise ValueError(f"Unknown band method: {band.method!r}")
+            columns.append(_band_columns(frequency, band))
+
+        used = [cols for cols in columns if len(cols)]
+        self.start = int(min(cols.min() for cols in used)) if used else 0
+        self.stop = int(max(cols.max() for cols in used)) + 1 if used else 0
+        self.columns = [cols - self.start for cols in columns]
+
+    def reduce(self, block: np.ndarray) -> np.ndarray:
+        """
+        행 블록(열 범위 start:stop)의 대역 값을 계산합니다.
+
+        반환:
+            (n_rows, n_bands) float64. 대역에 유효한 bin이 없는 행은 NaN.
+        """
+        out = np.full((block.shape[0], len(self.bands)), np.nan)
+        for j, (band, cols) in enumerate(zip(self.bands, self.columns)):
+            if not len(cols):
+                continue
+            # rms/peak는 연속 bin이므로 복사 없는 슬라이스
+            values = block[:, cols[0]:cols[-1] + 1] if band.method in ('rms', 'peak') else block[:, cols]
+            if band.method == 'nearest':
+                out[:, j] = values[:, 0]
+            elif band.method == 'peak':
+                out[:, j] = np.fmax.reduce(values, axis=1)
+            else:
+                out[:, j] = _root_sum_squares(values)
+        return out
+
+
+def extract_band_trends(frequency: np.ndarray, spectra: np.ndarray,
+                        bands: Sequence[Union[BandSpec, tuple]],
+                        chunk_bytes: int = BAND_CHUNK_BYTES) -> np.ndarray:
+    """
+    스펙트럼 행렬에서 파일별 대역 값을 계산합니다.
+
+    인자:
+        frequency: 공유 주파수 축 (n_bins).
+        spectra: (n_files, n_bins) 행렬 (np.memmap 가능). 유효 길이 밖은 NaN.
+        bands: BandSpec 목록.
+        chunk_bytes: 한 번에 읽는 행 블록 크기.
+
+    반환:
+        (n_files, n_bands) float64 행렬.
+    """
+    lookup = BandLookup(frequency, [BandSpec(*band) for band in bands])
+    n_rows = spectra.shape[0]
+    out = np.full((n_rows, len(lookup.bands)), np.nan)
+    width = lookup.stop - lookup.start
+    if width == 0 or n_rows == 0:
+        return out
+    chunk = max(1, chunk_bytes // (width * spectra.dtype.itemsize))
+    for r0 in range(0, n_rows, chunk):
+        r1 = min(n_rows, r0 + chunk)
+        out[r0:r1] = lookup.reduce(np.asarray(spectra[r0:r1, lookup.start:lookup.stop]))
+    return out
+
+
+def _root_sum_squares(values: np.ndarray) -> np.ndarray:
+    """
+    행별 √(∑P²) (NaN 무시, 모두 NaN이면 NaN).
+
+    einsum은 임시 배열 없이 float64로 누적합니다. NaN이 있는 행(짧은 행의 꼬리)만
+    nansum으로 다시 계산합니다.
+    """
+    total = np.einsum('ij,ij->i', values, values, dtype=np.float64)
+    nan_rows = np.isnan(total)
+    if nan_rows.any():
+        sub = values[nan_rows].astype(np.float64)
+        total[nan_rows] = np.where(np.isfinite(sub).any(axis=1), np.nansum(sub * sub, axis=1), np.nan)
+    return np.sqrt(total)
+
+
+def _band_columns(frequency: np.ndarray, band: BandSpec) -> np.ndarray:
+    """대역이 사용하는 열 인덱스 (오름차순)."""
+    if band.method in ('rms', 'peak'):
+        lo = np.searchsorted(frequency, band.low, side='left')
+        hi = np.searchsorted(frequency, band.high, side='right')
+        return np.arange(lo, max(lo, hi), dtype=np.int64)
+    if band.method == 'harmonics':
+        targets = band.low * np.arange(1, max(1, int(band.harmonics)) + 1)
+    else:
+        targets = np.array([band.low], dtype=np.float64)
+    if not len(frequency):
+        return np.empty(0, dtype=np.int64)
+    step = frequency[1] - frequency[0] if len(frequency) > 1 else 0.0
+    targets = targets[targets <= frequency[-1] + step / 2]
+    return np.unique(_nearest_bins(frequency, targets))
+
+
+def _nearest_bins(frequency: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """오름차순 축에서 targets에 가장 가까운 bin 인덱스."""
+    idx = np.clip(np.searchsorted(frequency, targets), 1, max(1, len(frequency) - 1))
+    if len(frequency) == 1:
+        return np.zeros(len(targets), dtype=np.int64)
+    left = frequency[idx - 1]
+    right = frequency[idx]
+    return np.where(targets - left <= right - targets, idx - 1, idx).astype(np.int64)
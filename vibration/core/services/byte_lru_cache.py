@@ -0,0 +1,165 @@
+"""
+바이트 예산 기반 LRU 캐시.
+
+FileService의 파서 캐시, Spectrum/Waterfall 프레젠터의 결과 캐시는 세션 동안
+무제한으로 커져 장시간 파일을 탐색하면 메모리가 계속 증가합니다. 항목 크기를
+실제 ndarray.nbytes 기준으로 추정하고, 설정한 바이트 예산을 넘으면 가장 오래
+사용하지 않은 항목부터 제거합니다.
+
+Qt 의존성 없음 - 순수 Python/NumPy 구현.
+"""
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 컨테이너/객체 속성을 따라가는 최대 깊이 (순환 참조 방지와 함께 사용)
+MAX_SIZE_DEPTH = 4
+
+
+def estimate_nbytes(value: Any, _depth: int = 0, _seen: Optional[set] = None) -> int:
+    """
+    값이 보유한 배열 메모리(바이트)를 추정합니다.
+
+    ndarray는 nbytes, bytes/str은 길이, 컨테이너와 일반 객체(__dict__/__slots__)는
+    구성 요소의 합으로 계산합니다. 같은 객체는 한 번만 셉니다.
+    """
+    if _seen is None:
+        _seen = set()
+    if value is None or id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (bytes, bytearray, memoryview, str)):
+        return len(value)
+    if isinstance(value, (int, float, bool, complex)) or _depth >= MAX_SIZE_DEPTH:
+        return sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        items = list(value.keys()) + list(value.values())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = list(value)
+    elif hasattr(value, '__dict__'):
+        items = list(vars(value).values())
+    elif hasattr(value, '__slots__'):
+        items = [getattr(value, s, None) for s in value.__slots__]
+    else:
+        return sys.getsizeof(value)
+
+    return sum(estimate_nbytes(item, _depth + 1, _seen) for item in items)
+
+
+class ByteBudgetLRUCache:
+    """
+    바이트 예산을 넘지 않도록 LRU 제거하는 스레드 안전 캐시.
+
+    dict처럼 `in`, `len`, 반복(오래된 순)을 지원하며, 이 연산들은 사용 순서와
+    적중 통계를 바꾸지 않습니다.
+
+    인자:
+        max_bytes: 최대 보관 바이트 수.
+        sizer: 값의 바이트 수를 반환하는 함수 (기본값: estimate_nbytes).
+        name: 로그/통계 표시용 이름.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        sizer: Optional[Callable[[Any], int]] = None,
+        name: str = "cache"
+    ):
+        self.max_bytes = max(0, int(max_bytes))
+        self.name = name
+        self._sizer = sizer or estimate_nbytes
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """값을 반환하고 최근 사용으로 표시합니다 (없으면 default)."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """
+        값을 저장하고 예산을 초과한 만큼 오래된 항목을 제거합니다.
+
+        반환:
+            저장 여부 (단일 항목이 예산보다 크면 저장하지 않음).
+        """
+        size = int(self._sizer(value))
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                logger.debug(f"{self.name}: {key!r} ({size} bytes) exceeds budget, not cached")
+                return False
+
+            self._entries[key] = value
+            self._sizes[key] = size
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+            return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """항목을 제거하고 값을 반환합니다."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            value = self._entries[key]
+            self._remove(key)
+            return value
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다 (통계는 유지)."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미스/제거 횟수와 사용량을 반환합니다."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        del self._entries[key]
+        self.current_bytes -= self._sizes.pop(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._entries))
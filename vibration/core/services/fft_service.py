@@ -12,6 +12,7 @@ from typing import Optional, Literal
 import numpy as np
 
 from .fft_engine import FFTEngine
+from .stft_frames import STFTFrameIndex
 from vibration.core.domain.models import FFTResult
 
 
@@ -115,6 +116,69 @@ class FFTService:
             metadata={'input_signal_type': input_signal_type}
         )
     
+    def frame_index_key(self) -> tuple:
+        """프레임 인덱스 재사용 여부를 판단하는 FFT 파라미터 키."""
+        return (self.sampling_rate, self._engine.nfft, self._engine.noverlap,
+                self._engine.window_type)
+    
+    def build_frame_index(self, data: np.ndarray) -> STFTFrameIndex:
+        """
+        구간 스펙트럼용 STFT 프레임 인덱스를 생성합니다 (백그라운드 스레드에서 호출 가능).
+        
+        인자:
+            data: 시간 영역 신호 데이터 (1차원 배열).
+        """
+        return STFTFrameIndex(
+            data, self._engine._window, self._engine.noverlap, key=self.frame_index_key()
+        )
+    
+    def compute_span_spectrum(
+        self,
+        index: STFTFrameIndex,
+        i_start: int,
+        i_end: int,
+        view_type: ViewType = 'ACC',
+        input_signal_type: ViewType = 'ACC'
+    ) -> FFTResult:
+        """
+        프레임 인덱스로 샘플 구간 [i_start, i_end)의 스펙트럼을 계산합니다.
+        
+        격자 프레임은 누적합에서 가져오고, 양 끝 프레임만 FFT합니다.
+        
+        예외:
+            ValueError: 인덱스의 FFT 파라미터가 현재와 다르거나 구간이 NFFT보다 짧은 경우.
+        """
+        if index.key != self.frame_index_key():
+            raise ValueError("Frame index was built with different FFT parameters")
+        
+        power = index.span_power(i_start, i_end)
+        if power is None:
+            raise ValueError(
+                f"Span length ({i_end - i_start}) is shorter than required NFFT ({index.nfft})"
+            )
+        
+        frequency = np.fft.rfftfreq(index.nfft, 1.0 / self.sampling_rate)
+        spectrum = self._apply_signal_conversion(
+            np.sqrt(power), frequency, input_signal_type, view_type
+        )
+        spectrum[0] = 0
+        
+        segment = index.data[max(0, i_start):i_end]
+        return FFTResult(
+            frequency=frequency,
+            spectrum=spectrum,
+            view_type=view_type,
+            window_type=self.window_type,
+            sampling_rate=self.sampling_rate,
+            delta_f=self.delta_f,
+            overlap=self.overlap,
+            acf=self._engine._calculate_acf(),
+            ecf=self._engine._calculate_ecf(),
+            rms=float(np.sqrt(np.mean(segment ** 2))),
+            psd=power,
+            metadata={'input_signal_type': input_signal_type, 'span_frames': True}
+        )
+    
     def _apply_signal_conversion(
         self,
         spectrum: np.ndarray,
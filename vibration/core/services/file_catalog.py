@@ -0,0 +1,235 @@
+"""
+파일명 카탈로그.
+
+로드한 파일 목록의 파일명을 한 번만 파싱하여 측정 시각(datetime64[s]), 채널,
+반복 번호를 컬럼 배열로 보관합니다. 탭들의 날짜 필터는 정렬된 시각 배열의
+이진 탐색, 채널 필터는 불리언 마스크로 계산하므로 필터를 바꿀 때마다 파일명을
+다시 자르지 않습니다. Trend/Peak 서비스의 시각 추출도 카탈로그를 먼저 조회합니다.
+
+파일명 형식:
+    YYYY-MM-DD_HH-MM-SS_<반복>_<채널>.txt   (반복 세그먼트는 선택)
+
+Qt 의존성 없음 - 순수 Python/NumPy 구현.
+"""
+import os
+import re
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+TIMESTAMP_PATTERNS = [
+    re.compile(r'(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})'),
+    re.compile(r'(\d{4})-(\d{2})-(\d{2})_(\d{2})-(\d{2})-(\d{2})'),
+    re.compile(r'(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})(\d{2})'),
+]
+CHANNEL_NUMBER_PATTERN = re.compile(r'(\d+)$')
+
+# 파일명 앞 19자가 'YYYY-MM-DD_HH-MM-SS'인 경우 벡터화 경로로 파싱
+_PREFIX_LENGTH = 19
+_PREFIX_SEPARATORS = {4: '-', 7: '-', 10: '_', 13: '-', 16: '-'}
+_ISO_SEPARATORS = {10: 'T', 13: ':', 16: ':'}
+
+DateLike = Union[date, datetime, str]
+
+
+def filename_timestamp(filename: str) -> Optional[datetime]:
+    """파일명에서 측정 시각을 추출합니다 (실패 시 None)."""
+    for pattern in TIMESTAMP_PATTERNS:
+        match = pattern.search(filename)
+        if match:
+            try:
+                return datetime(*(int(g) for g in match.groups()))
+            except ValueError:
+                continue
+    return None
+
+
+def filename_channel(filename: str) -> str:
+    """파일명에서 채널 식별자(확장자 전 마지막 세그먼트)를 추출합니다."""
+    parts = os.path.splitext(os.path.basename(filename))[0].split('_')
+    return parts[-1] if parts else '0'
+
+
+class FileCatalog:
+    """
+    파일명 목록의 파싱 결과.
+
+    인자:
+        names: 파일명 목록 (경로면 basename으로 파싱, 순서 유지).
+
+    속성:
+        names: 입력 순서의 파일명 목록.
+        timestamps: datetime64[s] 배열 (파싱 실패는 NaT).
+        channels: 채널 식별자 문자열 배열.
+        channel_numbers: 채널의 끝 숫자 (없으면 -1).
+        repetitions: 반복 번호 (세그먼트가 4개 이상이고 세 번째가 숫자일 때, 없으면 -1).
+    """
+
+    def __init__(self, names: Sequence[str]):
+        self.names: List[str] = list(names)
+        bases = [os.path.basename(name) for name in self.names]
+        self.timestamps = _parse_timestamps(bases)
+
+        n = len(bases)
+        channels = []
+        channel_numbers = np.full(n, -1, dtype=np.int64)
+        repetitions = np.full(n, -1, dtype=np.int64)
+        for row, base in enumerate(bases):
+            parts = os.path.splitext(base)[0].split('_')
+            channel = parts[-1]
+            channels.append(channel)
+            match = CHANNEL_NUMBER_PATTERN.search(channel)
+            if match:
+                channel_numbers[row] = int(match.group(1))
+            if len(parts) >= 4 and parts[2].isdigit():
+                repetitions[row] = int(parts[2])
+        self.channels = np.array(channels, dtype=str)
+        self.channel_numbers = channel_numbers
+        self.repetitions = repetitions
+
+        # 이진 탐색용 시각 정렬 순열 (NaT는 끝으로 정렬됨)
+        self._order = np.argsort(self.timestamps, kind='stable')
+        self._sorted = self.timestamps[self._order]
+        self._index: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def matches(self, names: Sequence[str]) -> bool:
+        """같은 파일명 목록(순서 포함)으로 만든 카탈로그인지 확인합니다."""
+        return len(names) == len(self.names) and list(names) == self.names
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def row(self, name: str) -> Optional[int]:
+        """파일명(또는 경로)의 행 번호. 없으면 None."""
+        if self._index is None:
+            self._index = {}
+            for row, item in enumerate(self.names):
+                self._index.setdefault(os.path.basename(item), row)
+        return self._index.get(os.path.basename(name))
+
+    def timestamp(self, name: str) -> Optional[datetime]:
+        """
+        파일의 측정 시각.
+
+        카탈로그에 없는 파일명은 정규식으로 직접 파싱합니다. 파싱할 수 없으면 None.
+        """
+        row = self.row(name)
+        if row is None:
+            return filename_timestamp(os.path.basename(name))
+        value = self.timestamps[row]
+        return None if np.isnat(value) else value.astype(datetime)
+
+    def channel(self, name: str) -> str:
+        """파일의 채널 식별자 (카탈로그에 없으면 파일명에서 추출)."""
+        row = self.row(name)
+        return filename_channel(name) if row is None else str(self.channels[row])
+
+    # ------------------------------------------------------------------
+    # 필터
+    # ------------------------------------------------------------------
+    def date_mask(self, date_from: Optional[DateLike] = None,
+                  date_to: Optional[DateLike] = None) -> np.ndarray:
+        """
+        날짜 범위(양 끝 포함) 안의 파일 마스크.
+
+        정렬된 시각 배열에서 범위 경계를 이진 탐색합니다. 시각을 파싱하지 못한
+        파일은 제외하지 않습니다.
+        """
+        mask = np.isnat(self.timestamps)
+        lo = 0
+        hi = len(self._sorted) - int(mask.sum())
+        if date_from is not None:
+            lo = int(np.searchsorted(self._sorted[:hi], _day_start(date_from), side='left'))
+        if date_to is not None:
+            end = _day_start(date_to) + np.timedelta64(1, 'D')
+            hi = int(np.searchsorted(self._sorted[:hi], end, side='left'))
+        mask[self._order[lo:max(lo, hi)]] = True
+        return mask
+
+    def channel_mask(self, channels: Optional[Iterable[Union[int, str]]]) -> np.ndarray:
+        """
+        채널 필터 마스크 (None 또는 빈 목록이면 전체).
+
+        '1'은 채널 '1'과 'CH1'에, 'CH1'은 채널 'CH1'에만 일치합니다.
+        """
+        wanted = [str(c) for c in channels] if channels is not None else []
+        if not wanted:
+            return np.ones(len(self), dtype=bool)
+        numbers = [int(c) for c in wanted if c.isdigit()]
+        return np.isin(self.channels, wanted) | np.isin(self.channel_numbers, numbers)
+
+    def select(self, date_from: Optional[DateLike] = None, date_to: Optional[DateLike] = None,
+               channels: Optional[Iterable[Union[int, str]]] = None) -> List[str]:
+        """날짜/채널 필터를 모두 만족하는 파일명 (입력 순서 유지)."""
+        mask = self.date_mask(date_from, date_to) & self.channel_mask(channels)
+        return [self.names[row] for row in np.flatnonzero(mask)]
+
+
+_shared_catalog: Optional[FileCatalog] = None
+
+
+def catalog_for(names: Sequence[str]) -> FileCatalog:
+    """
+    파일 목록의 공유 카탈로그를 반환합니다.
+
+    같은 로드 이벤트를 받은 여러 탭이 호출해도 파싱은 한 번만 수행하고,
+    목록이 바뀌면 새로 만들어 교체합니다.
+    """
+    global _shared_catalog
+    if _shared_catalog is None or not _shared_catalog.matches(names):
+        _shared_catalog = FileCatalog(names)
+    return _shared_catalog
+
+
+def lookup_timestamp(filename: str) -> Optional[datetime]:
+    """공유 카탈로그에서 파일의 측정 시각을 조회합니다 (없으면 파일명 파싱)."""
+    if _shared_catalog is not None:
+        return _shared_catalog.timestamp(filename)
+    return filename_timestamp(os.path.basename(filename))
+
+
+def _day_start(value: DateLike) -> np.datetime64:
+    if isinstance(value, datetime):
+        value = value.date()
+    elif not isinstance(value, date):
+        value = date.fromisoformat(str(value)[:10])
+    return np.datetime64(value, 's')
+
+
+def _parse_timestamps(bases: Sequence[str]) -> np.ndarray:
+    """
+    파일명들의 시각 배열.
+
+    'YYYY-MM-DD_HH-MM-SS'로 시작하는 이름은 코드 포인트 배열에서 구분자를 ISO
+    형식으로 바꿔 한 번에 변환하고, 나머지만 정규식으로 파싱합니다.
+    """
+    n = len(bases)
+    out = np.full(n, np.datetime64('NaT'), dtype='datetime64[s]')
+    if n == 0:
+        return out
+    prefix = np.array(bases, dtype=f'U{_PREFIX_LENGTH}')
+    codes = prefix.view(np.uint32).reshape(n, _PREFIX_LENGTH)
+    digit_cols = [c for c in range(_PREFIX_LENGTH) if c not in _PREFIX_SEPARATORS]
+    fast = ((codes[:, digit_cols] >= ord('0')) & (codes[:, digit_cols] <= ord('9'))).all(axis=1)
+    for col, sep in _PREFIX_SEPARATORS.items():
+        fast &= codes[:, col] == ord(sep)
+
+    if fast.any():
+        iso = codes[fast].copy()
+        for col, sep in _ISO_SEPARATORS.items():
+            iso[:, col] = ord(sep)
+        try:
+            out[fast] = iso.view(f'U{_PREFIX_LENGTH}').ravel().astype('datetime64[s]')
+        except ValueError:
+            # 달력에 없는 날짜(13월 등)가 섞여 있으면 정규식 경로에서 행별로 판정
+            fast[:] = False
+
+    for row in np.flatnonzero(~fast):
+        ts = filename_timestamp(bases[row])
+        if ts is not None:
+            out[row] = np.datetime64(ts, 's')
+    return out
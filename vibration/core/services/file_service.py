@@ -12,21 +12,28 @@ from datetime import datetime, date
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 
+from .byte_lru_cache import ByteBudgetLRUCache
 from .file_parser import FileParser
 from vibration.core.domain.models import FileMetadata
 
+# 파싱된 파일(FileParser + float64 데이터) 캐시의 기본 메모리 예산
+DEFAULT_FILE_CACHE_BUDGET = 256 * 1024 * 1024
 
 class FileService:
     """
     파일 로딩 및 관리를 위한 서비스 레이어.
 
     Qt 의존성 없이 디렉토리 스캔, 파일 파싱, 감도 관리 기능을 제공합니다.
+
+    인자:
+        cache_budget: 파싱된 파일 캐시의 최대 바이트 수 (LRU 제거).
     """
     
-    def __init__(self):
+    def __init__(self, cache_budget: int = DEFAULT_FILE_CACHE_BUDGET):
         self._sensitivity_map: Dict[str, float] = {}
         self._b_sensitivity_map: Dict[str, float] = {}
-        self._file_cache: Dict[str, FileParser] = {}
+        # 값: ((크기, 수정 시각 ns), FileParser) - 파일이 바뀌면 다시 파싱
+        self._file_cache = ByteBudgetLRUCache(cache_budget, name="file_cache")
     
     def scan_directory(
         self,
@@ -162,14 +169,26 @@ class FileService:
         """
         FileParser를 사용하여 파일 데이터를 로드합니다.
 
+        같은 크기/수정 시각의 파일은 캐시된 파서를 재사용합니다.
+
         인자:
             filepath: 파일 경로.
 
         반환:
             data, sampling_rate, metadata, validity를 포함하는 딕셔너리.
         """
-        parser = FileParser(filepath)
-        self._file_cache[filepath] = parser
+        try:
+            st = os.stat(filepath)
+            identity = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            identity = None
+        
+        cached = self._file_cache.get(filepath)
+        if cached is not None and identity is not None and cached[0] == identity:
+            parser = cached[1]
+        else:
+            parser = FileParser(filepath)
+            self._file_cache.put(filepath, (identity, parser))
         
         return {
             'data': parser.get_data(),
@@ -250,6 +269,10 @@ class FileService:
         """캐시된 모든 파일 파서를 초기화합니다."""
         self._file_cache.clear()
     
+    def get_cache_stats(self) -> Dict[str, int]:
+        """파일 캐시의 적중/미스/제거 횟수와 사용량을 반환합니다."""
+        return self._file_cache.stats()
+    
     def _extract_metadata(self, file_path: Path) -> FileMetadata:
         """파일 경로와 내용에서 메타데이터를 추출합니다."""
         stat = file_path.stat()
@@ -0,0 +1,189 @@
+"""
+컬럼형 파일 그룹 테이블.
+
+데이터 조회 탭의 그룹(같은 날짜/시각의 녹음 파일 묶음)을 컬럼별 NumPy 배열로
+보관합니다. 정렬은 컬럼 키의 argsort, 필터는 날짜/채널/샘플링 레이트/이상 상태
+불리언 마스크로 계산하므로 1년치 그룹(수만~수십만 행)도 Python 루프 없이
+처리합니다. 행 제거는 keep 마스크 하나로 모든 컬럼을 잘라냅니다.
+
+Qt 의존성 없음 - 순수 Python/NumPy 구현.
+"""
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+COLUMNS = ('date', 'time', 'count', 'channel', 'sampling_rate', 'sensitivity',
+           'files', 'file_paths', 'is_anomaly', 'anomaly_type')
+
+# 상태 정렬 순서: OK < warning < error
+_STATUS_RANK = {'warning': 1, 'error': 2}
+
+
+class FileTable:
+    """
+    파일 그룹의 컬럼형 테이블.
+
+    인자:
+        columns: COLUMNS 이름 -> 행 수가 같은 1차원 배열.
+            files/file_paths는 행마다 파일 목록을 담은 object 배열입니다.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self._columns = columns
+
+    @classmethod
+    def from_records(cls, records: Sequence[Dict[str, Any]]) -> 'FileTable':
+        """프레젠터의 그룹 딕셔너리 목록으로 테이블을 만듭니다."""
+        def strings(key: str) -> np.ndarray:
+            return np.array([str(r.get(key, '') or '') for r in records], dtype=str)
+
+        def lists(key: str) -> np.ndarray:
+            # fromiter는 목록을 시퀀스로 풀지 않고 원소 하나로 저장 (목록은 복사하지 않고 공유)
+            return np.fromiter(
+                (v if isinstance(v, list) else list(v) if isinstance(v, tuple) else [str(v)]
+                 for v in (r.get(key, []) for r in records)),
+                dtype=object, count=len(records)
+            )
+
+        anomaly = np.array([bool(r.get('is_anomaly', False)) for r in records], dtype=bool)
+        columns = {
+            'date': strings('date'),
+            'time': strings('time'),
+            'count': np.array([int(r.get('count', 0) or 0) for r in records], dtype=np.int64),
+            'channel': strings('channel'),
+            'sampling_rate': np.array([float(r.get('sampling_rate', 0.0) or 0.0) for r in records],
+                                      dtype=np.float64),
+            'sensitivity': strings('sensitivity'),
+            'files': lists('files'),
+            'file_paths': lists('file_paths'),
+            'is_anomaly': anomaly,
+            'anomaly_type': np.where(anomaly, strings('anomaly_type'), ''),
+        }
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(self._columns['date'])
+
+    def column(self, name: str) -> np.ndarray:
+        return self._columns[name]
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """행 하나를 프레젠터 형식 딕셔너리로 반환합니다."""
+        record = {name: self._columns[name][row] for name in COLUMNS}
+        for name in ('date', 'time', 'channel', 'sensitivity', 'anomaly_type'):
+            record[name] = str(record[name])
+        record['count'] = int(record['count'])
+        record['sampling_rate'] = float(record['sampling_rate'])
+        record['is_anomaly'] = bool(record['is_anomaly'])
+        record['files'] = list(record['files'])
+        record['file_paths'] = list(record['file_paths'])
+        return record
+
+    def records(self) -> List[Dict[str, Any]]:
+        return [self.record(row) for row in range(len(self))]
+
+    def take(self, rows: np.ndarray) -> 'FileTable':
+        """행 인덱스 또는 불리언 마스크로 새 테이블을 만듭니다."""
+        return FileTable({name: array[rows] for name, array in self._columns.items()})
+
+    def files_of(self, rows: Iterable[int]) -> List[str]:
+        """행들의 파일명을 행 순서대로 이어 붙입니다."""
+        files = self._columns['files']
+        return [name for row in rows for name in files[row]]
+
+    # ------------------------------------------------------------------
+    # 정렬 / 필터
+    # ------------------------------------------------------------------
+    def sort_order(self, key: str, rows: Optional[np.ndarray] = None,
+                   descending: bool = False) -> np.ndarray:
+        """
+        rows를 key 컬럼 기준으로 정렬하는 순열을 반환합니다 (안정 정렬).
+
+        인자:
+            key: 컬럼 이름 또는 'status' (OK < warning < error).
+                'date'는 날짜, 시각 순, 'files'는 첫 파일명 기준입니다.
+            rows: 정렬할 행 인덱스 (기본 전체).
+            descending: 내림차순 여부.
+
+        반환:
+            rows 내 위치의 순열 (rows[order]가 정렬 결과).
+        """
+        if rows is None:
+            rows = np.arange(len(self))
+        if descending:
+            # 뒤집은 행을 오름차순 안정 정렬 후 다시 뒤집어 같은 값끼리의 원래 순서 유지
+            rows = rows[::-1]
+        if key == 'date':
+            order = np.lexsort((self._columns['time'][rows], self._columns['date'][rows]))
+        else:
+            order = np.argsort(self._sort_key(key)[rows], kind='stable')
+        if descending:
+            order = len(rows) - 1 - order[::-1]
+        return order
+
+    def _sort_key(self, key: str) -> np.ndarray:
+        if key == 'status':
+            types = self._columns['anomaly_type']
+            rank = np.zeros(len(self), dtype=np.int8)
+            for name, value in _STATUS_RANK.items():
+                rank[types == name] = value
+            rank[self._columns['is_anomaly'] & (rank == 0)] = 1
+            return rank
+        if key == 'files':
+            return np.array([files[0] if files else '' for files in self._columns['files']], dtype=str)
+        return self._columns[key]
+
+    def mask(self, date_from: Union[date, str, None] = None, date_to: Union[date, str, None] = None,
+             channels: Optional[Iterable[str]] = None,
+             sampling_rates: Optional[Iterable[float]] = None,
+             anomaly: Optional[bool] = None) -> np.ndarray:
+        """
+        필터 조건을 만족하는 행의 불리언 마스크.
+
+        인자:
+            date_from, date_to: 날짜 범위 (포함, 'YYYY-MM-DD' 또는 date).
+            channels: 하나라도 포함하는 그룹만 (None이면 전체).
+            sampling_rates: 해당 샘플링 레이트만.
+            anomaly: True면 이상 그룹만, False면 정상 그룹만.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        dates = self._columns['date']
+        if date_from is not None:
+            mask &= dates >= str(date_from)
+        if date_to is not None:
+            mask &= dates <= str(date_to)
+        if channels is not None:
+            wanted = set(channels)
+            # 채널 표시 문자열("CH1, CH2")의 고유값마다 한 번만 판정
+            unique, inverse = np.unique(self._columns['channel'], return_inverse=True)
+            match = np.array([bool(wanted & set(_split_channels(value))) for value in unique],
+                             dtype=bool)
+            if len(unique):
+                mask &= match[inverse]
+        if sampling_rates is not None:
+            mask &= np.isin(self._columns['sampling_rate'], list(sampling_rates))
+        if anomaly is not None:
+            mask &= self._columns['is_anomaly'] == anomaly
+        return mask
+
+    def channel_names(self) -> List[str]:
+        """그룹들에 나타나는 개별 채널 이름 (정렬)."""
+        names = set()
+        for value in np.unique(self._columns['channel']):
+            names.update(_split_channels(value))
+        return sorted(names)
+
+    def date_range(self) -> Optional[tuple]:
+        """(첫 날짜, 마지막 날짜) 문자열. 행이 없으면 None."""
+        dates = np.unique(self._columns['date'])
+        return (str(dates[0]), str(dates[-1])) if len(dates) else None
+
+    def sampling_rates(self) -> List[float]:
+        """0이 아닌 고유 샘플링 레이트 (오름차순)."""
+        rates = np.unique(self._columns['sampling_rate'])
+        return [float(rate) for rate in rates if rate > 0]
+
+
+def _split_channels(value: str) -> List[str]:
+    return [part.strip() for part in str(value).split(',') if part.strip()]
@@ -5,15 +5,16 @@ PeakParallelProcessor를 래핑하여 배치 피크 트렌드 연산을 수행
 Qt 의존성 없음 - 순수 Python/NumPy 구현.
 """
 
-import re
 import sys
 from datetime import datetime
-from pathlib import Path
 from typing import List, Optional, Tuple, Callable, Literal
 
 import numpy as np
 
 from .OPTIMIZATION_PATCH_LEVEL5_TREND import PeakParallelProcessor
+from .analysis_result_store import AnalysisResultStore
+from .file_catalog import filename_channel, lookup_timestamp
+from .trend_result_cache import TrendResultCache
 from vibration.core.domain.models import TrendResult
 
 
@@ -35,17 +36,38 @@ class PeakService:
 
     인자:
         max_workers: 병렬 워커 수 (기본값: CPU 코어 수 - 1).
+        io_pipeline: 리더 스레드 → 연산 프로세스 파이프라인 사용 여부 (느린 저장소용).
+        queue_depth: 파이프라인 읽기 버퍼 수 (기본값: max_workers * 2).
+        result_store: Trend/Peak 공용 결과 저장소 (같은 파일/파라미터 재계산 방지).
+        result_cache: 파일 단위 영구 결과 캐시 (미스 파일만 계산).
     """
     
-    def __init__(self, max_workers: int = None):
+    def __init__(
+        self,
+        max_workers: int = None,
+        io_pipeline: bool = False,
+        queue_depth: Optional[int] = None,
+        result_store: Optional[AnalysisResultStore] = None,
+        result_cache: Optional[TrendResultCache] = None
+    ):
         """
         피크 서비스를 초기화합니다.
 
         인자:
             max_workers: 병렬 워커 수.
+            io_pipeline: 2단계 I/O 파이프라인 사용 여부.
+            queue_depth: 파이프라인 읽기 버퍼 수.
+            result_store: 공용 결과 저장소.
+            result_cache: 파일 단위 영구 결과 캐시.
         """
         self.max_workers = max_workers
-        self._processor = PeakParallelProcessor(max_workers=max_workers)
+        self._processor = PeakParallelProcessor(
+            max_workers=max_workers,
+            io_pipeline=io_pipeline,
+            queue_depth=queue_depth
+        )
+        self.result_store = result_store
+        self.result_cache = result_cache
     
     def compute_peak_trend(
         self,
@@ -84,19 +106,58 @@ class PeakService:
         band_min, band_max = frequency_band if frequency_band else (0.0, 5000.0)
         view_type_int = VIEW_TYPE_MAP.get(view_type.upper(), 1)
         
-        raw_results = self._processor.process_batch(
-            file_paths=file_paths,
-            delta_f=delta_f,
-            overlap=overlap,
-            window_type=window_type.lower(),
-            view_type=view_type_int,
-            band_min=band_min,
-            band_max=band_max,
-            progress_callback=progress_callback
+        raw_results = self._process_batch(
+            file_paths, delta_f, overlap, window_type.lower(),
+            view_type_int, band_min, band_max, progress_callback
         )
         
         return self._aggregate_results(raw_results, view_type.upper(), frequency_band)
     
+    def _process_batch(
+        self,
+        file_paths: List[str],
+        delta_f: float,
+        overlap: float,
+        window_type: str,
+        view_type: int,
+        band_min: float,
+        band_max: float,
+        progress_callback: Optional[Callable[[int, int], None]]
+    ) -> List:
+        """공용 저장소 → 파일 단위 캐시 순으로 재사용하고, 나머지만 계산합니다."""
+        key = None
+        if self.result_store is not None:
+            key = self.result_store.make_key(
+                file_paths, delta_f, overlap, window_type,
+                view_type, band_min, band_max
+            )
+            cached = self.result_store.get(key)
+            if cached is not None:
+                if progress_callback:
+                    progress_callback(len(cached), len(cached))
+                return cached
+
+        if self.result_cache is not None:
+            raw_results = self.result_cache.process_batch(
+                self._processor, file_paths, delta_f, overlap, window_type,
+                view_type, band_min, band_max, progress_callback
+            )
+        else:
+            raw_results = self._processor.process_batch(
+                file_paths=file_paths,
+                delta_f=delta_f,
+                overlap=overlap,
+                window_type=window_type,
+                view_type=view_type,
+                band_min=band_min,
+                band_max=band_max,
+                progress_callback=progress_callback
+            )
+
+        if key is not None:
+            self.result_store.put(key, raw_results)
+        return raw_results
+    
     def find_peaks(
         self,
         frequencies: np.ndarray,
@@ -199,42 +260,29 @@ class PeakService:
     
     def _extract_timestamp(self, filename: str) -> datetime:
         """
-        파일명에서 타임스탬프를 추출합니다.
+        파일명의 측정 시각을 반환합니다.
 
-        패턴: YYYYMMDD_HHMMSS 또는 유사 형식.
-        파싱 실패 시 현재 시간으로 대체합니다.
+        로드 시 만든 공유 파일 카탈로그를 먼저 조회하고, 카탈로그에 없는 파일만
+        파일명을 파싱합니다. 파싱 실패 시 현재 시간으로 대체합니다.
         """
-        patterns = [
-            r'(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})',
-            r'(\d{4})-(\d{2})-(\d{2})_(\d{2})-(\d{2})-(\d{2})',
-            r'(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})(\d{2})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, filename)
-            if match:
-                try:
-                    groups = match.groups()
-                    return datetime(
-                        int(groups[0]), int(groups[1]), int(groups[2]),
-                        int(groups[3]), int(groups[4]), int(groups[5])
-                    )
-                except (ValueError, IndexError):
-                    continue
-        
-        return datetime.now()
+        timestamp = lookup_timestamp(filename)
+        return timestamp if timestamp is not None else datetime.now()
     
     def _extract_channel(self, filename: str) -> str:
         """파일명에서 채널 식별자를 추출합니다 (일반적으로 확장자 전 마지막 세그먼트)."""
-        base = Path(filename).stem
-        parts = base.split('_')
-        return parts[-1] if parts else '0'
+        return filename_channel(filename)
     
     def get_parameters(self) -> dict:
         """현재 프로세서 파라미터를 반환합니다."""
         return {
-            'max_workers': self._processor.processor.max_workers
+            'max_workers': self._processor.processor.max_workers,
+            'io_pipeline': self._processor.processor.io_pipeline,
+            'queue_depth': self._processor.processor.queue_depth
         }
+    
+    def get_stage_timings(self) -> dict:
+        """마지막 파이프라인 배치의 단계별 소요 시간/처리량을 반환합니다."""
+        return dict(self._processor.last_stats)
 
 
 if __name__ == "__main__":
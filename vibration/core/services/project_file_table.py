@@ -0,0 +1,239 @@
+"""
+프로젝트 파일 목록의 컬럼형 테이블.
+
+프로젝트에 포함된 파일 정보(ProjectFileInfo)를 파일마다 JSON 객체로 쓰지 않고,
+컬럼별 .npy 파일로 프로젝트 폴더 안에 저장합니다. 날짜/시각/채널/감도처럼 값이
+반복되는 문자열 컬럼은 고유값 목록 + int32 코드로, 상대 경로는 UTF-8 바이트
+하나와 오프셋 배열로 저장합니다. open()은 컬럼을 memmap으로 열기만 하므로 파일
+수와 무관하게 즉시 반환되고, 행/경로는 접근할 때 디코딩합니다.
+
+레이아웃:
+    index.json                 버전, 행 수, 문자열 컬럼의 고유값 목록
+    relative_path.bin          상대 경로 UTF-8 (경로마다 '\\n'으로 끝남)
+    relative_path_offsets.npy  경로 시작 오프셋 (int64, n_rows + 1)
+    date.npy, time.npy, channel.npy, sensitivity.npy   고유값 코드 (int32)
+    sampling_rate.npy (float64), is_anomaly.npy (bool)
+
+index.json은 모든 컬럼을 기록한 뒤 마지막에 교체하므로, 기록 도중 중단된
+테이블은 열리지 않습니다.
+
+Qt 의존성 없음 - 순수 Python/NumPy 구현.
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from vibration.core.domain.models import ProjectFileInfo
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = 'index.json'
+FORMAT_VERSION = 1
+
+CATEGORY_COLUMNS = ('date', 'time', 'channel', 'sensitivity')
+_PATH_BLOB = 'relative_path.bin'
+_PATH_OFFSETS = 'relative_path_offsets.npy'
+
+# 반복 접근 시 한 번에 디코딩하는 행 수
+ITER_CHUNK_ROWS = 65536
+
+
+class ProjectFileTable:
+    """
+    프로젝트 파일 정보의 컬럼형 테이블 (ProjectFileInfo 시퀀스처럼 사용).
+
+    from_columns()/from_infos()로 메모리에 만들고 save()로 기록하며,
+    open()은 저장된 테이블을 읽기 전용 memmap으로 엽니다.
+
+    인자:
+        categories: 문자열 컬럼 이름 -> 고유값 목록.
+        columns: 컬럼 이름 -> 배열 (문자열 컬럼은 categories 코드).
+        path_blob: 상대 경로 UTF-8 바이트 (uint8 배열).
+        path_offsets: 경로 시작 오프셋 (n_rows + 1).
+    """
+
+    def __init__(self, categories: Dict[str, List[str]], columns: Dict[str, np.ndarray],
+                 path_blob: np.ndarray, path_offsets: np.ndarray):
+        self._categories = categories
+        self._columns = columns
+        self._path_blob = path_blob
+        self._path_offsets = path_offsets
+
+    # ------------------------------------------------------------------
+    # 생성 / 열기 / 저장
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_columns(cls, relative_paths: Sequence[str], dates: Sequence[str],
+                     times: Sequence[str], channels: Sequence[str],
+                     sampling_rates: Sequence[float], sensitivities: Sequence[str],
+                     is_anomaly: Sequence[bool]) -> 'ProjectFileTable':
+        """컬럼별 값 목록(길이 동일)으로 테이블을 만듭니다."""
+        categories: Dict[str, List[str]] = {}
+        columns: Dict[str, np.ndarray] = {}
+        for name, values in zip(CATEGORY_COLUMNS, (dates, times, channels, sensitivities)):
+            categories[name], columns[name] = _encode(values)
+        columns['sampling_rate'] = np.asarray(sampling_rates, dtype=np.float64)
+        columns['is_anomaly'] = np.asarray(is_anomaly, dtype=bool)
+
+        encoded = [path.encode('utf-8') + b'\n' for path in relative_paths]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(item) for item in encoded], out=offsets[1:])
+        blob = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        return cls(categories, columns, blob, offsets)
+
+    @classmethod
+    def from_infos(cls, infos: Iterable[ProjectFileInfo]) -> 'ProjectFileTable':
+        """ProjectFileInfo 목록(기존 JSON 프로젝트)으로 테이블을 만듭니다."""
+        infos = list(infos)
+        return cls.from_columns(
+            [fi.relative_path for fi in infos], [fi.date for fi in infos],
+            [fi.time for fi in infos], [fi.channel for fi in infos],
+            [float(fi.sampling_rate or 0.0) for fi in infos],
+            [fi.sensitivity for fi in infos], [bool(fi.is_anomaly) for fi in infos]
+        )
+
+    @classmethod
+    def open(cls, directory: Union[str, Path]) -> Optional['ProjectFileTable']:
+        """
+        저장된 테이블을 memmap으로 엽니다.
+
+        반환:
+            ProjectFileTable 또는 인덱스가 없거나 형식이 다르면 None.
+        """
+        path = Path(directory)
+        try:
+            with open(path / INDEX_FILE, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if index.get('version') != FORMAT_VERSION or index.get('kind') != 'project_files':
+            return None
+        try:
+            columns = {name: np.load(path / f"{name}.npy", mmap_mode='r', allow_pickle=False)
+                       for name in CATEGORY_COLUMNS + ('sampling_rate', 'is_anomaly')}
+            offsets = np.load(path / _PATH_OFFSETS, mmap_mode='r', allow_pickle=False)
+            blob = (np.memmap(path / _PATH_BLOB, dtype=np.uint8, mode='r')
+                    if offsets[-1] > 0 else np.empty(0, dtype=np.uint8))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Incomplete project file table in {path}: {e}")
+            return None
+        n_rows = int(index.get('rows', -1))
+        if len(offsets) != n_rows + 1 or any(len(c) != n_rows for c in columns.values()):
+            logger.warning(f"Project file table in {path} does not match its index")
+            return None
+        return cls(index.get('categories', {}), columns, blob, offsets)
+
+    def save(self, directory: Union[str, Path]) -> Path:
+        """
+        테이블을 폴더에 기록합니다 (index.json은 마지막에 원자적으로 교체).
+
+        반환:
+            테이블 폴더 경로.
+        """
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        for name, array in self._columns.items():
+            np.save(path / f"{name}.npy", np.ascontiguousarray(array), allow_pickle=False)
+        np.save(path / _PATH_OFFSETS, np.ascontiguousarray(self._path_offsets), allow_pickle=False)
+        with open(path / _PATH_BLOB, 'wb') as f:
+            f.write(memoryview(np.ascontiguousarray(self._path_blob)))
+
+        index = {
+            'version': FORMAT_VERSION,
+            'kind': 'project_files',
+            'rows': len(self),
+            'categories': self._categories,
+        }
+        tmp = path / (INDEX_FILE + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False)
+        os.replace(tmp, path / INDEX_FILE)
+        return path
+
+    # ------------------------------------------------------------------
+    # 시퀀스 접근
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._path_offsets) - 1
+
+    def __getitem__(self, row: int) -> ProjectFileInfo:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        return self._info(row, self.relative_path(row))
+
+    def __iter__(self) -> Iterator[ProjectFileInfo]:
+        for start in range(0, len(self), ITER_CHUNK_ROWS):
+            stop = min(len(self), start + ITER_CHUNK_ROWS)
+            for row, path in zip(range(start, stop), self.relative_paths(start, stop)):
+                yield self._info(row, path)
+
+    def _info(self, row: int, relative_path: str) -> ProjectFileInfo:
+        return ProjectFileInfo(
+            relative_path=relative_path,
+            date=self.value('date', row),
+            time=self.value('time', row),
+            channel=self.value('channel', row),
+            sampling_rate=float(self._columns['sampling_rate'][row]),
+            sensitivity=self.value('sensitivity', row),
+            is_anomaly=bool(self._columns['is_anomaly'][row]),
+        )
+
+    def value(self, name: str, row: int) -> str:
+        """문자열 컬럼의 행 값."""
+        return self._categories[name][int(self._columns[name][row])]
+
+    def column(self, name: str) -> np.ndarray:
+        """컬럼 배열 (문자열 컬럼은 categories() 코드)."""
+        return self._columns[name]
+
+    def categories(self, name: str) -> List[str]:
+        """문자열 컬럼의 고유값 목록 (오름차순, 코드 순서)."""
+        return list(self._categories[name])
+
+    def relative_path(self, row: int) -> str:
+        start, stop = self._path_offsets[row], self._path_offsets[row + 1]
+        return self._path_blob[start:stop - 1].tobytes().decode('utf-8')
+
+    def relative_paths(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """start:stop 행의 상대 경로 (구간 바이트를 한 번에 디코딩)."""
+        stop = len(self) if stop is None else stop
+        if stop <= start:
+            return []
+        lo, hi = self._path_offsets[start], self._path_offsets[stop]
+        return self._path_blob[lo:hi - 1].tobytes().decode('utf-8').split('\n')
+
+    def groups(self) -> Iterator[Tuple[str, str, np.ndarray]]:
+        """
+        (날짜, 시각) 그룹을 시간순으로 반환합니다.
+
+        반환:
+            (date, time, 행 인덱스) 반복자. 그룹 안의 행은 저장 순서를 유지합니다.
+        """
+        if not len(self):
+            return
+        dates = np.asarray(self._columns['date'], dtype=np.int64)
+        times = np.asarray(self._columns['time'], dtype=np.int64)
+        # 고유값 목록이 정렬되어 있으므로 코드 순서 = 문자열 순서
+        key = dates * max(1, len(self._categories['time'])) + times
+        order = np.argsort(key, kind='stable')
+        sorted_key = key[order]
+        bounds = np.concatenate(([0], np.flatnonzero(np.diff(sorted_key)) + 1, [len(order)]))
+        date_values, time_values = self._categories['date'], self._categories['time']
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            first = order[lo]
+            yield date_values[dates[first]], time_values[times[first]], order[lo:hi]
+
+
+def _encode(values: Sequence[Any]) -> Tuple[List[str], np.ndarray]:
+    """문자열 값 목록을 (정렬된 고유값, int32 코드)로 바꿉니다."""
+    strings = np.asarray([str(v or '') for v in values], dtype=str)
+    if not len(strings):
+        return [], np.empty(0, dtype=np.int32)
+    unique, codes = np.unique(strings, return_inverse=True)
+    return unique.tolist(), codes.astype(np.int32)
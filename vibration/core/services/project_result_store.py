@@ -0,0 +1,266 @@
+"""
+프로젝트 결과 저장소.
+
+프로젝트 폴더의 results/trend, results/peak, results/spectrum 아래에 계산 결과를
+컬럼별 .npy 파일과 index.json으로 저장합니다. 프로젝트를 다시 열 때 원본 데이터
+파일을 읽지 않고 플롯을 복원하며, 큰 스펙트럼 행렬은 memmap으로 열어 6개월치
+프로젝트도 수 초 안에 로드됩니다.
+
+레이아웃:
+    results/trend/index.json, file_name.npy, timestamp.npy, channel.npy, value.npy, ...
+    results/spectrum/index.json, frequency.npy, spectra.npy, file_name.npy, ... (SpectraStore)
+
+index.json은 모든 컬럼을 기록한 뒤 마지막에 교체하므로, 저장 도중 중단되면
+해당 종류의 결과는 없는 것으로 취급됩니다.
+
+Qt 의존성 없음 - 순수 Python/NumPy 구현.
+"""
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import numpy as np
+
+from vibration.core.domain.models import TrendResult
+
+if TYPE_CHECKING:
+    from .spectra_store import SpectraStore
+
+logger = logging.getLogger(__name__)
+
+# 결과 종류 -> 프로젝트 폴더 기준 하위 디렉토리 (ProjectService.RESULT_SUBDIRS와 동일)
+RESULT_DIRS = {
+    'spectrum': 'results/spectrum',
+    'trend': 'results/trend',
+    'peak': 'results/peak',
+}
+INDEX_FILE = 'index.json'
+FORMAT_VERSION = 1
+
+
+def _to_jsonable(value: Any) -> Any:
+    """index.json에 기록할 수 있도록 튜플/NumPy 스칼라를 변환합니다."""
+    if isinstance(value, dict):
+        return {str(k): _to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _from_jsonable(value: Any) -> Any:
+    """JSON 리스트를 튜플로 되돌립니다 (프레젠터 캐시 파라미터 비교용)."""
+    if isinstance(value, dict):
+        return {k: _from_jsonable(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return tuple(_from_jsonable(v) for v in value)
+    return value
+
+
+class ProjectResultStore:
+    """
+    프로젝트 폴더에 Trend/Peak/Waterfall 결과를 저장하고 복원합니다.
+
+    인자:
+        project_dir: project.json이 있는 프로젝트 폴더.
+    """
+
+    def __init__(self, project_dir: str):
+        self.project_dir = Path(project_dir)
+
+    @classmethod
+    def for_project_file(cls, json_path: str) -> 'ProjectResultStore':
+        """project.json 경로로부터 저장소를 생성합니다."""
+        return cls(str(Path(json_path).parent))
+
+    def result_dir(self, kind: str) -> Path:
+        """결과 종류의 저장 디렉토리를 반환합니다."""
+        if kind not in RESULT_DIRS:
+            raise ValueError(f"Unknown result kind: {kind}")
+        return self.project_dir / RESULT_DIRS[kind]
+
+    def has_result(self, kind: str) -> bool:
+        """저장된 결과가 있는지 확인합니다."""
+        return (self.result_dir(kind) / INDEX_FILE).is_file()
+
+    def read_index(self, kind: str) -> Optional[Dict[str, Any]]:
+        """index.json을 읽습니다 (없거나 손상되면 None)."""
+        try:
+            with open(self.result_dir(kind) / INDEX_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def clear(self, kind: str) -> None:
+        """저장된 결과를 삭제합니다."""
+        directory = self.result_dir(kind)
+        index = self.read_index(kind)
+        self._remove_index(directory)
+        for name in (index or {}).get('columns', []):
+            try:
+                (directory / f"{name}.npy").unlink()
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Trend / Peak
+    # ------------------------------------------------------------------
+    def save_trend(self, kind: str, result: TrendResult,
+                   params: Optional[Dict[str, Any]] = None) -> None:
+        """
+        TrendService/PeakService 결과를 저장합니다.
+
+        인자:
+            kind: 'trend' 또는 'peak'.
+            result: 서비스가 반환한 TrendResult.
+            params: 프레젠터 캐시 파라미터 (복원 시 그대로 반환).
+        """
+        channel_of: Dict[str, str] = {}
+        for channel, data in (result.channel_data or {}).items():
+            for label in data.get('labels', []):
+                channel_of[label] = channel
+
+        columns = {
+            'file_name': np.array(result.filenames, dtype=str),
+            'timestamp': np.array(
+                [ts if isinstance(ts, datetime) else datetime.min for ts in result.timestamps],
+                dtype='datetime64[us]'
+            ),
+            'channel': np.array([channel_of.get(n, '') for n in result.filenames], dtype=str),
+            'value': np.asarray(result.rms_values, dtype=np.float64),
+        }
+        if result.peak_values is not None:
+            columns['peak'] = np.asarray(result.peak_values, dtype=np.float64)
+        if result.peak_frequencies is not None:
+            columns['peak_freq'] = np.asarray(result.peak_frequencies, dtype=np.float64)
+
+        self._write(kind, columns, {
+            'view_type': result.view_type,
+            'frequency_band': result.frequency_band,
+            'sampling_rate': result.sampling_rate,
+            'metadata': result.metadata or {},
+            'params': params or {},
+        })
+
+    def load_trend(self, kind: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 Trend/Peak 결과를 복원합니다.
+
+        반환:
+            {'result': TrendResult, 'params': dict} 또는 저장된 결과가 없으면 None.
+        """
+        loaded = self._read(kind)
+        if loaded is None:
+            return None
+        index, columns = loaded
+
+        filenames = columns['file_name'].tolist()
+        timestamps = columns['timestamp'].astype(object).tolist()
+        values = np.array(columns['value'])
+
+        channel_data: Dict[str, Dict[str, List]] = {}
+        for name, ts, channel, value in zip(filenames, timestamps,
+                                            columns['channel'].tolist(), values.tolist()):
+            data = channel_data.setdefault(channel, {'x': [], 'y': [], 'labels': []})
+            data['x'].append(ts)
+            data['y'].append(value)
+            data['labels'].append(name)
+
+        band = index.get('frequency_band')
+        result = TrendResult(
+            timestamps=timestamps,
+            rms_values=values,
+            filenames=filenames,
+            view_type=index.get('view_type', 'ACC'),
+            frequency_band=tuple(band) if band else None,
+            channel_data=channel_data,
+            peak_values=np.array(columns['peak']) if 'peak' in columns else None,
+            peak_frequencies=np.array(columns['peak_freq']) if 'peak_freq' in columns else None,
+            sampling_rate=index.get('sampling_rate', 0.0),
+            metadata=dict(index.get('metadata', {}), restored_from=str(self.result_dir(kind))),
+        )
+        return {'result': result, 'params': _from_jsonable(index.get('params', {}))}
+
+    # ------------------------------------------------------------------
+    # Waterfall spectra
+    # ------------------------------------------------------------------
+    def save_spectra(self, store: 'SpectraStore',
+                     params: Optional[Dict[str, Any]] = None) -> 'SpectraStore':
+        """
+        워터폴 스펙트럼 저장소를 results/spectrum에 저장합니다.
+
+        저장소의 memmap 행렬을 청크 단위로 복사하므로 파일 수와 관계없이
+        메모리 사용량이 일정합니다. 형식은 spectra_store 모듈 참고.
+
+        인자:
+            store: 저장할 SpectraStore.
+            params: 프레젠터 캐시 파라미터.
+
+        반환:
+            프로젝트 폴더의 SpectraStore.
+        """
+        return store.save_as(str(self.result_dir('spectrum')), params)
+
+    def load_spectra(self) -> Optional['SpectraStore']:
+        """
+        저장된 워터폴 스펙트럼 저장소를 읽기 전용 memmap으로 엽니다.
+
+        반환:
+            SpectraStore 또는 저장된 결과가 없으면 None.
+        """
+        from .spectra_store import SpectraStore
+        return SpectraStore.open(str(self.result_dir('spectrum')))
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def _write(self, kind: str, columns: Dict[str, np.ndarray],
+               fields: Dict[str, Any]) -> None:
+        directory = self.result_dir(kind)
+        directory.mkdir(parents=True, exist_ok=True)
+        self._remove_index(directory)
+
+        for name, array in columns.items():
+            np.save(directory / f"{name}.npy", array, allow_pickle=False)
+
+        index = {
+            'version': FORMAT_VERSION,
+            'kind': kind,
+            'saved_at': datetime.now().isoformat(timespec='seconds'),
+            'rows': int(len(columns['file_name'])),
+            'columns': list(columns),
+        }
+        index.update(_to_jsonable(fields))
+
+        tmp_path = directory / (INDEX_FILE + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, directory / INDEX_FILE)
+        logger.info(f"Saved {index['rows']} {kind} results to {directory}")
+
+    def _read(self, kind: str, mmap_mode: Optional[str] = None):
+        index = self.read_index(kind)
+        if index is None or index.get('version') != FORMAT_VERSION:
+            return None
+
+        directory = self.result_dir(kind)
+        columns = {}
+        try:
+            for name in index.get('columns', []):
+                columns[name] = np.load(directory / f"{name}.npy",
+                                        mmap_mode=mmap_mode, allow_pickle=False)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Incomplete {kind} results in {directory}: {e}")
+            return None
+        return index, columns
+
+    @staticmethod
+    def _remove_index(directory: Path) -> None:
+        try:
+            (directory / INDEX_FILE).unlink()
+        except OSError:
+            pass
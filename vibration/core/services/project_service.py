@@ -1,7 +1,14 @@
 """
 프로젝트 저장 및 로드 서비스.
 
-프로젝트 데이터를 JSON 형식으로 저장하고 로드합니다.
+프로젝트 데이터를 project.json(메타데이터)과 컬럼형 파일 테이블로 저장하고
+로드합니다.
+
+형식 버전:
+    1  project.json의 'files'에 파일마다 JSON 객체 (읽기만 지원)
+    2  파일 목록은 프로젝트 폴더의 files/ 컬럼형 테이블 (ProjectFileTable),
+       project.json에는 'format_version'과 'file_table' 폴더 이름만 기록
+
 Qt 의존성 없음 - 순수 Python 구현.
 """
 
@@ -11,7 +18,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
-from vibration.core.domain.models import ProjectData, ProjectFileInfo
+from vibration.core.domain.models import ProjectData
+from vibration.core.services.project_file_table import ProjectFileTable
+
+PROJECT_FORMAT_VERSION = 2
+FILE_TABLE_DIR = 'files'
 
 
 class ProjectService:
@@ -29,7 +40,7 @@ class ProjectService:
         save_location: str,
     ) -> str:
         """
-        프로젝트를 JSON 파일로 저장하고 프로젝트 폴더를 생성합니다.
+        프로젝트 폴더를 만들고 파일 테이블과 project.json을 저장합니다.
 
         인자:
             project_data: 저장할 프로젝트 데이터.
@@ -48,26 +59,52 @@ class ProjectService:
         for subdir in self.RESULT_SUBDIRS:
             (project_dir / subdir).mkdir(parents=True, exist_ok=True)
 
+        files = project_data.files
+        if not isinstance(files, ProjectFileTable):
+            files = ProjectFileTable.from_infos(files)
+        files.save(project_dir / FILE_TABLE_DIR)
+
+        data = project_data.to_dict(include_files=False)
+        data['format_version'] = PROJECT_FORMAT_VERSION
+        data['file_table'] = FILE_TABLE_DIR
+        # 파일 테이블을 모두 기록한 뒤 project.json을 씀
         json_path = project_dir / 'project.json'
         with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(project_data.to_dict(), f, ensure_ascii=False, indent=2)
+            json.dump(data, f, ensure_ascii=False, indent=2)
 
         return str(json_path)
 
     def load_project(self, json_path: str) -> Optional[ProjectData]:
         """
-        JSON 파일에서 프로젝트 데이터를 로드합니다.
+        project.json에서 프로젝트 데이터를 로드합니다.
+
+        형식 2는 파일 테이블을 memmap으로 열기만 하고(행은 접근 시 디코딩),
+        형식 1(기존 JSON)은 파일 객체 목록을 테이블로 변환합니다.
 
         인자:
             json_path: project.json 파일 경로.
 
         반환:
-            ProjectData 객체 또는 로드 실패 시 None.
+            files가 ProjectFileTable인 ProjectData 또는 로드 실패 시 None.
         """
         try:
             with open(json_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            return ProjectData.from_dict(data)
+            version = data.get('format_version', 1)
+            if version > PROJECT_FORMAT_VERSION:
+                return None
+            if version == 1:
+                project_data = ProjectData.from_dict(data)
+                project_data.files = ProjectFileTable.from_infos(project_data.files)
+                return project_data
+
+            table_dir = Path(json_path).parent / data.get('file_table', FILE_TABLE_DIR)
+            files = ProjectFileTable.open(table_dir)
+            if files is None:
+                return None
+            project_data = ProjectData.from_dict({**data, 'files': []})
+            project_data.files = files
+            return project_data
         except Exception:
             return None
 
@@ -100,7 +137,10 @@ class ProjectService:
         name = parent_path.name
         now = datetime.now().isoformat(timespec='seconds')
 
-        file_infos: List[ProjectFileInfo] = []
+        columns: Dict[str, List[Any]] = {
+            name: [] for name in ('relative_paths', 'dates', 'times', 'channels',
+                                  'sampling_rates', 'sensitivities', 'is_anomaly')
+        }
         all_channels = set()
         all_dates = set()
         sampling_rates: List[float] = []
@@ -129,15 +169,13 @@ class ProjectService:
                 if sr > 0:
                     sampling_rates.append(sr)
 
-                file_infos.append(ProjectFileInfo(
-                    relative_path=rel,
-                    date=date_str,
-                    time=time_str,
-                    channel=channel,
-                    sampling_rate=sr,
-                    sensitivity=sensitivity,
-                    is_anomaly=is_anomaly,
-                ))
+                columns['relative_paths'].append(rel)
+                columns['dates'].append(date_str)
+                columns['times'].append(time_str)
+                columns['channels'].append(channel)
+                columns['sampling_rates'].append(sr)
+                columns['sensitivities'].append(sensitivity)
+                columns['is_anomaly'].append(is_anomaly)
 
         common_sr = 0.0
         if sampling_rates:
@@ -145,9 +183,10 @@ class ProjectService:
             sr_counts = Counter(sampling_rates)
             common_sr = sr_counts.most_common(1)[0][0]
 
+        file_table = ProjectFileTable.from_columns(**columns)
         sorted_dates = sorted(all_dates)
         summary = {
-            'total_files': len(file_infos),
+            'total_files': len(file_table),
             'date_range': [sorted_dates[0], sorted_dates[-1]] if sorted_dates else [],
             'channels': sorted(all_channels),
             'common_sampling_rate': common_sr,
@@ -159,6 +198,6 @@ class ProjectService:
             created_at=now,
             parent_folder=str(parent_path),
             measurement_type=measurement_type,
-            files=file_infos,
+            files=file_table,
             summary=summary,
         )
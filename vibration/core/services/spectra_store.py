@@ -0,0 +1,299 @@
+"""
+워터폴 스펙트럼 행렬 저장소.
+
+파라미터 세트(Δf, overlap, window, view_type) 하나의 파일별 스펙트럼을 디스크의
+float32 행렬(np.memmap)로 보관합니다. 주파수 축은 행마다 복제하지 않고 하나만
+저장하며, 파일명/타임스탬프/샘플링 레이트/유효 bin 수는 행 인덱스 컬럼으로
+저장합니다. 워터폴 렌더링, Band Trend, 프로젝트 저장은 행렬에서 필요한 구간만
+읽으므로 수만 개 파일도 RAM에 올리지 않습니다.
+
+레이아웃:
+    index.json         버전, 행 수, 주파수 간격, 파라미터
+    frequency.npy      공유 주파수 축 (float64, n_bins)
+    spectra.npy        스펙트럼 행렬 (float32, n_rows × n_bins, 유효 길이 밖은 NaN)
+    file_name.npy, timestamp.npy (datetime64[s]), sampling_rate.npy, n_valid.npy,
+    source_path.npy, source_size.npy, source_mtime.npy (재사용 판단용 원본 파일 정보)
+
+샘플링 레이트가 다른 파일은 같은 Δf 격자의 앞부분만 유효하므로 행 길이만 다릅니다.
+index.json은 모든 컬럼을 기록한 뒤 마지막에 교체하므로, 기록 도중 중단된
+저장소는 열리지 않습니다.
+
+Qt 의존성 없음 - 순수 Python/NumPy 구현.
+"""
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .project_result_store import _from_jsonable, _to_jsonable
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = 'index.json'
+FORMAT_VERSION = 2
+
+# 저장소 간 행 복사 시 한 번에 옮기는 크기
+COPY_CHUNK_BYTES = 64 * 1024 * 1024
+
+_INDEX_COLUMNS = ('file_name', 'timestamp', 'sampling_rate', 'n_valid',
+                  'source_path', 'source_size', 'source_mtime')
+
+
+class SpectraStore:
+    """
+    파일별 스펙트럼의 디스크 행렬과 행 인덱스.
+
+    create()로 만들고 write_row()로 행을 채운 뒤 flush()로 인덱스를 기록합니다.
+    open()은 기존 저장소를 읽기 전용 memmap으로 엽니다.
+
+    속성:
+        directory: 저장소 폴더.
+        frequency: 공유 주파수 축 (n_bins).
+        spectra: (n_rows, n_bins) float32 memmap.
+        file_names, timestamps, sampling_rates, n_valid: 행 인덱스.
+        params: 저장소를 만든 파라미터.
+    """
+
+    def __init__(self, directory: Path, frequency: np.ndarray, spectra: np.ndarray,
+                 columns: Dict[str, np.ndarray], params: Dict[str, Any],
+                 temp_dir: Optional[tempfile.TemporaryDirectory] = None):
+        self.directory = Path(directory)
+        self.frequency = frequency
+        self.spectra = spectra
+        self.params = params
+        self._columns = columns
+        # create(directory=None)이면 저장소가 임시 폴더를 소유 (GC/종료 시 삭제)
+        self._temp_dir = temp_dir
+
+    # ------------------------------------------------------------------
+    # 생성 / 열기
+    # ------------------------------------------------------------------
+    @classmethod
+    def create(cls, directory: Optional[str], n_bins: int, freq_step: float,
+               file_names: Sequence[str], timestamps: Sequence[datetime],
+               params: Optional[Dict[str, Any]] = None) -> 'SpectraStore':
+        """
+        빈 저장소를 만듭니다 (행 값은 write_row/copy_rows로 채움).
+
+        인자:
+            directory: 저장소 폴더. None이면 임시 폴더를 만들어 소유합니다.
+            n_bins: 가장 긴 행의 bin 수.
+            freq_step: 주파수 간격 (Hz).
+            file_names, timestamps: 행 순서의 파일명과 측정 시각.
+            params: 인덱스에 기록할 파라미터.
+        """
+        temp_dir = None
+        if directory is None:
+            temp_dir = tempfile.TemporaryDirectory(prefix='vibration_spectra_',
+                                                   ignore_cleanup_errors=True)
+            directory = temp_dir.name
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        _remove_index(path)
+
+        n_rows = len(file_names)
+        frequency = np.arange(n_bins, dtype=np.float64) * float(freq_step)
+        np.save(path / 'frequency.npy', frequency, allow_pickle=False)
+        spectra = np.lib.format.open_memmap(path / 'spectra.npy', mode='w+',
+                                            dtype=np.float32, shape=(n_rows, n_bins))
+        columns = {
+            'file_name': np.array(list(file_names), dtype=str),
+            'timestamp': np.array(list(timestamps), dtype='datetime64[s]'),
+            'sampling_rate': np.zeros(n_rows, dtype=np.float64),
+            'n_valid': np.zeros(n_rows, dtype=np.int64),
+            'source_path': np.full(n_rows, '', dtype=object),
+            'source_size': np.full(n_rows, -1, dtype=np.int64),
+            'source_mtime': np.full(n_rows, -1, dtype=np.int64),
+        }
+        return cls(path, frequency, spectra, columns, dict(params or {}), temp_dir)
+
+    @classmethod
+    def open(cls, directory: str, mode: str = 'r') -> Optional['SpectraStore']:
+        """
+        기존 저장소를 memmap으로 엽니다.
+
+        반환:
+            SpectraStore 또는 인덱스가 없거나 형식이 다르면 None.
+        """
+        path = Path(directory)
+        try:
+            with open(path / INDEX_FILE, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if index.get('version') != FORMAT_VERSION or index.get('kind') != 'spectrum':
+            return None
+        try:
+            frequency = np.load(path / 'frequency.npy', allow_pickle=False)
+            spectra = np.load(path / 'spectra.npy', mmap_mode=mode, allow_pickle=False)
+            columns = {name: np.load(path / f"{name}.npy", allow_pickle=False)
+                       for name in _INDEX_COLUMNS}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Incomplete spectra store in {path}: {e}")
+            return None
+        columns['source_path'] = columns['source_path'].astype(object)
+        return cls(path, frequency, spectra, columns, _from_jsonable(index.get('params', {})))
+
+    # ------------------------------------------------------------------
+    # 행 기록
+    # ------------------------------------------------------------------
+    def write_row(self, row: int, spectrum: np.ndarray, sampling_rate: float = 0.0,
+                  source: Optional[Tuple[str, int, int]] = None) -> None:
+        """
+        행 하나를 기록합니다 (유효 길이 밖은 NaN).
+
+        인자:
+            row: 행 인덱스.
+            spectrum: 스펙트럼 값 (bin 0부터).
+            sampling_rate: 원본 샘플링 레이트.
+            source: (원본 경로, 크기, 수정 시각 ns) - 다음 계산에서 재사용 판단용.
+        """
+        n = min(len(spectrum), self.n_bins)
+        self.spectra[row, :n] = spectrum[:n]
+        self.spectra[row, n:] = np.nan
+        self._columns['n_valid'][row] = n
+        self._columns['sampling_rate'][row] = sampling_rate
+        self._set_source(row, source)
+
+    def copy_rows(self, source: 'SpectraStore', source_rows: Sequence[int],
+                  rows: Sequence[int]) -> None:
+        """다른 저장소의 행을 청크 단위로 복사합니다 (메타데이터 포함)."""
+        source_rows = np.asarray(source_rows, dtype=np.int64)
+        rows = np.asarray(rows, dtype=np.int64)
+        n = min(source.n_bins, self.n_bins)
+        chunk = max(1, COPY_CHUNK_BYTES // max(1, n * 4))
+        for start in range(0, len(rows), chunk):
+            src = source_rows[start:start + chunk]
+            dst = rows[start:start + chunk]
+            block = np.full((len(dst), self.n_bins), np.nan, dtype=np.float32)
+            block[:, :n] = source.spectra[src, :n]
+            self.spectra[dst] = block
+        for name in ('sampling_rate', 'source_path', 'source_size', 'source_mtime'):
+            self._columns[name][rows] = source._columns[name][source_rows]
+        self._columns['n_valid'][rows] = np.minimum(source._columns['n_valid'][source_rows], n)
+
+    def flush(self, params: Optional[Dict[str, Any]] = None) -> None:
+        """행렬과 인덱스 컬럼을 기록하고 마지막에 index.json을 교체합니다."""
+        if params is not None:
+            self.params = dict(params)
+        if hasattr(self.spectra, 'flush'):
+            self.spectra.flush()
+        _remove_index(self.directory)
+        for name in _INDEX_COLUMNS:
+            values = self._columns[name]
+            if name == 'source_path':
+                values = values.astype(str)
+            np.save(self.directory / f"{name}.npy", values, allow_pickle=False)
+
+        index = {
+            'version': FORMAT_VERSION,
+            'kind': 'spectrum',
+            'saved_at': datetime.now().isoformat(timespec='seconds'),
+            'rows': len(self),
+            'freq_step': self.freq_step,
+            'columns': ['frequency', 'spectra', *_INDEX_COLUMNS],
+            'params': _to_jsonable(self.params),
+        }
+        tmp_path = self.directory / (INDEX_FILE + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.directory / INDEX_FILE)
+
+    def save_as(self, directory: str, params: Optional[Dict[str, Any]] = None) -> 'SpectraStore':
+        """
+        저장소를 다른 폴더로 복사합니다 (행렬은 청크 단위 디스크 간 복사).
+
+        같은 폴더면 인덱스만 다시 기록하고 자신을 반환합니다.
+        """
+        target = Path(directory)
+        if target.resolve() == self.directory.resolve():
+            self.flush(params)
+            return self
+        copy = SpectraStore.create(str(target), self.n_bins, self.freq_step,
+                                   self.file_names, self.timestamps.tolist(),
+                                   params if params is not None else self.params)
+        rows = np.arange(len(self))
+        copy.copy_rows(self, rows, rows)
+        copy.flush()
+        return copy
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return int(self.spectra.shape[0])
+
+    @property
+    def n_bins(self) -> int:
+        return int(self.spectra.shape[1])
+
+    @property
+    def freq_step(self) -> float:
+        return float(self.frequency[1] - self.frequency[0]) if len(self.frequency) > 1 else 0.0
+
+    @property
+    def file_names(self) -> List[str]:
+        return self._columns['file_name'].tolist()
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._columns['timestamp']
+
+    @property
+    def sampling_rates(self) -> np.ndarray:
+        return self._columns['sampling_rate']
+
+    @property
+    def n_valid(self) -> np.ndarray:
+        return self._columns['n_valid']
+
+    def row_frequency(self, row: int) -> np.ndarray:
+        """행의 주파수 배열 (공유 축의 앞부분 뷰)."""
+        return self.frequency[:int(self.n_valid[row])]
+
+    def row_spectrum(self, row: int) -> np.ndarray:
+        """행의 유효 스펙트럼 (memmap 뷰)."""
+        return self.spectra[row, :int(self.n_valid[row])]
+
+    def band(self, frequency: float) -> Tuple[float, np.ndarray]:
+        """
+        주파수에 가장 가까운 bin의 모든 행 값을 읽습니다.
+
+        반환:
+            (bin 주파수, 행별 값). 해당 bin이 없는 짧은 행은 NaN.
+        """
+        col = int(np.argmin(np.abs(self.frequency - frequency)))
+        return float(self.frequency[col]), np.asarray(self.spectra[:, col], dtype=np.float64)
+
+    def source_rows(self) -> Dict[Tuple[str, int, int], int]:
+        """(원본 경로, 크기, 수정 시각 ns) -> 행 (원본 정보가 있는 행만)."""
+        paths = self._columns['source_path']
+        sizes = self._columns['source_size']
+        mtimes = self._columns['source_mtime']
+        return {(str(paths[row]), int(sizes[row]), int(mtimes[row])): row
+                for row in range(len(self)) if paths[row]}
+
+    def close(self) -> None:
+        """memmap을 닫고, 임시 폴더를 소유하면 삭제합니다."""
+        self.spectra = np.empty((0, self.n_bins), dtype=np.float32)
+        if self._temp_dir is not None:
+            self._temp_dir.cleanup()
+            self._temp_dir = None
+
+    def _set_source(self, row: int, source: Optional[Tuple[str, int, int]]) -> None:
+        path, size, mtime = source if source is not None else ('', -1, -1)
+        self._columns['source_path'][row] = path
+        self._columns['source_size'][row] = size
+        self._columns['source_mtime'][row] = mtime
+
+
+def _remove_index(directory: Path) -> None:
+    try:
+        (directory / INDEX_FILE).unlink()
+    except OSError:
+        pass
@@ -0,0 +1,412 @@
+"""
+워커 프로세스 → 부모 프로세스 전체 스펙트럼 전달 계층.
+
+Waterfall 등 파일별 전체 스펙트럼이 필요한 기능에서 ProcessPoolExecutor 결과
+큐로 수만 개의 float64 배열을 피클링하지 않도록, 미리 할당한
+(n_files, n_bins) 공유 메모리 행렬에 워커가 직접 기록하고 행 인덱스와
+상태만 반환합니다. 부모는 복사 없이 행렬 뷰를 소유합니다.
+
+공유 메모리를 사용할 수 없으면 스펙트럼 배열을 결과로 피클링하는 방식으로
+자동 전환합니다.
+
+Qt 의존성 없음 - 순수 Python/NumPy 구현.
+"""
+
+import logging
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import multiprocessing as mp
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover - 공유 메모리 미지원 플랫폼
+    shared_memory = None
+
+from .fft_service import FFTService
+from .file_parser import FileParser
+
+logger = logging.getLogger(__name__)
+
+VIEW_TYPE_MAP = {1: 'ACC', 2: 'VEL', 3: 'DIS'}
+NUMERIC_PATTERN = re.compile(r"[-+]?[0-9]*\.?[0-9]+")
+
+# 이 수 미만의 파일은 프로세스 풀 기동 비용이 더 크므로 현재 프로세스에서 처리
+MIN_PARALLEL_FILES = 4
+
+
+def _extract_numeric_value(s: Optional[str]) -> Optional[float]:
+    if s is None:
+        return None
+    match = NUMERIC_PATTERN.search(str(s))
+    return float(match.group()) if match else None
+
+
+def sensitivity_scale(metadata: Dict[str, str]) -> float:
+    """헤더의 b.Sensitivity/Sensitivity 보정 배율 (값이 없으면 1.0)."""
+    b_sensitivity = _extract_numeric_value(metadata.get('b_sensitivity'))
+    sensitivity = _extract_numeric_value(metadata.get('sensitivity'))
+    if b_sensitivity is not None and sensitivity is not None and sensitivity != 0:
+        return b_sensitivity / sensitivity
+    return 1.0
+
+
+def compute_file_spectrum(
+    file_path: str,
+    delta_f: float,
+    overlap: float,
+    window_type: str,
+    view_type: int
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    단일 파일의 Waterfall용 스펙트럼을 계산합니다.
+
+    b.Sensitivity/Sensitivity 보정, 레코드 길이 기반 delta_f 보정,
+    소수점 4자리 반올림을 포함합니다.
+
+    인자:
+        file_path: 파일 경로.
+        delta_f: 주파수 분해능 (Hz).
+        overlap: 오버랩 비율 (0-100).
+        window_type: 윈도우 함수 이름.
+        view_type: 신호 유형 (1=ACC, 2=VEL, 3=DIS).
+
+    반환:
+        (frequency, spectrum, sampling_rate).
+
+    예외:
+        ValueError: 유효하지 않은 파일이거나 샘플링 레이트가 없는 경우.
+    """
+    frequency, spectrum, sampling_rate, scale = compute_unscaled_file_spectrum(
+        file_path, delta_f, overlap, window_type, view_type
+    )
+    return frequency, apply_spectrum_scale(spectrum, scale), sampling_rate
+
+
+def apply_spectrum_scale(spectrum: np.ndarray, scale: float) -> np.ndarray:
+    """감도 미적용 스펙트럼에 배율을 곱하고 소수점 4자리로 반올림합니다."""
+    return np.round(spectrum * scale, 4)
+
+
+def compute_unscaled_file_spectrum(
+    file_path: str,
+    delta_f: float,
+    overlap: float,
+    window_type: str,
+    view_type: int
+) -> Tuple[np.ndarray, np.ndarray, float, float]:
+    """
+    감도 보정 전 스펙트럼과 보정 배율을 계산합니다.
+
+    스펙트럼은 입력 스케일에 선형이므로 `apply_spectrum_scale(spectrum, scale)`은
+    보정된 신호를 FFT한 결과와 같습니다. 감도가 바뀌어도 FFT를 다시 하지 않도록
+    캐시에는 이 결과를 보관합니다.
+
+    반환:
+        (frequency, 반올림 전 스펙트럼, sampling_rate, 감도 배율).
+    """
+    parser = FileParser(file_path)
+    data = parser.get_data()
+    if not parser.is_valid() or data is None:
+        raise ValueError(f"Invalid file: {os.path.basename(file_path)}")
+
+    sampling_rate = parser.get_sampling_rate()
+    if sampling_rate is None or sampling_rate <= 0:
+        raise ValueError(f"Invalid sampling rate: {sampling_rate}")
+
+    scale = sensitivity_scale(parser.get_all_metadata())
+
+    effective_delta_f = delta_f
+    record_length = parser.get_record_length()
+    if record_length:
+        try:
+            duration = float(record_length)
+            hz_value = round(1 / duration + 0.01, 2)
+            effective_delta_f = max(delta_f, hz_value)
+        except (ValueError, ZeroDivisionError):
+            pass
+
+    fft_service = FFTService(
+        sampling_rate=sampling_rate,
+        delta_f=effective_delta_f,
+        overlap=overlap,
+        window_type=window_type
+    )
+    result = fft_service.compute_spectrum(
+        data, view_type=VIEW_TYPE_MAP.get(view_type, 'ACC')
+    )
+    return result.frequency, result.spectrum, float(sampling_rate), scale
+
+
+def max_spectrum_bins(file_paths: List[str], delta_f: float) -> int:
+    """
+    헤더의 샘플링 레이트로 파일별 최대 스펙트럼 길이 상한을 계산합니다.
+
+    실제 delta_f는 요청값 이상이므로 NFFT = fs / delta_f 가 상한입니다.
+    """
+    max_bins = 1
+    for path in file_paths:
+        sampling_rate = FileParser.parse_header_only(path).get('sampling_rate', 10240.0)
+        if sampling_rate and sampling_rate > 0 and delta_f > 0:
+            max_bins = max(max_bins, int(sampling_rate / delta_f) // 2 + 1)
+    return max_bins
+
+
+if shared_memory is not None:
+    class _OwnedSharedMemory(shared_memory.SharedMemory):
+        """행렬 뷰가 남아 있는 상태의 GC에서 BufferError 경고를 내지 않는 공유 메모리."""
+
+        def __del__(self):
+            try:
+                self.close()
+            except (OSError, BufferError):
+                # 뷰가 살아 있으면 매핑은 마지막 뷰와 함께 해제됨
+                pass
+
+
+class SharedSpectraBuffer:
+    """
+    (n_rows, n_bins) float64 스펙트럼 행렬 버퍼.
+
+    공유 메모리를 사용할 수 있으면 워커 프로세스가 이름으로 접근해 직접 기록하고,
+    그렇지 않으면 일반 NumPy 배열을 사용합니다 (is_shared=False).
+
+    인자:
+        n_rows: 행 수 (파일 수).
+        n_bins: 행당 최대 주파수 bin 수.
+        use_shared_memory: False면 항상 일반 배열 사용.
+    """
+
+    def __init__(self, n_rows: int, n_bins: int, use_shared_memory: bool = True):
+        self.shape = (max(n_rows, 0), max(n_bins, 1))
+        self._shm = None
+
+        nbytes = self.shape[0] * self.shape[1] * np.dtype(np.float64).itemsize
+        if use_shared_memory and shared_memory is not None and nbytes > 0:
+            try:
+                self._shm = _OwnedSharedMemory(create=True, size=nbytes)
+            except OSError as e:
+                logger.warning(f"Shared memory unavailable, falling back to pickling: {e}")
+                self._shm = None
+
+        if self._shm is not None:
+            self.matrix = np.ndarray(self.shape, dtype=np.float64, buffer=self._shm.buf)
+            self.matrix.fill(0.0)
+        else:
+            self.matrix = np.zeros(self.shape, dtype=np.float64)
+
+    @property
+    def is_shared(self) -> bool:
+        """공유 메모리 사용 여부."""
+        return self._shm is not None
+
+    @property
+    def name(self) -> Optional[str]:
+        """워커 접근용 공유 메모리 이름 (공유 메모리 미사용 시 None)."""
+        return self._shm.name if self._shm is not None else None
+
+    @staticmethod
+    def write_row(name: str, shape: Tuple[int, int], row: int, values: np.ndarray) -> None:
+        """워커 프로세스에서 공유 행렬의 한 행에 스펙트럼을 기록합니다."""
+        if sys.version_info >= (3, 13):
+            # 해제(unlink)는 부모 담당 - 워커의 resource_tracker 등록 방지
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+        try:
+            matrix = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+            try:
+                matrix[row, :len(values)] = values
+            finally:
+                del matrix
+        finally:
+            shm.close()
+
+    def release(self) -> None:
+        """
+        공유 메모리를 해제합니다.
+
+        unlink 후에도 부모의 매핑은 유지되므로 행렬 뷰는 계속 사용할 수 있으며,
+        마지막 참조가 사라질 때 메모리가 반환됩니다.
+        """
+        if self._shm is None:
+            return
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+@dataclass
+class SpectrumBatch:
+    """
+    배치 스펙트럼 결과 (행 = 입력 파일 순서).
+
+    속성:
+        file_paths: 입력 파일 경로 목록.
+        matrix: (n_files, n_bins) 스펙트럼 행렬 (각 행의 앞 n_valid[i]개만 유효).
+        n_valid: 행별 유효 bin 수.
+        freq_step: 행별 주파수 간격 (Hz).
+        sampling_rates: 행별 샘플링 레이트.
+        scales: 행별 b.Sensitivity/Sensitivity 배율.
+        success: 행별 성공 여부.
+        errors: 실패 행의 오류 메시지 (행 인덱스 → 메시지).
+        shared: 공유 메모리 전송 사용 여부.
+    """
+    file_paths: List[str]
+    matrix: np.ndarray
+    n_valid: np.ndarray
+    freq_step: np.ndarray
+    sampling_rates: np.ndarray
+    scales: np.ndarray
+    success: np.ndarray
+    errors: Dict[int, str] = field(default_factory=dict)
+    shared: bool = False
+    _buffer: Optional[SharedSpectraBuffer] = field(default=None, repr=False)
+
+    def frequency(self, row: int) -> np.ndarray:
+        """행의 주파수 배열."""
+        return np.arange(self.n_valid[row]) * self.freq_step[row]
+
+    def spectrum(self, row: int) -> np.ndarray:
+        """행의 스펙트럼 (행렬 뷰, 복사 없음)."""
+        return self.matrix[row, :self.n_valid[row]]
+
+
+def _spectrum_row_worker(args: Tuple) -> Tuple[int, bool, int, float, float, float, Optional[str], Optional[np.ndarray]]:
+    """
+    단일 파일 스펙트럼 계산 워커
+
+    Args:
+        args: (row, file_path, shm_name, shape, delta_f, overlap, window_type, view_type,
+               apply_sensitivity)
+
+    Returns:
+        (row, success, n_valid, freq_step, sampling_rate, scale, error, spectrum)
+        spectrum은 공유 메모리를 사용하지 않는 경우에만 포함
+    """
+    (row, file_path, shm_name, shape, delta_f, overlap, window_type, view_type,
+     apply_sensitivity) = args
+    try:
+        frequency, spectrum, sampling_rate, scale = compute_unscaled_file_spectrum(
+            file_path, delta_f, overlap, window_type, view_type
+        )
+        if apply_sensitivity:
+            spectrum = apply_spectrum_scale(spectrum, scale)
+        n_valid = min(len(spectrum), shape[1])
+        freq_step = float(frequency[1] - frequency[0]) if len(frequency) > 1 else 0.0
+
+        if shm_name is not None:
+            SharedSpectraBuffer.write_row(shm_name, shape, row, spectrum[:n_valid])
+            payload = None
+        else:
+            payload = spectrum[:n_valid]
+        return row, True, n_valid, freq_step, sampling_rate, scale, None, payload
+    except Exception as e:
+        return row, False, 0, 0.0, 0.0, 1.0, str(e), None
+
+
+class SpectrumBatchProcessor:
+    """
+    파일별 전체 스펙트럼 병렬 계산기 (ProcessPoolExecutor + 공유 메모리 전송).
+
+    인자:
+        max_workers: 프로세스 수 (None이면 CPU 코어 수 - 1).
+        use_shared_memory: False면 결과 피클링 방식 사용.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, use_shared_memory: bool = True):
+        if max_workers is None:
+            max_workers = max(mp.cpu_count() - 1, 1)
+        self.max_workers = max_workers
+        self.use_shared_memory = use_shared_memory
+
+    def process_batch(
+        self,
+        file_paths: List[str],
+        delta_f: float,
+        overlap: float,
+        window_type: str,
+        view_type: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        apply_sensitivity: bool = True
+    ) -> SpectrumBatch:
+        """
+        파일 목록의 스펙트럼을 계산합니다.
+
+        인자:
+            file_paths: 파일 경로 목록.
+            delta_f: 주파수 분해능 (Hz).
+            overlap: 오버랩 비율 (0-100).
+            window_type: 윈도우 함수 이름.
+            view_type: 신호 유형 (1=ACC, 2=VEL, 3=DIS).
+            progress_callback: 진행률 콜백 (current, total).
+            apply_sensitivity: False면 감도 보정 전 스펙트럼을 반환합니다
+                (배율은 SpectrumBatch.scales, 적용은 apply_spectrum_scale).
+
+        반환:
+            SpectrumBatch (행 순서 = 입력 순서).
+        """
+        total = len(file_paths)
+        parallel = total >= MIN_PARALLEL_FILES and self.max_workers > 1
+        n_bins = max_spectrum_bins(file_paths, delta_f)
+        buffer = SharedSpectraBuffer(total, n_bins, self.use_shared_memory and parallel)
+
+        n_valid = np.zeros(total, dtype=np.int64)
+        freq_step = np.zeros(total, dtype=np.float64)
+        sampling_rates = np.zeros(total, dtype=np.float64)
+        scales = np.ones(total, dtype=np.float64)
+        success = np.zeros(total, dtype=bool)
+        errors: Dict[int, str] = {}
+
+        args_list = [
+            (row, fp, buffer.name, buffer.shape, delta_f, overlap,
+             window_type.lower(), view_type, apply_sensitivity)
+            for row, fp in enumerate(file_paths)
+        ]
+
+        def collect(outcome: Tuple, done: int) -> None:
+            row, ok, valid, step, fs, scale, error, payload = outcome
+            if ok:
+                if payload is not None:
+                    buffer.matrix[row, :valid] = payload
+                n_valid[row] = valid
+                freq_step[row] = step
+                sampling_rates[row] = fs
+                scales[row] = scale
+                success[row] = True
+            else:
+                errors[row] = error or ''
+                logger.warning(f"Spectrum failed for {os.path.basename(file_paths[row])}: {error}")
+            if progress_callback:
+                progress_callback(done, total)
+
+        try:
+            if not parallel:
+                for done, args in enumerate(args_list, start=1):
+                    collect(_spectrum_row_worker(args), done)
+            else:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = [executor.submit(_spectrum_row_worker, a) for a in args_list]
+                    for done, future in enumerate(as_completed(futures), start=1):
+                        collect(future.result(), done)
+        finally:
+            buffer.release()
+
+        return SpectrumBatch(
+            file_paths=list(file_paths),
+            matrix=buffer.matrix,
+            n_valid=n_valid,
+            freq_step=freq_step,
+            sampling_rates=sampling_rates,
+            scales=scales,
+            success=success,
+            errors=errors,
+            shared=buffer.is_shared,
+            _buffer=buffer
+        )
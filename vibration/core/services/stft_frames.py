@@ -0,0 +1,108 @@
+"""
+구간 스펙트럼용 STFT 프레임 인덱스.
+
+Welch 스펙트럼은 구간 안 세그먼트별 파워 스펙트럼의 평균입니다. 신호 전체를
+고정 격자(시작 위치가 step = nfft - noverlap의 배수)로 한 번 나누어 프레임별
+파워를 누적합으로 보관하면, 임의 구간의 스펙트럼은 구간 안에 완전히 들어가는
+격자 프레임의 합(누적합 차이, O(bins))과 격자에 맞지 않는 양 끝 프레임 최대
+2개의 FFT로 계산됩니다.
+
+구간 시작/끝이 격자에 맞으면 scipy.signal.welch 결과와 같고, 그렇지 않으면
+세그먼트 위치만 최대 step 미만으로 다른 근사입니다.
+
+Qt 의존성 없음 - 순수 NumPy 구현.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def frame_powers(data: np.ndarray, starts: np.ndarray, window: np.ndarray) -> np.ndarray:
+    """
+    주어진 시작 위치의 프레임별 단측 파워 스펙트럼을 계산합니다.
+
+    scipy.signal.welch(scaling='spectrum', detrend='constant')의 세그먼트
+    하나와 같은 스케일입니다.
+
+    반환:
+        (len(starts), nfft // 2 + 1) 배열.
+    """
+    nfft = len(window)
+    segments = sliding_window_view(data, nfft)[starts]
+    segments = segments - segments.mean(axis=1, keepdims=True)
+    power = np.abs(np.fft.rfft(segments * window, axis=1)) ** 2
+    power /= window.sum() ** 2
+    if nfft % 2 == 0:
+        power[:, 1:-1] *= 2
+    else:
+        power[:, 1:] *= 2
+    return power
+
+
+class STFTFrameIndex:
+    """
+    신호 한 개의 고정 격자 프레임 파워 누적합.
+
+    인자:
+        data: 시간 영역 신호 (1차원).
+        window: 윈도우 배열 (길이 = nfft).
+        noverlap: 프레임 간 겹침 샘플 수.
+        key: 생성 당시 FFT 파라미터 (재사용 가능 여부 판단용).
+    """
+
+    def __init__(self, data: np.ndarray, window: np.ndarray, noverlap: int,
+                 key: Optional[Tuple] = None):
+        self.data = np.asarray(data, dtype=np.float64).ravel()
+        self.window = np.asarray(window, dtype=np.float64)
+        self.nfft = len(self.window)
+        self.step = max(1, self.nfft - int(noverlap))
+        self.key = key
+
+        if len(self.data) >= self.nfft:
+            starts = np.arange(0, len(self.data) - self.nfft + 1, self.step)
+        else:
+            starts = np.empty(0, dtype=np.int64)
+        self.num_frames = len(starts)
+
+        # 행 i = 프레임 0..i-1 파워의 합 (구간 합을 두 행의 차로 계산)
+        self._cumulative = np.zeros((self.num_frames + 1, self.nfft // 2 + 1))
+        if self.num_frames:
+            np.cumsum(frame_powers(self.data, starts, self.window), axis=0,
+                      out=self._cumulative[1:])
+
+    @property
+    def nbytes(self) -> int:
+        """누적합 배열 메모리 (바이트)."""
+        return int(self._cumulative.nbytes)
+
+    def span_power(self, i_start: int, i_end: int) -> Optional[np.ndarray]:
+        """
+        샘플 구간 [i_start, i_end)의 평균 파워 스펙트럼을 반환합니다.
+
+        구간이 nfft보다 짧으면 None을 반환합니다.
+        """
+        i_start = max(0, int(i_start))
+        i_end = min(len(self.data), int(i_end))
+        if i_end - i_start < self.nfft:
+            return None
+
+        first = -(-i_start // self.step)
+        last = min((i_end - self.nfft) // self.step, self.num_frames - 1)
+
+        total = np.zeros(self.nfft // 2 + 1)
+        count = 0
+        if first <= last:
+            total += self._cumulative[last + 1] - self._cumulative[first]
+            count = last - first + 1
+
+        edges = set()
+        if count == 0 or first * self.step > i_start:
+            edges.add(i_start)
+        if count == 0 or last * self.step + self.nfft < i_end:
+            edges.add(i_end - self.nfft)
+        if edges:
+            total += frame_powers(self.data, np.array(sorted(edges)), self.window).sum(axis=0)
+            count += len(edges)
+
+        return total / count
@@ -0,0 +1,368 @@
+"""
+Trend 배치용 2단계 I/O + 연산 파이프라인.
+
+기존 TrendParallelProcessor는 각 워커 프로세스가 파일 읽기(블로킹 I/O)와
+FFT 연산을 모두 수행하므로, HDD/SMB 공유 폴더에서는 N개 프로세스가 디스크를
+무작위로 읽으며 I/O 대기 중 CPU가 유휴 상태가 됩니다.
+
+파이프라인 구성:
+    1. 리더 스레드 (기본 1개): 파일을 디스크 배치 순서(inode 순)로 순차 읽어
+       공유 메모리 버퍼에 적재합니다.
+    2. 연산 프로세스: 준비된 버퍼에 접근하여 파싱 + FFT + RMS/Peak를 계산합니다.
+
+queue_depth는 동시에 존재할 수 있는 읽기 완료 버퍼 수(메모리 상한)이며,
+단계별 소요 시간은 last_stats에 기록됩니다.
+
+Qt 의존성 없음 - 순수 Python/NumPy 구현.
+"""
+
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import multiprocessing as mp
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover - 공유 메모리 미지원 플랫폼
+    shared_memory = None
+
+from .OPTIMIZATION_PATCH_LEVEL5_TREND import (
+    TrendResult,
+    _compute_trend_result,
+    _failed_trend_result,
+    _parse_trend_text,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READER_THREADS = 1
+
+
+def _attach_shared_memory(name: str):
+    """워커 프로세스에서 부모가 생성한 공유 메모리에 접근합니다."""
+    if sys.version_info >= (3, 13):
+        # 해제(unlink)는 부모 담당 - 워커의 resource_tracker 등록 방지
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _process_trend_buffer_worker(args: Tuple) -> Tuple[TrendResult, float]:
+    """
+    읽기 완료 버퍼 처리 워커
+
+    Args:
+        args: (file_name, shm_name, nbytes, payload, delta_f, window_type,
+               view_type, band_min, band_max)
+              shm_name이 None이면 payload(bytes)를 직접 사용 (피클링 폴백)
+
+    Returns:
+        (TrendResult, 연산 소요 시간(초))
+    """
+    (file_name, shm_name, nbytes, payload, delta_f, window_type,
+     view_type, band_min, band_max) = args
+
+    start = time.perf_counter()
+    try:
+        if shm_name is not None:
+            shm = _attach_shared_memory(shm_name)
+            view = shm.buf[:nbytes]
+            try:
+                text = str(view, 'utf-8', 'ignore')
+            finally:
+                view.release()
+                shm.close()
+        else:
+            text = payload.decode('utf-8', errors='ignore')
+
+        data, sampling_rate, metadata = _parse_trend_text(text)
+        result = _compute_trend_result(
+            file_name, data, sampling_rate, metadata,
+            delta_f, window_type, view_type, band_min, band_max
+        )
+    except Exception as e:
+        result = _failed_trend_result(file_name, e)
+
+    return result, time.perf_counter() - start
+
+
+def disk_order(file_paths: List[str]) -> List[int]:
+    """
+    파일을 디스크 배치 순서에 가깝게 정렬한 인덱스를 반환합니다.
+
+    (st_dev, st_ino) 순으로 정렬하며, stat 실패 파일은 입력 순서대로 뒤에 둡니다.
+    """
+    keyed = []
+    missing = []
+    for idx, path in enumerate(file_paths):
+        try:
+            st = os.stat(path)
+            keyed.append(((st.st_dev, st.st_ino), idx))
+        except OSError:
+            missing.append(idx)
+    keyed.sort()
+    return [idx for _, idx in keyed] + missing
+
+
+class TrendPipeline:
+    """
+    리더 스레드 → 연산 프로세스 2단계 Trend 파이프라인.
+
+    인자:
+        max_workers: 연산 프로세스 수 (None이면 CPU 코어 수 - 1).
+        reader_threads: 파일 읽기 스레드 수.
+        queue_depth: 동시에 보관할 읽기 완료 버퍼 수 (None이면 max_workers * 2).
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        reader_threads: int = DEFAULT_READER_THREADS,
+        queue_depth: Optional[int] = None
+    ):
+        if max_workers is None:
+            max_workers = max(mp.cpu_count() - 1, 1)
+
+        self.max_workers = max_workers
+        self.reader_threads = max(1, reader_threads)
+        self.queue_depth = max(1, queue_depth or max_workers * 2)
+        self.last_stats: Dict[str, float] = {}
+
+    def process_batch(
+        self,
+        file_paths: List[str],
+        delta_f: float,
+        overlap: float,
+        window_type: str,
+        view_type: int,
+        band_min: float,
+        band_max: float,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[TrendResult]:
+        """
+        배치 처리 (TrendParallelProcessor.process_batch와 동일한 인터페이스).
+
+        반환:
+            TrendResult 리스트 (입력 순서 보장).
+        """
+        total = len(file_paths)
+        if total == 0:
+            self.last_stats = {}
+            return []
+
+        window_type = window_type.lower()
+        wall_start = time.perf_counter()
+
+        order: "queue.Queue[int]" = queue.Queue()
+        for idx in disk_order(file_paths):
+            order.put(idx)
+
+        ready: "queue.Queue[Tuple]" = queue.Queue()
+        slots = threading.Semaphore(self.queue_depth)
+        stop = threading.Event()
+        stats_lock = threading.Lock()
+        stats = {'read_seconds': 0.0, 'read_wait_seconds': 0.0, 'bytes_read': 0}
+
+        readers = [
+            threading.Thread(
+                target=self._reader_loop,
+                args=(file_paths, order, ready, slots, stop, stats, stats_lock),
+                name=f"trend-reader-{i}",
+                daemon=True
+            )
+            for i in range(self.reader_threads)
+        ]
+
+        results: Dict[int, TrendResult] = {}
+        pending: Dict[Any, Tuple[int, Any]] = {}
+        compute_seconds = 0.0
+        compute_wait_seconds = 0.0
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                # fork 플랫폼: 리더 스레드가 락(resource_tracker 등)을 잡은 순간 워커가
+                # fork되면 자식에서 교착되므로, 워커 프로세스를 먼저 기동한 뒤 리더 시작
+                executor.submit(os.getpid).result()
+                for reader in readers:
+                    reader.start()
+
+                while len(results) < total:
+                    # ===== 1. 읽기 완료 버퍼를 연산 프로세스에 제출 =====
+                    block = not pending
+                    while True:
+                        try:
+                            item = ready.get(block=block)
+                        except queue.Empty:
+                            break
+                        block = False
+
+                        idx, shm, nbytes, payload, error = item
+                        if error is not None:
+                            results[idx] = TrendResult(
+                                file_name=os.path.basename(file_paths[idx]),
+                                rms_value=0.0, peak_value=0.0, peak_freq=0.0,
+                                sampling_rate=0.0, metadata={},
+                                success=False, error_msg=error
+                            )
+                            slots.release()
+                            if progress_callback:
+                                progress_callback(len(results), total)
+                            continue
+
+                        future = executor.submit(
+                            _process_trend_buffer_worker,
+                            (os.path.basename(file_paths[idx]),
+                             shm.name if shm is not None else None,
+                             nbytes, payload, delta_f, window_type,
+                             view_type, band_min, band_max)
+                        )
+                        pending[future] = (idx, shm)
+
+                    if not pending:
+                        continue
+
+                    # ===== 2. 완료된 연산 수집 + 버퍼 반환 =====
+                    wait_start = time.perf_counter()
+                    done, _ = wait(list(pending), timeout=0.01,
+                                   return_when=FIRST_COMPLETED)
+                    compute_wait_seconds += time.perf_counter() - wait_start
+
+                    for future in done:
+                        idx, shm = pending.pop(future)
+                        self._release_buffer(shm)
+                        slots.release()
+                        try:
+                            result, elapsed = future.result()
+                            compute_seconds += elapsed
+                        except Exception as e:
+                            result = _failed_trend_result(
+                                os.path.basename(file_paths[idx]), e
+                            )
+                        results[idx] = result
+                        if progress_callback:
+                            progress_callback(len(results), total)
+        finally:
+            stop.set()
+            for _ in readers:
+                slots.release()
+            for reader in readers:
+                if reader.is_alive():
+                    reader.join(timeout=5)
+            for _, shm in pending.values():
+                self._release_buffer(shm)
+            while True:
+                try:
+                    leftover = ready.get_nowait()
+                except queue.Empty:
+                    break
+                self._release_buffer(leftover[1])
+
+        wall_seconds = time.perf_counter() - wall_start
+        self.last_stats = {
+            'files': total,
+            'wall_seconds': wall_seconds,
+            'read_seconds': stats['read_seconds'],
+            'read_wait_seconds': stats['read_wait_seconds'],
+            'compute_seconds': compute_seconds,
+            'compute_wait_seconds': compute_wait_seconds,
+            'bytes_read': stats['bytes_read'],
+            'read_mb_per_s': (
+                stats['bytes_read'] / stats['read_seconds'] / 1e6
+                if stats['read_seconds'] > 0 else 0.0
+            ),
+            'cpu_utilization': (
+                compute_seconds / (wall_seconds * self.max_workers)
+                if wall_seconds > 0 else 0.0
+            ),
+        }
+        logger.info(
+            f"Trend pipeline: {total} files in {wall_seconds:.2f}s "
+            f"(read {stats['read_seconds']:.2f}s, "
+            f"compute {compute_seconds:.2f}s, "
+            f"{self.last_stats['read_mb_per_s']:.1f} MB/s)"
+        )
+
+        return [results[i] for i in range(total)]
+
+    def _reader_loop(
+        self,
+        file_paths: List[str],
+        order: "queue.Queue[int]",
+        ready: "queue.Queue[Tuple]",
+        slots: threading.Semaphore,
+        stop: threading.Event,
+        stats: Dict[str, float],
+        stats_lock: threading.Lock
+    ) -> None:
+        """디스크 순서대로 파일을 읽어 ready 큐에 (idx, shm, nbytes, payload, error)를 넣습니다."""
+        while not stop.is_set():
+            try:
+                idx = order.get_nowait()
+            except queue.Empty:
+                return
+
+            # 큐 깊이 제한: 연산이 끝나 버퍼가 반환될 때까지 대기
+            wait_start = time.perf_counter()
+            slots.acquire()
+            waited = time.perf_counter() - wait_start
+            if stop.is_set():
+                return
+
+            read_start = time.perf_counter()
+            try:
+                item = self._read_file(idx, file_paths[idx])
+            except Exception as e:
+                item = (idx, None, 0, None, str(e))
+            read_seconds = time.perf_counter() - read_start
+
+            with stats_lock:
+                stats['read_wait_seconds'] += waited
+                stats['read_seconds'] += read_seconds
+                stats['bytes_read'] += item[2]
+            ready.put(item)
+
+    @staticmethod
+    def _read_file(idx: int, path: str) -> Tuple:
+        """파일 전체를 공유 메모리(불가 시 bytes)로 읽습니다."""
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+
+            shm = None
+            if shared_memory is not None and size > 0:
+                try:
+                    shm = shared_memory.SharedMemory(create=True, size=size)
+                except OSError:
+                    shm = None
+
+            if shm is None:
+                payload = f.read()
+                return idx, None, len(payload), payload, None
+
+            try:
+                nbytes = 0
+                while nbytes < size:
+                    with shm.buf[nbytes:size] as chunk:
+                        n = f.readinto(chunk)
+                    if not n:
+                        break
+                    nbytes += n
+            except BaseException:
+                TrendPipeline._release_buffer(shm)
+                raise
+            return idx, shm, nbytes, None, None
+
+    @staticmethod
+    def _release_buffer(shm) -> None:
+        """공유 메모리 버퍼를 닫고 해제합니다."""
+        if shm is None:
+            return
+        try:
+            shm.close()
+            shm.unlink()
+        except (FileNotFoundError, OSError):
+            pass
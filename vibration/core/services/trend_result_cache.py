@@ -0,0 +1,246 @@
+"""
+파일 단위 Trend 결과 영구 캐시 (SQLite).
+
+Trend/Peak 프레젠터는 마지막 배치만 캐시하므로 선택 파일이 하나만 바뀌어도
+전체를 재계산합니다 (90일 선택에 하루를 추가하면 90일 전체 재계산).
+파일별 RMS/Peak 결과를 (파일 경로, 분석 파라미터) 키로 디스크에 저장하고,
+파일 크기/수정 시각(ns)이 같을 때만 적중으로 처리합니다. 배치 시 적중 결과를
+한 번에 조회하고 미스 파일만 워커 풀로 보냅니다.
+
+Qt 의존성 없음 - 순수 Python 구현 (표준 라이브러리 sqlite3).
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .OPTIMIZATION_PATCH_LEVEL5_TREND import TrendResult
+
+logger = logging.getLogger(__name__)
+
+# SQLite 바인딩 변수 상한(999)보다 작게 IN 절을 분할
+LOOKUP_CHUNK = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trend_results (
+    path TEXT NOT NULL,
+    delta_f REAL NOT NULL,
+    overlap REAL NOT NULL,
+    window_type TEXT NOT NULL,
+    view_type INTEGER NOT NULL,
+    band_min REAL NOT NULL,
+    band_max REAL NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    rms_value REAL NOT NULL,
+    peak_value REAL NOT NULL,
+    peak_freq REAL NOT NULL,
+    sampling_rate REAL NOT NULL,
+    metadata TEXT NOT NULL,
+    PRIMARY KEY (path, delta_f, overlap, window_type, view_type, band_min, band_max)
+)
+"""
+
+
+def default_cache_path() -> Path:
+    """사용자별 기본 캐시 파일 경로 (Windows: %LOCALAPPDATA%, 그 외: ~/.cache)."""
+    base = os.environ.get('LOCALAPPDATA')
+    root = Path(base) if base else Path.home() / '.cache'
+    return root / 'cnave' / 'trend_results.sqlite'
+
+
+def _file_identity(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class TrendResultCache:
+    """
+    파일 단위 Trend 결과 SQLite 캐시.
+
+    실패 결과는 저장하지 않습니다 (일시적 I/O 오류가 고정되지 않도록).
+
+    인자:
+        db_path: SQLite 파일 경로 (None이면 default_cache_path()).
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = str(db_path or default_cache_path())
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    @staticmethod
+    def _param_row(delta_f, overlap, window_type, view_type, band_min, band_max) -> Tuple:
+        return (float(delta_f), float(overlap), window_type.lower(), int(view_type),
+                float(band_min), float(band_max))
+
+    def lookup(
+        self,
+        file_paths: List[str],
+        delta_f: float,
+        overlap: float,
+        window_type: str,
+        view_type: int,
+        band_min: float,
+        band_max: float
+    ) -> Dict[int, TrendResult]:
+        """
+        적중 결과를 일괄 조회합니다.
+
+        반환:
+            {입력 인덱스: TrendResult} (크기/수정 시각이 일치하는 파일만).
+        """
+        params = self._param_row(delta_f, overlap, window_type, view_type, band_min, band_max)
+        wanted: Dict[str, List[int]] = {}
+        for idx, path in enumerate(file_paths):
+            wanted.setdefault(os.path.normpath(os.path.abspath(path)), []).append(idx)
+
+        rows = []
+        keys = list(wanted)
+        with self._lock, closing(self._connect()) as conn:
+            for start in range(0, len(keys), LOOKUP_CHUNK):
+                chunk = keys[start:start + LOOKUP_CHUNK]
+                rows.extend(conn.execute(
+                    "SELECT path, size, mtime_ns, rms_value, peak_value, peak_freq, "
+                    "sampling_rate, metadata FROM trend_results "
+                    "WHERE delta_f = ? AND overlap = ? AND window_type = ? AND view_type = ? "
+                    "AND band_min = ? AND band_max = ? "
+                    f"AND path IN ({', '.join('?' * len(chunk))})",
+                    params + tuple(chunk)
+                ))
+
+        hits: Dict[int, TrendResult] = {}
+        for path, size, mtime_ns, rms, peak, peak_freq, fs, metadata in rows:
+            if _file_identity(path) != (size, mtime_ns):
+                continue
+            for idx in wanted[path]:
+                hits[idx] = TrendResult(
+                    file_name=os.path.basename(file_paths[idx]),
+                    rms_value=rms, peak_value=peak, peak_freq=peak_freq,
+                    sampling_rate=fs, metadata=json.loads(metadata),
+                    success=True
+                )
+
+        self.hits += len(hits)
+        self.misses += len(file_paths) - len(hits)
+        return hits
+
+    def store(
+        self,
+        file_paths: List[str],
+        results: List[TrendResult],
+        delta_f: float,
+        overlap: float,
+        window_type: str,
+        view_type: int,
+        band_min: float,
+        band_max: float
+    ) -> int:
+        """
+        성공 결과를 저장합니다 (같은 경로/파라미터의 이전 결과는 교체).
+
+        반환:
+            저장한 행 수.
+        """
+        params = self._param_row(delta_f, overlap, window_type, view_type, band_min, band_max)
+        rows = []
+        for path, result in zip(file_paths, results):
+            if not result.success:
+                continue
+            identity = _file_identity(path)
+            if identity is None:
+                continue
+            rows.append(
+                (os.path.normpath(os.path.abspath(path)),) + params + identity + (
+                    result.rms_value, result.peak_value, result.peak_freq,
+                    result.sampling_rate, json.dumps(result.metadata, default=str)
+                )
+            )
+
+        if rows:
+            with self._lock, closing(self._connect()) as conn, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO trend_results VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+        return len(rows)
+
+    def process_batch(
+        self,
+        processor,
+        file_paths: List[str],
+        delta_f: float,
+        overlap: float,
+        window_type: str,
+        view_type: int,
+        band_min: float,
+        band_max: float,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[TrendResult]:
+        """
+        적중 결과는 캐시에서, 미스 파일만 processor.process_batch로 계산합니다.
+
+        인자:
+            processor: TrendParallelProcessor 또는 PeakParallelProcessor.
+
+        반환:
+            입력 순서의 TrendResult 리스트.
+        """
+        args = (delta_f, overlap, window_type, view_type, band_min, band_max)
+        hits = self.lookup(file_paths, *args)
+        total = len(file_paths)
+        miss_idx = [i for i in range(total) if i not in hits]
+        logger.info(f"Trend cache: {len(hits)} hits, {len(miss_idx)} misses")
+
+        if progress_callback and hits:
+            progress_callback(len(hits), total)
+
+        computed: List[TrendResult] = []
+        if miss_idx:
+            miss_paths = [file_paths[i] for i in miss_idx]
+
+            def offset_progress(current: int, _total: int) -> None:
+                if progress_callback:
+                    progress_callback(len(hits) + current, total)
+
+            computed = processor.process_batch(
+                file_paths=miss_paths,
+                delta_f=delta_f,
+                overlap=overlap,
+                window_type=window_type,
+                view_type=view_type,
+                band_min=band_min,
+                band_max=band_max,
+                progress_callback=offset_progress
+            )
+            self.store(miss_paths, computed, *args)
+
+        results: List[Optional[TrendResult]] = [hits.get(i) for i in range(total)]
+        for i, result in zip(miss_idx, computed):
+            results[i] = result
+        return results
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 삭제합니다."""
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM trend_results")
+
+    def __len__(self) -> int:
+        with self._lock, closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM trend_results").fetchone()[0]
@@ -0,0 +1,315 @@
+"""
+워터폴 화면 배치 계산.
+
+파일별 스펙트럼을 (파일 수, bin 수) 행렬로 한 번 쌓아 두고, 축 범위/각도가
+바뀔 때마다 행렬 연산으로 화면 좌표(주파수/진폭 정규화 + 파일별 대각선 오프셋)와
+피킹 포인트를 계산합니다. 결과 행렬은 LineCollection 세그먼트로 바로 사용합니다.
+
+길이가 다른 스펙트럼(샘플링 속도가 다른 파일)은 NaN으로 채우며, NaN 포인트와
+주파수 범위 밖 포인트는 그려지지 않습니다.
+
+SpectrumHeatmap은 같은 행렬을 시간(파일) × 주파수 이미지로 보여 주는 히트맵
+모드용입니다. 현재 보이는 구간만 화면 픽셀 크기에 맞춰 최댓값 풀링하므로
+수천 개 파일에서도 좁은 톤이 사라지지 않습니다.
+
+Qt 의존성 없음 - 순수 NumPy 구현.
+"""
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 주파수 축 전체 폭과 진폭 축 높이 (화면 좌표)
+X_SCALE = 530.0
+Y_HEIGHT = 130.0
+
+# 파일(행)당 피킹 포인트 수 상한 (대략)
+PICKS_PER_ROW = 200
+
+# 히트맵 풀링 시 한 번에 읽는 행렬 크기 (memmap이면 이 단위로 디스크에서 읽음)
+HEATMAP_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def stack_spectra(frequencies: Sequence[np.ndarray],
+                  spectra: Sequence[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    파일별 주파수/스펙트럼 배열을 (n_files, n_bins) 행렬로 쌓습니다.
+
+    모든 파일의 주파수 배열이 같으면 주파수 행렬은 복사 없이 broadcast 뷰입니다.
+    길이가 다르면 가장 긴 길이에 맞춰 NaN으로 채웁니다.
+
+    반환:
+        (frequency, spectrum) 행렬.
+    """
+    n = len(spectra)
+    n_bins = max((len(s) for s in spectra), default=0)
+    spectrum = np.full((n, n_bins), np.nan)
+    for row, values in enumerate(spectra):
+        spectrum[row, :len(values)] = values
+
+    first = np.asarray(frequencies[0], dtype=np.float64) if n else np.empty(0)
+    if len(first) == n_bins and all(f is frequencies[0] or np.array_equal(f, first)
+                                    for f in frequencies[1:]):
+        return np.broadcast_to(first, (n, n_bins)), spectrum
+
+    frequency = np.full((n, n_bins), np.nan)
+    for row, values in enumerate(frequencies):
+        frequency[row, :len(values)] = values
+    return frequency, spectrum
+
+
+class WaterfallLayout(NamedTuple):
+    """워터폴 화면 좌표. 행렬은 모두 (n_files, n_cols)이며 그리지 않는 포인트는 NaN."""
+    x: np.ndarray
+    y: np.ndarray
+    frequency: np.ndarray
+    amplitude: np.ndarray
+    visible: np.ndarray
+
+    @property
+    def rows(self) -> np.ndarray:
+        """그릴 포인트가 하나 이상 있는 행 인덱스."""
+        return np.flatnonzero(self.visible.any(axis=1))
+
+    def segments(self, max_points: Optional[int] = None) -> np.ndarray:
+        """
+        그릴 행의 (n_rows, n_cols, 2) LineCollection 세그먼트.
+
+        max_points를 주면 열 수가 그 2배를 넘을 때 버킷별 (min, max) 포락선으로
+        줄입니다. 화면 픽셀보다 조밀한 선은 그리기 비용만 크고 모양은 같습니다.
+        """
+        rows = self.rows
+        x, y = self.x[rows], self.y[rows]
+        if max_points is not None and x.shape[1] > 2 * max_points:
+            x, y = _envelope(x, y, -(-x.shape[1] // max_points))
+        return np.stack([x, y], axis=-1)
+
+
+class WaterfallPoints(NamedTuple):
+    """피킹 포인트 배열 (화면 좌표, 원래 주파수/진폭, 파일 행)."""
+    x: np.ndarray
+    y: np.ndarray
+    frequency: np.ndarray
+    amplitude: np.ndarray
+    row: np.ndarray
+    file_names: List[str]
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def entry(self, i: int) -> Tuple[float, float, float, float, str]:
+        """i번째 포인트의 (plot_x, plot_y, freq, amp, file_name)."""
+        return (float(self.x[i]), float(self.y[i]), float(self.frequency[i]),
+                float(self.amplitude[i]), self.file_names[int(self.row[i])])
+
+
+def _envelope(x: np.ndarray, y: np.ndarray, block: int) -> Tuple[np.ndarray, np.ndarray]:
+    """열을 block개씩 묶어 버킷 시작 x에 (min, max) y를 교대로 배치합니다 (NaN 무시)."""
+    n_rows, n_cols = y.shape
+    pad = -n_cols % block
+    if pad:
+        x = np.pad(x, ((0, 0), (0, pad)), constant_values=np.nan)
+        y = np.pad(y, ((0, 0), (0, pad)), constant_values=np.nan)
+    n_buckets = (n_cols + pad) // block
+    xb = x.reshape(n_rows, n_buckets, block)
+    yb = y.reshape(n_rows, n_buckets, block)
+    nan = np.isnan(yb)
+    lo = np.where(nan, np.inf, yb).min(axis=2)
+    hi = np.where(nan, -np.inf, yb).max(axis=2)
+    start = np.where(nan, np.inf, xb).min(axis=2)
+    empty = np.isinf(lo)
+    lo[empty] = hi[empty] = start[empty] = np.nan
+
+    out_x = np.repeat(start, 2, axis=1)
+    out_y = np.empty_like(out_x)
+    out_y[:, 0::2] = lo
+    out_y[:, 1::2] = hi
+    return out_x, out_y
+
+
+def layout_waterfall(frequency: np.ndarray, spectrum: np.ndarray,
+                     x_min: float, x_max: float, z_min: float, z_max: float,
+                     angle: float, x_scale: float = X_SCALE,
+                     height: float = Y_HEIGHT) -> WaterfallLayout:
+    """
+    스펙트럼 행렬을 워터폴 화면 좌표로 변환합니다.
+
+    인자:
+        frequency, spectrum: stack_spectra 결과.
+        x_min, x_max: 표시 주파수 범위.
+        z_min, z_max: 표시 진폭 범위 (같거나 뒤집히면 전체 스펙트럼 최댓값으로 정규화).
+        angle: 파일 간 오프셋 방향 (도).
+        x_scale, height: 화면 좌표 폭/높이.
+
+    반환:
+        WaterfallLayout. 범위 안 포인트가 있는 열만 포함합니다.
+    """
+    n = spectrum.shape[0]
+    x_range = x_max - x_min
+    if z_max > z_min:
+        peak = None
+    else:
+        peak = np.nanmax(spectrum) if np.isfinite(spectrum).any() else 0.0
+        peak = peak if peak > 0 else 1.0
+    with np.errstate(invalid='ignore'):
+        visible = (frequency >= x_min) & (frequency <= x_max) & np.isfinite(spectrum)
+    if x_range <= 0:
+        visible = np.zeros_like(visible)
+
+    cols = np.flatnonzero(visible.any(axis=0))
+    if len(cols):
+        cols = slice(int(cols[0]), int(cols[-1]) + 1)
+        frequency, spectrum, visible = frequency[:, cols], spectrum[:, cols], visible[:, cols]
+    else:
+        frequency = spectrum = np.empty((n, 0))
+        visible = np.zeros((n, 0), dtype=bool)
+
+    if peak is None:
+        y_normalized = (np.clip(spectrum, z_min, z_max) - z_min) / (z_max - z_min)
+    else:
+        y_normalized = spectrum / peak
+
+    offset = height / max(n, 1)
+    angle_rad = np.deg2rad(angle)
+    base = np.arange(n, dtype=np.float64)[:, None] * offset
+    x = (frequency - x_min) / (x_range if x_range > 0 else 1.0) * x_scale + base * np.cos(angle_rad)
+    y = y_normalized * height + base * np.sin(angle_rad)
+    x[~visible] = np.nan
+    y[~visible] = np.nan
+    return WaterfallLayout(x, y, frequency, spectrum, visible)
+
+
+def picking_points(layout: WaterfallLayout, file_names: Sequence[str],
+                   per_row: int = PICKS_PER_ROW) -> WaterfallPoints:
+    """
+    행마다 보이는 포인트를 약 per_row개 간격으로 골라 피킹 포인트를 만듭니다.
+
+    간격은 행의 보이는 포인트 수 // per_row (최소 1)이며 각 행의 첫 포인트부터 고릅니다.
+    """
+    visible = layout.visible
+    counts = visible.sum(axis=1)
+    step = np.maximum(1, counts // per_row)[:, None]
+    rank = np.cumsum(visible, axis=1) - 1
+    rows, cols = np.nonzero(visible & (rank % step == 0))
+    return WaterfallPoints(
+        layout.x[rows, cols], layout.y[rows, cols],
+        layout.frequency[rows, cols], layout.amplitude[rows, cols],
+        rows, list(file_names)
+    )
+
+
+def global_extents(frequency: np.ndarray, spectrum: np.ndarray) -> Optional[Tuple[float, float, float, float]]:
+    """
+    (freq_min, freq_max, amp_min, amp_max). 유효한 값이 없으면 None.
+
+    fmin/fmax 축소는 NaN을 건너뛰며 복사본을 만들지 않으므로 memmap 행렬도 한 번만 읽습니다.
+    """
+    if spectrum.size == 0:
+        return None
+    amp_min = float(np.fmin.reduce(spectrum, axis=None))
+    amp_max = float(np.fmax.reduce(spectrum, axis=None))
+    if np.isnan(amp_min):
+        return None
+    return (float(np.fmin.reduce(frequency, axis=None)), float(np.fmax.reduce(frequency, axis=None)),
+            amp_min, amp_max)
+
+
+def frequency_axis(frequency: np.ndarray) -> np.ndarray:
+    """
+    stack_spectra 주파수 행렬의 공통 주파수 축.
+
+    Δf가 같으면 길이가 다른 행도 같은 격자의 앞부분이므로 가장 긴 행을 사용합니다.
+    """
+    if frequency.ndim == 1:
+        return frequency
+    if frequency.shape[0] == 0:
+        return np.empty(0)
+    if frequency.strides[0] == 0:
+        return frequency[0]
+    return frequency[int(np.argmax(np.isfinite(frequency).sum(axis=1)))]
+
+
+class SpectrumHeatmap:
+    """
+    시간(파일 행) × 주파수 스펙트럼 행렬의 최댓값 풀링 이미지 소스.
+
+    y 좌표는 행 인덱스(0 = 첫 파일), x 좌표는 주파수입니다. query()는 보이는 구간을
+    픽셀 수에 맞춘 블록으로 나눠 블록별 최댓값(NaN 무시)을 반환합니다. 블록 경계를
+    블록 크기의 배수에 맞추므로 팬할 때 이미지가 흔들리지 않습니다.
+
+    인자:
+        frequency: 주파수 축 (오름차순, 등간격).
+        spectrum: (n_rows, n_bins) 행렬. np.memmap이면 행 단위 청크로 읽습니다.
+        chunk_bytes: 한 번에 읽는 행렬 크기.
+    """
+
+    def __init__(self, frequency: np.ndarray, spectrum: np.ndarray,
+                 chunk_bytes: int = HEATMAP_CHUNK_BYTES):
+        self.frequency = np.asarray(frequency, dtype=np.float64)
+        self.spectrum = spectrum
+        self.chunk_bytes = chunk_bytes
+        n_bins = spectrum.shape[1]
+        self.df = float(self.frequency[1] - self.frequency[0]) if n_bins > 1 else 1.0
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.spectrum.shape
+
+    @property
+    def extent(self) -> Tuple[float, float, float, float]:
+        """전체 이미지 범위 (x0, x1, y0, y1)."""
+        n_rows, n_bins = self.shape
+        x0 = float(self.frequency[0]) - self.df / 2 if n_bins else 0.0
+        return x0, x0 + n_bins * self.df, -0.5, n_rows - 0.5
+
+    def query(self, x_min: float, x_max: float, y_min: float, y_max: float,
+              width: int, height: int) -> Tuple[np.ndarray, Tuple[float, float, float, float]]:
+        """
+        보이는 구간을 약 width × height 픽셀로 최댓값 풀링합니다.
+
+        반환:
+            (image, extent). image는 (rows, cols) float 배열이며 extent는
+            imshow(origin='lower') 범위 (x0, x1, y0, y1)입니다.
+        """
+        n_rows, n_bins = self.shape
+        x0, _, _, _ = self.extent
+        c0, c1 = self._index_range(x_min, x_max, x0, self.df, n_bins)
+        r0, r1 = self._index_range(y_min, y_max, -0.5, 1.0, n_rows)
+        cb = max(1, -(-(c1 - c0) // max(1, int(width))))
+        rb = max(1, -(-(r1 - r0) // max(1, int(height))))
+        c0, r0 = c0 - c0 % cb, r0 - r0 % rb
+
+        image = self._pool(r0, r1, c0, c1, rb, cb)
+        extent = (x0 + c0 * self.df, x0 + (c0 + image.shape[1] * cb) * self.df,
+                  r0 - 0.5, r0 - 0.5 + image.shape[0] * rb)
+        return image, extent
+
+    @staticmethod
+    def _index_range(lo: float, hi: float, origin: float, step: float, n: int) -> Tuple[int, int]:
+        """[lo, hi] 구간에 걸치는 셀 인덱스 범위 [i0, i1) (최소 1셀)."""
+        lo, hi = min(lo, hi), max(lo, hi)
+        i0 = min(max(0, int(np.floor((lo - origin) / step))), max(n - 1, 0))
+        i1 = max(min(n, int(np.ceil((hi - origin) / step))), i0 + 1)
+        return i0, min(i1, n)
+
+    def _pool(self, r0: int, r1: int, c0: int, c1: int, rb: int, cb: int) -> np.ndarray:
+        """[r0:r1, c0:c1]을 (rb, cb) 블록 최댓값으로 줄입니다 (행 청크 단위 읽기)."""
+        n_cols = -(-(c1 - c0) // cb)
+        n_out = -(-(r1 - r0) // rb)
+        image = np.full((n_out, n_cols), np.nan)
+        row_bytes = max(1, (c1 - c0) * self.spectrum.dtype.itemsize)
+        blocks_per_chunk = max(1, self.chunk_bytes // (row_bytes * rb))
+
+        for out0 in range(0, n_out, blocks_per_chunk):
+            out1 = min(n_out, out0 + blocks_per_chunk)
+            start, stop = r0 + out0 * rb, min(r1, r0 + out1 * rb)
+            # 원래 dtype(float32) 그대로 행 방향 -> 열 방향 순서로 줄임 (연속 메모리 우선)
+            chunk = np.asarray(self.spectrum[start:stop, c0:c1])
+            if chunk.dtype.kind != 'f':
+                chunk = chunk.astype(np.float64)
+            pad_rows = (out1 - out0) * rb - chunk.shape[0]
+            pad_cols = n_cols * cb - chunk.shape[1]
+            if pad_rows or pad_cols:
+                chunk = np.pad(chunk, ((0, pad_rows), (0, pad_cols)), constant_values=np.nan)
+            rows = np.fmax.reduce(chunk.reshape(out1 - out0, rb, n_cols * cb), axis=1)
+            image[out0:out1] = np.fmax.reduce(rows.reshape(out1 - out0, n_cols, cb), axis=2)
+        return image
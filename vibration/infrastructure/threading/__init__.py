@@ -1 +1,4 @@
 """Threading and concurrency utilities."""
+from .prefetcher import Prefetcher
+
+__all__ = ['Prefetcher']
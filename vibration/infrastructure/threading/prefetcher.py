@@ -0,0 +1,183 @@
+"""
+백그라운드 read-ahead 프리페처.
+
+다음에 필요할 가능성이 높은 항목(예: 파일 목록의 다음 N개 파일)을
+백그라운드 스레드에서 미리 로드해 둡니다. 메모리 예산을 초과하지 않도록
+완료된 결과의 바이트 수를 추적하며, 선택이 다른 곳으로 이동하면
+cancel()로 대기 중인 작업과 결과를 모두 폐기합니다.
+
+Qt 의존성 없음 - 순수 Python 구현.
+"""
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Prefetcher:
+    """
+    메모리 예산 기반 read-ahead 프리페처.
+
+    인자:
+        loader: 키를 받아 결과를 반환하는 함수 (워커 스레드에서 실행).
+        sizer: 결과의 메모리 사용량(바이트)을 반환하는 함수.
+        max_workers: 백그라운드 스레드 수.
+        memory_budget: 보관할 완료 결과의 최대 바이트 수.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Any],
+        sizer: Callable[[Any], int],
+        max_workers: int = 2,
+        memory_budget: int = 256 * 1024 * 1024
+    ):
+        self._loader = loader
+        self._sizer = sizer
+        self._max_workers = max_workers
+        self.memory_budget = memory_budget
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._futures: Dict[str, Future] = {}
+        self._sizes: Dict[str, int] = {}
+        self._memory_used = 0
+
+    def set_loader(self, loader: Callable[[str], Any]) -> None:
+        """
+        로더 함수를 교체합니다.
+
+        파라미터가 바뀐 로더로 교체되므로 기존 작업과 결과는 모두 폐기됩니다.
+        """
+        self.cancel()
+        self._loader = loader
+
+    def schedule(self, keys: Iterable[str]) -> int:
+        """
+        키 목록을 순서대로 프리페치 예약합니다.
+
+        이미 예약되었거나 완료된 키는 건너뜁니다. 메모리 예산이 가득 차면
+        남은 키는 예약하지 않습니다.
+
+        인자:
+            keys: 프리페치할 키 목록 (우선순위 순).
+
+        반환:
+            새로 예약된 작업 수.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="prefetch"
+            )
+
+        submitted = []
+        with self._lock:
+            generation = self._generation
+            for key in keys:
+                if key in self._futures:
+                    continue
+                if self._memory_used + self._estimated_pending_bytes() >= self.memory_budget:
+                    break
+                future = self._executor.submit(self._loader, key)
+                self._futures[key] = future
+                submitted.append((key, future))
+
+        # 이미 완료된 future는 add_done_callback 시점에 콜백이 즉시 호출되므로
+        # 락을 해제한 뒤 등록해야 함 (_on_done이 같은 락을 획득)
+        for key, future in submitted:
+            future.add_done_callback(
+                lambda f, k=key, g=generation: self._on_done(k, g, f)
+            )
+
+        if submitted:
+            logger.debug(f"Prefetch scheduled: {len(submitted)} items")
+        return len(submitted)
+
+    def take(self, key: str, timeout: Optional[float] = None) -> Optional[Any]:
+        """
+        프리페치된 결과를 꺼냅니다.
+
+        작업이 진행 중이면 timeout까지 기다립니다. 예약되지 않았거나
+        실패/폐기/시간 초과된 경우 None을 반환하며, 호출자는 직접 로드해야
+        합니다. 시간 초과된 작업의 결과는 보관하지 않습니다.
+
+        인자:
+            key: 꺼낼 키.
+            timeout: 진행 중인 작업의 최대 대기 시간 (초, None이면 무제한).
+
+        반환:
+            로더 결과 또는 None.
+        """
+        with self._lock:
+            future = self._futures.get(key)
+        if future is None:
+            return None
+
+        try:
+            result = future.result(timeout=timeout)
+        except Exception as e:
+            logger.debug(f"Prefetch miss for {key}: {e}")
+            result = None
+
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+                self._memory_used -= self._sizes.pop(key, 0)
+        if result is None:
+            future.cancel()
+        return result
+
+    def cancel(self) -> None:
+        """대기 중인 작업을 취소하고 보관 중인 결과를 모두 폐기합니다."""
+        with self._lock:
+            self._generation += 1
+            for future in self._futures.values():
+                future.cancel()
+            dropped = len(self._futures)
+            self._futures.clear()
+            self._sizes.clear()
+            self._memory_used = 0
+        if dropped:
+            logger.debug(f"Prefetch cancelled: {dropped} items dropped")
+
+    def shutdown(self) -> None:
+        """프리페처를 종료합니다."""
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    @property
+    def memory_used(self) -> int:
+        """완료된 결과가 차지하는 바이트 수를 반환합니다."""
+        return self._memory_used
+
+    def _estimated_pending_bytes(self) -> int:
+        """진행 중인 작업의 예상 바이트 수 (완료 결과 평균 크기 기준)."""
+        if not self._sizes:
+            return 0
+        pending = len(self._futures) - len(self._sizes)
+        return pending * (self._memory_used // len(self._sizes))
+
+    def _on_done(self, key: str, generation: int, future: Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        try:
+            size = int(self._sizer(future.result()))
+        except Exception:
+            size = 0
+
+        with self._lock:
+            if generation != self._generation or self._futures.get(key) is not future:
+                return
+            if self._memory_used + size > self.memory_budget:
+                # 예산 초과 결과는 보관하지 않음 (take 시 직접 로드)
+                del self._futures[key]
+                logger.debug(f"Prefetch result dropped (over budget): {key}")
+                return
+            self._sizes[key] = size
+            self._memory_used += size
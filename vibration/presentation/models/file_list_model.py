@@ -3,12 +3,19 @@
 
 테이블 뷰에 파일 메타데이터를 표시하는 QAbstractTableModel.
 cn_3F_trend_optimized.py Tab 1에서 모듈화 아키텍처를 위해 추출.
+
+그룹 데이터는 컬럼형 FileTable에 보관하고, 표시 순서는 행 인덱스 순열
+(필터 마스크 + argsort 정렬)로 관리합니다. 표시 문자열과 배경색은 set_files 때
+컬럼 단위로 미리 만들어 data()는 배열 조회만 합니다. 체크 상태는 불리언 배열입니다.
 """
 from typing import List, Dict, Any, Optional
 
+import numpy as np
 from PyQt5.QtCore import QAbstractTableModel, Qt, QModelIndex
 from PyQt5.QtGui import QBrush, QColor
 
+from vibration.core.services.file_table import FileTable
+
 COL_DATE = 0
 COL_TIME = 1
 COL_COUNT = 2
@@ -22,27 +29,84 @@ COL_SELECT = 8
 ANOMALY_RED = QColor(255, 180, 180)
 ANOMALY_YELLOW = QColor(255, 255, 180)
 
+# 열 -> FileTable 정렬 키 (Select 열은 정렬하지 않음)
+SORT_KEYS = {
+    COL_DATE: 'date',
+    COL_TIME: 'time',
+    COL_COUNT: 'count',
+    COL_CH: 'channel',
+    COL_FS: 'sampling_rate',
+    COL_SENSITIVITY: 'sensitivity',
+    COL_FILES: 'files',
+    COL_STATUS: 'status',
+}
+
 
 class FileListModel(QAbstractTableModel):
     """
     파일 목록 테이블 모델.
     
     날짜, 시간, 개수, 파일명으로 그룹화된 파일 데이터를 표시합니다.
-    다중 파일 작업을 위한 체크박스 선택을 지원합니다.
+    다중 파일 작업을 위한 체크박스 선택, 열 정렬, 날짜/채널/Fs/이상 상태 필터를 지원합니다.
+    행 인덱스 인자(get_row_data, remove_rows 등)는 화면에 보이는 행 기준입니다.
     """
     
     def __init__(self, parent=None):
         """파일 목록 모델을 초기화합니다."""
         super().__init__(parent)
-        self._data: List[Dict[str, Any]] = []
         self._headers = ['Date', 'Time', 'Count', 'Ch', 'Fs(Hz)', 'Sensitivity', 'Files', 'Status', 'Select']
-        self._checked_rows: set = set()
+        self._brushes = {'error': QBrush(ANOMALY_RED), 'warning': QBrush(ANOMALY_YELLOW)}
+        self._filter: Dict[str, Any] = {}
+        self._sort: Optional[tuple] = None
+        self._set_table(FileTable.from_records([]))
+    
+    def _set_table(self, table: FileTable, checked: Optional[np.ndarray] = None) -> None:
+        """테이블을 교체하고 표시 배열/필터/정렬을 다시 계산합니다 (리셋 구간 안에서 호출)."""
+        self._table = table
+        self._checked = checked if checked is not None else np.zeros(len(table), dtype=bool)
+        self._display = self._build_display(table)
+        anomaly_type = table.column('anomaly_type')
+        self._background = np.full(len(table), None, dtype=object)
+        anomalous = table.column('is_anomaly')
+        self._background[anomalous] = self._brushes['warning']
+        self._background[anomalous & (anomaly_type == 'error')] = self._brushes['error']
+        self._update_order()
+    
+    @staticmethod
+    def _build_display(table: FileTable) -> List[Optional[np.ndarray]]:
+        """열별 표시 문자열 (object 배열, 행은 테이블 순서)."""
+        def text(values) -> np.ndarray:
+            return np.asarray(values, dtype=str).astype(object)
+        
+        sr = table.column('sampling_rate')
+        fs_text = np.full(len(table), '', dtype=object)
+        fs_text[sr != 0] = text(np.round(sr[sr != 0]).astype(np.int64))
+        files_text = np.array([', '.join(files) for files in table.column('files')], dtype=object)
+        return [
+            text(table.column('date')),
+            text(table.column('time')),
+            text(table.column('count')),
+            text(table.column('channel')),
+            fs_text,
+            text(table.column('sensitivity')),
+            files_text,
+            np.where(table.column('is_anomaly'), 'Anomaly', 'OK').astype(object),
+            None,
+        ]
+    
+    def _update_order(self) -> None:
+        """필터 마스크와 정렬 키로 화면 행 -> 테이블 행 순열을 계산합니다."""
+        rows = np.flatnonzero(self._table.mask(**self._filter))
+        if self._sort is not None:
+            key, descending = self._sort
+            rows = rows[self._table.sort_order(key, rows, descending)]
+        self._order = rows
     
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """행 수를 반환합니다."""
         if parent.isValid():
             return 0
-        return len(self._data)
+        return len(self._order)
     
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """열 수를 반환합니다."""
@@ -58,44 +122,20 @@ class FileListModel(QAbstractTableModel):
         row = index.row()
         col = index.column()
         
-        if row >= len(self._data):
+        if row >= len(self._order):
             return None
         
-        row_data = self._data[row]
+        table_row = self._order[row]
         
         if role == Qt.DisplayRole:
-            if col == COL_DATE:
-                return row_data.get('date', '')
-            elif col == COL_TIME:
-                return row_data.get('time', '')
-            elif col == COL_COUNT:
-                return str(row_data.get('count', 0))
-            elif col == COL_CH:
-                return row_data.get('channel', '')
-            elif col == COL_FS:
-                sr = row_data.get('sampling_rate', 0.0)
-                return f"{sr:.0f}" if sr else ''
-            elif col == COL_SENSITIVITY:
-                return row_data.get('sensitivity', '')
-            elif col == COL_FILES:
-                files = row_data.get('files', [])
-                return ', '.join(files) if isinstance(files, list) else str(files)
-            elif col == COL_STATUS:
-                if row_data.get('is_anomaly', False):
-                    return 'Anomaly'
-                return 'OK'
-            elif col == COL_SELECT:
-                return None
+            column = self._display[col]
+            return column[table_row] if column is not None else None
         
         elif role == Qt.CheckStateRole and col == COL_SELECT:
-            return Qt.Checked if row in self._checked_rows else Qt.Unchecked
+            return Qt.Checked if self._checked[table_row] else Qt.Unchecked
         
         elif role == Qt.BackgroundRole:
-            if row_data.get('is_anomaly', False):
-                anomaly_type = row_data.get('anomaly_type', 'warning')
-                if anomaly_type == 'error':
-                    return QBrush(ANOMALY_RED)
-                return QBrush(ANOMALY_YELLOW)
+            return self._background[table_row]
         
         return None
     
@@ -105,11 +145,7 @@ class FileListModel(QAbstractTableModel):
             return False
         
         if role == Qt.CheckStateRole and index.column() == COL_SELECT:
-            row = index.row()
-            if value == Qt.Checked:
-                self._checked_rows.add(row)
-            else:
-                self._checked_rows.discard(row)
+            self._checked[self._order[index.row()]] = value == Qt.Checked
             self.dataChanged.emit(index, index, [Qt.CheckStateRole])
             return True
         return False
@@ -132,6 +168,35 @@ class FileListModel(QAbstractTableModel):
                 return self._headers[section]
         return None
     
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """열 기준으로 정렬합니다 (argsort, Select 열은 무시)."""
+        key = SORT_KEYS.get(column)
+        if key is None:
+            return
+        self.layoutAboutToBeChanged.emit()
+        self._sort = (key, order == Qt.DescendingOrder)
+        self._update_order()
+        self.layoutChanged.emit()
+    
+    def set_filter(self, date_from=None, date_to=None, channels=None,
+                   sampling_rates=None, anomaly: Optional[bool] = None) -> None:
+        """
+        표시할 행을 필터링합니다 (None 조건은 적용하지 않음).
+        
+        인자:
+            date_from, date_to: 날짜 범위 ('YYYY-MM-DD' 또는 date, 포함)
+            channels: 포함할 채널 이름 목록
+            sampling_rates: 포함할 샘플링 레이트 목록
+            anomaly: True면 이상 그룹만, False면 정상 그룹만
+        """
+        self.beginResetModel()
+        self._filter = {name: value for name, value in (
+            ('date_from', date_from), ('date_to', date_to), ('channels', channels),
+            ('sampling_rates', sampling_rates), ('anomaly', anomaly)
+        ) if value is not None}
+        self._update_order()
+        self.endResetModel()
+    
     def set_files(self, files: List[Dict[str, Any]]) -> None:
         """
         파일 목록을 업데이트합니다.
@@ -140,65 +205,55 @@ class FileListModel(QAbstractTableModel):
             files: date, time, count, files 키를 포함하는 딕셔너리 목록
         """
         self.beginResetModel()
-        self._data = files
-        self._checked_rows.clear()
+        self._set_table(FileTable.from_records(files))
         self.endResetModel()
     
+    def get_table(self) -> FileTable:
+        """전체 (필터 전) 컬럼형 테이블을 반환합니다."""
+        return self._table
+    
     def get_files(self) -> List[Dict[str, Any]]:
         """현재 파일 목록을 반환합니다."""
-        return self._data.copy()
+        return self._table.records()
     
     def get_row_data(self, row: int) -> Optional[Dict[str, Any]]:
-        """특정 행의 데이터를 반환합니다."""
-        if 0 <= row < len(self._data):
-            return self._data[row]
+        """특정 (화면) 행의 데이터를 반환합니다."""
+        if 0 <= row < len(self._order):
+            return self._table.record(int(self._order[row]))
         return None
     
     def get_checked_rows(self) -> List[int]:
-        """체크된 행 인덱스 목록을 반환합니다."""
-        return sorted(self._checked_rows)
+        """체크된 화면 행 인덱스 목록을 반환합니다."""
+        return np.flatnonzero(self._checked[self._order]).tolist()
     
     def get_checked_files(self) -> List[str]:
-        """체크된 행의 파일명 목록을 반환합니다."""
-        result = []
-        for row in sorted(self._checked_rows):
-            if row < len(self._data):
-                files = self._data[row].get('files', [])
-                if isinstance(files, list):
-                    result.extend(files)
-                else:
-                    result.append(str(files))
-        return result
+        """체크된 (보이는) 행의 파일명 목록을 시간순으로 반환합니다."""
+        visible = np.zeros(len(self._table), dtype=bool)
+        visible[self._order] = True
+        return self._table.files_of(np.flatnonzero(self._checked & visible))
     
     def set_all_checked(self, checked: bool) -> None:
-        """모든 행을 체크하거나 해제합니다."""
+        """보이는 모든 행을 체크하거나 해제합니다."""
         self.beginResetModel()
-        if checked:
-            self._checked_rows = set(range(len(self._data)))
-        else:
-            self._checked_rows.clear()
+        self._checked[self._order] = checked
         self.endResetModel()
     
     def toggle_all(self) -> None:
         """모든 체크박스를 토글합니다."""
-        all_checked = len(self._checked_rows) == len(self._data)
+        all_checked = bool(self._checked[self._order].all())
         self.set_all_checked(not all_checked)
     
     def remove_rows(self, rows: List[int]) -> None:
-        """지정된 행들을 제거합니다."""
-        for row in sorted(rows, reverse=True):
-            if 0 <= row < len(self._data):
-                self.beginRemoveRows(QModelIndex(), row, row)
-                self._data.pop(row)
-                self._checked_rows.discard(row)
-                updated = set()
-                for r in self._checked_rows:
-                    if r > row:
-                        updated.add(r - 1)
-                    elif r < row:
-                        updated.add(r)
-                self._checked_rows = updated
-                self.endRemoveRows()
+        """지정된 (화면) 행들을 제거합니다 (keep 마스크로 모든 컬럼을 한 번에 잘라냄)."""
+        rows = np.asarray(rows, dtype=np.int64)
+        rows = rows[(rows >= 0) & (rows < len(self._order))]
+        if not len(rows):
+            return
+        keep = np.ones(len(self._table), dtype=bool)
+        keep[self._order[rows]] = False
+        self.beginResetModel()
+        self._set_table(self._table.take(keep), self._checked[keep])
+        self.endResetModel()
 
 
 if __name__ == "__main__":
@@ -226,7 +281,7 @@ if __name__ == "__main__":
     
     check_idx = model.index(0, COL_SELECT)
     model.setData(check_idx, Qt.Checked, Qt.CheckStateRole)
-    assert 0 in model._checked_rows, "Row 0 should be checked"
+    assert model.get_checked_rows() == [0], "Row 0 should be checked"
     
     checked_files = model.get_checked_files()
     assert checked_files == ['a.txt', 'b.txt', 'c.txt'], f"Unexpected: {checked_files}"
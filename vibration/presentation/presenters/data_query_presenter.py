@@ -11,6 +11,8 @@ from typing import Optional, List, Dict, Any
 from pathlib import Path
 from collections import defaultdict, Counter
 
+import numpy as np
+
 from vibration.core.services.file_parser import FileParser
 from vibration.core.services.file_service import FileService
 from vibration.core.services.project_service import ProjectService
@@ -251,40 +253,39 @@ class DataQueryPresenter:
         
         self._directory_path = project_data.parent_folder
         self.view.set_directory(self._directory_path)
+        self._event_bus.directory_selected.emit(self._directory_path)
         self._measurement_type = project_data.measurement_type
         self.view.set_measurement_type(self._measurement_type)
         
-        grouped = []
-        file_groups: Dict[tuple, List] = defaultdict(list)
-        for fi in project_data.files:
-            key = (fi.date, fi.time)
-            file_groups[key].append(fi)
+        # 컬럼형 파일 테이블: 경로는 한 번에 디코딩하고 그룹은 (날짜, 시각) 코드로 나눔
+        table = project_data.files
+        relative_paths = table.relative_paths()
+        channel_codes = table.column('channel')
+        channel_values = table.categories('channel')
+        sampling_rates = table.column('sampling_rate')
+        is_anomaly = table.column('is_anomaly')
         
-        for (date_str, time_str), file_infos in sorted(file_groups.items()):
-            files = []
-            file_paths = []
-            channels = set()
-            for fi in file_infos:
-                fname = Path(fi.relative_path).name
-                files.append(fname)
-                file_paths.append(
-                    os.path.join(self._directory_path, fi.relative_path)
-                )
-                if fi.channel:
-                    channels.add(fi.channel)
+        grouped = []
+        for date_str, time_str, rows in table.groups():
+            rels = [relative_paths[row] for row in rows]
+            files = [os.path.basename(rel) for rel in rels]
+            file_paths = [os.path.join(self._directory_path, rel) for rel in rels]
+            channels = {channel_values[code] for code in np.unique(channel_codes[rows])}
+            channels.discard('')
             
-            first = file_infos[0]
+            first = int(rows[0])
+            anomaly = bool(is_anomaly[first])
             grouped.append({
                 'date': date_str,
                 'time': time_str,
                 'count': len(files),
                 'channel': ', '.join(sorted(channels)),
-                'sampling_rate': first.sampling_rate,
-                'sensitivity': first.sensitivity,
+                'sampling_rate': float(sampling_rates[first]),
+                'sensitivity': table.value('sensitivity', first),
                 'files': files,
                 'file_paths': file_paths,
-                'is_anomaly': first.is_anomaly,
-                'anomaly_type': 'warning' if first.is_anomaly else '',
+                'is_anomaly': anomaly,
+                'anomaly_type': 'warning' if anomaly else '',
             })
         
         self._grouped_data = grouped
@@ -12,7 +12,9 @@ from typing import List, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from vibration.core.services.peak_service import PeakService, ViewType
+from vibration.core.services.file_catalog import FileCatalog, catalog_for
 from vibration.core.services.file_service import FileService
+from vibration.core.services.project_result_store import ProjectResultStore
 from vibration.core.domain.models import TrendResult
 from vibration.presentation.views.tabs.peak_tab import PeakTabView
 from vibration.presentation.views.dialogs.progress_dialog import ProgressDialog
@@ -44,6 +46,7 @@ class PeakPresenter:
         
         self._file_paths: List[str] = []
         self._directory_path: str = ""
+        self._catalog = FileCatalog([])
         self._current_view_type: str = 'ACC'
         self._last_result: Optional[TrendResult] = None
         self._progress_dialog: Optional[ProgressDialog] = None
@@ -52,10 +55,14 @@ class PeakPresenter:
             'result': None,
             'params': {}
         }
+        # 저장/로드한 프로젝트의 결과 저장소 (연산 결과를 results/peak에 기록)
+        self._result_store: Optional[ProjectResultStore] = None
         
         self._event_bus = get_event_bus()
         self._event_bus.files_loaded.connect(self._on_files_loaded)
         self._event_bus.directory_selected.connect(self._on_directory_selected)
+        self._event_bus.project_saved.connect(self._on_project_saved)
+        self._event_bus.project_loaded.connect(self._on_project_loaded)
         
         self._connect_signals()
         logger.debug("PeakPresenter initialized")
@@ -65,6 +72,7 @@ class PeakPresenter:
         self.view.view_type_changed.connect(self._on_view_type_changed)
         self.view.save_requested.connect(self._on_save_requested)
         self.view.list_save_requested.connect(self._on_list_save_requested)
+        self.view.channel_filter_changed.connect(self._apply_file_filter)
     
     def load_files(self, file_paths: List[str]) -> None:
         self._file_paths = list(file_paths)
@@ -142,6 +150,7 @@ class PeakPresenter:
                 'params': current_params
             }
             self._update_view_with_result(result)
+            self._save_to_project()
             
             logger.info(f"Computed peak trend for {result.num_files} files, view_type={view_type_str}")
             
@@ -209,13 +218,58 @@ class PeakPresenter:
     
     def _on_files_loaded(self, files: List[str]) -> None:
         logger.info(f"Received {len(files)} files from Data Query")
+        self._catalog = catalog_for(files)
         self.view.set_files(files)
+        if self.view.get_selected_channels():
+            self._apply_file_filter()
+    
+    def _apply_file_filter(self) -> None:
+        """공유 파일 카탈로그로 채널 필터를 적용해 목록을 다시 표시합니다."""
+        filtered = self._catalog.select(channels=self.view.get_selected_channels())
+        self.view.show_files(filtered)
+        logger.info(f"Channel filter applied: {len(filtered)}/{len(self._catalog)} files")
     
     def _on_directory_selected(self, directory: str) -> None:
         self._directory_path = directory
         self.view.set_directory_path(directory)
         logger.info(f"Directory updated: {directory}")
     
+    def _on_project_saved(self, json_path: str) -> None:
+        self._result_store = ProjectResultStore.for_project_file(json_path)
+        self._save_to_project()
+    
+    def _on_project_loaded(self, json_path: str) -> None:
+        self._result_store = ProjectResultStore.for_project_file(json_path)
+        try:
+            restored = self._result_store.load_trend('peak')
+        except Exception as e:
+            logger.error(f"Failed to restore peak results: {e}")
+            return
+        if restored is None:
+            return
+        
+        result = restored['result']
+        self._last_result = result
+        self._peak_cache = {
+            'computed': True,
+            'result': result,
+            'params': restored['params']
+        }
+        self._current_view_type = result.view_type
+        self.view.set_view_type(result.view_type)
+        self._update_view_with_result(result)
+        logger.info(f"Restored peak trend for {result.num_files} files from project")
+    
+    def _save_to_project(self) -> None:
+        if self._result_store is None or not self._peak_cache.get('computed'):
+            return
+        try:
+            self._result_store.save_trend(
+                'peak', self._peak_cache['result'], self._peak_cache['params']
+            )
+        except Exception as e:
+            logger.error(f"Failed to save peak results to project: {e}")
+    
     def _on_list_save_requested(self, channel_files: dict, directory_path: str) -> None:
         try:
             dialog = ListSaveDialog(
@@ -6,19 +6,23 @@ SpectrumTabView와 FFTService를 조율하여 스펙트럼 분석 워크플로
 """
 import logging
 import os
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Dict, Optional, List, Tuple
 
 import numpy as np
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication
 
+from vibration.core.services.byte_lru_cache import ByteBudgetLRUCache
 from vibration.core.services.fft_service import FFTService
+from vibration.core.services.file_catalog import FileCatalog, catalog_for
 from vibration.core.services.file_service import FileService
 from vibration.core.domain.models import FFTResult, SignalData
 from vibration.presentation.views.tabs.spectrum_tab import SpectrumTabView
 from vibration.presentation.views.dialogs import ProgressDialog
 from vibration.presentation.views.dialogs.spectrum_window import SpectrumWindow
 from vibration.infrastructure.event_bus import get_event_bus
+from vibration.infrastructure.threading import Prefetcher
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +30,17 @@ logger = logging.getLogger(__name__)
 VIEW_TYPE_INT_TO_STR = {1: 'ACC', 2: 'VEL', 3: 'DIS'}
 VIEW_TYPE_STR_TO_INT = {'ACC': 1, 'VEL': 2, 'DIS': 3}
 
+# 파일 로드 + FFT 병렬 스레드 수 (scipy.fft / NumPy 파싱은 대부분 GIL 해제)
+LOAD_MAX_WORKERS = max(1, min(8, os.cpu_count() or 1))
+
+# Next 탐색 read-ahead: 미리 로드할 파일 수와 보관 메모리 예산
+PREFETCH_DEPTH = 3
+PREFETCH_MEMORY_BUDGET = 256 * 1024 * 1024
+# Next 클릭 시 진행 중인 프리페치를 GUI 스레드에서 기다리는 최대 시간 (초)
+PREFETCH_TAKE_TIMEOUT = 0.05
+# 계산 완료(SignalData, FFTResult) 캐시의 메모리 예산 (LRU 제거)
+COMPUTED_CACHE_BUDGET = 512 * 1024 * 1024
+
 
 class SpectrumPresenter:
     """
@@ -47,10 +62,27 @@ class SpectrumPresenter:
         self._signal_data_list: List[SignalData] = []
         self._last_results: List[FFTResult] = []
         self._directory_path: str = ""
+        # 사용자 감도(mV/g). 캐시/플롯 원본은 감도 미적용 상태로 보관하고
+        # 렌더링 시 _sensitivity_scale()을 곱합니다 (스펙트럼은 입력 스케일에 선형).
         self._custom_sensitivity: Optional[float] = None
         self._all_files: List[str] = []
+        self._catalog = FileCatalog([])
+        self._date_filter: Optional[Tuple[str, str]] = None
         self._spectrum_windows: List[SpectrumWindow] = []
-        self._computed_cache: Dict[str, Tuple[SignalData, FFTResult]] = {}
+        # filename -> (SignalData, FFTResult), 감도 미적용
+        self._computed_cache = ByteBudgetLRUCache(
+            COMPUTED_CACHE_BUDGET, name="spectrum_computed"
+        )
+        self._prefetcher = Prefetcher(
+            loader=self._prefetch_loader(),
+            sizer=self._outcome_nbytes,
+            memory_budget=PREFETCH_MEMORY_BUDGET
+        )
+        # filename -> STFTFrameIndex Future (플롯 후 백그라운드 계산, 구간 스펙트럼용)
+        self._frame_indexes: Dict[str, Future] = {}
+        self._frame_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="stft-frames"
+        )
         
         self._event_bus = get_event_bus()
         self._event_bus.files_loaded.connect(self._on_files_loaded)
@@ -66,6 +98,7 @@ class SpectrumPresenter:
         self.view.next_file_requested.connect(self._on_next_file_requested)
         self.view.file_clicked.connect(self._on_file_clicked)
         self.view.date_filter_changed.connect(self._on_date_filter_changed)
+        self.view.channel_filter_changed.connect(self._apply_file_filter)
         self.view.Sensitivity_edit.returnPressed.connect(self._on_sensitivity_changed)
         self.view.refresh_requested.connect(self._on_compute_requested)
         self.view.close_all_windows_requested.connect(self._on_close_all_windows)
@@ -136,64 +169,69 @@ class SpectrumPresenter:
         self._last_results = []
         self._signal_data_list = []
         self._computed_cache.clear()
+        self._reset_prefetcher()
+        self._clear_frame_indexes()
         
         self._load_and_plot_files(selected_files)
+        self._schedule_prefetch()
     
     def _load_and_plot_files(self, filenames: List[str]) -> None:
-        """파일 로드 → FFT → 플롯. 결과를 _computed_cache에 축적."""
-        nfft = self.fft_service._engine.nfft
-        skipped_files: List[Tuple[str, int]] = []
-        computed_batch: List[Tuple[str, SignalData, FFTResult]] = []
+        """
+        파일 로드 → FFT → 플롯. 결과를 _computed_cache에 축적.
+        
+        로드 + FFT 단계는 스레드 풀에서 병렬 실행하고, 결과는 선택 순서대로
+        수집합니다. 플롯은 GUI 스레드에서만 수행합니다.
+        """
+        nfft = self._current_nfft()
+        outcomes: Dict[int, Tuple[Optional[SignalData], Optional[FFTResult], int]] = {}
         
         progress_dialog = ProgressDialog(len(filenames), self.view)
         progress_dialog.setWindowModality(Qt.WindowModal)
         progress_dialog.show()
+        QApplication.processEvents()
         
         try:
-            for idx, filename in enumerate(filenames):
-                progress_dialog.update_progress(idx + 1)
-                QApplication.processEvents()
-                
-                filepath = os.path.join(self._directory_path, filename)
+            max_workers = max(1, min(LOAD_MAX_WORKERS, len(filenames)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_idx = {
+                    executor.submit(
+                        self._load_and_compute_file,
+                        filename, nfft, self._current_view_type
+                    ): idx
+                    for idx, filename in enumerate(filenames)
+                }
                 
-                if not os.path.exists(filepath):
-                    logger.warning(f"File not found: {filepath}")
-                    continue
-                
-                try:
-                    file_data = self.file_service.load_file(filepath)
-                    
-                    if not file_data['is_valid']:
-                        logger.warning(f"Invalid file: {filename}")
-                        continue
-                    
-                    raw_data = file_data['data']
-                    if self._custom_sensitivity is not None:
-                        raw_data = raw_data / (self._custom_sensitivity / 1000.0)
-                    
-                    if len(raw_data) < nfft:
-                        skipped_files.append((filename, len(raw_data)))
-                        logger.warning(
-                            f"Skipped {filename}: data length ({len(raw_data)}) "
-                            f"< NFFT ({nfft})"
-                        )
-                        continue
-                    
-                    signal_data = SignalData(
-                        data=raw_data,
-                        sampling_rate=file_data['sampling_rate'],
-                        signal_type='ACC',
-                        channel=filename
-                    )
-                    
-                    result = self._compute_single_signal(signal_data, self._current_view_type)
-                    computed_batch.append((filename, signal_data, result))
-                    
-                except Exception as e:
-                    logger.error(f"Error processing file {filename}: {e}")
+                for future in as_completed(future_to_idx):
+                    idx = future_to_idx[future]
+                    try:
+                        outcomes[idx] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error processing file {filenames[idx]}: {e}")
+                        outcomes[idx] = (None, None, 0)
+                    progress_dialog.update_progress(len(outcomes))
+                    QApplication.processEvents()
         finally:
             progress_dialog.close()
         
+        self._plot_outcomes(filenames, outcomes, nfft)
+    
+    def _plot_outcomes(
+        self,
+        filenames: List[str],
+        outcomes: Dict[int, Tuple[Optional[SignalData], Optional[FFTResult], int]],
+        nfft: int
+    ) -> None:
+        """로드 + FFT 결과를 선택 순서대로 플롯하고 길이 부족 파일을 경고합니다."""
+        skipped_files: List[Tuple[str, int]] = []
+        computed_batch: List[Tuple[str, SignalData, FFTResult]] = []
+        
+        for idx, filename in enumerate(filenames):
+            signal_data, result, data_length = outcomes.get(idx, (None, None, 0))
+            if result is not None:
+                computed_batch.append((filename, signal_data, result))
+            elif data_length > 0:
+                skipped_files.append((filename, data_length))
+        
         if skipped_files:
             skip_msg_lines = [
                 f"  - {fname} (길이: {dlen})"
@@ -212,40 +250,119 @@ class SpectrumPresenter:
             return
         
         plotted_count = len(self._last_results)
+        scale = self._sensitivity_scale()
         self.view.begin_batch()
         try:
             for filename, signal_data, result in computed_batch:
                 self._signal_data_list.append(signal_data)
                 self._last_results.append(result)
-                self._computed_cache[filename] = (signal_data, result)
-                
-                time_array = self._generate_time_array(
-                    len(signal_data.data), signal_data.sampling_rate
-                )
-                self.view.plot_waveform(
-                    time=time_array.tolist(),
-                    amplitude=signal_data.data.tolist(),
-                    label=filename,
-                    color_index=plotted_count,
-                    clear=(plotted_count == 0)
-                )
-                self.view.plot_spectrum(
-                    frequencies=result.frequency.tolist(),
-                    spectrum=result.spectrum.tolist(),
-                    label=filename,
-                    color_index=plotted_count,
-                    clear=(plotted_count == 0)
-                )
+                self._computed_cache.put(filename, (signal_data, result))
+                self._plot_signal(filename, signal_data, result, plotted_count, scale)
                 plotted_count += 1
         finally:
             self.view.end_batch()
         
+        for filename, signal_data, _ in computed_batch:
+            self._frame_indexes[filename] = self._frame_executor.submit(
+                self.fft_service.build_frame_index, signal_data.data
+            )
+        
         logger.info(
             f"Computed {len(computed_batch)} spectra, "
             f"total={len(self._last_results)}, "
             f"view_type={self._current_view_type}"
         )
     
+    def _plot_signal(self, filename: str, signal_data: SignalData, result: FFTResult,
+                     color_index: int, scale: float) -> None:
+        """감도 미적용 파형/스펙트럼에 scale을 곱해 플롯합니다."""
+        time_array = self._generate_time_array(
+            len(signal_data.data), signal_data.sampling_rate
+        )
+        self.view.plot_waveform(
+            time=time_array,
+            amplitude=signal_data.data * scale,
+            label=filename,
+            color_index=color_index,
+            clear=(color_index == 0)
+        )
+        self.view.plot_spectrum(
+            frequencies=result.frequency,
+            spectrum=result.spectrum * scale,
+            label=filename,
+            color_index=color_index,
+            clear=(color_index == 0)
+        )
+    
+    def _sensitivity_scale(self) -> float:
+        """사용자 감도에 따른 배율 (미설정 시 1.0). 기존 raw / (감도 / 1000)과 동일."""
+        if self._custom_sensitivity is None:
+            return 1.0
+        return 1000.0 / self._custom_sensitivity
+    
+    def _replot_scaled(self) -> None:
+        """플롯된 신호를 현재 감도로 다시 그립니다 (파일 재로드/FFT 없음)."""
+        if not self._signal_data_list:
+            return
+        
+        scale = self._sensitivity_scale()
+        self.view.begin_batch()
+        try:
+            for idx, (signal_data, result) in enumerate(
+                zip(self._signal_data_list, self._last_results)
+            ):
+                self._plot_signal(signal_data.channel, signal_data, result, idx, scale)
+        finally:
+            self.view.end_batch()
+        logger.info(f"Rescaled {len(self._last_results)} plotted signals (x{scale:g})")
+    
+    def _load_and_compute_file(
+        self,
+        filename: str,
+        nfft: int,
+        view_type: str
+    ) -> Tuple[Optional[SignalData], Optional[FFTResult], int]:
+        """
+        단일 파일을 로드하고 FFT를 계산합니다 (워커 스레드에서 실행).
+        
+        Qt 객체에 접근하지 않으므로 스레드 풀에서 안전하게 호출할 수 있습니다.
+        사용자 감도는 적용하지 않습니다 (렌더링 시 배율로 적용).
+        
+        반환:
+            (SignalData, FFTResult, 데이터 길이). 로드 실패 시 (None, None, 0),
+            데이터 길이가 NFFT보다 짧으면 (None, None, 데이터 길이).
+        """
+        filepath = os.path.join(self._directory_path, filename)
+        
+        if not os.path.exists(filepath):
+            logger.warning(f"File not found: {filepath}")
+            return None, None, 0
+        
+        file_data = self.file_service.load_file(filepath)
+        
+        if not file_data['is_valid']:
+            logger.warning(f"Invalid file: {filename}")
+            return None, None, 0
+        
+        raw_data = file_data['data']
+        
+        if len(raw_data) < nfft:
+            logger.warning(
+                f"Skipped {filename}: data length ({len(raw_data)}) "
+                f"< NFFT ({nfft})"
+            )
+            return None, None, len(raw_data)
+        
+        signal_data = SignalData(
+            data=raw_data,
+            sampling_rate=file_data['sampling_rate'],
+            signal_type='ACC',
+            channel=filename
+        )
+        
+        result = self._compute_single_signal(signal_data, view_type)
+        return signal_data, result, len(raw_data)
+    
     def _compute_single_signal(self, signal_data: SignalData,
                                 view_type: str) -> FFTResult:
         return self.fft_service.compute_spectrum(
@@ -273,6 +390,7 @@ class SpectrumPresenter:
         
         self._current_view_type = view_type_str
         self.view.set_view_type(view_type_str)
+        self._reset_prefetcher()
         
         logger.debug(f"View type changed to {view_type_str}")
     
@@ -289,6 +407,7 @@ class SpectrumPresenter:
             return
         
         self.fft_service.window_type = normalized
+        self._reset_prefetcher()
         logger.debug(f"Window type changed to {normalized}")
     
     def _on_next_file_requested(self) -> None:
@@ -322,14 +441,107 @@ class SpectrumPresenter:
         
         if next_filename in self._computed_cache:
             logger.debug(f"Cache hit: {next_filename}")
+            self._schedule_prefetch()
             return
         
-        self._load_and_plot_files([next_filename])
+        # 아직 로드 중이면 GUI 스레드를 붙잡지 않고 진행률 대화상자와 함께 직접 로드
+        prefetched = self._prefetcher.take(next_filename, timeout=PREFETCH_TAKE_TIMEOUT)
+        if prefetched is not None:
+            logger.debug(f"Prefetch hit: {next_filename}")
+            self._plot_outcomes([next_filename], {0: prefetched}, self._current_nfft())
+        else:
+            self._load_and_plot_files([next_filename])
+        self._schedule_prefetch()
         logger.info(
             f"Next: added {next_filename}, total plotted={len(self._last_results)}"
         )
     
+    def _clear_frame_indexes(self) -> None:
+        """대기 중인 프레임 인덱스 계산을 취소하고 보관 중인 인덱스를 폐기합니다."""
+        for future in self._frame_indexes.values():
+            future.cancel()
+        self._frame_indexes.clear()
+    
+    def _span_spectrum(self, signal: SignalData, i_start: int, i_end: int) -> FFTResult:
+        """
+        구간 스펙트럼을 계산합니다.
+        
+        프레임 인덱스가 준비되어 있으면 격자 프레임 평균 + 양 끝 프레임 FFT로,
+        아직 계산 중이거나 FFT 파라미터가 바뀌었으면 구간 전체를 직접 FFT합니다.
+        """
+        future = self._frame_indexes.get(signal.channel)
+        if future is not None and future.done() and not future.cancelled() \
+                and future.exception() is None:
+            index = future.result()
+            if index.key == self.fft_service.frame_index_key():
+                try:
+                    return self.fft_service.compute_span_spectrum(
+                        index, i_start, i_end,
+                        view_type=self._current_view_type,
+                        input_signal_type=signal.signal_type
+                    )
+                except ValueError:
+                    pass
+        
+        return self.fft_service.compute_spectrum(
+            data=signal.data[i_start:i_end],
+            view_type=self._current_view_type,
+            input_signal_type=signal.signal_type
+        )
+    
+    def _current_nfft(self) -> int:
+        """현재 FFT 서비스의 NFFT를 반환합니다."""
+        return self.fft_service.get_parameters()['nfft']
+    
+    def _reset_prefetcher(self) -> None:
+        """분석 파라미터 변경 시 프리페치 결과를 폐기하고 로더를 재생성합니다."""
+        self._prefetcher.set_loader(self._prefetch_loader())
+    
+    def _prefetch_loader(self):
+        """현재 FFT 파라미터를 고정한 프리페치 로더를 생성합니다."""
+        nfft = self._current_nfft()
+        view_type = self._current_view_type
+        return lambda filename: self._load_and_compute_file(filename, nfft, view_type)
+    
+    def _schedule_prefetch(self) -> None:
+        """마지막 선택 파일 다음의 PREFETCH_DEPTH개 파일을 백그라운드 로드합니다."""
+        if not self._directory_path:
+            return
+        
+        selected_items = self.view.file_list.selectedItems()
+        if not selected_items:
+            return
+        
+        start = self.view.file_list.row(selected_items[-1]) + 1
+        end = min(start + PREFETCH_DEPTH, self.view.file_list.count())
+        upcoming = []
+        for row in range(start, end):
+            item = self.view.file_list.item(row)
+            if item and item.text() not in self._computed_cache:
+                upcoming.append(item.text())
+        
+        if upcoming:
+            self._prefetcher.schedule(upcoming)
+    
+    @staticmethod
+    def _outcome_nbytes(
+        outcome: Tuple[Optional[SignalData], Optional[FFTResult], int]
+    ) -> int:
+        """프리페치 결과가 차지하는 배열 메모리(바이트)를 계산합니다."""
+        signal_data, result, _ = outcome
+        total = 0
+        if signal_data is not None:
+            total += signal_data.data.nbytes
+        if result is not None:
+            total += result.frequency.nbytes + result.spectrum.nbytes
+            if result.psd is not None:
+                total += result.psd.nbytes
+        return total
+    
     def _on_file_clicked(self, filename: str) -> None:
+        # 선택이 다른 곳으로 이동 → 진행 중인 read-ahead 폐기
+        self._prefetcher.cancel()
+        
         if not self._directory_path:
             logger.warning("No directory path set")
             return
@@ -358,40 +570,47 @@ class SpectrumPresenter:
                 
         except Exception as e:
             logger.error(f"Error loading file {filename}: {e}")
+        
+        self._schedule_prefetch()
     
     def _on_directory_selected(self, directory: str) -> None:
         self._directory_path = directory
+        self._prefetcher.cancel()
         logger.info(f"Directory path updated: {directory}")
     
     def _on_files_loaded(self, files: List[str]) -> None:
         logger.info(f"Received {len(files)} files from Data Query")
         self._all_files = list(files)
+        self._catalog = catalog_for(self._all_files)
+        self._prefetcher.cancel()
         self.view.set_files(files)
+        if self._date_filter or self.view.get_selected_channels():
+            self._apply_file_filter()
     
     def _on_date_filter_changed(self, from_date: str, to_date: str) -> None:
-        filtered = []
-        for filename in self._all_files:
-            try:
-                date_part = filename.split('_')[0]
-                if len(filename.split('_')) >= 2:
-                    date_part = filename.split('_')[0]
-                if from_date <= date_part <= to_date:
-                    filtered.append(filename)
-            except (IndexError, ValueError):
-                filtered.append(filename)
-        
-        self.view.Querry_list.clear()
-        self.view.Querry_list.addItems(filtered)
-        logger.info(f"Date filter applied: {from_date} ~ {to_date}, {len(filtered)}/{len(self._all_files)} files")
+        self._prefetcher.cancel()
+        self._date_filter = (from_date, to_date)
+        self._apply_file_filter()
+    
+    def _apply_file_filter(self) -> None:
+        """공유 파일 카탈로그로 날짜/채널 필터를 함께 적용해 목록을 다시 표시합니다."""
+        date_from, date_to = self._date_filter or (None, None)
+        filtered = self._catalog.select(date_from, date_to, self.view.get_selected_channels())
+        self.view.show_files(filtered)
+        logger.info(f"File filter applied: {date_from} ~ {date_to}, {len(filtered)}/{len(self._all_files)} files")
     
     def _on_sensitivity_changed(self) -> None:
         try:
             value = float(self.view.Sensitivity_edit.text())
+            if value <= 0:
+                raise ValueError(value)
             self._custom_sensitivity = value
             logger.info(f"Custom sensitivity set: {value} mV/g")
         except ValueError:
             self._custom_sensitivity = None
             logger.warning("Invalid sensitivity value, reset to default")
+        # 캐시/프리페치 결과는 감도 미적용이므로 그대로 두고 배율만 다시 적용
+        self._replot_scaled()
     
     def _on_close_all_windows(self) -> None:
         for window in self._spectrum_windows:
@@ -422,6 +641,7 @@ class SpectrumPresenter:
         
         window = SpectrumWindow(t_start, t_end)
         plotted_count = 0
+        scale = self._sensitivity_scale()
         
         for signal in self._signal_data_list:
             sr = signal.sampling_rate
@@ -434,18 +654,12 @@ class SpectrumPresenter:
                 logger.warning(f"Selected time range too short for {signal.channel}")
                 continue
             
-            segment = signal.data[i_start:i_end]
-            
             try:
-                result = self.fft_service.compute_spectrum(
-                    data=segment,
-                    view_type=self._current_view_type,
-                    input_signal_type=signal.signal_type
-                )
+                result = self._span_spectrum(signal, i_start, i_end).scaled(scale)
                 
                 window.plot_spectrum(
-                    frequencies=result.frequency.tolist(),
-                    spectrum=result.spectrum.tolist(),
+                    frequencies=result.frequency,
+                    spectrum=result.spectrum,
                     label=f"{signal.channel} [{t_start:.3f}s-{t_end:.3f}s]",
                     view_type=self._current_view_type,
                     color_index=plotted_count,
@@ -466,8 +680,9 @@ class SpectrumPresenter:
             window.close()
     
     def get_last_results(self) -> List[FFTResult]:
-        """마지막 연산 결과를 반환합니다."""
-        return self._last_results.copy()
+        """마지막 연산 결과를 현재 감도를 적용하여 반환합니다."""
+        scale = self._sensitivity_scale()
+        return [result.scaled(scale) for result in self._last_results]
     
     def get_current_view_type(self) -> str:
         """현재 뷰 타입을 문자열로 반환합니다."""
@@ -13,7 +13,9 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication
 
 from vibration.core.services.trend_service import TrendService
+from vibration.core.services.file_catalog import FileCatalog, catalog_for
 from vibration.core.services.file_service import FileService
+from vibration.core.services.project_result_store import ProjectResultStore
 from vibration.core.domain.models import TrendResult
 from vibration.presentation.views.tabs.trend_tab import TrendTabView
 from vibration.presentation.views.dialogs import ProgressDialog
@@ -43,6 +45,7 @@ class TrendPresenter:
         
         self._file_paths: List[str] = []
         self._directory_path: str = ""
+        self._catalog = FileCatalog([])
         self._current_view_type: str = 'ACC'
         self._last_result: Optional[TrendResult] = None
         self._trend_cache: dict = {
@@ -50,10 +53,14 @@ class TrendPresenter:
             'result': None,
             'params': {}
         }
+        # 저장/로드한 프로젝트의 결과 저장소 (연산 결과를 results/trend에 기록)
+        self._result_store: Optional[ProjectResultStore] = None
         
         self._event_bus = get_event_bus()
         self._event_bus.files_loaded.connect(self._on_files_loaded)
         self._event_bus.directory_selected.connect(self._on_directory_selected)
+        self._event_bus.project_saved.connect(self._on_project_saved)
+        self._event_bus.project_loaded.connect(self._on_project_loaded)
         
         self._connect_signals()
         logger.debug("TrendPresenter initialized")
@@ -65,6 +72,7 @@ class TrendPresenter:
         self.view.save_requested.connect(self._on_save_requested)
         self.view.list_save_requested.connect(self._on_list_save_requested)
         self.view.view_type_changed.connect(self._on_view_type_changed)
+        self.view.channel_filter_changed.connect(self._apply_file_filter)
     
     def load_files(self, file_paths: List[str]) -> None:
         """
@@ -152,6 +160,7 @@ class TrendPresenter:
                 'params': current_params
             }
             self._update_view_with_result(result)
+            self._save_to_project()
             
             logger.info(f"Computed trend for {result.num_files} files, view_type={view_type_str}")
             
@@ -226,7 +235,55 @@ class TrendPresenter:
     
     def _on_files_loaded(self, files: List[str]) -> None:
         logger.info(f"Received {len(files)} files from Data Query")
+        self._catalog = catalog_for(files)
         self.view.set_files(files)
+        if self.view.get_selected_channels():
+            self._apply_file_filter()
+    
+    def _apply_file_filter(self) -> None:
+        """공유 파일 카탈로그로 채널 필터를 적용해 목록을 다시 표시합니다."""
+        filtered = self._catalog.select(channels=self.view.get_selected_channels())
+        self.view.show_files(filtered)
+        logger.info(f"Channel filter applied: {len(filtered)}/{len(self._catalog)} files")
+    
+    def _on_project_saved(self, json_path: str) -> None:
+        """프로젝트 저장 시 현재 결과를 프로젝트 결과 저장소에 기록합니다."""
+        self._result_store = ProjectResultStore.for_project_file(json_path)
+        self._save_to_project()
+    
+    def _on_project_loaded(self, json_path: str) -> None:
+        """프로젝트 로드 시 저장된 트렌드 결과로 원본 파일을 읽지 않고 플롯을 복원합니다."""
+        self._result_store = ProjectResultStore.for_project_file(json_path)
+        try:
+            restored = self._result_store.load_trend('trend')
+        except Exception as e:
+            logger.error(f"Failed to restore trend results: {e}")
+            return
+        if restored is None:
+            return
+        
+        result = restored['result']
+        self._last_result = result
+        self._trend_cache = {
+            'computed': True,
+            'result': result,
+            'params': restored['params']
+        }
+        self._current_view_type = result.view_type
+        self.view.set_view_type(result.view_type)
+        self._update_view_with_result(result)
+        logger.info(f"Restored trend for {result.num_files} files from project")
+    
+    def _save_to_project(self) -> None:
+        """마지막 결과를 프로젝트 결과 저장소에 기록합니다 (프로젝트가 열려 있을 때만)."""
+        if self._result_store is None or not self._trend_cache.get('computed'):
+            return
+        try:
+            self._result_store.save_trend(
+                'trend', self._trend_cache['result'], self._trend_cache['params']
+            )
+        except Exception as e:
+            logger.error(f"Failed to save trend results to project: {e}")
     
     def _on_list_save_requested(self, channel_files: dict, directory_path: str) -> None:
         """
@@ -282,10 +339,6 @@ class TrendPresenter:
     def get_file_count(self) -> int:
         """로드된 파일 수를 반환합니다."""
         return len(self._file_paths)
-    
-    def _on_files_loaded(self, files: List[str]) -> None:
-        logger.info(f"Received {len(files)} files from Data Query")
-        self.view.set_files(files)
 
 
 if __name__ == "__main__":
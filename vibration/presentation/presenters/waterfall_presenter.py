@@ -2,21 +2,34 @@
 워터폴 분석 프레젠터 - WaterfallTabView와 분석 서비스를 조율합니다.
 
 축/각도 변경 시 불필요한 FFT 재연산을 방지하는 캐싱을 적용한
-plot_waterfall_spectrum 로직을 구현합니다. FFTService를 사용하여 주파수 분석을 수행합니다.
+plot_waterfall_spectrum 로직을 구현합니다. SpectrumBatchProcessor를 사용하여 주파수 분석을 수행합니다.
 """
 import logging
 import os
-import re
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, List, Dict, Any, cast, Union
+from typing import Optional, List, Dict, Any, Tuple, cast, Union
 
 import numpy as np
+import matplotlib
+from matplotlib.collections import LineCollection
+from matplotlib.colors import LogNorm, Normalize
+from matplotlib.ticker import FuncFormatter, MaxNLocator
 
 from vibration.presentation.views.tabs.waterfall_tab import WaterfallTabView
 from vibration.presentation.views.dialogs.progress_dialog import ProgressDialog
 from vibration.presentation.views.dialogs.responsive_layout_utils import PlotFontSizes
-from vibration.core.services.fft_service import FFTService, WindowType, ViewType
+from vibration.presentation.views.widgets.plot_lod import ImageLOD
+from vibration.core.services.band_trend import BandSpec, extract_band_trends
+from vibration.core.services.file_catalog import FileCatalog, catalog_for
 from vibration.core.services.file_service import FileService
+from vibration.core.services.project_result_store import ProjectResultStore
+from vibration.core.services.spectra_store import SpectraStore
+from vibration.core.services.spectrum_transport import SpectrumBatchProcessor, apply_spectrum_scale
+from vibration.core.services.waterfall_layout import (
+    X_SCALE, SpectrumHeatmap, frequency_axis, global_extents, layout_waterfall,
+    picking_points
+)
 from vibration.infrastructure.event_bus import get_event_bus
 
 logger = logging.getLogger(__name__)
@@ -29,6 +42,12 @@ VIEW_TYPE_LABELS = {
     'DIS': 'Vibration Displacement\n(μm, RMS)'
 }
 
+# 재사용을 위해 유지하는 파라미터 세트별 스펙트럼 저장소 수 (오래된 것부터 닫음)
+MAX_SPECTRA_STORES = 4
+
+# 로그 색 스케일에서 Z 최솟값이 0 이하일 때 사용할 최댓값 대비 하한
+HEATMAP_LOG_FLOOR = 1e-5
+
 
 class WaterfallPresenter:
     """
@@ -42,24 +61,39 @@ class WaterfallPresenter:
         self.view = view
         self._directory_path = directory_path
         self._all_files: List[str] = []
+        self._catalog = FileCatalog([])
+        self._date_filter: Optional[Tuple[str, str]] = None
         
         self._event_bus = get_event_bus()
         self._event_bus.files_loaded.connect(self._on_files_loaded)
         self._event_bus.directory_selected.connect(self._on_directory_changed)
+        self._event_bus.project_saved.connect(self._on_project_saved)
+        self._event_bus.project_loaded.connect(self._on_project_loaded)
         
         self._file_service = FileService()
+        self._spectrum_processor = SpectrumBatchProcessor()
         
         self._waterfall_cache: Dict[str, Any] = {
             'computed': False,
-            'spectra': [],
+            'store': None,
+            'matrix': None,
             'params': {}
         }
+        # (delta_f, overlap, window, view_type) -> 디스크 스펙트럼 저장소 (float32 memmap)
+        # 선택이 바뀌면 원본이 바뀌지 않은 파일의 행은 이전 저장소에서 복사하고
+        # 없는 파일만 FFT합니다.
+        self._stores: 'OrderedDict[Tuple[Any, ...], SpectraStore]' = OrderedDict()
+        # 저장/로드한 프로젝트의 결과 저장소 (스펙트럼을 results/spectrum에 기록)
+        self._result_store: Optional[ProjectResultStore] = None
         
         self._current_x_min: Optional[float] = None
         self._current_x_max: Optional[float] = None
         self._current_z_min: Optional[float] = None
         self._current_z_max: Optional[float] = None
         self._band_trend_dialogs: List[Any] = []
+        self._heatmap: Optional[ImageLOD] = None
+        # 마지막 렌더링의 (표시 모드, 주파수 하한, 상한) - 드래그 구간을 주파수로 변환
+        self._band_axis: Optional[Tuple[str, float, float]] = None
         
         self._connect_signals()
         logger.debug("WaterfallPresenter initialized")
@@ -72,12 +106,18 @@ class WaterfallPresenter:
         self.view.auto_scale_z_requested.connect(self._on_auto_scale_z)
         self.view.angle_changed.connect(self._on_angle_changed)
         self.view.date_filter_changed.connect(self._on_date_filter_changed)
+        self.view.channel_filter_changed.connect(self._apply_file_filter)
         self.view.band_trend_requested.connect(self._on_band_trend_requested)
+        self.view.band_span_selected.connect(self._on_band_span_selected)
+        self.view.display_mode_changed.connect(self._on_display_mode_changed)
     
     def _on_files_loaded(self, files: List[str]) -> None:
         logger.info(f"Received {len(files)} files from Data Query")
         self._all_files = list(files)
+        self._catalog = catalog_for(self._all_files)
         self.view.set_files(files)
+        if self._date_filter or self.view.get_selected_channels():
+            self._apply_file_filter()
     
     def _on_directory_changed(self, directory_path: str) -> None:
         self._directory_path = directory_path
@@ -141,6 +181,19 @@ class WaterfallPresenter:
             force_recalculate=False
         )
     
+    def _on_display_mode_changed(self):
+        """표시 모드/색 스케일 변경 - FFT 없이 캐시된 스펙트럼으로 다시 그립니다."""
+        if not self._waterfall_cache.get('computed'):
+            return
+        params: Dict[str, Any] = self.view.get_parameters()  # type: ignore[assignment]
+        self._render_waterfall(
+            self._current_x_min, self._current_x_max,
+            self._current_z_min, self._current_z_max,
+            params.get('angle', 270.0), self._waterfall_cache['params'].get('view_type', 1),
+            display_mode=params.get('display_mode', 'lines'),
+            log_color=bool(params.get('log_color', False))
+        )
+    
     def plot_waterfall_spectrum(
         self,
         x_min: Optional[float] = None,
@@ -180,10 +233,13 @@ class WaterfallPresenter:
             logger.info("Computing FFT for waterfall plot...")
             self._compute_waterfall_fft(selected_files, delta_f, overlap, window_type, view_type)
             self._waterfall_cache['params'] = current_params
+            self._save_to_project()
         else:
             logger.debug("Using cached waterfall data")
         
-        self._render_waterfall(x_min, x_max, z_min, z_max, angle, view_type)
+        self._render_waterfall(x_min, x_max, z_min, z_max, angle, view_type,
+                               display_mode=params.get('display_mode', 'lines'),
+                               log_color=bool(params.get('log_color', False)))
     
     def _compute_waterfall_fft(
         self,
@@ -193,10 +249,15 @@ class WaterfallPresenter:
         window_type: str,
         view_type: int
     ):
-        self._waterfall_cache['spectra'] = []
-        
-        progress_dialog = ProgressDialog(len(selected_files), self.view)
-        progress_dialog.show()
+        """
+        선택 파일의 스펙트럼 저장소를 시간순으로 만듭니다.
+
+        같은 파라미터의 이전 저장소에 있고 원본(크기, 수정 시각)이 바뀌지 않은 파일은
+        행을 복사하고, 나머지만 FFT합니다. 저장소는 디스크의 float32 행렬이므로
+        파일 수만큼 RAM을 사용하지 않습니다. 감도 배율은 FFT 후 곱합니다.
+        """
+        self._waterfall_cache['store'] = None
+        self._waterfall_cache['matrix'] = None
         
         items_with_time = []
         for file_name in selected_files:
@@ -207,95 +268,141 @@ class WaterfallPresenter:
             items_with_time.append((file_name, timestamp))
         
         sorted_items = sorted(items_with_time, key=lambda x: x[1], reverse=False)
+        file_paths = [
+            os.path.join(self._directory_path, file_name) for file_name, _ in sorted_items
+        ]
+        
+        key = (delta_f, overlap, window_type, view_type)
+        previous = self._stores.get(key)
+        reusable = previous.source_rows() if previous is not None else {}
+        sources = [self._file_source(path) for path in file_paths]
+        reused = {idx: reusable[source] for idx, source in enumerate(sources)
+                  if source is not None and source in reusable}
+        
+        missing = [idx for idx in range(len(file_paths)) if idx not in reused]
+        logger.info(
+            f"Waterfall: {len(reused)} cached, {len(missing)} to compute"
+        )
         
-        for draw_idx, (file_name, timestamp) in enumerate(sorted_items):
-            file_path = os.path.join(self._directory_path, file_name)
-            progress_dialog.label.setText(f"{file_name} 처리 중...")
-            
-            try:
-                file_data = self._file_service.load_file(file_path)
-            except Exception as e:
-                logger.warning(f"Failed to load file {file_name}: {e}")
-                progress_dialog.update_progress(draw_idx + 1)
-                continue
-            
-            if not file_data.get('is_valid') or file_data.get('data') is None:
-                progress_dialog.update_progress(draw_idx + 1)
-                continue
-            
-            data = file_data['data']
-            sampling_rate = file_data.get('sampling_rate', 0)
-            record_length = file_data.get('record_length')
-            metadata = file_data.get('metadata', {})
-            
-            if sampling_rate is None or sampling_rate <= 0:
-                progress_dialog.update_progress(draw_idx + 1)
-                continue
-            
-            b_sensitivity = self._extract_numeric_value(metadata.get('b_sensitivity'))
-            sensitivity = self._extract_numeric_value(metadata.get('sensitivity'))
-            
-            if b_sensitivity is not None and sensitivity is not None and sensitivity != 0:
-                scaled_data = (b_sensitivity / sensitivity) * data
-            else:
-                scaled_data = data
-            
-            effective_delta_f = delta_f
-            if record_length:
-                try:
-                    duration = float(record_length)
-                    hz_value = round(1 / duration + 0.01, 2)
-                    effective_delta_f = max(delta_f, hz_value)
-                except (ValueError, ZeroDivisionError):
-                    pass
-            
+        batch = None
+        if missing:
+            progress_dialog = ProgressDialog(len(missing), self.view)
+            progress_dialog.show()
             try:
-                view_type_str = VIEW_TYPE_MAP.get(view_type, 'ACC')
-                window_type_literal = cast(WindowType, window_type)
-                view_type_literal = cast(ViewType, view_type_str)
-                fft_service = FFTService(
-                    sampling_rate=sampling_rate,
-                    delta_f=effective_delta_f,
-                    overlap=overlap,
-                    window_type=window_type_literal
+                # 워커 프로세스가 공유 메모리 행렬에 직접 기록
+                batch = self._spectrum_processor.process_batch(
+                    [file_paths[idx] for idx in missing],
+                    delta_f, overlap, window_type, view_type,
+                    progress_callback=lambda done, total: progress_dialog.update_progress(done),
+                    apply_sensitivity=False
                 )
-                fft_result = fft_service.compute_spectrum(scaled_data, view_type=view_type_literal)
-                
-                frequency = fft_result.frequency
-                spectrum = np.round(fft_result.spectrum, 4)
-                
-            except Exception as e:
-                logger.warning(f"FFT computation failed for {file_name}: {e}")
-                progress_dialog.update_progress(draw_idx + 1)
-                continue
-            
-            try:
-                name_only = os.path.splitext(file_name)[0]
-                parts = name_only.split("_")
-                if len(parts) >= 3:
-                    date = parts[0]
-                    time = parts[1]
-                    rest = '_'.join(parts[2:])
-                    x_label = f"{date}\n{time}_{rest}"
-                else:
-                    x_label = file_name
-            except Exception:
-                x_label = file_name
-            
-            self._waterfall_cache['spectra'].append({
-                'file_name': file_name,
-                'frequency': frequency,
-                'spectrum': spectrum,
-                'timestamp': timestamp,
-                'x_label': x_label,
-                'sampling_rate': sampling_rate
-            })
-            
-            progress_dialog.update_progress(draw_idx + 1)
-        
-        progress_dialog.close()
+            finally:
+                progress_dialog.close()
+        
+        computed = [(row, idx) for row, idx in enumerate(missing) if batch.success[row]] if batch else []
+        kept = sorted(list(reused) + [idx for _, idx in computed])
+        
+        # 공유 주파수 축: 가장 긴 행의 bin 수와 Δf
+        n_bins, freq_step = 0, 0.0
+        if reused and previous is not None:
+            n_bins = int(previous.n_valid[list(reused.values())].max())
+            freq_step = previous.freq_step
+        for row, _ in computed:
+            if int(batch.n_valid[row]) > n_bins:
+                n_bins, freq_step = int(batch.n_valid[row]), float(batch.freq_step[row])
+        
+        store = None
+        if kept and n_bins > 0:
+            store = SpectraStore.create(
+                None, n_bins, freq_step,
+                [sorted_items[idx][0] for idx in kept], [sorted_items[idx][1] for idx in kept],
+                {'delta_f': delta_f, 'overlap': overlap, 'window_type': window_type,
+                 'view_type': view_type}
+            )
+            position = {idx: pos for pos, idx in enumerate(kept)}
+            if reused:
+                reused_idx = sorted(reused)
+                store.copy_rows(previous, [reused[idx] for idx in reused_idx],
+                                [position[idx] for idx in reused_idx])
+            for row, idx in computed:
+                store.write_row(position[idx],
+                                apply_spectrum_scale(batch.spectrum(row), batch.scales[row]),
+                                float(batch.sampling_rates[row]), sources[idx])
+            store.flush()
+            self._keep_store(key, store)
+        
+        self._waterfall_cache['store'] = store
         self._waterfall_cache['computed'] = True
-        logger.info(f"Waterfall cache created with {len(self._waterfall_cache['spectra'])} files")
+        logger.info(f"Waterfall store created with {len(kept)} files")
+    
+    def _keep_store(self, key: Tuple[Any, ...], store: SpectraStore) -> None:
+        """파라미터 세트의 저장소를 교체하고 오래된 저장소를 닫습니다."""
+        old = self._stores.pop(key, None)
+        if old is not None and old is not store:
+            old.close()
+        self._stores[key] = store
+        while len(self._stores) > MAX_SPECTRA_STORES:
+            _, evicted = self._stores.popitem(last=False)
+            evicted.close()
+    
+    @staticmethod
+    def _make_x_label(file_name: str) -> str:
+        """'날짜_시각_나머지' 파일명을 두 줄 라벨로 변환합니다."""
+        name_only = os.path.splitext(file_name)[0]
+        parts = name_only.split("_")
+        if len(parts) >= 3:
+            return f"{parts[0]}\n{parts[1]}_{'_'.join(parts[2:])}"
+        return file_name
+    
+    def _on_project_saved(self, json_path: str) -> None:
+        self._result_store = ProjectResultStore.for_project_file(json_path)
+        self._save_to_project()
+    
+    def _on_project_loaded(self, json_path: str) -> None:
+        """저장된 스펙트럼(memmap)으로 원본 파일을 읽지 않고 워터폴을 복원합니다."""
+        self._result_store = ProjectResultStore.for_project_file(json_path)
+        try:
+            restored = self._result_store.load_spectra()
+        except Exception as e:
+            logger.error(f"Failed to restore waterfall spectra: {e}")
+            return
+        if restored is None or len(restored) == 0:
+            return
+        
+        params = restored.params
+        self._waterfall_cache = {
+            'computed': True,
+            'store': restored,
+            'matrix': None,
+            'params': params
+        }
+        # 원본 파일이 그대로면 다음 계산에서 프로젝트의 행을 재사용
+        self._keep_store((params.get('delta_f'), params.get('overlap'),
+                          params.get('window_type'), params.get('view_type')), restored)
+        view_type = params.get('view_type', 1)
+        view_params: Dict[str, Any] = self.view.get_parameters()  # type: ignore[assignment]
+        self._render_waterfall(None, None, None, None, view_params.get('angle', 270.0), view_type,
+                               display_mode=view_params.get('display_mode', 'lines'),
+                               log_color=bool(view_params.get('log_color', False)))
+        logger.info(f"Restored waterfall with {len(restored)} spectra from project")
+    
+    def _save_to_project(self) -> None:
+        store = self._waterfall_cache.get('store')
+        if self._result_store is None or store is None:
+            return
+        try:
+            self._result_store.save_spectra(store, self._waterfall_cache['params'])
+        except Exception as e:
+            logger.error(f"Failed to save waterfall spectra to project: {e}")
+    
+    @staticmethod
+    def _file_source(path: str) -> Optional[Tuple[str, int, int]]:
+        """파일 변경 감지용 (경로, 크기, 수정 시각 ns)."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return path, st.st_size, st.st_mtime_ns
     
     def _render_waterfall(
         self,
@@ -304,9 +411,12 @@ class WaterfallPresenter:
         z_min: Optional[float],
         z_max: Optional[float],
         angle: float,
-        view_type: int
+        view_type: int,
+        display_mode: str = 'lines',
+        log_color: bool = False
     ):
-        if len(self._waterfall_cache['spectra']) == 0:
+        store = self._waterfall_cache.get('store')
+        if store is None or len(store) == 0:
             logger.warning("No data to display in waterfall plot")
             return
         
@@ -318,116 +428,75 @@ class WaterfallPresenter:
         self.view.hover_pos = None
         self.view.waterfall_marker = None
         self.view.waterfall_annotation = None
+        self._heatmap = None
         ax.set_title("Waterfall Spectrum", fontsize=PlotFontSizes.TITLE)
         
-        all_frequencies = []
-        all_spectra = []
-        for cached in self._waterfall_cache['spectra']:
-            all_frequencies.extend(cached['frequency'])
-            all_spectra.extend(cached['spectrum'])
-        
-        global_xmin: float = float(np.min(all_frequencies))
-        global_xmax: float = float(np.max(all_frequencies))
-        global_zmin: float = float(np.min(all_spectra))
-        global_zmax: float = float(np.max(all_spectra))
+        frequency, spectrum, extents = self._spectrum_matrix()
+        if extents is None:
+            logger.warning("No data to display in waterfall plot")
+            return
+        global_xmin, global_xmax, global_zmin, global_zmax = extents
         
         eff_x_min: float = global_xmin if x_min is None else x_min
         eff_x_max: float = global_xmax if x_max is None else x_max
         eff_z_min: float = global_zmin if z_min is None else z_min
         eff_z_max: float = global_zmax if z_max is None else z_max
+        self._band_axis = (display_mode, eff_x_min, eff_x_max)
         
-        angle_rad = np.deg2rad(angle)
+        if display_mode == 'heatmap':
+            self._draw_heatmap(fig, ax, frequency, spectrum, x_min, x_max,
+                               eff_z_min, eff_z_max, view_type, log_color)
+            self.view.set_picking_data(None)
+            self.view.draw()
+            return
         
-        fixed_ymin, fixed_ymax = 0, 130
-        num_files = len(self._waterfall_cache['spectra'])
-        offset_range = fixed_ymax - fixed_ymin
-        offset_distance = offset_range / max(num_files, 1)
-        dx = offset_distance * np.cos(angle_rad)
-        dy = offset_distance * np.sin(angle_rad)
+        file_names = store.file_names
+        layout = layout_waterfall(frequency, spectrum, eff_x_min, eff_x_max,
+                                  eff_z_min, eff_z_max, angle, x_scale=X_SCALE)
+        rows = layout.rows
+        
+        # 모든 파일을 LineCollection 하나로 (선 색은 ax.plot과 같은 색 순환)
+        cycle = matplotlib.rcParams['axes.prop_cycle'].by_key().get('color', ['C0'])
+        colors = [cycle[i % len(cycle)] for i in range(len(rows))]
+        pixel_width = max(100, int(ax.get_window_extent().width))
+        lines = LineCollection(layout.segments(max_points=pixel_width), colors=colors,
+                               alpha=0.6, linewidths=0.8)
+        ax.add_collection(lines)
+        ax.autoscale_view()
+        
+        if len(rows):
+            first = rows[0]
+            row_x = layout.x[first][layout.visible[first]]
+            row_y = layout.y[first][layout.visible[first]]
+            if len(row_x) >= 2:
+                xticks = np.linspace(row_x[0], row_x[-1], 7)
+                xtick_labels = np.linspace(eff_x_min, eff_x_max, 7)
+                ax.set_xticks(xticks)
+                ax.set_xticklabels([f"{val:.1f}" for val in xtick_labels])
+            
+            if len(row_y) >= 2:
+                ax.yaxis.set_ticks_position('left')
+                yticks = np.linspace(row_y.min(), row_y.max(), 7)
+                ytick_labels = np.linspace(eff_z_min, eff_z_max, 7)
+                ax.set_yticks(yticks)
+                ax.set_yticklabels([f"{val:.4f}" for val in ytick_labels], fontsize=PlotFontSizes.TICK)
+                ax.tick_params(axis='y', labelleft=True)
+                ax.set_ylim(0, 150)
         
         max_labels = 5
-        total_files = num_files
-        if total_files <= max_labels:
-            label_indices = list(range(total_files))
+        num_files = len(file_names)
+        if num_files <= max_labels:
+            label_indices = np.arange(num_files)
         else:
-            label_indices = np.linspace(0, total_files - 1, max_labels, dtype=int).tolist()
+            label_indices = np.linspace(0, num_files - 1, max_labels, dtype=int)
+        label_indices = label_indices[np.isin(label_indices, rows)]
+        row_bottoms = np.nanmin(layout.y[label_indices], axis=1) if len(label_indices) else []
         
         yticks_for_labels = []
         labels_for_ticks = []
-        
-        x_scale = 530
-        picking_data: List[tuple[float, float, float, float, str]] = []
-        
-        for draw_idx, cached_data in enumerate(self._waterfall_cache['spectra']):
-            f = cached_data['frequency']
-            P_magnitude = cached_data['spectrum']
-            file_name = cached_data['file_name']
-            
-            mask_freq = (f >= eff_x_min) & (f <= eff_x_max)
-            f_filtered = f[mask_freq]
-            p_filtered = P_magnitude[mask_freq]
-            
-            if len(f_filtered) == 0:
-                continue
-            
-            x_range = eff_x_max - eff_x_min
-            if x_range <= 0:
-                continue
-            f_normalized = (f_filtered - eff_x_min) / x_range
-            
-            if eff_z_max > eff_z_min:
-                p_clipped = np.clip(p_filtered, eff_z_min, eff_z_max)
-                y_normalized = (p_clipped - eff_z_min) / (eff_z_max - eff_z_min)
-            else:
-                global_max = np.max(all_spectra) if np.max(all_spectra) > 0 else 1
-                y_normalized = p_filtered / global_max
-            
-            scale_factor = (fixed_ymax - fixed_ymin)
-            y_scaled = y_normalized * scale_factor
-            
-            base_x = draw_idx * dx
-            base_y = draw_idx * dy
-            offset_x = f_normalized * x_scale + base_x
-            offset_y = y_scaled + base_y
-            
-            ax.plot(offset_x, offset_y, alpha=0.6, linewidth=0.8)
-            
-            sample_step = max(1, len(f_filtered) // 200)
-            for i in range(0, len(f_filtered), sample_step):
-                picking_data.append((
-                    float(offset_x[i]), float(offset_y[i]),
-                    float(f_filtered[i]), float(p_filtered[i]),
-                    file_name
-                ))
-            
-            if draw_idx == 0:
-                if len(offset_x) >= 2:
-                    xticks = np.linspace(offset_x[0], offset_x[-1], 7)
-                    xtick_labels = np.linspace(eff_x_min, eff_x_max, 7)
-                    ax.set_xticks(xticks)
-                    ax.set_xticklabels([f"{val:.1f}" for val in xtick_labels])
-                
-                if len(offset_y) >= 2:
-                    ax.yaxis.set_ticks_position('left')
-                    ymin_plot = min(offset_y)
-                    ymax_plot = max(offset_y)
-                    yticks = np.linspace(ymin_plot, ymax_plot, 7)
-                    ytick_labels = np.linspace(eff_z_min, eff_z_max, 7)
-                    ax.set_yticks(yticks)
-                    ax.set_yticklabels([f"{val:.4f}" for val in ytick_labels], fontsize=PlotFontSizes.TICK)
-                    ax.tick_params(axis='y', labelleft=True)
-                    ax.set_ylim(0, 150)
-            
-            if draw_idx in label_indices:
-                center_y = np.min(offset_y)
-                try:
-                    timestamp = self._extract_timestamp_from_filename(file_name)
-                    label_text = timestamp.strftime("%m-%d\n%H:%M:%S")
-                except Exception:
-                    label_text = file_name.replace(".txt", "")
-                
-                yticks_for_labels.append(center_y)
-                labels_for_ticks.append(label_text)
+        for row, center_y in zip(label_indices, row_bottoms):
+            yticks_for_labels.append(center_y)
+            labels_for_ticks.append(self._time_label(file_names[row]))
         
         ax_right = ax.twinx()
         ax_right.set_ylim(ax.get_ylim())
@@ -449,11 +518,75 @@ class WaterfallPresenter:
         ax.tick_params(axis='x', labelsize=PlotFontSizes.TICK)
         ax.tick_params(axis='y', labelsize=PlotFontSizes.TICK)
         
-        self._add_grid_lines(ax, eff_x_min, eff_x_max, x_scale)
+        self._add_grid_lines(ax, eff_x_min, eff_x_max, X_SCALE)
         
-        self.view.set_picking_data(picking_data)
+        self.view.set_picking_data(picking_points(layout, file_names))
         self.view.draw()
     
+    def _draw_heatmap(self, fig, ax, frequency, spectrum, x_min: Optional[float],
+                      x_max: Optional[float], z_min: float, z_max: float,
+                      view_type: int, log_color: bool):
+        """
+        스펙트럼 행렬을 시간(파일) × 주파수 이미지로 그립니다.
+
+        ImageLOD가 보이는 구간을 축 픽셀 크기로 최댓값 풀링하고 줌/팬 때 다시 풀링합니다.
+        x_min/x_max가 None이면 전체 주파수 범위를 표시합니다.
+        """
+        if log_color:
+            z_max = z_max if z_max > 0 else 1.0
+            z_min = z_min if 0 < z_min < z_max else z_max * HEATMAP_LOG_FLOOR
+            norm = LogNorm(vmin=z_min, vmax=z_max)
+        else:
+            norm = Normalize(vmin=z_min, vmax=z_max)
+        
+        source = SpectrumHeatmap(frequency_axis(frequency), spectrum)
+        self._heatmap = ImageLOD(ax, source, cmap='viridis', norm=norm)
+        if x_min is not None and x_max is not None:
+            ax.set_xlim(x_min, x_max)
+        
+        file_names = self._waterfall_cache['store'].file_names
+        
+        def row_label(y, pos):
+            row = int(round(y))
+            return self._time_label(file_names[row]) if 0 <= row < len(file_names) else ""
+        
+        ax.yaxis.set_major_locator(MaxNLocator(nbins=6, integer=True))
+        ax.yaxis.set_major_formatter(FuncFormatter(row_label))
+        ax.tick_params(axis='both', labelsize=PlotFontSizes.TICK)
+        ax.set_xlabel("Frequency (Hz)", fontsize=PlotFontSizes.LABEL)
+        ax.set_ylabel("Time", fontsize=PlotFontSizes.LABEL)
+        
+        view_type_str = VIEW_TYPE_MAP.get(view_type, 'ACC')
+        colorbar = fig.colorbar(self._heatmap.image, ax=ax)
+        colorbar.set_label(VIEW_TYPE_LABELS.get(view_type_str, 'RMS Vibration'), fontsize=PlotFontSizes.LABEL)
+        colorbar.ax.tick_params(labelsize=PlotFontSizes.TICK)
+    
+    def _time_label(self, file_name: str) -> str:
+        """파일명의 타임스탬프를 두 줄 라벨로 (없으면 파일명)."""
+        try:
+            timestamp = self._extract_timestamp_from_filename(file_name)
+            return timestamp.strftime("%m-%d\n%H:%M:%S")
+        except Exception:
+            return file_name.replace(".txt", "")
+    
+    def _spectrum_matrix(self):
+        """
+        저장소의 (n_files, n_bins) memmap 행렬과 공유 주파수 축의 브로드캐스트 뷰.
+
+        행렬을 RAM으로 복사하지 않습니다. 전체 범위(extents)는 저장소가 바뀔 때만
+        한 번 읽어 계산합니다.
+
+        반환:
+            (frequency, spectrum, extents) - extents는 global_extents 결과.
+        """
+        if self._waterfall_cache.get('matrix') is None:
+            store = self._waterfall_cache['store']
+            spectrum = store.spectra
+            frequency = np.broadcast_to(store.frequency, spectrum.shape)
+            self._waterfall_cache['matrix'] = (frequency, spectrum,
+                                               global_extents(frequency, spectrum))
+        return self._waterfall_cache['matrix']
+    
     def _add_grid_lines(self, ax, x_min: float, x_max: float, x_scale: float):
         x_range = x_max - x_min
         if x_range <= 0:
@@ -483,66 +616,74 @@ class WaterfallPresenter:
                           linewidth=0.5, alpha=0.3)
     
     def _extract_timestamp_from_filename(self, filename: str) -> datetime:
-        match = re.search(r'(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})', filename)
-        
-        if match:
-            timestamp_str = match.group(1)
-            timestamp_str = timestamp_str.replace('_', ' ')
-            timestamp_str = timestamp_str[:10] + ' ' + timestamp_str[11:].replace('-', ':')
-            
-            try:
-                return datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                return datetime.now()
-        else:
-            return datetime.now()
-    
-    def _extract_numeric_value(self, s: Optional[str]) -> Optional[float]:
-        if s is None:
-            return None
-        match = re.search(r"[-+]?[0-9]*\.?[0-9]+", str(s))
-        return float(match.group()) if match else None
+        """로드 시 파싱한 카탈로그의 측정 시각 (파싱 실패 시 현재 시간)."""
+        timestamp = self._catalog.timestamp(filename)
+        return timestamp if timestamp is not None else datetime.now()
     
     def _on_date_filter_changed(self, from_date: str, to_date: str) -> None:
-        filtered = []
-        for filename in self._all_files:
-            try:
-                date_part = filename.split('_')[0]
-                if from_date <= date_part <= to_date:
-                    filtered.append(filename)
-            except (IndexError, ValueError):
-                filtered.append(filename)
-        self.view._populate_file_list_grouped(filtered)
-        logger.info(f"Date filter applied: {from_date} ~ {to_date}, {len(filtered)}/{len(self._all_files)} files")
-    
-    def _on_band_trend_requested(self, target_freq: float) -> None:
-        if not self._waterfall_cache.get('computed') or not self._waterfall_cache['spectra']:
+        self._date_filter = (from_date, to_date)
+        self._apply_file_filter()
+    
+    def _apply_file_filter(self) -> None:
+        """공유 파일 카탈로그로 날짜/채널 필터를 함께 적용해 목록을 다시 표시합니다."""
+        date_from, date_to = self._date_filter or (None, None)
+        filtered = self._catalog.select(date_from, date_to, self.view.get_selected_channels())
+        self.view.show_files(filtered)
+        logger.info(f"File filter applied: {date_from} ~ {date_to}, {len(filtered)}/{len(self._all_files)} files")
+    
+    def _on_band_span_selected(self, x_start: float, x_end: float) -> None:
+        """드래그한 축 구간을 주파수 대역으로 바꿔 대역 트렌드 다이얼로그를 엽니다."""
+        if self._band_axis is None:
+            return
+        mode, x_min, x_max = self._band_axis
+        if mode == 'heatmap':
+            f1, f2 = x_start, x_end
+        else:
+            # 라인 모드 x는 첫 파일 기준 화면 좌표 (0..X_SCALE)
+            f1, f2 = (x_min + x / X_SCALE * (x_max - x_min) for x in (x_start, x_end))
+        self.view.open_band_trend_dialog(max(0.0, min(f1, f2)), max(f1, f2))
+    
+    def _on_band_trend_requested(self, bands: Union[float, List[BandSpec]]) -> None:
+        """
+        저장소 행렬에서 대역 트렌드를 추출합니다.
+
+        대역별 bin 인덱스를 한 번 계산하고 행렬을 청크로 읽으며 축소하므로
+        여러 대역도 행렬을 한 번만 읽습니다. 숫자 하나는 최근접 bin 대역으로 처리합니다.
+        """
+        store = self._waterfall_cache.get('store')
+        if not self._waterfall_cache.get('computed') or store is None or len(store) == 0:
             logger.warning("No cached data for band trend")
             return
+        if isinstance(bands, (int, float)):
+            bands = [BandSpec('nearest', float(bands))]
+        if not bands:
+            return
         
-        timestamps = []
-        amplitudes = []
-        
-        for cached in self._waterfall_cache['spectra']:
-            freq_arr = cached['frequency']
-            spec_arr = cached['spectrum']
-            idx = int(np.argmin(np.abs(freq_arr - target_freq)))
-            amplitudes.append(float(spec_arr[idx]))
-            timestamps.append(cached['timestamp'])
-        
-        if not timestamps:
+        values = extract_band_trends(store.frequency, store.spectra, bands)
+        timestamps = store.timestamps.astype(object)
+        series = []
+        for band, column in zip(bands, values.T):
+            # 대역에 bin이 없는 행(짧은 행, 범위 밖)은 제외
+            valid = np.isfinite(column)
+            if valid.any():
+                series.append((band.label, timestamps[valid].tolist(), column[valid].tolist()))
+        
+        if not series:
+            logger.warning("No spectrum bins in the requested bands")
             return
         
-        self._show_band_trend_window(target_freq, timestamps, amplitudes)
+        self._show_band_trend_window(series)
     
-    def _show_band_trend_window(self, freq, timestamps, amplitudes):
+    def _show_band_trend_window(self, series):
+        """series: (라벨, 타임스탬프 목록, 값 목록) 목록."""
         from PyQt5.QtWidgets import QDialog, QVBoxLayout
         from matplotlib.figure import Figure
         from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
         import matplotlib.dates as mdates
         
+        title = series[0][0] if len(series) == 1 else f"{len(series)} bands"
         dialog = QDialog(self.view)
-        dialog.setWindowTitle(f"Band Trend @ {freq:.1f} Hz")
+        dialog.setWindowTitle(f"Band Trend - {title}")
         dialog.resize(800, 400)
         
         layout = QVBoxLayout(dialog)
@@ -551,9 +692,12 @@ class WaterfallPresenter:
         layout.addWidget(canvas)
         
         ax = fig.add_subplot(111)
-        ax.plot(timestamps, amplitudes, 'b-o', markersize=3, linewidth=1)
-        ax.set_title(f"Single Band Trend @ {freq:.1f} Hz", fontsize=PlotFontSizes.TITLE)
+        for label, timestamps, amplitudes in series:
+            ax.plot(timestamps, amplitudes, '-o', markersize=3, linewidth=1, label=label)
+        ax.set_title(f"Band Trend - {title}", fontsize=PlotFontSizes.TITLE)
         ax.set_xlabel("Time", fontsize=PlotFontSizes.LABEL)
+        if len(series) > 1:
+            ax.legend(fontsize=PlotFontSizes.LEGEND)
         
         params = self.view.get_parameters()
         view_type_int = cast(int, params.get('view_type', 1))
@@ -573,9 +717,13 @@ class WaterfallPresenter:
     def clear_cache(self):
         self._waterfall_cache = {
             'computed': False,
-            'spectra': [],
+            'store': None,
+            'matrix': None,
             'params': {}
         }
+        for store in self._stores.values():
+            store.close()
+        self._stores.clear()
         self._current_x_min = None
         self._current_x_max = None
         self._current_z_min = None
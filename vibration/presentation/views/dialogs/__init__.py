@@ -2,5 +2,6 @@
 from .progress_dialog import ProgressDialog
 from .axis_range_dialog import AxisRangeDialog
 from .list_save_dialog import ListSaveDialog
+from .band_trend_dialog import BandTrendDialog
 
-__all__ = ['ProgressDialog', 'AxisRangeDialog', 'ListSaveDialog']
+__all__ = ['ProgressDialog', 'AxisRangeDialog', 'ListSaveDialog', 'BandTrendDialog']
@@ -0,0 +1,124 @@
+"""
+대역 트렌드 설정 다이얼로그.
+
+워터폴 스펙트럼에서 추출할 대역(최근접 bin, 대역 RMS/Peak, 고조파 세트)을
+하나 이상 설정합니다. 목록에 추가한 대역은 한 번에 계산되어 같은 창에 그려집니다.
+"""
+from typing import List, Optional
+
+from PyQt5.QtWidgets import (
+    QComboBox, QDialog, QDialogButtonBox, QDoubleSpinBox, QFormLayout, QHBoxLayout,
+    QListWidget, QPushButton, QSpinBox, QVBoxLayout
+)
+
+from vibration.core.services.band_trend import BandSpec
+
+METHOD_ITEMS = [
+    ("Nearest Bin", 'nearest'),
+    ("Band RMS", 'rms'),
+    ("Band Peak", 'peak'),
+    ("Harmonics (RMS)", 'harmonics'),
+]
+
+
+class BandTrendDialog(QDialog):
+    """대역 트렌드 설정 다이얼로그.
+
+    속성:
+        method_combo (QComboBox): 대역 종류
+        low_input, high_input (QDoubleSpinBox): 기준/하한, 상한 주파수
+        harmonics_input (QSpinBox): 고조파 개수
+        band_list (QListWidget): 추가한 대역 목록
+    """
+
+    def __init__(self, low: float = 100.0, high: Optional[float] = None, parent=None):
+        """다이얼로그를 초기화합니다.
+
+        인자:
+            low (float): 초기 기준/하한 주파수.
+            high (float, optional): 초기 상한 주파수. 주어지면 Band RMS로 시작합니다.
+            parent (QWidget, optional): 부모 위젯.
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Band Trend")
+        self.setModal(True)
+        self.setMinimumWidth(360)
+        self._bands: List[BandSpec] = []
+
+        layout = QVBoxLayout(self)
+        form_layout = QFormLayout()
+
+        self.method_combo = QComboBox()
+        for text, method in METHOD_ITEMS:
+            self.method_combo.addItem(text, method)
+        self.method_combo.currentIndexChanged.connect(self._update_inputs)
+        form_layout.addRow("Method:", self.method_combo)
+
+        self.low_input = self._frequency_input(low)
+        form_layout.addRow("f1 (Hz):", self.low_input)
+        self.high_input = self._frequency_input(high if high is not None else low)
+        form_layout.addRow("f2 (Hz):", self.high_input)
+
+        self.harmonics_input = QSpinBox()
+        self.harmonics_input.setRange(1, 50)
+        self.harmonics_input.setValue(5)
+        form_layout.addRow("Harmonics:", self.harmonics_input)
+        layout.addLayout(form_layout)
+
+        button_layout = QHBoxLayout()
+        add_button = QPushButton("Add")
+        add_button.clicked.connect(self._add_current)
+        remove_button = QPushButton("Remove")
+        remove_button.clicked.connect(self._remove_selected)
+        button_layout.addWidget(add_button)
+        button_layout.addWidget(remove_button)
+        layout.addLayout(button_layout)
+
+        self.band_list = QListWidget()
+        layout.addWidget(self.band_list)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+        if high is not None:
+            self.method_combo.setCurrentIndex(1)
+        self._update_inputs()
+
+    @staticmethod
+    def _frequency_input(value: float) -> QDoubleSpinBox:
+        spin = QDoubleSpinBox()
+        spin.setRange(0.0, 50000.0)
+        spin.setDecimals(1)
+        spin.setValue(value)
+        return spin
+
+    def _update_inputs(self):
+        """대역 종류에 맞는 입력만 활성화합니다."""
+        method = self.method_combo.currentData()
+        self.high_input.setEnabled(method in ('rms', 'peak'))
+        self.harmonics_input.setEnabled(method == 'harmonics')
+
+    def current_band(self) -> BandSpec:
+        """입력 필드의 대역을 반환합니다 (f1 > f2이면 교환)."""
+        low, high = self.low_input.value(), self.high_input.value()
+        method = self.method_combo.currentData()
+        if method in ('rms', 'peak') and low > high:
+            low, high = high, low
+        return BandSpec(method, low, high, self.harmonics_input.value())
+
+    def _add_current(self):
+        band = self.current_band()
+        self._bands.append(band)
+        self.band_list.addItem(band.label)
+
+    def _remove_selected(self):
+        row = self.band_list.currentRow()
+        if row >= 0:
+            self.band_list.takeItem(row)
+            del self._bands[row]
+
+    def get_bands(self) -> List[BandSpec]:
+        """추가한 대역 목록. 비어 있으면 입력 필드의 대역 하나."""
+        return list(self._bands) or [self.current_band()]
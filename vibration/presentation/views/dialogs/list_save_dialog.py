@@ -33,6 +33,7 @@ from .responsive_layout_utils import (
     PlotFontSizes,
     APP_FONT_FAMILY
 )
+from vibration.presentation.views.widgets.plot_lod import AxesLOD, MinMaxPyramid, PeakPyramid
 
 try:
     from .axis_range_dialog import AxisRangeDialog
@@ -185,10 +186,12 @@ class ListSaveDialog(QtWidgets.QDialog, ResponsiveLayoutMixin):
             self.tab_waveform_figure = figure
             self.tab_waveax = ax
             self.tab_wavecanvas = canvas
+            self._wave_lod = AxesLOD(ax)
         else:
             self.tab_figure = figure
             self.tab_ax = ax
             self.tab_canvas = canvas
+            self._spec_lod = AxesLOD(ax)
 
         canvas.setFocusPolicy(QtCore.Qt.StrongFocus)
         canvas.mpl_connect('button_press_event',
@@ -397,6 +400,8 @@ class ListSaveDialog(QtWidgets.QDialog, ResponsiveLayoutMixin):
 
         self.tab_waveax.clear()
         self.tab_ax.clear()
+        self._wave_lod.reset()
+        self._spec_lod.reset()
         self.color_cycle = itertools.cycle(plt.cm.tab10.colors)
         self.data_dict = {}
         self.spectrum_data_dict1 = {}
@@ -419,12 +424,12 @@ class ListSaveDialog(QtWidgets.QDialog, ResponsiveLayoutMixin):
         color = next(self.color_cycle)
         base_name = result['base_name']
 
-        self.tab_waveax.plot(
-            result['time'], result['data'], 
+        self._wave_lod.plot(
+            MinMaxPyramid.from_xy(result['time'], result['data']),
             label=base_name, color=color, linewidth=0.5, alpha=0.8
         )
-        self.tab_ax.plot(
-            result['frequency'], result['spectrum'],
+        self._spec_lod.plot(
+            PeakPyramid(result['frequency'], result['spectrum']),
             label=base_name, color=color, linewidth=0.5, alpha=0.8
         )
 
@@ -28,6 +28,8 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 from vibration.core.services.file_parser import FileParser
 from vibration.core.services.fft_engine import FFTEngine
+from vibration.presentation.views.widgets.pick_index import PickIndex, PointNavigator, axes_scale
+from vibration.presentation.views.widgets.blit_overlay import BlitOverlay
 
 
 class SpectrumPicker:
@@ -59,11 +61,17 @@ class SpectrumPicker:
         self.canvas = canvas
         self.data_dict = data_dict
         self.markers: List[Tuple] = []
+        self.pick_index = PickIndex()
+        self.navigator = PointNavigator()
+        for file_name, (data_x, data_y) in data_dict.items():
+            self.pick_index.add(data_x, data_y, tag=file_name)
+            self.navigator.add(data_x, data_y, tag=file_name)
         self.hover_pos = [None, None]
         self.mouse_tracking_enabled = True
         
-        # 호버 표시기 생성
-        self.hover_dot = self.ax.plot([], [], 'ko', markersize=6, alpha=0.5)[0]
+        # 호버 표시기 생성 (블리팅 오버레이로 갱신)
+        self.hover_overlay = BlitOverlay(canvas)
+        self.hover_dot = self.hover_overlay.add(self.ax.plot([], [], 'ko', markersize=6, alpha=0.5)[0])
     
     def on_mouse_move(self, event) -> None:
         """호버링을 위한 마우스 이동 이벤트를 처리합니다."""
@@ -71,24 +79,16 @@ class SpectrumPicker:
             if self.hover_pos[0] is not None:
                 self.hover_dot.set_data([], [])
                 self.hover_pos = [None, None]
-                self.canvas.draw_idle()
+                self.hover_overlay.update()
             return
         
-        closest_x, closest_y, min_dist = None, None, np.inf
-        for line in self.ax.get_lines():
-            x_data, y_data = line.get_xdata(), line.get_ydata()
-            if len(x_data) == 0 or len(y_data) == 0:
-                continue
-            for x, y in zip(x_data, y_data):
-                dist = np.hypot(event.xdata - x, event.ydata - y)
-                if dist < min_dist:
-                    min_dist = dist
-                    closest_x, closest_y = x, y
+        pick = self.pick_index.nearest(event.xdata, event.ydata, *axes_scale(self.ax))
+        closest_x, closest_y = (pick.x, pick.y) if pick else (None, None)
         
         if closest_x is not None:
             self.hover_dot.set_data([closest_x], [closest_y])
             self.hover_pos = [closest_x, closest_y]
-            self.canvas.draw_idle()
+            self.hover_overlay.update()
     
     def on_mouse_click(self, event) -> None:
         if not event.inaxes:
@@ -103,66 +103,29 @@ class SpectrumPicker:
     def on_key_press(self, event) -> None:
         """데이터 피킹을 위한 키보드 탐색을 처리합니다."""
         x, y = self.hover_dot.get_data()
-        if not x or not y:
+        if len(x) == 0 or len(y) == 0:
             return
         
-        all_x_data, all_y_data = [], []
-        for line in self.ax.get_lines():
-            x_data, y_data = line.get_xdata(), line.get_ydata()
-            if len(x_data) > 0:
-                all_x_data.extend(x_data)
-                all_y_data.extend(y_data)
-        
-        current_index = None
-        min_dist = np.inf
-        for idx, (x_val, y_val) in enumerate(zip(all_x_data, all_y_data)):
-            dist = np.hypot(x[0] - x_val, y[0] - y_val)
-            if dist < min_dist:
-                min_dist = dist
-                current_index = idx
-        
-        if current_index is None:
+        pos = self.navigator.locate(float(x[0]), float(y[0]))
+        if pos is None:
             return
         
-        candidates = []
-        if event.key == 'left':
-            candidates = [(i, abs(all_x_data[i] - x[0])) 
-                         for i in range(len(all_x_data)) if all_x_data[i] < x[0]]
-        elif event.key == 'right':
-            candidates = [(i, abs(all_x_data[i] - x[0])) 
-                         for i in range(len(all_x_data)) if all_x_data[i] > x[0]]
-        elif event.key == 'enter':
-            self.add_marker(all_x_data[current_index], all_y_data[current_index])
+        if event.key == 'enter':
+            point = self.navigator.point(pos)
+            self.add_marker(point.x, point.y)
             return
         
-        if candidates:
-            candidates.sort(key=lambda t: t[1])
-            current_index = candidates[0][0]
-        
-        new_x = all_x_data[current_index]
-        new_y = all_y_data[current_index]
-        self.hover_pos = [new_x, new_y]
-        self.hover_dot.set_data([new_x], [new_y])
-        self.canvas.draw_idle()
+        if event.key in ('left', 'right'):
+            pos = self.navigator.step(pos, event.key)
+        point = self.navigator.point(pos)
+        self.hover_pos = [point.x, point.y]
+        self.hover_dot.set_data([point.x], [point.y])
+        self.hover_overlay.update()
     
     def add_marker(self, x: float, y: float) -> None:
-        min_distance = float('inf')
-        closest_file = None
-        closest_x = closest_y = None
-
-        for file_name, (data_x, data_y) in self.data_dict.items():
-            x_array = np.array(data_x)
-            y_array = np.array(data_y)
-            idx = int((np.abs(x_array - x)).argmin())
-            x_val = float(x_array[idx])
-            y_val = float(y_array[idx])
-            dist = np.hypot(x_val - x, y_val - y)
-            if dist < min_distance:
-                min_distance = dist
-                closest_file = file_name
-                closest_x, closest_y = x_val, y_val
-
-        if closest_file is not None and closest_x is not None and closest_y is not None:
+        pick = self.pick_index.nearest(x, y, *axes_scale(self.ax))
+        if pick is not None:
+            closest_file, closest_x, closest_y = pick.tag, pick.x, pick.y
             marker = self.ax.plot(
                 np.round(closest_x, 4), np.round(closest_y, 4),
                 marker='o', color='red', markersize=7
@@ -1,9 +1,8 @@
 """
 스펙트럼 팝업 윈도우 — 파형 시간 범위 선택 시 독립 스펙트럼 표시.
 """
-from typing import List, Optional
+from typing import Optional
 
-import numpy as np
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSizePolicy, QApplication
 from PyQt5.QtCore import Qt
 
@@ -12,6 +11,9 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 from vibration.presentation.views.dialogs.responsive_layout_utils import PlotFontSizes
 from vibration.presentation.views.tabs.spectrum_tab import VIEW_TYPE_LABELS
+from vibration.presentation.views.widgets.plot_lod import AxesLOD, PeakPyramid
+from vibration.presentation.views.widgets.pick_index import PickIndex, axes_scale
+from vibration.presentation.views.widgets.blit_overlay import BlitOverlay
 
 
 class SpectrumWindow(QWidget):
@@ -45,8 +47,11 @@ class SpectrumWindow(QWidget):
         self.ax = self.figure.add_subplot(111)
         self.ax.set_title("Vibration Spectrum", fontsize=PlotFontSizes.TITLE)
         self.canvas.setFocusPolicy(Qt.ClickFocus)
+        self._lod = AxesLOD(self.ax)
+        self._pick_index = PickIndex()
+        self._hover_overlay = BlitOverlay(self.canvas)
         
-        self.hover_dot = self.ax.plot([], [], 'ko', markersize=6, alpha=0.5)[0]
+        self.hover_dot = self._hover_overlay.add(self.ax.plot([], [], 'ko', markersize=6, alpha=0.5)[0])
         
         self.canvas.mpl_connect("motion_notify_event", self._on_mouse_move)
         self.canvas.mpl_connect("button_press_event", self._on_mouse_click)
@@ -55,16 +60,19 @@ class SpectrumWindow(QWidget):
     
     PLOT_COLORS = ['b', 'g', 'r', 'c', 'm', 'y']
 
-    def plot_spectrum(self, frequencies: List[float], spectrum: List[float],
-                      label: str = '', view_type: str = 'ACC',
+    def plot_spectrum(self, frequencies, spectrum, label: str = '', view_type: str = 'ACC',
                       color_index: int = 0, clear: bool = True):
         if clear:
             self.ax.clear()
+            self._lod.reset()
+            self._pick_index.clear()
             self.ax.set_title("Vibration Spectrum", fontsize=PlotFontSizes.TITLE)
-            self.hover_dot = self.ax.plot([], [], 'ko', markersize=6, alpha=0.5)[0]
+            self.hover_dot = self._hover_overlay.add(self.ax.plot([], [], 'ko', markersize=6, alpha=0.5)[0])
         
         color = self.PLOT_COLORS[color_index % len(self.PLOT_COLORS)]
-        self.ax.plot(frequencies, spectrum, color=color, linewidth=0.5, label=label, alpha=0.8)
+        self._lod.plot(PeakPyramid(frequencies, spectrum),
+                       color=color, linewidth=0.5, label=label, alpha=0.8)
+        self._pick_index.add(frequencies, spectrum, tag=label)
         self.ax.set_xlabel('Frequency (Hz)')
         self.ax.set_ylabel(VIEW_TYPE_LABELS.get(view_type, ''))
         self.ax.grid(True)
@@ -78,25 +86,16 @@ class SpectrumWindow(QWidget):
             if self.hover_pos is not None:
                 self.hover_dot.set_data([], [])
                 self.hover_pos = None
-                self.canvas.draw_idle()
+                self._hover_overlay.update()
             return
         
-        closest_x, closest_y, min_dist = None, None, np.inf
-        
-        for line in self.ax.get_lines():
-            x_data, y_data = line.get_xdata(), line.get_ydata()
-            if len(x_data) == 0 or len(y_data) == 0:
-                continue
-            for x, y in zip(x_data, y_data):
-                dist = np.hypot(event.xdata - x, event.ydata - y)
-                if dist < min_dist:
-                    min_dist = dist
-                    closest_x, closest_y = x, y
+        pick = self._pick_index.nearest(event.xdata, event.ydata, *axes_scale(self.ax))
+        closest_x, closest_y = (pick.x, pick.y) if pick else (None, None)
         
         if closest_x is not None:
             self.hover_dot.set_data([closest_x], [closest_y])
             self.hover_pos = [closest_x, closest_y]
-            self.canvas.draw_idle()
+            self._hover_overlay.update()
     
     def _on_mouse_click(self, event):
         if not event.inaxes:
@@ -9,7 +9,7 @@ from typing import Optional, List, Dict, Any
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QTextBrowser, QTableView, QHeaderView, QFileDialog, QMessageBox,
-    QLabel, QDateEdit, QMenu, QAction, QInputDialog
+    QLabel, QDateEdit, QMenu, QAction, QInputDialog, QComboBox, QCheckBox
 )
 from PyQt5.QtCore import pyqtSignal, Qt, QDate
 from PyQt5.QtGui import QCursor
@@ -84,6 +84,16 @@ class DataQueryTabView(QWidget):
         filter_layout.addWidget(to_label)
         filter_layout.addWidget(self.date_to)
         
+        # 로드된 그룹을 즉시 필터링 (다시 스캔하지 않음)
+        self.channel_filter_combo = QComboBox()
+        self.channel_filter_combo.addItem("All Ch", None)
+        self.fs_filter_combo = QComboBox()
+        self.fs_filter_combo.addItem("All Fs", None)
+        self.anomaly_only_checkbox = QCheckBox("Anomaly only")
+        filter_layout.addWidget(self.channel_filter_combo)
+        filter_layout.addWidget(self.fs_filter_combo)
+        filter_layout.addWidget(self.anomaly_only_checkbox)
+        
         filter_layout.addSpacing(20)
         
         self.measurement_type_label = QLabel("Type: --")
@@ -109,6 +119,8 @@ class DataQueryTabView(QWidget):
         self.file_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.file_table.customContextMenuRequested.connect(self._on_context_menu)
         self.file_table.setSelectionBehavior(QTableView.SelectRows)
+        self.file_table.setSortingEnabled(True)
+        self.file_table.sortByColumn(0, Qt.AscendingOrder)
         layout.addWidget(self.file_table, stretch=1)
     
     def _connect_signals(self):
@@ -117,6 +129,49 @@ class DataQueryTabView(QWidget):
         self.choose_btn.clicked.connect(self._on_choose_clicked)
         self.save_project_btn.clicked.connect(self.save_project_requested.emit)
         self.load_project_btn.clicked.connect(self.load_project_requested.emit)
+        self.date_from.dateChanged.connect(self._apply_filter)
+        self.date_to.dateChanged.connect(self._apply_filter)
+        self.channel_filter_combo.currentIndexChanged.connect(self._apply_filter)
+        self.fs_filter_combo.currentIndexChanged.connect(self._apply_filter)
+        self.anomaly_only_checkbox.stateChanged.connect(self._apply_filter)
+    
+    def _apply_filter(self, *_):
+        """날짜/채널/Fs/이상 상태 필터를 모델에 적용합니다."""
+        channel = self.channel_filter_combo.currentData()
+        fs = self.fs_filter_combo.currentData()
+        from_date, to_date = self.get_date_range()
+        self._model.set_filter(
+            date_from=from_date, date_to=to_date,
+            channels=[channel] if channel is not None else None,
+            sampling_rates=[fs] if fs is not None else None,
+            anomaly=True if self.anomaly_only_checkbox.isChecked() else None,
+        )
+    
+    def _populate_filter_choices(self):
+        """로드된 그룹의 채널/샘플링 레이트로 필터 콤보를 채웁니다."""
+        table = self._model.get_table()
+        for combo, label, values, text in (
+            (self.channel_filter_combo, "All Ch", table.channel_names(), str),
+            (self.fs_filter_combo, "All Fs", table.sampling_rates(), lambda fs: f"{fs:.0f} Hz"),
+        ):
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItem(label, None)
+            for value in values:
+                combo.addItem(text(value), value)
+            combo.blockSignals(False)
+        
+        # 프로젝트 로드 등으로 날짜 범위 밖의 그룹이 들어오면 범위를 넓혀 숨기지 않음
+        date_range = table.date_range()
+        if date_range is not None:
+            first, last = date_range
+            for edit, value, wider in ((self.date_from, first, lambda d, cur: d < cur),
+                                       (self.date_to, last, lambda d, cur: d > cur)):
+                qdate = QDate.fromString(str(value), "yyyy-MM-dd")
+                if qdate.isValid() and wider(qdate, edit.date()):
+                    edit.blockSignals(True)
+                    edit.setDate(qdate)
+                    edit.blockSignals(False)
     
     def _on_select_clicked(self):
         dir_path = QFileDialog.getExistingDirectory(
@@ -167,6 +222,8 @@ class DataQueryTabView(QWidget):
     
     def set_files(self, files: List[Dict[str, Any]]):
         self._model.set_files(files)
+        self._populate_filter_choices()
+        self._apply_filter()
     
     def get_selected_files(self) -> List[str]:
         return self._model.get_checked_files()
@@ -6,8 +6,6 @@ cn_3F_trend_optimized.py 1810-2100 라인과 동일한 픽셀 완벽 UI 호환.
 from typing import List, Optional
 import re
 import numpy as np
-from datetime import datetime
-import matplotlib.dates as mdates
 
 from PyQt5.QtWidgets import (
     QWidget, QHBoxLayout, QGridLayout, QVBoxLayout, QComboBox, QPushButton,
@@ -21,6 +19,8 @@ from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 from vibration.presentation.views.dialogs.responsive_layout_utils import WidgetSizes, PlotFontSizes
+from vibration.presentation.views.widgets.pick_index import PickIndex, PointNavigator, axes_scale
+from vibration.presentation.views.widgets.blit_overlay import BlitOverlay
 
 
 VIEW_TYPE_LABELS = {
@@ -58,6 +58,9 @@ class PeakTabView(QWidget):
         self.peak_x_value = []
         self.peak_values = []
         self.peak_file_names = []
+        self._pick_index = PickIndex()
+        self._navigator = PointNavigator()
+        self._marker_index = PickIndex()
         self._all_files: List[str] = []
         self._original_limits: dict = {}
         self._setup_ui()
@@ -228,6 +231,7 @@ class PeakTabView(QWidget):
         self.peak_figure.set_tight_layout({'rect': [0, 0, 0.88, 1]})
         self.peak_canvas = FigureCanvas(self.peak_figure)
         self.peak_canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self._hover_overlay = BlitOverlay(self.peak_canvas)
         self.peak_ax = self.peak_figure.add_subplot(111)
         self.peak_ax.set_title("Band Peak Trend", fontsize=PlotFontSizes.TITLE)
         self.peak_canvas.setFocusPolicy(Qt.ClickFocus)
@@ -277,35 +281,21 @@ class PeakTabView(QWidget):
         self.checkBox_24.stateChanged.connect(self._on_channel_filter_changed)
     
     def _on_channel_filter_changed(self):
-        """채널 체크박스 상태 변경을 처리 - 파일 목록을 필터링합니다."""
-        self._update_filtered_file_list()
+        """채널 체크박스 상태 변경을 알립니다 - 프레젠터가 파일 카탈로그로 목록을 필터링합니다."""
         self.channel_filter_changed.emit()
     
-    def _update_filtered_file_list(self):
-        """선택된 채널 체크박스에 따라 파일 목록을 업데이트합니다."""
-        if not self._all_files:
-            return
-        
-        selected_channels = []
+    def get_selected_channels(self) -> List[str]:
+        """체크된 채널 번호 목록 ('1'~'6', 비어 있으면 전체 채널)."""
         checkboxes = [
             self.checkBox_19, self.checkBox_20, self.checkBox_21,
             self.checkBox_22, self.checkBox_23, self.checkBox_24
         ]
-        for idx, checkbox in enumerate(checkboxes, start=1):
-            if checkbox.isChecked():
-                selected_channels.append(str(idx))
-        
-        if not selected_channels:
-            self.Querry_list4.clear()
-            self.Querry_list4.addItems(self._all_files)
-            return
-        
-        filtered_files = [
-            f for f in self._all_files
-            if any(f.endswith(f"_{ch}.txt") for ch in selected_channels)
-        ]
+        return [str(idx) for idx, checkbox in enumerate(checkboxes, start=1) if checkbox.isChecked()]
+    
+    def show_files(self, files: List[str]):
+        """필터를 적용한 파일 목록을 표시합니다 (set_files의 전체 목록은 유지)."""
         self.Querry_list4.clear()
-        self.Querry_list4.addItems(filtered_files)
+        self.Querry_list4.addItems(files)
     
     def _init_mouse_events(self):
         self.peak_canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
@@ -384,10 +374,14 @@ class PeakTabView(QWidget):
     def plot_peak_trend(self, channel_data: dict, clear: bool = True):
         if clear:
             self.peak_ax.clear()
+            self._pick_index.clear()
+            self._navigator.clear()
             self.peak_ax.set_title("Band Peak Trend", fontsize=PlotFontSizes.TITLE)
         
         for idx, (ch, data) in enumerate(sorted(channel_data.items())):
             color = CHANNEL_COLORS[idx % len(CHANNEL_COLORS)]
+            self._pick_index.add(data['x'], data['y'], tag=ch)
+            self._navigator.add(data['x'], data['y'], tag=ch)
             self.peak_ax.plot(data['x'], data['y'], 
                              label=f"Channel {ch}", color=color,
                              marker='o', markersize=2, linewidth=0.5)
@@ -406,6 +400,8 @@ class PeakTabView(QWidget):
     
     def clear_plot(self):
         self.peak_ax.clear()
+        self._pick_index.clear()
+        self._navigator.clear()
         self.peak_ax.set_title("Band Peak Trend", fontsize=PlotFontSizes.TITLE)
         self.peak_canvas.draw()
     
@@ -423,32 +419,19 @@ class PeakTabView(QWidget):
                 if self.hover_dot:
                     self.hover_dot.set_data([], [])
                 self.hover_pos = None
-                self.peak_canvas.draw_idle()
+                self._hover_overlay.update()
             return
         
-        closest_x, closest_y, min_dist = None, None, np.inf
-        
-        for line in self.peak_ax.get_lines():
-            x_data, y_data = line.get_xdata(), line.get_ydata()
-            
-            if len(x_data) == 0 or len(y_data) == 0:
-                continue
-            
-            if isinstance(x_data[0], datetime):
-                x_data = mdates.date2num(x_data)
-            
-            for x, y in zip(x_data, y_data):
-                dist = np.hypot(event.xdata - x, event.ydata - y)
-                if dist < min_dist:
-                    min_dist = dist
-                    closest_x, closest_y = x, y
+        pick = self._pick_index.nearest(event.xdata, event.ydata, *axes_scale(self.peak_ax))
+        closest_x, closest_y = (pick.x, pick.y) if pick else (None, None)
         
         if closest_x is not None:
-            if self.hover_dot is None:
-                self.hover_dot = self.peak_ax.plot([], [], 'ko', markersize=6, alpha=0.5)[0]
+            if self.hover_dot is None or self.hover_dot.axes is None:
+                self.hover_dot = self._hover_overlay.add(
+                    self.peak_ax.plot([], [], 'ko', markersize=6, alpha=0.5)[0])
             self.hover_dot.set_data([closest_x], [closest_y])
             self.hover_pos = [closest_x, closest_y]
-            self.peak_canvas.draw_idle()
+            self._hover_overlay.update()
     
     def _on_mouse_click(self, event):
         if not event.inaxes:
@@ -475,35 +458,27 @@ class PeakTabView(QWidget):
             self._clear_markers()
         elif event.key == 'enter' and self.hover_pos:
             self._add_marker(self.hover_pos[0], self.hover_pos[1])
+        elif event.key in ('left', 'right', 'up', 'down') and self.hover_pos:
+            self._move_hover(event.key)
+    
+    def _move_hover(self, key: str):
+        """방향키로 호버 포인트를 인접 포인트로 옮깁니다."""
+        pos = self._navigator.locate(self.hover_pos[0], self.hover_pos[1])
+        if pos is None:
+            return
+        point = self._navigator.point(self._navigator.step(pos, key))
+        self.hover_dot.set_data([point.x], [point.y])
+        self.hover_pos = [point.x, point.y]
+        self._hover_overlay.update()
     
     def _add_marker(self, x, y):
         if not self.peak_x_value or not self.peak_values:
             return
         
-        min_distance = float('inf')
-        closest_index = -1
-        
-        for i, (data_x, data_y) in enumerate(zip(self.peak_x_value, self.peak_values)):
-            if isinstance(data_x, datetime):
-                data_x_float = mdates.date2num(data_x)
-            else:
-                data_x_float = data_x
-            
-            if isinstance(x, datetime):
-                x_float = mdates.date2num(x)
-            else:
-                x_float = x
-            
-            dx = abs(x_float - data_x_float)
-            dy = abs(float(y) - data_y)
-            dist = np.hypot(dx, dy) if dx != 0 else dy
-            
-            if dist < min_distance:
-                min_distance = dist
-                closest_index = i
-        
-        if closest_index == -1:
+        pick = self._marker_index.nearest(x, y, *axes_scale(self.peak_ax))
+        if pick is None:
             return
+        closest_index = pick.index
         
         if self.peak_marker:
             try:
@@ -598,6 +573,8 @@ class PeakTabView(QWidget):
         self.peak_x_value = x_values
         self.peak_values = peak_values
         self.peak_file_names = file_names
+        self._marker_index.clear()
+        self._marker_index.add(x_values, peak_values)
     
     def set_directory_path(self, directory_path: str):
         self._directory_path = directory_path
@@ -19,6 +19,9 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.widgets import SpanSelector
 
 from vibration.presentation.views.dialogs.responsive_layout_utils import WidgetSizes, PlotFontSizes
+from vibration.presentation.views.widgets.plot_lod import AxesLOD, MinMaxPyramid, PeakPyramid
+from vibration.presentation.views.widgets.pick_index import PickIndex, PointNavigator, axes_scale
+from vibration.presentation.views.widgets.blit_overlay import BlitOverlay
 
 
 VIEW_TYPE_LABELS = {
@@ -354,6 +357,7 @@ class SpectrumTabView(QWidget):
         self.waveax = self.waveform_figure.add_subplot(111)
         self.waveax.set_title("Waveform", fontsize=PlotFontSizes.TITLE)
         self.wavecanvas.setFocusPolicy(Qt.StrongFocus)
+        self._wave_lod = AxesLOD(self.waveax)
         
         self.figure = Figure(figsize=(10, 4), dpi=dpi)
         self.figure.set_tight_layout({'rect': [0, 0, 0.88, 1]})
@@ -362,6 +366,10 @@ class SpectrumTabView(QWidget):
         self.ax = self.figure.add_subplot(111)
         self.ax.set_title("Vibration Spectrum", fontsize=PlotFontSizes.TITLE)
         self.canvas.setFocusPolicy(Qt.StrongFocus)
+        self._spec_lod = AxesLOD(self.ax)
+        self._pick_index = PickIndex()
+        self._navigator = PointNavigator()
+        self._hover_overlay = BlitOverlay(self.canvas)
         
         self._connect_picking_events()
         
@@ -612,35 +620,21 @@ class SpectrumTabView(QWidget):
         self.date_filter_changed.emit(from_str, to_str)
     
     def _on_channel_filter_changed(self):
-        """채널 체크박스 상태 변경을 처리 - 파일 목록을 필터링합니다."""
-        self._update_filtered_file_list()
+        """채널 체크박스 상태 변경을 알립니다 - 프레젠터가 파일 카탈로그로 목록을 필터링합니다."""
         self.channel_filter_changed.emit()
     
-    def _update_filtered_file_list(self):
-        """선택된 채널 체크박스에 따라 파일 목록을 업데이트합니다."""
-        if not self._all_files:
-            return
-        
-        selected_channels = []
+    def get_selected_channels(self) -> List[str]:
+        """체크된 채널 번호 목록 ('1'~'6', 비어 있으면 전체 채널)."""
         checkboxes = [
             self.checkBox, self.checkBox_2, self.checkBox_3,
             self.checkBox_4, self.checkBox_5, self.checkBox_6
         ]
-        for idx, checkbox in enumerate(checkboxes, start=1):
-            if checkbox.isChecked():
-                selected_channels.append(str(idx))
-        
-        if not selected_channels:
-            self.Querry_list.clear()
-            self.Querry_list.addItems(self._all_files)
-            return
-        
-        filtered_files = [
-            f for f in self._all_files
-            if any(f.endswith(f"_{ch}.txt") for ch in selected_channels)
-        ]
+        return [str(idx) for idx, checkbox in enumerate(checkboxes, start=1) if checkbox.isChecked()]
+    
+    def show_files(self, files: List[str]):
+        """필터를 적용한 파일 목록을 표시합니다 (set_files의 전체 목록은 유지)."""
         self.Querry_list.clear()
-        self.Querry_list.addItems(filtered_files)
+        self.Querry_list.addItems(files)
     
     def _on_span_selected(self, t_start: float, t_end: float):
         """SpanSelector 시간 범위 선택 처리."""
@@ -726,7 +720,7 @@ class SpectrumTabView(QWidget):
         self.cid_move = self.canvas.mpl_connect("motion_notify_event", self._on_mouse_move)
         self.cid_click = self.canvas.mpl_connect("button_press_event", self._on_mouse_click)
         self.cid_key = self.canvas.mpl_connect("key_press_event", self._on_key_press)
-        self.hover_dot = self.ax.plot([], [], 'ko', markersize=6, alpha=0.5)[0]
+        self.hover_dot = self._hover_overlay.add(self.ax.plot([], [], 'ko', markersize=6, alpha=0.5)[0])
     
     def _reconnect_picking_events(self):
         if hasattr(self, 'cid_move') and self.cid_move:
@@ -738,7 +732,7 @@ class SpectrumTabView(QWidget):
         self.cid_move = self.canvas.mpl_connect("motion_notify_event", self._on_mouse_move)
         self.cid_click = self.canvas.mpl_connect("button_press_event", self._on_mouse_click)
         self.cid_key = self.canvas.mpl_connect("key_press_event", self._on_key_press)
-        self.hover_dot = self.ax.plot([], [], 'ko', markersize=6, alpha=0.5)[0]
+        self.hover_dot = self._hover_overlay.add(self.ax.plot([], [], 'ko', markersize=6, alpha=0.5)[0])
         self.hover_pos = None
     
     def get_parameters(self) -> dict:
@@ -750,18 +744,28 @@ class SpectrumTabView(QWidget):
     
     _MAX_LEGEND_ITEMS = 15
     
-    def plot_spectrum(self, frequencies: List[float], spectrum: List[float],
-                      label: str = '', color_index: int = 0, clear: bool = True):
+    def plot_spectrum(self, frequencies, spectrum, label: str = '', color_index: int = 0,
+                      clear: bool = True):
+        """
+        스펙트럼을 그립니다. 픽셀 버킷마다 최댓값만 그리는 피크 보존 샘플링을
+        사용하며 줌/팬/축 범위 변경 시 다시 조회합니다.
+        """
         if clear:
             self.ax.clear()
+            self._spec_lod.reset()
+            self._pick_index.clear()
+            self._navigator.clear()
             self.ax.set_title("Vibration Spectrum", fontsize=PlotFontSizes.TITLE)
             self.data_dict.clear()
             self.markers.clear()
             self._reconnect_picking_events()
         
         color = PLOT_COLORS[color_index % len(PLOT_COLORS)]
-        self.ax.plot(frequencies, spectrum, color=color, linewidth=0.5, label=label, alpha=0.8)
+        self._spec_lod.plot(PeakPyramid(frequencies, spectrum),
+                            color=color, linewidth=0.5, label=label, alpha=0.8)
         
+        self._pick_index.add(frequencies, spectrum, tag=label)
+        self._navigator.add(frequencies, spectrum, tag=label)
         if label:
             self.data_dict[label] = (frequencies, spectrum)
         
@@ -770,14 +774,20 @@ class SpectrumTabView(QWidget):
         self.ax.grid(True)
         self._update_legend(self.ax, self.figure, self.canvas)
     
-    def plot_waveform(self, time: List[float], amplitude: List[float],
-                      label: str = '', color_index: int = 0, clear: bool = True):
+    def plot_waveform(self, time, amplitude, label: str = '', color_index: int = 0,
+                      clear: bool = True):
+        """
+        파형을 그립니다. 원본 샘플 대신 min/max 피라미드에서 현재 x 범위와
+        축 픽셀 폭에 맞는 포인트만 그리고, 줌/팬 시 다시 조회합니다.
+        """
         if clear:
             self.waveax.clear()
+            self._wave_lod.reset()
             self.waveax.set_title("Waveform", fontsize=PlotFontSizes.TITLE)
         
         color = PLOT_COLORS[color_index % len(PLOT_COLORS)]
-        self.waveax.plot(time, amplitude, color=color, linewidth=0.5, label=label, alpha=0.8)
+        self._wave_lod.plot(MinMaxPyramid.from_xy(time, amplitude),
+                            color=color, linewidth=0.5, label=label, alpha=0.8)
         self.waveax.set_xlabel('Time (s)')
         self.waveax.set_ylabel(WAVEFORM_Y_LABELS.get(self._current_view_type, ''))
         self.waveax.grid(True)
@@ -837,12 +847,16 @@ class SpectrumTabView(QWidget):
     
     def clear_plots(self):
         self.ax.clear()
+        self._spec_lod.reset()
+        self._pick_index.clear()
+        self._navigator.clear()
         self.ax.set_title("Vibration Spectrum", fontsize=PlotFontSizes.TITLE)
         self.markers.clear()
         self.data_dict.clear()
         self._reconnect_picking_events()
         self.canvas.draw()
         self.waveax.clear()
+        self._wave_lod.reset()
         self.waveax.set_title("Waveform", fontsize=PlotFontSizes.TITLE)
         self.wavecanvas.draw()
     
@@ -870,27 +884,16 @@ class SpectrumTabView(QWidget):
             if self.hover_pos is not None:
                 self.hover_dot.set_data([], [])
                 self.hover_pos = None
-                self.canvas.draw_idle()
+                self._hover_overlay.update()
             return
         
-        import numpy as np
-        closest_x, closest_y, min_dist = None, None, np.inf
-        
-        for line in self.ax.get_lines():
-            x_data, y_data = line.get_xdata(), line.get_ydata()
-            if len(x_data) == 0 or len(y_data) == 0:
-                continue
-            
-            for x, y in zip(x_data, y_data):
-                dist = np.hypot(event.xdata - x, event.ydata - y)
-                if dist < min_dist:
-                    min_dist = dist
-                    closest_x, closest_y = x, y
+        pick = self._pick_index.nearest(event.xdata, event.ydata, *axes_scale(self.ax))
+        closest_x, closest_y = (pick.x, pick.y) if pick else (None, None)
         
         if closest_x is not None:
             self.hover_dot.set_data([closest_x], [closest_y])
             self.hover_pos = [closest_x, closest_y]
-            self.canvas.draw_idle()
+            self._hover_overlay.update()
     
     def _on_mouse_click(self, event):
         if not event.inaxes:
@@ -913,60 +916,23 @@ class SpectrumTabView(QWidget):
             self.clear_markers()
     
     def _on_key_press(self, event):
-        import numpy as np
         x, y = self.hover_dot.get_data()
         if x is None or len(x) == 0:
             return
         
-        x, y = float(x[0]), float(y[0])
-        
-        all_x_data = []
-        all_y_data = []
-        for line in self.ax.get_lines():
-            x_data, y_data = line.get_xdata(), line.get_ydata()
-            if len(x_data) == 0 or len(y_data) == 0:
-                continue
-            all_x_data.extend(x_data)
-            all_y_data.extend(y_data)
-        
-        if not all_x_data:
-            return
-        
-        current_index = None
-        min_dist = np.inf
-        for idx, (x_val, y_val) in enumerate(zip(all_x_data, all_y_data)):
-            dist = np.hypot(x - x_val, y - y_val)
-            if dist < min_dist:
-                min_dist = dist
-                current_index = idx
-        
-        if current_index is None:
+        pos = self._navigator.locate(float(x[0]), float(y[0]))
+        if pos is None:
             return
         
-        candidates = []
-        if event.key == 'left':
-            candidates = [(i, abs(all_x_data[i] - x)) for i in range(len(all_x_data)) if all_x_data[i] < x]
-        elif event.key == 'right':
-            candidates = [(i, abs(all_x_data[i] - x)) for i in range(len(all_x_data)) if all_x_data[i] > x]
-        elif event.key == 'up':
-            candidates = [(i, abs(all_y_data[i] - y)) for i in range(len(all_y_data)) 
-                          if abs(all_x_data[i] - x) < 1e-6 and all_y_data[i] > y]
-        elif event.key == 'down':
-            candidates = [(i, abs(all_y_data[i] - y)) for i in range(len(all_y_data)) 
-                          if abs(all_x_data[i] - x) < 1e-6 and all_y_data[i] < y]
-        elif event.key == 'enter':
-            self._add_marker(all_x_data[current_index], all_y_data[current_index])
+        if event.key == 'enter':
+            point = self._navigator.point(pos)
+            self._add_marker(point.x, point.y)
             return
         
-        if candidates:
-            candidates.sort(key=lambda t: t[1])
-            current_index = candidates[0][0]
-        
-        new_x = all_x_data[current_index]
-        new_y = all_y_data[current_index]
-        self.hover_pos = [new_x, new_y]
-        self.hover_dot.set_data([new_x], [new_y])
-        self.canvas.draw_idle()
+        point = self._navigator.point(self._navigator.step(pos, event.key))
+        self.hover_pos = [point.x, point.y]
+        self.hover_dot.set_data([point.x], [point.y])
+        self._hover_overlay.update()
     
     def _add_marker(self, x: float, y: float):
         marker, = self.ax.plot([x], [y], 'ro', markersize=8, zorder=10)
@@ -19,9 +19,14 @@ from PyQt5.QtGui import QScreen, QColor, QFont, QCursor
 import numpy as np
 
 from matplotlib.figure import Figure
+from matplotlib.widgets import SpanSelector
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
+from vibration.core.services.waterfall_layout import WaterfallPoints
+from vibration.presentation.views.dialogs.band_trend_dialog import BandTrendDialog
 from vibration.presentation.views.dialogs.responsive_layout_utils import WidgetSizes, PlotFontSizes
+from vibration.presentation.views.widgets.pick_index import PickIndex, axes_scale
+from vibration.presentation.views.widgets.blit_overlay import BlitOverlay
 
 
 VIEW_TYPE_LABELS = {
@@ -62,7 +67,9 @@ class WaterfallTabView(QWidget):
     angle_changed = pyqtSignal()
     channel_filter_changed = pyqtSignal()
     date_filter_changed = pyqtSignal(str, str)
-    band_trend_requested = pyqtSignal(float)
+    band_trend_requested = pyqtSignal(list)  # BandSpec 목록
+    band_span_selected = pyqtSignal(float, float)  # 축 데이터 x 범위 (오른쪽 드래그)
+    display_mode_changed = pyqtSignal()
     
     def __init__(self, parent: Optional[QWidget] = None):
         """워터폴 탭 뷰를 초기화합니다."""
@@ -73,7 +80,9 @@ class WaterfallTabView(QWidget):
         self.hover_pos = None
         self.waterfall_marker = None
         self.waterfall_annotation = None
-        self._picking_data: List[tuple[float, float, float, float, str]] = []
+        self._picking_data: Optional[WaterfallPoints] = None
+        self._band_selector: Optional[SpanSelector] = None
+        self._pick_index = PickIndex()
         self._setup_ui()
         self._connect_signals()
     
@@ -268,6 +277,22 @@ class WaterfallTabView(QWidget):
         self.angle_input.setMaximumSize(*WidgetSizes.option_control())
         self.options2_layout.addWidget(self.angle_input, 5, 1)
         
+        # 표시 모드: 라인 스택(기존) / 시간 × 주파수 히트맵
+        self.display_mode_label = QTextBrowser()
+        self.display_mode_label.setMaximumSize(*WidgetSizes.option_control())
+        self.display_mode_label.setHtml("Display")
+        self.options2_layout.addWidget(self.display_mode_label, 6, 0)
+        
+        self.display_mode_combo = QComboBox()
+        self.display_mode_combo.setMaximumSize(*WidgetSizes.option_control())
+        self.display_mode_combo.setStyleSheet("background-color: lightgray; color: black;")
+        self.display_mode_combo.addItem("Lines", 'lines')
+        self.display_mode_combo.addItem("Heatmap", 'heatmap')
+        self.options2_layout.addWidget(self.display_mode_combo, 6, 1)
+        
+        self.log_color_checkbox = QCheckBox("Log Color")
+        self.options2_layout.addWidget(self.log_color_checkbox, 7, 1)
+        
         # Plot Waterfall button
         self.plot_waterfall_button = QPushButton("Plot Waterfall")
         self.plot_waterfall_button.setMaximumSize(*WidgetSizes.option_control())
@@ -371,6 +396,7 @@ class WaterfallTabView(QWidget):
         self.waterfall_figure = Figure(figsize=(10, 4), dpi=dpi)
         self.waterfall_canvas = FigureCanvas(self.waterfall_figure)
         self.waterfall_canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self._hover_overlay = BlitOverlay(self.waterfall_canvas)
         self.waterfall_ax = self.waterfall_figure.add_subplot(111)
         self.waterfall_ax.set_title("Waterfall Spectrum", fontsize=PlotFontSizes.TITLE)
         
@@ -391,6 +417,10 @@ class WaterfallTabView(QWidget):
         # 각도 입력 - Enter 시 발행
         self.angle_input.returnPressed.connect(self.angle_changed.emit)
         
+        # 표시 모드/색 스케일 - 캐시된 스펙트럼으로 다시 그림
+        self.display_mode_combo.currentIndexChanged.connect(lambda _: self.display_mode_changed.emit())
+        self.log_color_checkbox.stateChanged.connect(lambda _: self.display_mode_changed.emit())
+        
         # 전체 선택 / 전체 해제 버튼
         self.select_all_btn2.clicked.connect(self.Querry_list2.selectAll)
         self.deselect_all_btn2.clicked.connect(self.Querry_list2.clearSelection)
@@ -408,33 +438,20 @@ class WaterfallTabView(QWidget):
 
     
     def _on_channel_filter_changed(self):
-        """채널 체크박스 상태 변경을 처리 - 파일 목록을 필터링합니다."""
-        self._update_filtered_file_list()
+        """채널 체크박스 상태 변경을 알립니다 - 프레젠터가 파일 카탈로그로 목록을 필터링합니다."""
         self.channel_filter_changed.emit()
     
-    def _update_filtered_file_list(self):
-        """선택된 채널 체크박스에 따라 파일 목록을 업데이트합니다."""
-        if not self._all_files:
-            return
-        
-        selected_channels = []
+    def get_selected_channels(self) -> List[str]:
+        """체크된 채널 번호 목록 ('1'~'6', 비어 있으면 전체 채널)."""
         checkboxes = [
             self.checkBox_7, self.checkBox_8, self.checkBox_9,
             self.checkBox_10, self.checkBox_11, self.checkBox_12
         ]
-        for idx, checkbox in enumerate(checkboxes, start=1):
-            if checkbox.isChecked():
-                selected_channels.append(str(idx))
-        
-        if not selected_channels:
-            self._populate_file_list_grouped(self._all_files)
-            return
-        
-        filtered_files = [
-            f for f in self._all_files
-            if any(f.endswith(f"_{ch}.txt") for ch in selected_channels)
-        ]
-        self._populate_file_list_grouped(filtered_files)
+        return [str(idx) for idx, checkbox in enumerate(checkboxes, start=1) if checkbox.isChecked()]
+    
+    def show_files(self, files: List[str]):
+        """필터를 적용한 파일 목록을 표시합니다 (set_files의 전체 목록은 유지)."""
+        self._populate_file_list_grouped(files)
     
     @staticmethod
     def _extract_channel(filename: str) -> str:
@@ -483,7 +500,9 @@ class WaterfallTabView(QWidget):
             'window_type': self.Function_2.currentText().lower(),
             'overlap': float(self.Overlap_Factor_2.currentText().replace('%', '')),
             'view_type': self.select_pytpe2.currentData(),
-            'angle': angle
+            'angle': angle,
+            'display_mode': self.display_mode_combo.currentData(),
+            'log_color': self.log_color_checkbox.isChecked()
         }
     
     def get_x_axis_limits(self) -> Tuple[Optional[float], Optional[float]]:
@@ -542,6 +561,11 @@ class WaterfallTabView(QWidget):
     def set_axes(self, ax):
         """figure 초기화 후 matplotlib axes 참조를 설정합니다."""
         self.waterfall_ax = ax
+        # 오른쪽 드래그로 대역 선택 (클릭만 하면 기존처럼 마커 지우기)
+        self._band_selector = SpanSelector(
+            ax, self._on_band_span_selected, 'horizontal', button=3, minspan=1.0,
+            useblit=True, props=dict(alpha=0.2, facecolor='orange')
+        )
     
     def draw(self):
         """캔버스를 다시 그립니다."""
@@ -553,12 +577,16 @@ class WaterfallTabView(QWidget):
         self.date_filter_changed.emit(from_str, to_str)
     
     def _on_band_trend_clicked(self):
-        from PyQt5.QtWidgets import QInputDialog
-        freq, ok = QInputDialog.getDouble(
-            self, "Band Trend", "Frequency (Hz):", value=100.0, min=0.0, max=50000.0, decimals=1
-        )
-        if ok:
-            self.band_trend_requested.emit(freq)
+        self.open_band_trend_dialog()
+    
+    def _on_band_span_selected(self, x_start: float, x_end: float):
+        self.band_span_selected.emit(x_start, x_end)
+    
+    def open_band_trend_dialog(self, low: float = 100.0, high: Optional[float] = None):
+        """대역 트렌드 다이얼로그를 열고 확인하면 band_trend_requested를 발행합니다."""
+        dialog = BandTrendDialog(low, high, self)
+        if dialog.exec_() == BandTrendDialog.Accepted:
+            self.band_trend_requested.emit(dialog.get_bands())
     
     def _init_mouse_events(self):
         self.waterfall_canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
@@ -599,8 +627,12 @@ class WaterfallTabView(QWidget):
                                    xdata + (xlim[1] - xdata) * scale_factor)
         self.waterfall_canvas.draw_idle()
     
-    def set_picking_data(self, data: List[tuple[float, float, float, float, str]]):
+    def set_picking_data(self, data: Optional[WaterfallPoints]):
+        """피킹 포인트 배열을 설정합니다 (호버 시 data.entry(i)로 마커 정보 조회)."""
         self._picking_data = data
+        self._pick_index.clear()
+        if data is not None and len(data):
+            self._pick_index.add(data.x, data.y)
     
     def _on_mouse_move(self, event):
         if not event.inaxes:
@@ -608,28 +640,22 @@ class WaterfallTabView(QWidget):
                 if self.hover_dot:
                     self.hover_dot.set_data([], [])
                 self.hover_pos = None
-                self.waterfall_canvas.draw_idle()
+                self._hover_overlay.update()
             return
         
-        if not self._picking_data:
+        if self._picking_data is None:
             return
         
-        closest = None
-        min_dist = np.inf
-        
-        for entry in self._picking_data:
-            plot_x, plot_y = entry[0], entry[1]
-            dist = np.hypot(event.xdata - plot_x, event.ydata - plot_y)
-            if dist < min_dist:
-                min_dist = dist
-                closest = entry
+        pick = self._pick_index.nearest(event.xdata, event.ydata, *axes_scale(self.waterfall_ax))
+        closest = self._picking_data.entry(pick.index) if pick else None
         
         if closest is not None:
-            if self.hover_dot is None:
-                self.hover_dot = self.waterfall_ax.plot([], [], 'ko', markersize=5, alpha=0.5)[0]
+            if self.hover_dot is None or self.hover_dot.axes is None:
+                self.hover_dot = self._hover_overlay.add(
+                    self.waterfall_ax.plot([], [], 'ko', markersize=5, alpha=0.5)[0])
             self.hover_dot.set_data([closest[0]], [closest[1]])
             self.hover_pos = closest
-            self.waterfall_canvas.draw_idle()
+            self._hover_overlay.update()
     
     def _on_mouse_click(self, event):
         if not event.inaxes:
@@ -1,5 +1,10 @@
 """Widget components for vibration analysis application."""
 from .plot_widget import PlotWidget
 from .marker_manager import MarkerManager
+from .blit_overlay import BlitOverlay
+from .plot_lod import AxesLOD, ImageLOD, MinMaxPyramid, PeakPyramid
+from .pick_index import Pick, PickIndex, PointNavigator, axes_scale
 
-__all__ = ['PlotWidget', 'MarkerManager']
+__all__ = ['PlotWidget', 'MarkerManager', 'BlitOverlay',
+           'AxesLOD', 'ImageLOD', 'MinMaxPyramid', 'PeakPyramid',
+           'Pick', 'PickIndex', 'PointNavigator', 'axes_scale']
@@ -0,0 +1,87 @@
+"""
+블리팅 기반 호버 오버레이.
+
+마우스 이동마다 canvas.draw_idle()을 호출하면 점 하나를 옮기기 위해 축의 모든
+선을 다시 그립니다. BlitOverlay는 전체 그리기(draw_event)가 끝날 때마다 배경을
+캐시하고, 호버 점처럼 자주 바뀌는 아티스트는 animated로 지정해 배경 복원 후
+해당 아티스트만 그려 blit합니다. 따라서 호버 프레임 시간은 선 개수와 무관합니다.
+
+배경 캐시는 다음 경우 무효화되고 다음 update()에서 전체 그리기로 대체됩니다:
+- 캔버스 크기 변경 (resize_event)
+- 축 범위 변경 (줌/팬/축 범위 설정) - 캐시 시점의 xlim/ylim과 비교
+- 데이터 변경 등 전체 그리기 - draw_event에서 새 배경을 캐시
+"""
+from typing import Any, List, Optional
+
+
+class BlitOverlay:
+    """
+    캔버스 하나의 animated 아티스트를 블리팅으로 갱신합니다.
+
+    인자:
+        canvas: matplotlib FigureCanvas. 블리팅을 지원하지 않으면 draw_idle로 대체합니다.
+    """
+
+    def __init__(self, canvas: Any):
+        self.canvas = canvas
+        self._artists: List[Any] = []
+        self._background = None
+        self._limits: Optional[list] = None
+        self._cids: List[int] = []
+        if getattr(canvas, 'supports_blit', False):
+            self._cids = [
+                canvas.mpl_connect('draw_event', self._on_draw),
+                canvas.mpl_connect('resize_event', lambda event: self.invalidate()),
+            ]
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._cids)
+
+    def add(self, artist: Any) -> Any:
+        """아티스트를 animated로 지정하고 오버레이에 등록합니다."""
+        if artist is None or artist in self._artists:
+            return artist
+        self._artists = [a for a in self._artists if a.axes is not None]
+        if self.enabled:
+            artist.set_animated(True)
+        self._artists.append(artist)
+        return artist
+
+    def invalidate(self) -> None:
+        """배경 캐시를 버립니다 (다음 update는 전체 그리기)."""
+        self._background = None
+
+    def update(self) -> None:
+        """등록된 아티스트만 다시 그립니다. 캐시가 없거나 오래되면 전체 그리기를 예약합니다."""
+        if not self.enabled:
+            self.canvas.draw_idle()
+            return
+        if self._background is None or self._limits != self._current_limits():
+            self._background = None
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def disconnect(self) -> None:
+        for cid in self._cids:
+            self.canvas.mpl_disconnect(cid)
+        self._cids = []
+        self._background = None
+
+    def _on_draw(self, event) -> None:
+        figure = self.canvas.figure
+        self._background = self.canvas.copy_from_bbox(figure.bbox)
+        self._limits = self._current_limits()
+        self._draw_artists()
+
+    def _draw_artists(self) -> None:
+        figure = self.canvas.figure
+        for artist in self._artists:
+            if artist.axes is not None and artist.figure is figure:
+                figure.draw_artist(artist)
+
+    def _current_limits(self) -> list:
+        return [(ax.get_xlim(), ax.get_ylim()) for ax in self.canvas.figure.axes]
@@ -6,6 +6,8 @@ from PyQt5.QtCore import QObject, pyqtSignal
 from matplotlib.axes import Axes
 
 from vibration.presentation.views.dialogs.responsive_layout_utils import PlotFontSizes
+from vibration.presentation.views.widgets.blit_overlay import BlitOverlay
+from vibration.presentation.views.widgets.pick_index import PickIndex, axes_scale
 
 
 class MarkerType(Enum):
@@ -31,41 +33,51 @@ class MarkerManager(QObject):
         self._hover_dot = None
         self._hover_pos: Optional[List[float]] = None
         self._label_formatter: Optional[Callable[[float, float, Optional[str]], str]] = None
+        self._pick_index = PickIndex()
+        self._pick_key: Optional[tuple] = None
+        self._overlay = BlitOverlay(canvas) if canvas is not None else None
 
     def set_label_formatter(self, formatter: Callable[[float, float, Optional[str]], str]):
         self._label_formatter = formatter
 
     def init_hover_dot(self, color: str = 'blue', size: int = 10) -> Any:
         self._hover_dot, = self.axes.plot([], [], 'o', color=color, markersize=size)
+        if self._overlay:
+            self._overlay.add(self._hover_dot)
         return self._hover_dot
 
     def find_closest_point(self, x: float, y: float) -> Tuple[Optional[float], Optional[float], float]:
-        closest_x, closest_y, min_dist = None, None, np.inf
-        for line in self.axes.get_lines():
-            if line == self._hover_dot:
-                continue
-            xdata, ydata = line.get_xdata(), line.get_ydata()
-            if len(xdata) == 0:
-                continue
-            xdata, ydata = np.asarray(xdata), np.asarray(ydata)
-            dists = np.hypot(xdata - x, ydata - y)
-            idx = np.argmin(dists)
-            if dists[idx] < min_dist:
-                min_dist, closest_x, closest_y = dists[idx], float(xdata[idx]), float(ydata[idx])
-        return closest_x, closest_y, min_dist
+        """데이터 선 중 가장 가까운 포인트와 픽셀 거리를 반환합니다."""
+        pick = self._line_index().nearest(x, y, *axes_scale(self.axes))
+        if pick is None:
+            return None, None, np.inf
+        return pick.x, pick.y, pick.distance
+
+    def _line_index(self) -> PickIndex:
+        """축의 데이터 선으로 피킹 인덱스를 만들고, 선 데이터가 바뀔 때만 다시 만듭니다."""
+        excluded = {id(self._hover_dot)} | {id(marker) for marker, _ in self._markers}
+        lines = [line for line in self.axes.get_lines() if id(line) not in excluded]
+        key = tuple((id(line), id(line.get_xdata(orig=True)), id(line.get_ydata(orig=True)))
+                    for line in lines)
+        if key != self._pick_key:
+            self._pick_index.clear()
+            for line in lines:
+                self._pick_index.add(line.get_xdata(), line.get_ydata(), tag=line)
+            self._pick_key = key
+        return self._pick_index
 
     def on_mouse_move(self, event) -> Optional[Tuple[float, float]]:
         if not event.inaxes or event.inaxes != self.axes:
             if self._hover_pos and self._hover_dot:
                 self._hover_dot.set_data([], [])
                 self._hover_pos = None
-                self._draw()
+                self._draw_hover()
             return None
         cx, cy, _ = self.find_closest_point(event.xdata, event.ydata)
         if cx is not None and self._hover_dot:
             self._hover_dot.set_data([cx], [cy])
             self._hover_pos = [cx, cy]
-            self._draw()
+            self._draw_hover()
         return (cx, cy) if cx else None
 
     def on_mouse_click(self, event, data_lookup: Optional[Callable] = None):
@@ -137,6 +149,9 @@ class MarkerManager(QObject):
     def _draw(self):
         if self.canvas: self.canvas.draw_idle()
 
+    def _draw_hover(self):
+        if self._overlay: self._overlay.update()
+
     def get_marker_count(self) -> int: return len(self._markers)
 
     def get_marker_positions(self) -> List[Tuple[float, float]]:
@@ -0,0 +1,261 @@
+"""
+최근접 포인트 피킹 인덱스.
+
+마우스 이동마다 모든 선의 모든 포인트를 Python 루프로 비교하는 대신, 플롯을
+갱신할 때 한 번 그룹(선)별로 x 정렬 배열을 만들어 두고 이벤트마다 이진 탐색 후
+커서 주변 구간만 NumPy로 비교합니다. 구간은 두 배씩 넓히며, 구간 경계의 x 거리가
+현재 최소 거리보다 크면 더 볼 필요가 없으므로 탐색을 멈춥니다.
+
+거리는 축 픽셀 좌표 기준입니다 (axes_scale 참고). datetime x는 추가 시 한 번만
+matplotlib 날짜 숫자로 변환합니다.
+
+PointNavigator는 방향키 탐색용입니다. 모든 선의 포인트를 (x, y) 순으로 정렬한
+배열과 같은 x 포인트 묶음(run) 경계를 한 번 만들어 두고, 좌/우는 인접 run,
+상/하는 같은 run 안의 이웃 포인트로 이동합니다.
+"""
+from datetime import datetime
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import matplotlib.dates as mdates
+
+# 첫 탐색 구간의 한쪽 포인트 수 (이후 두 배씩 확장)
+_WINDOW = 32
+
+# 방향키 탐색에서 같은 x로 보는 허용 오차
+X_TOLERANCE = 1e-6
+
+
+class Pick(NamedTuple):
+    """최근접 포인트 조회 결과."""
+    x: float
+    y: float
+    tag: Any
+    index: int
+    distance: float
+
+
+def axes_scale(ax) -> Tuple[float, float]:
+    """
+    데이터 좌표 1단위당 픽셀 수 (x, y).
+
+    선형 축 기준이며, 축 크기가 아직 정해지지 않았으면 축 범위로 정규화합니다.
+    """
+    x0, x1 = ax.get_xlim()
+    y0, y1 = ax.get_ylim()
+    try:
+        width, height = ax.bbox.width, ax.bbox.height
+    except Exception:
+        width = height = 1.0
+    x_span = abs(x1 - x0) or 1.0
+    y_span = abs(y1 - y0) or 1.0
+    return (width or 1.0) / x_span, (height or 1.0) / y_span
+
+
+def as_float_x(values: Sequence) -> np.ndarray:
+    """x 값을 float 배열로 변환합니다 (datetime은 matplotlib 날짜 숫자)."""
+    arr = np.asarray(values)
+    if arr.dtype.kind == 'M' or (arr.dtype == object and len(arr) and isinstance(arr.flat[0], datetime)):
+        return np.asarray(mdates.date2num(values), dtype=np.float64)
+    return arr.astype(np.float64, copy=False)
+
+
+class PickIndex:
+    """
+    그룹(선)별 x 정렬 배열 기반 최근접 포인트 인덱스.
+
+    add()로 그룹을 추가하고 nearest()로 조회합니다. 조회 비용은 그룹마다
+    이진 탐색 O(log n)과 커서 주변 구간 비교입니다.
+    """
+
+    def __init__(self):
+        self._groups: List[Tuple[np.ndarray, np.ndarray, np.ndarray, Any]] = []
+
+    def clear(self) -> None:
+        self._groups.clear()
+
+    def __len__(self) -> int:
+        return sum(len(group[0]) for group in self._groups)
+
+    def add(self, x: Sequence, y: Sequence, tag: Any = None) -> None:
+        """
+        포인트 그룹을 추가합니다.
+
+        인자:
+            x: x 값 (float 또는 datetime).
+            y: y 값.
+            tag: 조회 결과에 함께 반환할 식별자 (예: 파일명, 채널).
+        """
+        xs = as_float_x(x)
+        ys = np.asarray(y, dtype=np.float64)
+        n = min(len(xs), len(ys))
+        xs, ys = xs[:n], ys[:n]
+
+        index = np.flatnonzero(np.isfinite(xs) & np.isfinite(ys))
+        if len(index) == 0:
+            return
+        if len(index) < n:
+            xs, ys = xs[index], ys[index]
+        if np.any(np.diff(xs) < 0):
+            order = np.argsort(xs, kind='stable')
+            xs, ys, index = xs[order], ys[order], index[order]
+        self._groups.append((xs, ys, index, tag))
+
+    def nearest(self, x: float, y: float, x_scale: float = 1.0,
+                y_scale: float = 1.0) -> Optional[Pick]:
+        """
+        (x, y)에 가장 가까운 포인트를 반환합니다.
+
+        인자:
+            x, y: 조회 위치 (데이터 좌표).
+            x_scale, y_scale: 거리 계산 시 축별 배율 (axes_scale 결과).
+
+        반환:
+            Pick (index는 add()에 넘긴 배열 기준 위치) 또는 포인트가 없으면 None.
+        """
+        if x is None or y is None:
+            return None
+        if isinstance(x, datetime):
+            x = mdates.date2num(x)
+        best = np.inf
+        found = None
+        for xs, ys, index, tag in self._groups:
+            dist, i = self._search(xs, ys, float(x), float(y), x_scale, y_scale, best)
+            if i >= 0:
+                best = dist
+                found = Pick(float(xs[i]), float(ys[i]), tag, int(index[i]), float(dist))
+        return found
+
+    @staticmethod
+    def _search(xs: np.ndarray, ys: np.ndarray, x: float, y: float,
+                sx: float, sy: float, best: float) -> Tuple[float, int]:
+        """한 그룹에서 best보다 가까운 최근접 포인트를 찾습니다 (없으면 -1)."""
+        n = len(xs)
+        lo = hi = int(np.searchsorted(xs, x))
+        width = _WINDOW
+        best_i = -1
+        while lo > 0 or hi < n:
+            new_lo, new_hi = max(0, lo - width), min(n, hi + width)
+            for a, b in ((new_lo, lo), (hi, new_hi)):
+                if b > a:
+                    dist = np.hypot((xs[a:b] - x) * sx, (ys[a:b] - y) * sy)
+                    i = int(np.argmin(dist))
+                    if dist[i] < best:
+                        best, best_i = float(dist[i]), a + i
+            lo, hi = new_lo, new_hi
+
+            # 경계 밖 포인트는 x 거리만으로도 best 이상이면 중단
+            left_gap = (x - xs[lo - 1]) * sx if lo > 0 else np.inf
+            right_gap = (xs[hi] - x) * sx if hi < n else np.inf
+            if min(left_gap, right_gap) >= best:
+                break
+            width *= 2
+        return best, best_i
+
+
+class PointNavigator:
+    """
+    방향키 마커 탐색용 포인트 배열.
+
+    add()로 선을 추가하면 첫 조회 때 한 번 정렬 배열을 만듭니다.
+    위치(pos)는 정렬 배열의 인덱스이며, 좌/우/상/하 이동은 run 경계 배열
+    조회와 run 안 이진 탐색만으로 처리합니다.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        self._pending: List[Tuple[np.ndarray, np.ndarray, Any]] = []
+        self._tags: List[Any] = []
+        self._built = True
+        self._x = self._y = np.empty(0)
+        self._group = self._index = np.empty(0, dtype=np.int64)
+        self._run_starts = self._run_ends = self._run_of = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        self._build()
+        return len(self._x)
+
+    def add(self, x: Sequence, y: Sequence, tag: Any = None) -> None:
+        """선 하나의 포인트를 추가합니다 (tag는 Pick.tag로 반환)."""
+        xs = as_float_x(x)
+        ys = np.asarray(y, dtype=np.float64)
+        n = min(len(xs), len(ys))
+        self._pending.append((xs[:n], ys[:n], tag))
+        self._built = False
+
+    def locate(self, x: float, y: float) -> Optional[int]:
+        """(x, y)에 가장 가까운 x의 run에서 y가 가장 가까운 포인트 위치."""
+        self._build()
+        if len(self._run_starts) == 0 or x is None or y is None:
+            return None
+        if isinstance(x, datetime):
+            x = mdates.date2num(x)
+        run_x = self._x[self._run_starts]
+        r = int(np.searchsorted(run_x, x))
+        if r == len(run_x) or (r > 0 and x - run_x[r - 1] <= run_x[r] - x):
+            r -= 1
+        return self._nearest_in_run(r, float(y))
+
+    def step(self, pos: int, key: str) -> int:
+        """
+        방향키로 이동한 위치를 반환합니다 (이동할 곳이 없으면 pos 그대로).
+
+        left/right: 인접 x의 run에서 현재 y에 가장 가까운 포인트.
+        up/down: 같은 x에서 y가 바로 위/아래인 포인트.
+        """
+        self._build()
+        r = int(self._run_of[pos])
+        if key == 'left' and r > 0:
+            return self._nearest_in_run(r - 1, self._y[pos])
+        if key == 'right' and r + 1 < len(self._run_starts):
+            return self._nearest_in_run(r + 1, self._y[pos])
+        if key == 'up' and pos + 1 < self._run_ends[r]:
+            return pos + 1
+        if key == 'down' and pos > self._run_starts[r]:
+            return pos - 1
+        return pos
+
+    def point(self, pos: int) -> Pick:
+        """위치의 포인트 (index는 add()에 넘긴 선 배열 기준)."""
+        self._build()
+        return Pick(float(self._x[pos]), float(self._y[pos]),
+                    self._tags[self._group[pos]], int(self._index[pos]), 0.0)
+
+    def _nearest_in_run(self, r: int, y: float) -> int:
+        start, end = int(self._run_starts[r]), int(self._run_ends[r])
+        j = start + int(np.searchsorted(self._y[start:end], y))
+        if j == end or (j > start and y - self._y[j - 1] <= self._y[j] - y):
+            j -= 1
+        return j
+
+    def _build(self) -> None:
+        if self._built:
+            return
+        self._built = True
+        xs, ys, groups, indices = [self._x], [self._y], [self._group], [self._index]
+        for x, y, tag in self._pending:
+            xs.append(x)
+            ys.append(y)
+            groups.append(np.full(len(x), len(self._tags), dtype=np.int64))
+            indices.append(np.arange(len(x), dtype=np.int64))
+            self._tags.append(tag)
+        self._pending.clear()
+        self._x, self._y = np.concatenate(xs), np.concatenate(ys)
+        self._group, self._index = np.concatenate(groups), np.concatenate(indices)
+
+        keep = np.isfinite(self._x) & np.isfinite(self._y)
+        x, y = self._x[keep], self._y[keep]
+        # (x, y) 순 정렬: y로 정렬한 뒤 x로 안정 정렬 (np.lexsort보다 빠름)
+        order = np.argsort(y)
+        order = order[np.argsort(x[order], kind='stable')]
+        self._x, self._y = x[order], y[order]
+        self._group, self._index = self._group[keep][order], self._index[keep][order]
+
+        n = len(self._x)
+        breaks = np.flatnonzero(np.diff(self._x) > X_TOLERANCE) + 1
+        self._run_starts = np.concatenate([[0], breaks]).astype(np.int64) if n else breaks
+        self._run_ends = np.append(breaks, n).astype(np.int64) if n else breaks
+        self._run_of = np.repeat(np.arange(len(self._run_starts)),
+                                 self._run_ends - self._run_starts)
@@ -0,0 +1,309 @@
+"""
+플롯 LOD(Level of Detail) 도구.
+
+수십만 포인트 신호를 그대로 matplotlib에 넘기지 않고, 현재 x 범위와 축의
+픽셀 폭에 맞춰 필요한 만큼만 그립니다. 축의 xlim이 바뀌면(줌/팬/축 범위
+설정) 해당 범위를 다시 조회하여 선 데이터를 교체합니다.
+
+- MinMaxPyramid: 등간격 파형용 다중 해상도 min/max 피라미드.
+  버킷마다 최솟값과 최댓값을 모두 그리므로 화면상 포락선이 원본과 같습니다.
+- PeakPyramid: 스펙트럼용 피크 보존 피라미드.
+  버킷마다 최댓값 샘플을 원래 x 위치 그대로 그리므로 좁은 톤이 사라지지 않습니다.
+- ImageLOD: 이미지(히트맵)를 현재 x/y 범위와 축 픽셀 크기에 맞춰 다시 조회합니다.
+"""
+import math
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+# 피라미드 최상위 레벨의 최소 버킷 수
+MIN_LEVEL_SIZE = 64
+
+
+def _select_level(span: int, n_pixels: int, num_levels: int) -> int:
+    """버킷 수가 n_pixels ~ 2 * n_pixels가 되는 레벨 (span이 작으면 0)."""
+    if span <= 2 * n_pixels:
+        return 0
+    return min(int(math.floor(math.log2(span / n_pixels))), num_levels - 1)
+
+
+class MinMaxPyramid:
+    """
+    등간격 샘플 신호의 다중 해상도 min/max 피라미드.
+
+    레벨 k의 버킷은 원본 2**k개 샘플의 최솟값/최댓값입니다.
+    메모리는 원본의 약 2배입니다.
+
+    인자:
+        y: 신호 값 (1차원).
+        x0: 첫 샘플의 x 좌표.
+        dx: 샘플 간격.
+    """
+
+    def __init__(self, y: np.ndarray, x0: float = 0.0, dx: float = 1.0):
+        self.y = np.asarray(y, dtype=np.float64).ravel()
+        self.x0 = float(x0)
+        self.dx = float(dx) if dx > 0 else 1.0
+        self._mins: List[np.ndarray] = [self.y]
+        self._maxs: List[np.ndarray] = [self.y]
+
+        mins, maxs = self.y, self.y
+        while len(mins) >= 2 * MIN_LEVEL_SIZE:
+            if len(mins) % 2:
+                mins = np.append(mins, mins[-1])
+                maxs = np.append(maxs, maxs[-1])
+            mins = np.minimum(mins[0::2], mins[1::2])
+            maxs = np.maximum(maxs[0::2], maxs[1::2])
+            self._mins.append(mins)
+            self._maxs.append(maxs)
+
+    @classmethod
+    def from_xy(cls, x: np.ndarray, y: np.ndarray) -> 'MinMaxPyramid':
+        """등간격 x 배열의 양 끝으로 x0/dx를 정해 생성합니다."""
+        x = np.asarray(x)
+        if len(x) > 1:
+            return cls(y, float(x[0]), float(x[-1] - x[0]) / (len(x) - 1))
+        return cls(y, float(x[0]) if len(x) else 0.0)
+
+    @property
+    def num_levels(self) -> int:
+        return len(self._mins)
+
+    @property
+    def x_range(self) -> Tuple[float, float]:
+        return self.x0, self.x0 + self.dx * max(len(self.y) - 1, 0)
+
+    def query(self, x_min: float, x_max: float, n_pixels: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        [x_min, x_max] 구간을 약 n_pixels 버킷으로 샘플링합니다.
+
+        구간 안 샘플 수가 n_pixels의 2배 이하이면 원본을 그대로 반환하고, 그보다
+        많으면 버킷 수가 n_pixels ~ 2 * n_pixels가 되는 레벨의 (min, max) 쌍을
+        버킷 시작 x에 교대로 배치합니다. 양 끝에 구간 밖 샘플 1개를 포함합니다.
+
+        반환:
+            (x, y) 배열.
+        """
+        n = len(self.y)
+        if n == 0:
+            return np.empty(0), np.empty(0)
+
+        i0 = min(max(0, int(math.floor((x_min - self.x0) / self.dx)) - 1), n - 1)
+        i1 = max(min(n, int(math.ceil((x_max - self.x0) / self.dx)) + 2), i0 + 1)
+        span = i1 - i0
+        n_pixels = max(1, int(n_pixels))
+
+        level = _select_level(span, n_pixels, self.num_levels)
+        if level == 0:
+            x = self.x0 + self.dx * np.arange(i0, i1)
+            return x, self.y[i0:i1]
+
+        block = 1 << level
+        j0, j1 = i0 // block, -(-i1 // block)
+        mins = self._mins[level][j0:j1]
+        maxs = self._maxs[level][j0:j1]
+        starts = self.x0 + self.dx * block * np.arange(j0, j1)
+
+        x = np.repeat(starts, 2)
+        y = np.empty(2 * len(mins))
+        y[0::2] = mins
+        y[1::2] = maxs
+        if i1 == n:
+            # 마지막 샘플을 붙여 x 범위(자동 축 범위)가 원본과 같도록 유지
+            x = np.append(x, self.x0 + self.dx * (n - 1))
+            y = np.append(y, self.y[-1])
+        return x, y
+
+
+class PeakPyramid:
+    """
+    스펙트럼의 다중 해상도 피크(최댓값) 피라미드.
+
+    레벨 k는 원본 2**k개 샘플마다 최댓값 샘플의 인덱스를 보관합니다.
+    x는 오름차순이면 되고 등간격일 필요는 없습니다.
+
+    인자:
+        x: 주파수 (오름차순).
+        y: 스펙트럼 값.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray):
+        self.x = np.asarray(x, dtype=np.float64).ravel()
+        self.y = np.asarray(y, dtype=np.float64).ravel()
+        self._indices: List[np.ndarray] = [np.arange(len(self.y))]
+
+        indices = self._indices[0]
+        while len(indices) >= 2 * MIN_LEVEL_SIZE:
+            if len(indices) % 2:
+                indices = np.append(indices, indices[-1])
+            left, right = indices[0::2], indices[1::2]
+            indices = np.where(self.y[right] > self.y[left], right, left)
+            self._indices.append(indices)
+
+    @property
+    def num_levels(self) -> int:
+        return len(self._indices)
+
+    @property
+    def x_range(self) -> Tuple[float, float]:
+        if len(self.x) == 0:
+            return 0.0, 0.0
+        return float(self.x[0]), float(self.x[-1])
+
+    def query(self, x_min: float, x_max: float, n_pixels: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        [x_min, x_max] 구간을 버킷별 최댓값 샘플로 샘플링합니다.
+
+        구간 안 샘플 수가 n_pixels의 2배 이하이면 원본을 그대로 반환합니다.
+        구간이 데이터 양 끝을 포함하면 첫/마지막 샘플도 포함하여 자동 축
+        범위가 원본과 같도록 유지합니다.
+
+        반환:
+            (x, y) 배열.
+        """
+        n = len(self.y)
+        if n == 0:
+            return np.empty(0), np.empty(0)
+
+        i0 = min(max(0, int(np.searchsorted(self.x, x_min, side='left')) - 1), n - 1)
+        i1 = max(min(n, int(np.searchsorted(self.x, x_max, side='right')) + 1), i0 + 1)
+        n_pixels = max(1, int(n_pixels))
+
+        level = _select_level(i1 - i0, n_pixels, self.num_levels)
+        if level == 0:
+            return self.x[i0:i1], self.y[i0:i1]
+
+        block = 1 << level
+        j0, j1 = i0 // block, -(-i1 // block)
+        indices = self._indices[level][j0:j1]
+        if j0 == 0 and indices[0] != 0:
+            indices = np.insert(indices, 0, 0)
+        if j1 * block >= n and indices[-1] != n - 1:
+            indices = np.append(indices, n - 1)
+        return self.x[indices], self.y[indices]
+
+
+class AxesLOD:
+    """
+    Axes의 선을 현재 x 범위에 맞춰 다시 샘플링합니다.
+
+    ax.clear()는 xlim 콜백도 초기화하므로 축을 지운 뒤에는 reset()을 호출해야 합니다.
+
+    인자:
+        ax: 대상 matplotlib Axes.
+    """
+
+    def __init__(self, ax):
+        self._ax = ax
+        self._entries: List[Tuple[object, Callable]] = []
+        self._cid: Optional[int] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """등록된 선을 비우고 xlim 콜백을 다시 연결합니다."""
+        self._entries.clear()
+        if self._cid is not None:
+            self._ax.callbacks.disconnect(self._cid)
+        self._cid = self._ax.callbacks.connect('xlim_changed', lambda ax: self.refresh())
+
+    def add(self, line, query: Callable[[float, float, int], Tuple[np.ndarray, np.ndarray]]) -> None:
+        """
+        선을 등록합니다. 선은 전체 범위 샘플링 결과로 미리 그려 두어야
+        자동 축 범위가 원본 데이터와 같아집니다.
+
+        인자:
+            line: matplotlib Line2D.
+            query: (x_min, x_max, n_pixels) -> (x, y).
+        """
+        self._entries.append((line, query))
+
+    def plot(self, pyramid, **kwargs):
+        """
+        피라미드의 전체 범위 샘플링 결과로 선을 그리고 등록합니다.
+
+        인자:
+            pyramid: MinMaxPyramid 또는 PeakPyramid.
+            **kwargs: ax.plot 스타일 인자.
+
+        반환:
+            생성된 Line2D.
+        """
+        x, y = pyramid.query(*pyramid.x_range, self.pixel_width())
+        line, = self._ax.plot(x, y, **kwargs)
+        self.add(line, pyramid.query)
+        return line
+
+    def pixel_width(self) -> int:
+        """축의 현재 픽셀 폭."""
+        try:
+            width = self._ax.get_window_extent().width
+        except Exception:
+            width = 0
+        return max(100, int(width))
+
+    def refresh(self) -> None:
+        """현재 xlim으로 모든 선을 다시 샘플링합니다 (다음 draw에 반영)."""
+        if not self._entries:
+            return
+        x_min, x_max = sorted(self._ax.get_xlim())
+        n_pixels = self.pixel_width()
+        for line, query in self._entries:
+            line.set_data(*query(x_min, x_max, n_pixels))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ImageLOD:
+    """
+    Axes의 이미지를 현재 x/y 범위와 픽셀 크기에 맞춰 다시 조회합니다.
+
+    source는 extent 속성 (x0, x1, y0, y1)과
+    query(x_min, x_max, y_min, y_max, width, height) -> (image, extent)를
+    제공해야 합니다 (예: SpectrumHeatmap). 축 자동 범위는 끄고 전체 범위로
+    고정하므로 줌/팬/축 범위 설정만 범위를 바꿉니다.
+
+    인자:
+        ax: 대상 matplotlib Axes (새로 만든 축이어야 함 - 콜백을 연결).
+        source: 이미지 소스.
+        **kwargs: ax.imshow 인자 (cmap, norm 등).
+    """
+
+    def __init__(self, ax, source, **kwargs):
+        self._ax = ax
+        self._source = source
+        self._last = None
+        x0, x1, y0, y1 = source.extent
+        image, extent = source.query(x0, x1, y0, y1, *self.pixel_size())
+        kwargs.setdefault('interpolation', 'nearest')
+        kwargs.setdefault('aspect', 'auto')
+        self.image = ax.imshow(image, extent=extent, origin='lower', **kwargs)
+        ax.set_xlim(x0, x1)
+        ax.set_ylim(y0, y1)
+        ax.set_autoscale_on(False)
+        self._cids = [ax.callbacks.connect(name, lambda ax: self.refresh())
+                      for name in ('xlim_changed', 'ylim_changed')]
+
+    def pixel_size(self) -> Tuple[int, int]:
+        """축의 현재 픽셀 크기 (폭, 높이)."""
+        try:
+            bbox = self._ax.get_window_extent()
+            width, height = bbox.width, bbox.height
+        except Exception:
+            width = height = 0
+        return max(100, int(width)), max(100, int(height))
+
+    def refresh(self) -> None:
+        """현재 범위로 이미지를 다시 조회합니다 (다음 draw에 반영)."""
+        request = (*self._ax.get_xlim(), *self._ax.get_ylim(), *self.pixel_size())
+        if request == self._last:
+            return
+        self._last = request
+        image, extent = self._source.query(*request)
+        self.image.set_data(image)
+        self.image.set_extent(extent)
+
+    def disconnect(self) -> None:
+        for cid in self._cids:
+            self._ax.callbacks.disconnect(cid)
+        self._cids = []